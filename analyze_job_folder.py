@@ -0,0 +1,52 @@
+import argparse
+import logging
+import os
+import time
+from datetime import datetime
+
+from utils.part_metrics import iter_job_part_metrics, save_part_metrics
+from utils.sheet_settings.sheet_settings import SheetSettings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Analyse every DXF and bending PDF in a job folder and write a manifest of part metrics.",
+        epilog="Import a .json manifest into a job with the Import Part Metrics button under an assembly's laser cut parts in the job planner.",
+    )
+    parser.add_argument("job_directory", help="Folder to search, including sub folders.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Manifest to write, .json (can be imported into a job) or .csv. Defaults to part_metrics.json in the job folder.",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of worker processes, defaults to the number of CPUs.")
+    parser.add_argument("-m", "--material", default="", help="Material of every part, as named in the sheet settings. Needed for weights.")
+    parser.add_argument("-t", "--thickness", default="", help="Thickness of every part, as named in the sheet settings. Needed for weights.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    output = args.output or os.path.join(args.job_directory, "part_metrics.json")
+
+    pounds_per_square_foot = SheetSettings().get_pounds_per_square_foot(args.material, args.thickness) if args.material and args.thickness else 0.0
+    if (args.material or args.thickness) and not pounds_per_square_foot:
+        logging.warning(f"No pounds per square foot for {args.thickness} {args.material}, weights will be 0")
+
+    start_time = time.perf_counter()
+    parts = []
+    failed: dict[str, str] = {}
+    for name, part, error in iter_job_part_metrics(
+        args.job_directory,
+        args.jobs,
+        material=args.material,
+        thickness=args.thickness,
+        pounds_per_square_foot=pounds_per_square_foot,
+    ):
+        if part:
+            parts.append(part)
+            print(f"{datetime.now().isoformat()} - {name}: {part['meta_data']['cutting_length']:,.2f} in, {part['meta_data']['piercing_points']} pierces, {part['meta_data']['bend_hits']} bend hits")
+        else:
+            failed[name] = error
+            print(f"{datetime.now().isoformat()} - {name}: FAILED {error}")
+
+    parts.sort(key=lambda part: part["name"])
+    save_part_metrics(output, parts, failed)
+    print(f"{datetime.now().isoformat()} - {len(parts)} parts ({len(failed)} failed) in {time.perf_counter() - start_time:.1f} s, saved to {output}")
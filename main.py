@@ -1,4 +1,5 @@
 import builtins
+import multiprocessing
 import sys
 
 from PyQt6.QtWidgets import QApplication
@@ -28,4 +29,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Nest imports run in worker processes, needed for the frozen build
     main()
@@ -10,10 +10,12 @@ from PyQt6.QtGui import QAction, QCursor, QFont, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
     QComboBox,
+    QFileDialog,
     QHBoxLayout,
     QLineEdit,
     QMenu,
     QMessageBox,
+    QPushButton,
     QScrollArea,
     QTableWidgetItem,
     QWidget,
@@ -42,11 +44,15 @@ from ui.dialogs.add_laser_cut_part_dialog import AddLaserCutPartDialog
 from ui.dialogs.edit_paint_dialog import EditPaintDialog
 from ui.theme import theme_var
 from ui.widgets.assembly_widget import AssemblyWidget
-from utils.dxf_analyzer import DxfAnalyzer
-from utils.get_bend_hits import get_bend_hits
+from utils.dxf_analysis_cache import CachedDxfAnalysis
+from utils.dxf_analyzer import dxf_analysis_to_string
+from utils.get_bend_hits import BendHits
 from utils.inventory.component import Component
 from utils.inventory.laser_cut_part import LaserCutPart
+from utils.part_metrics import load_part_metrics
 from utils.settings import Settings
+from utils.threads.bend_hits_service import BendHitsService
+from utils.threads.dxf_analysis_service import DxfAnalysisService
 from utils.workers.upload_files import UploadFilesWorker
 from utils.workers.workspace.download_file import WorkspaceDownloadWorker
 from utils.workers.workspace.upload_file import WorkspaceUploadWorker
@@ -66,6 +72,12 @@ class AssemblyPlanningWidget(AssemblyWidget):
         self.upload_images_thread: UploadFilesWorker = None
         self.upload_files_thread: WorkspaceUploadWorker = None
         self.download_file_thread: WorkspaceDownloadWorker = None
+        self.dxf_analysis_service = DxfAnalysisService(parent=self)
+        self.bend_hits_service = BendHitsService(parent=self)
+        # Parts whose dropped DXF matches an inventory part, asked about once all dropped DXFs are analysed
+        self.pending_dxf_analyses = 0
+        self.dxf_analyses: dict[LaserCutPart, tuple[str, CachedDxfAnalysis]] = {}
+        self.dxf_inventory_matches: dict[LaserCutPart, LaserCutPart] = {}
 
         self.settings_file = Settings()
         self.tables_font = QFont()
@@ -130,6 +142,10 @@ class AssemblyPlanningWidget(AssemblyWidget):
         self.laser_cut_parts_table.rowChanged.connect(self.laser_cut_parts_table_changed)
         self.laser_cut_parts_layout.addWidget(self.laser_cut_parts_table)
         self.add_laser_cut_part_button.clicked.connect(self.add_laser_cut_part)
+        self.import_part_metrics_button = QPushButton("Import Part Metrics", self.laser_cut_widget)
+        self.import_part_metrics_button.setToolTip("Add the laser cut parts from a manifest written by analyze_job_folder.py")
+        self.import_part_metrics_button.clicked.connect(self.import_part_metrics)
+        self.horizontalLayout_4.insertWidget(1, self.import_part_metrics_button)
         self.load_laser_cut_parts_table_context_menu()
 
         self.components_table = ComponentsPlanningTableWidget(self)
@@ -481,7 +497,7 @@ class AssemblyPlanningWidget(AssemblyWidget):
     def delete_selected_components(self):
         if selected_components := self.get_selected_components():
             for component in selected_components:
-                self.assembly.components.remove(component)
+                self.assembly.remove_component(component)
         self.changes_made()
         self.load_components_table()
 
@@ -842,6 +858,38 @@ class AssemblyPlanningWidget(AssemblyWidget):
                 self.assembly.add_laser_cut_part(new_laser_cut_part)
                 self.add_laser_cut_part_to_table(new_laser_cut_part)
 
+    def import_part_metrics(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import Part Metrics", "", "Part metrics (*.json)")
+        if not file_path:
+            return
+        try:
+            laser_cut_parts = load_part_metrics(file_path, self.laser_cut_inventory)
+        except Exception as e:
+            QMessageBox.critical(self, "Import failed", f"Could not import {file_path}:\n{e}")
+            return
+
+        # Same as dropping the files on each part, they are copied to the workspace folder and uploaded
+        files_to_upload: list[str] = []
+        for laser_cut_part in laser_cut_parts:
+            for file_category in ("cnc_milling_files", "bending_files"):
+                target_paths: list[str] = []
+                for file_path in getattr(laser_cut_part.workspace_data, file_category):
+                    if not os.path.isfile(file_path):  # Manifest was written on another computer or the job folder moved
+                        continue
+                    file_ext = file_path.split(".")[-1].upper()
+                    target_dir = os.path.join("data", "workspace", file_ext)
+                    target_path = os.path.join(target_dir, os.path.basename(file_path))
+                    os.makedirs(target_dir, exist_ok=True)
+                    self.copy_file_with_overwrite(file_path, target_path)
+                    target_paths.append(target_path)
+                    files_to_upload.append(file_path)
+                setattr(laser_cut_part.workspace_data, file_category, target_paths)
+            self.assembly.add_laser_cut_part(laser_cut_part)
+            self.add_laser_cut_part_to_table(laser_cut_part)
+        if files_to_upload:
+            self.upload_files(files_to_upload)
+        self.changes_made()
+
     def update_laser_cut_parts_table_height(self):
         total_height = 0
         for row in range(self.laser_cut_parts_table.rowCount()):
@@ -921,7 +969,7 @@ class AssemblyPlanningWidget(AssemblyWidget):
     def delete_selected_laser_cut_parts(self):
         if selected_laser_cut_parts := self.get_selected_laser_cut_parts():
             for laser_cut_part in selected_laser_cut_parts:
-                self.assembly.laser_cut_parts.remove(laser_cut_part)
+                self.assembly.remove_laser_cut_part(laser_cut_part)
         self.changes_made()
         self.load_laser_cut_parts_table()
 
@@ -1168,98 +1216,18 @@ class AssemblyPlanningWidget(AssemblyWidget):
 
             if "dxf" in file_ext.lower() and file_category == "cnc_milling_files":
                 laser_cut_part.meta_data.file_name = file_name.split(".")[0]
-                dxf_analyzer = DxfAnalyzer(file_path)
-                dxf_analyzer.save_preview_image(f"images/{laser_cut_part.meta_data.file_name}.jpeg")
-                laser_cut_part.meta_data.image_index = f"{laser_cut_part.meta_data.file_name}.jpeg"
-                self.upload_images([laser_cut_part.meta_data.image_index])
-                are_you_sure = QMessageBox(
-                    QMessageBox.Icon.Question,
-                    "Are you sure?",
-                    f"The following information is extracted from the DXF file:\n{dxf_analyzer}\n\nDo you want to use these settings?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
-                    self,
+                self.pending_dxf_analyses += 1
+                self.dxf_analysis_service.analyze(
+                    file_path,
+                    partial(self.laser_cut_part_dxf_analyzed, laser_cut_part, laser_cut_part.meta_data.file_name),
+                    partial(self.laser_cut_part_dxf_analysis_failed, file_name),
                 )
-                if are_you_sure.exec() == QMessageBox.StandardButton.Yes:
-                    laser_cut_part.load_dxf_settings(dxf_analyzer)
-
-                if existing_laser_cut_part := self.laser_cut_inventory.get_laser_cut_part_by_name(laser_cut_part.meta_data.file_name):
-                    are_you_sure = QMessageBox(
-                        QMessageBox.Icon.Question,
-                        "Are you sure?",
-                        f"The laser cut part '{existing_laser_cut_part.name}' already exists in the inventory. Do you want to use the settings from the existing laser cut part?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
-                        self,
-                    )
-                    if are_you_sure.exec() == QMessageBox.StandardButton.Yes:
-                        # self.laser_cut_part_table_items[laser_cut_part]["material"].setCurrentText(existing_laser_cut_part.material)
-                        # self.laser_cut_part_table_items[laser_cut_part]["thickness"].setCurrentText(existing_laser_cut_part.gauge)
-                        laser_cut_part.meta_data.material = existing_laser_cut_part.meta_data.material
-                        laser_cut_part.meta_data.gauge = existing_laser_cut_part.meta_data.gauge
-                        laser_cut_part.meta_data.machine_time = existing_laser_cut_part.meta_data.machine_time
-                        laser_cut_part.meta_data.weight = existing_laser_cut_part.meta_data.weight
-                        laser_cut_part.meta_data.surface_area = existing_laser_cut_part.meta_data.surface_area
-                        laser_cut_part.meta_data.cutting_length = existing_laser_cut_part.meta_data.cutting_length
-                        laser_cut_part.meta_data.piercing_time = existing_laser_cut_part.meta_data.piercing_time
-                        laser_cut_part.meta_data.piercing_points = existing_laser_cut_part.meta_data.piercing_points
-                        laser_cut_part.meta_data.shelf_number = existing_laser_cut_part.meta_data.shelf_number
-                        laser_cut_part.meta_data.sheet_dim = existing_laser_cut_part.meta_data.sheet_dim
-                        laser_cut_part.meta_data.part_dim = existing_laser_cut_part.meta_data.part_dim
-                        laser_cut_part.meta_data.geofile_name = existing_laser_cut_part.meta_data.geofile_name
-                        laser_cut_part.meta_data.modified_date = existing_laser_cut_part.meta_data.modified_date
-                        laser_cut_part.meta_data.notes = existing_laser_cut_part.meta_data.notes
-                        laser_cut_part.prices.price = existing_laser_cut_part.prices.price
-                        laser_cut_part.prices.cost_of_goods = existing_laser_cut_part.prices.cost_of_goods
-                        laser_cut_part.prices.bend_cost = existing_laser_cut_part.prices.bend_cost
-                        laser_cut_part.prices.labor_cost = existing_laser_cut_part.prices.labor_cost
-                        laser_cut_part.primer_data.uses_primer = existing_laser_cut_part.primer_data.uses_primer
-                        laser_cut_part.primer_data.primer_name = existing_laser_cut_part.primer_data.primer_name
-                        laser_cut_part.primer_data.primer_overspray = existing_laser_cut_part.primer_data.primer_overspray
-                        laser_cut_part.prices.cost_for_primer = existing_laser_cut_part.prices.cost_for_primer
-                        laser_cut_part.paint_data.uses_paint = existing_laser_cut_part.paint_data.uses_paint
-                        laser_cut_part.paint_data.paint_name = existing_laser_cut_part.paint_data.paint_name
-                        laser_cut_part.paint_data.paint_overspray = existing_laser_cut_part.paint_data.paint_overspray
-                        laser_cut_part.prices.cost_for_paint = existing_laser_cut_part.prices.cost_for_paint
-                        laser_cut_part.powder_data.uses_powder = existing_laser_cut_part.powder_data.uses_powder
-                        laser_cut_part.powder_data.powder_name = existing_laser_cut_part.powder_data.powder_name
-                        laser_cut_part.powder_data.powder_transfer_efficiency = existing_laser_cut_part.powder_data.powder_transfer_efficiency
-                        laser_cut_part.prices.cost_for_powder_coating = existing_laser_cut_part.prices.cost_for_powder_coating
-                        # with contextlib.suppress(KeyError):
-                        # self.laser_cut_part_table_items[laser_cut_part]["painting_widget"].update_checkboxes()
-                        # self.laser_cut_part_table_items[laser_cut_part]["painting_settings_widget"].update_inputs()
-                        self.laser_cut_part_table_items[laser_cut_part]["flowtag_data_button"].dropdown.load_ui()
-                        # laser_cut_part.bending_files = existing_laser_cut_part.bending_files
-                        # laser_cut_part.welding_files = existing_laser_cut_part.welding_files
-                        # laser_cut_part.cnc_milling_files = existing_laser_cut_part.cnc_milling_files
-
-                current_row = self.laser_cut_part_table_items[laser_cut_part]["row"]
-
-                image_item = QTableWidgetItem()
-                try:
-                    if "images" not in laser_cut_part.meta_data.image_index:
-                        laser_cut_part.meta_data.image_index = "images/" + laser_cut_part.meta_data.image_index
-                    if not laser_cut_part.meta_data.image_index.endswith(".jpeg"):
-                        laser_cut_part.meta_data.image_index += ".jpeg"
-                    image = QPixmap(laser_cut_part.meta_data.image_index)
-                    if image.isNull():
-                        image = QPixmap("images/404.jpeg")
-                    original_width = image.width()
-                    original_height = image.height()
-                    new_height = self.laser_cut_parts_table.row_height
-                    try:
-                        new_width = int(original_width * (new_height / original_height))
-                    except ZeroDivisionError:
-                        new_width = original_width
-                    pixmap = image.scaled(new_width, new_height, Qt.AspectRatioMode.KeepAspectRatio)
-                    image_item.setData(Qt.ItemDataRole.DecorationRole, pixmap)
-                except Exception as e:
-                    image_item.setText(f"Error: {e}")
-
-                self.laser_cut_parts_table.setRowHeight(current_row, new_height)
-                self.laser_cut_parts_table.setItem(current_row, LaserCutTableColumns.PICTURE.value, image_item)
-                self.laser_cut_parts_table.item(current_row, LaserCutTableColumns.PART_NAME.value).setText(laser_cut_part.meta_data.file_name)
             elif "pdf" in file_ext.lower() and file_category == "bending_files":
-                laser_cut_part.meta_data.bend_hits = get_bend_hits(file_path)
-                laser_cut_part.prices.bend_cost = laser_cut_part.meta_data.bend_hits
+                self.bend_hits_service.analyze(
+                    file_path,
+                    partial(self.laser_cut_part_bend_hits_found, laser_cut_part),
+                    partial(self.file_analysis_failed, file_name),
+                )
 
             target_dir = os.path.join("data", "workspace", file_ext)
             target_path = os.path.join(target_dir, file_name)
@@ -1280,6 +1248,152 @@ class AssemblyPlanningWidget(AssemblyWidget):
         self.upload_files(file_paths)
         self.changes_made()
 
+    def laser_cut_part_dxf_analyzed(self, laser_cut_part: LaserCutPart, file_name: str, dxf_analysis: CachedDxfAnalysis):
+        self.pending_dxf_analyses -= 1
+        # Skipped if the part was removed or another DXF was dropped on it while this one was being analysed
+        if laser_cut_part in self.laser_cut_part_table_items and file_name == laser_cut_part.meta_data.file_name:
+            if dxf_analysis["preview_path"]:
+                shutil.copyfile(dxf_analysis["preview_path"], f"images/{file_name}.jpeg")
+            laser_cut_part.meta_data.image_index = f"{file_name}.jpeg"
+            self.upload_images([laser_cut_part.meta_data.image_index])
+            self.dxf_analyses[laser_cut_part] = (file_name, dxf_analysis)
+
+            if existing_laser_cut_part := self.laser_cut_inventory.get_laser_cut_part_by_name(file_name):
+                self.dxf_inventory_matches[laser_cut_part] = existing_laser_cut_part
+
+            self.update_laser_cut_part_picture(laser_cut_part)
+            part_name_item = self.laser_cut_parts_table.item(self.laser_cut_part_table_items[laser_cut_part]["row"], LaserCutTableColumns.PART_NAME.value)
+            part_name_item.setText(file_name)
+            part_name_item.setToolTip(f"Extracted from the DXF file:\n{dxf_analysis_to_string(dxf_analysis)}")
+            self.changes_made()
+        self.dxf_analyses_finished()
+
+    def laser_cut_part_dxf_analysis_failed(self, file_name: str, error: str):
+        self.pending_dxf_analyses -= 1
+        self.file_analysis_failed(file_name, error)
+        self.dxf_analyses_finished()
+
+    def dxf_analyses_finished(self):
+        if self.pending_dxf_analyses:
+            return
+        analyses = {laser_cut_part: analysis for laser_cut_part, analysis in self.dxf_analyses.items() if laser_cut_part in self.laser_cut_part_table_items}
+        matches = {laser_cut_part: existing_laser_cut_part for laser_cut_part, existing_laser_cut_part in self.dxf_inventory_matches.items() if laser_cut_part in self.laser_cut_part_table_items}
+        self.dxf_analyses.clear()
+        self.dxf_inventory_matches.clear()
+        if analyses:
+            self.load_dxf_analyses(analyses)
+        if matches:
+            self.load_dxf_inventory_matches(matches)
+
+    def load_dxf_analyses(self, analyses: dict[LaserCutPart, tuple[str, CachedDxfAnalysis]]):
+        summaries = "\n\n".join(f"{file_name}:\n{dxf_analysis_to_string(dxf_analysis)}" for file_name, dxf_analysis in analyses.values())
+        are_you_sure = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Are you sure?",
+            f"The following information is extracted from the DXF files:\n{summaries}\n\nDo you want to use these settings?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+            self,
+        )
+        if are_you_sure.exec() != QMessageBox.StandardButton.Yes:
+            return
+        for laser_cut_part, (file_name, dxf_analysis) in analyses.items():
+            # Removed, or given another DXF, while the question was open
+            if laser_cut_part in self.laser_cut_part_table_items and file_name == laser_cut_part.meta_data.file_name:
+                laser_cut_part.load_dxf_settings(dxf_analysis)
+        self.changes_made()
+
+    def load_dxf_inventory_matches(self, matches: dict[LaserCutPart, LaserCutPart]):
+        part_names = "\n".join(existing_laser_cut_part.name for existing_laser_cut_part in matches.values())
+        are_you_sure = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Are you sure?",
+            f"The following laser cut parts already exist in the inventory:\n{part_names}\n\nDo you want to use the settings from the existing laser cut parts?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+            self,
+        )
+        if are_you_sure.exec() != QMessageBox.StandardButton.Yes:
+            return
+        for laser_cut_part, existing_laser_cut_part in matches.items():
+            if laser_cut_part in self.laser_cut_part_table_items:  # Removed while the question was open
+                self.load_existing_laser_cut_part_settings(laser_cut_part, existing_laser_cut_part)
+        self.changes_made()
+
+    def load_existing_laser_cut_part_settings(self, laser_cut_part: LaserCutPart, existing_laser_cut_part: LaserCutPart):
+        # self.laser_cut_part_table_items[laser_cut_part]["material"].setCurrentText(existing_laser_cut_part.material)
+        # self.laser_cut_part_table_items[laser_cut_part]["thickness"].setCurrentText(existing_laser_cut_part.gauge)
+        laser_cut_part.meta_data.material = existing_laser_cut_part.meta_data.material
+        laser_cut_part.meta_data.gauge = existing_laser_cut_part.meta_data.gauge
+        laser_cut_part.meta_data.machine_time = existing_laser_cut_part.meta_data.machine_time
+        laser_cut_part.meta_data.weight = existing_laser_cut_part.meta_data.weight
+        laser_cut_part.meta_data.surface_area = existing_laser_cut_part.meta_data.surface_area
+        laser_cut_part.meta_data.cutting_length = existing_laser_cut_part.meta_data.cutting_length
+        laser_cut_part.meta_data.piercing_time = existing_laser_cut_part.meta_data.piercing_time
+        laser_cut_part.meta_data.piercing_points = existing_laser_cut_part.meta_data.piercing_points
+        laser_cut_part.meta_data.shelf_number = existing_laser_cut_part.meta_data.shelf_number
+        laser_cut_part.meta_data.sheet_dim = existing_laser_cut_part.meta_data.sheet_dim
+        laser_cut_part.meta_data.part_dim = existing_laser_cut_part.meta_data.part_dim
+        laser_cut_part.meta_data.geofile_name = existing_laser_cut_part.meta_data.geofile_name
+        laser_cut_part.meta_data.modified_date = existing_laser_cut_part.meta_data.modified_date
+        laser_cut_part.meta_data.notes = existing_laser_cut_part.meta_data.notes
+        laser_cut_part.prices.price = existing_laser_cut_part.prices.price
+        laser_cut_part.prices.cost_of_goods = existing_laser_cut_part.prices.cost_of_goods
+        laser_cut_part.prices.bend_cost = existing_laser_cut_part.prices.bend_cost
+        laser_cut_part.prices.labor_cost = existing_laser_cut_part.prices.labor_cost
+        laser_cut_part.primer_data.uses_primer = existing_laser_cut_part.primer_data.uses_primer
+        laser_cut_part.primer_data.primer_name = existing_laser_cut_part.primer_data.primer_name
+        laser_cut_part.primer_data.primer_overspray = existing_laser_cut_part.primer_data.primer_overspray
+        laser_cut_part.prices.cost_for_primer = existing_laser_cut_part.prices.cost_for_primer
+        laser_cut_part.paint_data.uses_paint = existing_laser_cut_part.paint_data.uses_paint
+        laser_cut_part.paint_data.paint_name = existing_laser_cut_part.paint_data.paint_name
+        laser_cut_part.paint_data.paint_overspray = existing_laser_cut_part.paint_data.paint_overspray
+        laser_cut_part.prices.cost_for_paint = existing_laser_cut_part.prices.cost_for_paint
+        laser_cut_part.powder_data.uses_powder = existing_laser_cut_part.powder_data.uses_powder
+        laser_cut_part.powder_data.powder_name = existing_laser_cut_part.powder_data.powder_name
+        laser_cut_part.powder_data.powder_transfer_efficiency = existing_laser_cut_part.powder_data.powder_transfer_efficiency
+        laser_cut_part.prices.cost_for_powder_coating = existing_laser_cut_part.prices.cost_for_powder_coating
+        # with contextlib.suppress(KeyError):
+        # self.laser_cut_part_table_items[laser_cut_part]["painting_widget"].update_checkboxes()
+        # self.laser_cut_part_table_items[laser_cut_part]["painting_settings_widget"].update_inputs()
+        self.laser_cut_part_table_items[laser_cut_part]["flowtag_data_button"].dropdown.load_ui()
+        # laser_cut_part.bending_files = existing_laser_cut_part.bending_files
+        # laser_cut_part.welding_files = existing_laser_cut_part.welding_files
+        # laser_cut_part.cnc_milling_files = existing_laser_cut_part.cnc_milling_files
+
+    def update_laser_cut_part_picture(self, laser_cut_part: LaserCutPart):
+        current_row = self.laser_cut_part_table_items[laser_cut_part]["row"]
+
+        image_item = QTableWidgetItem()
+        new_height = self.laser_cut_parts_table.row_height
+        try:
+            if "images" not in laser_cut_part.meta_data.image_index:
+                laser_cut_part.meta_data.image_index = "images/" + laser_cut_part.meta_data.image_index
+            if not laser_cut_part.meta_data.image_index.endswith(".jpeg"):
+                laser_cut_part.meta_data.image_index += ".jpeg"
+            image = QPixmap(laser_cut_part.meta_data.image_index)
+            if image.isNull():
+                image = QPixmap("images/404.jpeg")
+            original_width = image.width()
+            original_height = image.height()
+            try:
+                new_width = int(original_width * (new_height / original_height))
+            except ZeroDivisionError:
+                new_width = original_width
+            pixmap = image.scaled(new_width, new_height, Qt.AspectRatioMode.KeepAspectRatio)
+            image_item.setData(Qt.ItemDataRole.DecorationRole, pixmap)
+        except Exception as e:
+            image_item.setText(f"Error: {e}")
+
+        self.laser_cut_parts_table.setRowHeight(current_row, new_height)
+        self.laser_cut_parts_table.setItem(current_row, LaserCutTableColumns.PICTURE.value, image_item)
+
+    def laser_cut_part_bend_hits_found(self, laser_cut_part: LaserCutPart, bend_hits: BendHits):
+        laser_cut_part.meta_data.bend_hits = bend_hits["count"]
+        laser_cut_part.prices.bend_cost = laser_cut_part.meta_data.bend_hits
+        self.changes_made()
+
+    def file_analysis_failed(self, file_name: str, error: str):
+        QMessageBox.critical(self, "Analysis failed", f"Could not analyse {file_name}:\n{error}")
+
     def upload_files(self, files: list[str]):
         self.upload_files_thread = WorkspaceUploadWorker(files)
         QThreadPool.globalInstance().start(self.upload_files_thread)
@@ -1455,5 +1569,6 @@ class AssemblyPlanningWidget(AssemblyWidget):
 
     @override
     def changes_made(self):
+        self.assembly.invalidate_cache()
         self.doubleSpinBox_expected_time_to_complete.setValue(int(self.assembly.get_expected_time_to_complete()))
         super().changes_made()
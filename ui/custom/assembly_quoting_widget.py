@@ -467,7 +467,7 @@ class AssemblyQuotingWidget(AssemblyWidget):
     def delete_selected_components(self):
         if selected_components := self.get_selected_components():
             for component in selected_components:
-                self.assembly.components.remove(component)
+                self.assembly.remove_component(component)
         self.changes_made()
         self.load_components_table()
 
@@ -768,8 +768,8 @@ class AssemblyQuotingWidget(AssemblyWidget):
 
     def update_laser_cut_parts_table_prices(self):
         self.laser_cut_parts_table.blockSignals(True)
-        for laser_cut_part, table_data in self.laser_cut_part_table_items.items():
-            unit_price = self.price_calculator.get_laser_cut_part_cost(laser_cut_part)
+        unit_prices = self.price_calculator.get_laser_cut_parts_costs(list(self.laser_cut_part_table_items))
+        for (laser_cut_part, table_data), unit_price in zip(self.laser_cut_part_table_items.items(), unit_prices):
             cost_of_goods = self.price_calculator.get_laser_cut_part_cost_of_goods(laser_cut_part)
             paint_cost = self.price_calculator.get_laser_cut_part_cost_for_painting(laser_cut_part)
             cutting_cost = self.price_calculator.get_laser_cut_part_cost_for_cutting(laser_cut_part)
@@ -981,7 +981,7 @@ class AssemblyQuotingWidget(AssemblyWidget):
     def delete_selected_laser_cut_parts(self):
         if selected_laser_cut_parts := self.get_selected_laser_cut_parts():
             for laser_cut_part in selected_laser_cut_parts:
-                self.assembly.laser_cut_parts.remove(laser_cut_part)
+                self.assembly.remove_laser_cut_part(laser_cut_part)
         self.changes_made()
         self.load_laser_cut_parts_table()
 
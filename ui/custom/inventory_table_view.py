@@ -0,0 +1,342 @@
+import difflib
+import logging
+import os
+import time
+from typing import Any, Callable, Iterable
+
+import sympy
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPixmap, QPixmapCache
+from PyQt6.QtWidgets import QAbstractItemView, QComboBox, QPlainTextEdit, QStyledItemDelegate, QTableView, QWidget
+
+from ui.custom_widgets import HumbleDoubleSpinBox
+from ui.theme import theme_var
+from utils.settings import Settings
+
+THUMBNAIL_HEIGHT = 50
+
+
+def get_thumbnail(path: str) -> QPixmap | None:
+    # Only called from data(), so images are decoded when their row is painted, not when the table loads.
+    if not path:
+        return None
+    if (pixmap := QPixmapCache.find(path)) is not None:
+        return pixmap
+    if not os.path.isfile(path):
+        return None
+    pixmap = QPixmap(path)
+    if pixmap.isNull():
+        return None
+    pixmap = pixmap.scaledToHeight(THUMBNAIL_HEIGHT, Qt.TransformationMode.SmoothTransformation)
+    QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+
+def forget_thumbnail(path: str):
+    QPixmapCache.remove(path)
+
+
+def parse_number(text: str) -> float:
+    return float(
+        sympy.sympify(
+            str(text).replace("USD", "").replace("CAD", "").replace("$", "").replace(",", "").strip(),
+            evaluate=True,
+        )
+    )
+
+
+class InventoryTableModel(QAbstractTableModel):
+    """Rows are inventory items, or plain strings for group header rows (e.g. material/thickness).
+
+    Subclasses implement item_data(), set_item_data() and row_color(). Nothing is copied out of the
+    items, so a changed item only needs refresh_item() to repaint its row.
+    """
+
+    itemEdited = pyqtSignal(object)
+    editFailed = pyqtSignal(object, str)  # item, column name
+
+    headers: list[str] = []
+    editable_columns: list[int] = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.settings_file = Settings()
+        self.tables_font = QFont()
+        self.tables_font.setFamily(self.settings_file.get_value("tables_font")["family"])
+        self.tables_font.setPointSize(self.settings_file.get_value("tables_font")["pointSize"])
+        self.tables_font.setWeight(self.settings_file.get_value("tables_font")["weight"])
+        self.tables_font.setItalic(self.settings_file.get_value("tables_font")["italic"])
+        self.group_font = QFont()
+        self.group_font.setPointSize(15)
+
+        self.rows: list[Any] = []
+        self._row_of: dict[int, int] = {}
+
+    def set_rows(self, rows: list[Any]):
+        self.beginResetModel()
+        self.rows = rows
+        self._row_of = {id(row): i for i, row in enumerate(rows) if not isinstance(row, str)}
+        self.endResetModel()
+
+    def patch_rows(self, rows: list[Any], updated_items: Iterable[Any] = ()):
+        """Moves to rows with row inserts and removes instead of a reset, so selection and scroll position are kept."""
+        start_time = time.perf_counter()
+        old_keys = [self.row_key(row) for row in self.rows]
+        new_keys = [self.row_key(row) for row in rows]
+        opcodes = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False).get_opcodes()
+        for tag, i1, i2, j1, j2 in reversed(opcodes):  # Back to front so earlier row numbers stay valid
+            if tag in ("replace", "delete"):
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self.rows[i1:i2]
+                self.endRemoveRows()
+            if tag in ("replace", "insert"):
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self.rows[i1:i1] = rows[j1:j2]
+                self.endInsertRows()
+        self._row_of = {id(row): i for i, row in enumerate(self.rows) if not isinstance(row, str)}
+        for item in updated_items:
+            self.refresh_item(item)
+        logging.info(f"{type(self).__name__}: patched {len(self.rows)} rows in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    def row_key(self, row: Any) -> tuple[str, str | int]:
+        return ("group", row) if isinstance(row, str) else ("item", id(row))
+
+    def get_items(self) -> list[Any]:
+        return [row for row in self.rows if not isinstance(row, str)]
+
+    def get_group_rows(self) -> list[int]:
+        return [i for i, row in enumerate(self.rows) if isinstance(row, str)]
+
+    def item_at(self, row: int) -> Any | None:
+        if 0 <= row < len(self.rows) and not isinstance(self.rows[row], str):
+            return self.rows[row]
+        return None
+
+    def row_of(self, item: Any) -> int | None:
+        return self._row_of.get(id(item))
+
+    def refresh_item(self, item: Any) -> bool:
+        if (row := self.row_of(item)) is None:
+            return False
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        return True
+
+    def refresh_columns(self, first: int, last: int | None = None):
+        if self.rows:
+            self.dataChanged.emit(self.index(0, first), self.index(len(self.rows) - 1, first if last is None else last))
+
+    def refresh_all(self):
+        self.refresh_columns(0, self.columnCount() - 1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if (item := self.item_at(index.row())) is None:
+            return Qt.ItemFlag.ItemIsEnabled
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if self.is_editable(item, index.column()):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def is_editable(self, item: Any, column: int) -> bool:
+        return column in self.editable_columns
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if isinstance(row, str):
+            return self.group_data(row, index.column(), role)
+        value = self.item_data(row, index.column(), role)
+        if value is None:
+            if role == Qt.ItemDataRole.FontRole:
+                return self.tables_font
+            if role == Qt.ItemDataRole.BackgroundRole and (color := self.row_color(row)):
+                return QColor(color)
+        return value
+
+    def group_data(self, group: str, column: int, role: Qt.ItemDataRole):
+        if role == Qt.ItemDataRole.DisplayRole and column == 0:
+            return group
+        elif role == Qt.ItemDataRole.FontRole:
+            return self.group_font
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            return QColor(theme_var("background"))
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or (item := self.item_at(index.row())) is None:
+            return False
+        try:
+            if not self.set_item_data(item, index.column(), value):
+                return False
+        except (sympy.SympifyError, TypeError, ValueError):
+            self.editFailed.emit(item, self.headers[index.column()])
+            return False
+        self.refresh_item(item)
+        self.itemEdited.emit(item)
+        return True
+
+    def item_data(self, item: Any, column: int, role: Qt.ItemDataRole):
+        raise NotImplementedError
+
+    def set_item_data(self, item: Any, column: int, value: Any) -> bool:
+        raise NotImplementedError
+
+    def row_color(self, item: Any) -> str | None:
+        return None
+
+
+class InventoryTableView(QTableView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setShowGrid(True)
+        self.setWordWrap(True)
+        self.setSortingEnabled(False)
+        self.setTextElideMode(Qt.TextElideMode.ElideNone)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setStyleSheet("QScrollBar:horizontal {height: 20px;}")
+
+        # Column whose editor stays open on the current row, for cells that are full widgets (order buttons).
+        self.row_editor_column: int | None = None
+        self._row_editor_index = QPersistentModelIndex()
+
+    def setModel(self, model: InventoryTableModel):
+        super().setModel(model)
+        model.modelReset.connect(self.apply_spans)
+        model.rowsInserted.connect(self.apply_spans)
+        model.rowsRemoved.connect(self.apply_spans)
+        self.selectionModel().currentRowChanged.connect(self.open_row_editor)
+
+    def apply_spans(self):
+        self.clearSpans()
+        for row in self.model().get_group_rows():
+            self.setSpan(row, 0, 1, self.model().columnCount())
+
+    def open_row_editor(self, current: QModelIndex, previous: QModelIndex):
+        if self.row_editor_column is None:
+            return
+        if self._row_editor_index.isValid():
+            self.closePersistentEditor(QModelIndex(self._row_editor_index))
+        self._row_editor_index = QPersistentModelIndex()
+        if current.isValid() and self.model().item_at(current.row()) is not None:
+            index = self.model().index(current.row(), self.row_editor_column)
+            self.openPersistentEditor(index)
+            self._row_editor_index = QPersistentModelIndex(index)
+
+    def get_selected_rows(self) -> list[int]:
+        return sorted({index.row() for index in self.selectionModel().selectedIndexes()})
+
+    def get_selected_items(self) -> list[Any]:
+        return [item for row in self.get_selected_rows() if (item := self.model().item_at(row)) is not None]
+
+    def select_item(self, item: Any) -> bool:
+        if (row := self.model().row_of(item)) is None:
+            return False
+        self.selectRow(row)
+        self.scrollTo(self.model().index(row, 0))
+        return True
+
+
+class ComboBoxDelegate(QStyledItemDelegate):
+    def __init__(self, get_items: Callable[[], list[str]], parent=None):
+        super().__init__(parent)
+        self.get_items = get_items
+
+    def createEditor(self, parent, option, index):
+        combo_box = QComboBox(parent)
+        combo_box.setStyleSheet("border-radius: 0px;")
+        combo_box.wheelEvent = lambda event: event.ignore()
+        combo_box.addItems(self.get_items())
+        combo_box.activated.connect(lambda: self.commit_and_close(combo_box))
+        return combo_box
+
+    def commit_and_close(self, editor: QComboBox):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+    def setEditorData(self, editor: QComboBox, index: QModelIndex):
+        editor.setCurrentText(index.data(Qt.ItemDataRole.EditRole))
+
+    def setModelData(self, editor: QComboBox, model: InventoryTableModel, index: QModelIndex):
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor: QComboBox, option, index):
+        editor.setGeometry(option.rect)
+
+
+class NotesDelegate(QStyledItemDelegate):
+    def createEditor(self, parent, option, index):
+        editor = QPlainTextEdit(parent)
+        editor.setObjectName("notes")
+        editor.setStyleSheet("QPlainTextEdit#notes{border-radius: 0px;}")
+        return editor
+
+    def setEditorData(self, editor: QPlainTextEdit, index: QModelIndex):
+        editor.setPlainText(index.data(Qt.ItemDataRole.EditRole) or "")
+
+    def setModelData(self, editor: QPlainTextEdit, model: InventoryTableModel, index: QModelIndex):
+        model.setData(index, editor.toPlainText(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor: QPlainTextEdit, option, index):
+        editor.setGeometry(option.rect)
+
+
+class DoubleSpinBoxDelegate(QStyledItemDelegate):
+    def __init__(self, decimals: int = 3, parent=None):
+        super().__init__(parent)
+        self.decimals = decimals
+
+    def createEditor(self, parent, option, index):
+        spin_box = HumbleDoubleSpinBox(parent)
+        spin_box.setDecimals(self.decimals)
+        spin_box.setStyleSheet("border-radius: none;")
+        return spin_box
+
+    def setEditorData(self, editor: HumbleDoubleSpinBox, index: QModelIndex):
+        editor.setValue(float(index.data(Qt.ItemDataRole.EditRole)))
+
+    def setModelData(self, editor: HumbleDoubleSpinBox, model: InventoryTableModel, index: QModelIndex):
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor: HumbleDoubleSpinBox, option, index):
+        editor.setGeometry(option.rect)
+
+
+class WidgetDelegate(QStyledItemDelegate):
+    """Uses a full widget as the cell editor, the widget saves its own changes."""
+
+    def __init__(self, create_widget: Callable[[Any, QWidget], QWidget], parent=None):
+        super().__init__(parent)
+        self.create_widget = create_widget
+
+    def createEditor(self, parent, option, index):
+        widget = self.create_widget(index.model().item_at(index.row()), parent)
+        widget.setAutoFillBackground(True)
+        return widget
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex):
+        pass
+
+    def setModelData(self, editor: QWidget, model: InventoryTableModel, index: QModelIndex):
+        pass
+
+    def updateEditorGeometry(self, editor: QWidget, option, index):
+        editor.setGeometry(option.rect)
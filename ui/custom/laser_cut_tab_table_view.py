@@ -0,0 +1,124 @@
+import os
+from datetime import datetime
+
+from PyQt6.QtCore import Qt
+
+from ui.custom.inventory_table_view import InventoryTableModel, InventoryTableView, get_thumbnail, parse_number
+from ui.theme import theme_var
+from utils.inventory.category import Category
+from utils.inventory.laser_cut_part import LaserCutPart
+
+
+class LaserCutPartsTableModel(InventoryTableModel):
+    part_name_column = 0
+    price_column = 1
+    unit_quantity_column = 2
+    quantity_column = 3
+    total_cost_in_stock_column = 4
+    shelf_number_column = 5
+    modified_date_column = 6
+
+    headers = [
+        "Part Name",
+        "Price",
+        "Quantity per Unit",
+        "Quantity in Stock",
+        "Total Cost in Stock",
+        "Shelf #",
+        "Modified Date",
+    ]
+    editable_columns = [
+        part_name_column,
+        unit_quantity_column,
+        quantity_column,
+        shelf_number_column,
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.category: Category | None = None
+
+    def set_laser_cut_parts(self, category: Category, rows: list[LaserCutPart | str]):
+        self.category = category
+        self.set_rows(rows)
+
+    def get_image_path(self, laser_cut_part: LaserCutPart) -> str:
+        image_path = laser_cut_part.meta_data.image_index
+        if not image_path:
+            return ""
+        if not image_path.startswith("images/"):
+            image_path = f"images/{image_path}"
+        if not os.path.splitext(image_path)[1]:
+            image_path += ".jpeg"
+        return image_path
+
+    def item_data(self, laser_cut_part: LaserCutPart, column: int, role: Qt.ItemDataRole):
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == self.part_name_column:
+                return laser_cut_part.name
+            elif column == self.price_column:
+                return f"${laser_cut_part.prices.price:,.2f}"
+            elif column == self.unit_quantity_column:
+                return f"{laser_cut_part.get_category_quantity(self.category):,.2f}"
+            elif column == self.quantity_column:
+                return f"{laser_cut_part.inventory_data.quantity:,.2f}"
+            elif column == self.total_cost_in_stock_column:
+                return f"${(laser_cut_part.prices.price * laser_cut_part.inventory_data.quantity):,.2f}"
+            elif column == self.shelf_number_column:
+                return laser_cut_part.meta_data.shelf_number
+            elif column == self.modified_date_column:
+                return laser_cut_part.meta_data.modified_date
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == self.part_name_column:
+                return f"""
+                <b>{laser_cut_part.meta_data.geofile_name}</b><br>
+                <img src="{self.get_image_path(laser_cut_part)}" width="150"><br>
+                <p>Laser cut part is present in:<br>{laser_cut_part.print_categories()}</p>
+                """
+            elif column == self.unit_quantity_column:
+                return f"Unit quantities:\n{laser_cut_part.print_category_quantities()}"
+            elif column in (self.quantity_column, self.modified_date_column):
+                return laser_cut_part.meta_data.modified_date
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (self.part_name_column, self.modified_date_column):
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+        elif role == Qt.ItemDataRole.DecorationRole and column == self.part_name_column:
+            return get_thumbnail(self.get_image_path(laser_cut_part))
+        return None
+
+    def set_item_data(self, laser_cut_part: LaserCutPart, column: int, value: str) -> bool:
+        if column == self.part_name_column:
+            laser_cut_part.name = value
+        elif column == self.unit_quantity_column:
+            laser_cut_part.set_category_quantity(self.category, parse_number(value))
+        elif column == self.quantity_column:
+            old_quantity = laser_cut_part.inventory_data.quantity
+            laser_cut_part.inventory_data.quantity = parse_number(value)
+            if old_quantity != laser_cut_part.inventory_data.quantity:
+                laser_cut_part.meta_data.modified_date = (
+                    f"{os.getlogin().title()} - Manually set to {laser_cut_part.inventory_data.quantity} from {old_quantity} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
+                )
+        elif column == self.shelf_number_column:
+            laser_cut_part.meta_data.shelf_number = value
+        else:
+            return False
+        return True
+
+    def row_color(self, laser_cut_part: LaserCutPart) -> str | None:
+        if self.category.name == "Recut":
+            return None
+        if laser_cut_part.inventory_data.quantity <= laser_cut_part.inventory_data.red_quantity_limit:
+            return theme_var("table-red-quantity")
+        elif laser_cut_part.inventory_data.quantity <= laser_cut_part.inventory_data.yellow_quantity_limit:
+            return theme_var("table-yellow-quantity")
+        return None
+
+
+class LaserCutPartsTableView(InventoryTableView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setModel(LaserCutPartsTableModel(self))
+
+    def model(self) -> LaserCutPartsTableModel:
+        return super().model()
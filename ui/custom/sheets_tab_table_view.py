@@ -0,0 +1,176 @@
+import os
+from datetime import datetime
+from enum import Enum, auto
+from typing import Callable
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget
+
+from ui.custom.inventory_table_view import (
+    ComboBoxDelegate,
+    DoubleSpinBoxDelegate,
+    InventoryTableModel,
+    InventoryTableView,
+    NotesDelegate,
+    WidgetDelegate,
+    parse_number,
+)
+from ui.theme import theme_var
+from utils.inventory.sheet import Sheet
+from utils.inventory.sheets_inventory import SheetsInventory
+from utils.sheet_settings.sheet_settings import SheetSettings
+
+
+class AutoNumber(Enum):
+    def _generate_next_value_(name, start, count, last_values):
+        return count
+
+
+class SheetsTableColumns(AutoNumber):
+    THICKNESS = auto()
+    MATERIAL = auto()
+    LENGTH = auto()
+    WIDTH = auto()
+    COST_PER_SHEET = auto()
+    QUANTITY_IN_STOCK = auto()
+    TOTAL_COST_IN_STOCK = auto()
+    ORDERS = auto()
+    NOTES = auto()
+    VENDORS = auto()
+    MODIFIED_DATE = auto()
+
+
+class SheetsTableModel(InventoryTableModel):
+    headers = [
+        "Thickness",
+        "Material",
+        "Length",
+        "Width",
+        "Cost per Sheet",
+        "Quantity in Stock",
+        "Total Cost in Stock",
+        "Orders",
+        "Notes",
+        "Vendors",
+        "Modified Date",
+    ]
+    editable_columns = [
+        SheetsTableColumns.QUANTITY_IN_STOCK.value,
+        SheetsTableColumns.NOTES.value,
+    ]
+    edit_mode_columns = [
+        SheetsTableColumns.THICKNESS.value,
+        SheetsTableColumns.MATERIAL.value,
+        SheetsTableColumns.LENGTH.value,
+        SheetsTableColumns.WIDTH.value,
+    ]
+
+    def __init__(self, sheets_inventory: SheetsInventory, parent=None):
+        super().__init__(parent)
+        self.sheets_inventory = sheets_inventory
+        self.edit_mode = False
+
+    def set_edit_mode(self, edit_mode: bool):
+        self.edit_mode = edit_mode
+
+    def is_editable(self, sheet: Sheet, column: int) -> bool:
+        return column in self.editable_columns or (self.edit_mode and column in self.edit_mode_columns)
+
+    def item_data(self, sheet: Sheet, column: int, role: Qt.ItemDataRole):
+        if role == Qt.ItemDataRole.EditRole and column in (SheetsTableColumns.LENGTH.value, SheetsTableColumns.WIDTH.value):
+            return sheet.length if column == SheetsTableColumns.LENGTH.value else sheet.width
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == SheetsTableColumns.THICKNESS.value:
+                return sheet.thickness
+            elif column == SheetsTableColumns.MATERIAL.value:
+                return sheet.material
+            elif column == SheetsTableColumns.LENGTH.value:
+                return f"{sheet.length:,.3f}"
+            elif column == SheetsTableColumns.WIDTH.value:
+                return f"{sheet.width:,.3f}"
+            elif column == SheetsTableColumns.COST_PER_SHEET.value:
+                return f"${self.sheets_inventory.get_sheet_cost(sheet):,.2f}"
+            elif column == SheetsTableColumns.QUANTITY_IN_STOCK.value:
+                return f"{sheet.quantity:,.2f}"
+            elif column == SheetsTableColumns.TOTAL_COST_IN_STOCK.value:
+                return f"${self.sheets_inventory.get_sheet_cost(sheet) * sheet.quantity:,.2f}"
+            elif column == SheetsTableColumns.ORDERS.value:
+                return "\n".join([f"Order Pending ({int(order.quantity)}) - {order.expected_arrival_time}" for order in sheet.orders])
+            elif column == SheetsTableColumns.NOTES.value:
+                return sheet.notes
+            elif column == SheetsTableColumns.VENDORS.value:
+                return "\n".join([vendor.name for vendor in sheet.vendors])
+            elif column == SheetsTableColumns.MODIFIED_DATE.value:
+                return sheet.latest_change_quantity
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == SheetsTableColumns.ORDERS.value:
+                return "\n\n".join([str(order) for order in sheet.orders])
+            elif column == SheetsTableColumns.VENDORS.value:
+                return "\n\n".join([vendor.__str__() for vendor in sheet.vendors])
+            elif column == SheetsTableColumns.MODIFIED_DATE.value:
+                return sheet.latest_change_quantity
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (
+                SheetsTableColumns.NOTES.value,
+                SheetsTableColumns.VENDORS.value,
+                SheetsTableColumns.MODIFIED_DATE.value,
+            ):
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def set_item_data(self, sheet: Sheet, column: int, value: str | float) -> bool:
+        if column == SheetsTableColumns.THICKNESS.value:
+            sheet.thickness = value
+        elif column == SheetsTableColumns.MATERIAL.value:
+            sheet.material = value
+        elif column == SheetsTableColumns.LENGTH.value:
+            sheet.length = float(value)
+        elif column == SheetsTableColumns.WIDTH.value:
+            sheet.width = float(value)
+        elif column == SheetsTableColumns.QUANTITY_IN_STOCK.value:
+            old_quantity = sheet.quantity
+            sheet.quantity = parse_number(value)
+            if old_quantity != sheet.quantity:
+                sheet.has_sent_warning = False
+                sheet.latest_change_quantity = (
+                    f"{os.getlogin().title()} - Manually set to {sheet.quantity} from {old_quantity} quantity at {str(datetime.now().strftime('%B %d %A %Y %I:%M:%S %p'))}"
+                )
+        elif column == SheetsTableColumns.NOTES.value:
+            sheet.notes = value
+        else:
+            return False
+        return True
+
+    def row_color(self, sheet: Sheet) -> str:
+        if sheet.orders:
+            return theme_var("table-order-pending")
+        elif sheet.quantity <= sheet.red_quantity_limit:
+            return theme_var("table-red-quantity")
+        elif sheet.quantity <= sheet.yellow_quantity_limit:
+            return theme_var("table-yellow-quantity")
+        return theme_var("background")
+
+
+class SheetsTableView(InventoryTableView):
+    def __init__(
+        self,
+        sheets_inventory: SheetsInventory,
+        sheet_settings: SheetSettings,
+        create_order_widget: Callable[[Sheet, QWidget], QWidget],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.verticalHeader().setDefaultSectionSize(60)
+        self.setModel(SheetsTableModel(sheets_inventory, self))
+
+        self.setItemDelegateForColumn(SheetsTableColumns.THICKNESS.value, ComboBoxDelegate(sheet_settings.get_thicknesses, self))
+        self.setItemDelegateForColumn(SheetsTableColumns.MATERIAL.value, ComboBoxDelegate(sheet_settings.get_materials, self))
+        self.setItemDelegateForColumn(SheetsTableColumns.LENGTH.value, DoubleSpinBoxDelegate(3, self))
+        self.setItemDelegateForColumn(SheetsTableColumns.WIDTH.value, DoubleSpinBoxDelegate(3, self))
+        self.setItemDelegateForColumn(SheetsTableColumns.NOTES.value, NotesDelegate(self))
+        self.setItemDelegateForColumn(SheetsTableColumns.ORDERS.value, WidgetDelegate(create_order_widget, self))
+        self.row_editor_column = SheetsTableColumns.ORDERS.value
+
+    def model(self) -> SheetsTableModel:
+        return super().model()
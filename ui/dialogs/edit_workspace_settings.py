@@ -211,6 +211,7 @@ class FlowTagWidget(QWidget):
         self.flow_tag.tags.pop(index)
         tag = self.workspace_settings.get_tag(new_tag_name)
         self.flow_tag.tags.insert(index, tag)
+        self.flow_tag.index_version = -1  # Tags were swapped in place, not through add_tag/remove_tag
         tag_widget.tag = tag
         self.update_tag_selections()
 
@@ -342,6 +343,7 @@ class FlowTagsTableWidget(QTableWidget):
         with contextlib.suppress(KeyError):
             for flow_tag, table_item in self.table_widgets.items():
                 flow_tag.name = table_item["name"].text()
+        self.workspace_settings.update_indexes()
         self.blockSignals(False)
 
     def open_group_menu(self, menu: QMenu):
@@ -545,6 +547,7 @@ class EditWorkspaceSettings(QDialog, Ui_Form):
                 msg.exec()
                 return
             current_tag.name = new_name
+            self.workspace_settings.update_indexes()
         self.load_tags()
 
     def get_selected_tag(self) -> Tag:
@@ -161,6 +161,7 @@ class JobGeneratorDialog(QDialog, Ui_Form):
             cloned.meta_data.quantity = state.get("quantity", assembly.meta_data.quantity)
             if not self.checkBox_bring_along_subassemblies.isChecked():
                 cloned.sub_assemblies.clear()
+                cloned.invalidate_cache()
             merged_job.add_assembly(cloned)
 
         for sub in assembly.sub_assemblies:
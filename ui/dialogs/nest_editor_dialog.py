@@ -82,15 +82,7 @@ class NestEditorDialog(QDialog, Ui_Form):
         self.splitter.setStretchFactor(1, 1)
 
     def safe_copy_nests(self, nests: list[Nest]) -> list[Nest]:
-        new_nests: list[Nest] = []
-        for nest in nests:
-            new_nest = Nest(
-                nest.to_dict(),
-                self.sheet_settings,
-                self.laser_cut_inventory,
-            )
-            new_nests.append(new_nest)
-        return new_nests
+        return [nest.clone() for nest in nests]
 
     def reset(self):
         msg = QMessageBox(
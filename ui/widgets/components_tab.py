@@ -10,9 +10,8 @@ from typing import TYPE_CHECKING
 import sympy
 from natsort import natsorted
 from PyQt6.QtCore import QDate, Qt, QThreadPool, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QColor, QCursor, QFont
+from PyQt6.QtGui import QAction, QCursor, QFont
 from PyQt6.QtWidgets import (
-    QAbstractItemView,
     QApplication,
     QCompleter,
     QDateEdit,
@@ -22,19 +21,13 @@ from PyQt6.QtWidgets import (
     QMenu,
     QMessageBox,
     QPushButton,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
-from ui.custom_widgets import (
-    CustomTableWidget,
-    CustomTabWidget,
-    ExchangeRateComboBox,
-    NotesPlainTextEdit,
-    OrderStatusButton,
-    PriorityComboBox,
-)
+from ui.custom.components_tab_table_view import ComponentsTableColumns, ComponentsTableView
+from ui.custom.inventory_table_view import forget_thumbnail
+from ui.custom_widgets import CustomTabWidget, OrderStatusButton
 from ui.dialogs.add_item_dialog import AddItemDialog
 from ui.dialogs.edit_category_dialog import EditCategoryDialog
 from ui.dialogs.items_change_quantity_dialog import ItemsChangeQuantityDialog
@@ -53,6 +46,7 @@ from utils.history_file import HistoryFile
 from utils.inventory.category import Category
 from utils.inventory.component import Component
 from utils.inventory.components_inventory import ComponentsInventory
+from utils.inventory.inventory_changes import InventoryChanges
 from utils.inventory.order import Order, OrderDict
 from utils.settings import Settings
 from utils.workers.upload_files import UploadFilesWorker
@@ -63,37 +57,6 @@ if TYPE_CHECKING:
     from ui.windows.main_window import MainWindow
 
 
-class ComponentsTableWidget(CustomTableWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setShowGrid(True)
-        self.setWordWrap(True)
-        self.setSortingEnabled(False)
-        self.setTextElideMode(Qt.TextElideMode.ElideNone)
-        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-        self.set_editable_column_index([4, 9])
-        headers: list[str] = [
-            "Part Name",
-            "Part Number",
-            "Quantity per Unit",
-            "Quantity in Stock",
-            "Item Price",
-            "USD/CAD",
-            "Total Cost in Stock",
-            "Total Unit Cost",
-            "Priority",
-            "Shelf #",
-            "Notes",
-            "Vendors",
-            "Orders",
-        ]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
-
-
 class ComponentsTabWidget(CustomTabWidget):
     def __init__(self, parent: QWidget):
         super().__init__(parent)
@@ -162,11 +125,6 @@ class OrderWidget(QWidget):
             v_layout.addWidget(order_status_button)
             v_layout.addWidget(arrival_date)
             self.orders_layout.addLayout(v_layout)
-        self._parent_widget.category_tables[self._parent_widget.category].setColumnWidth(12, 400)  # Widgets don't like being resized with columns
-        self._parent_widget.update_component_row_color(
-            self._parent_widget.category_tables[self._parent_widget.category],
-            self.component,
-        )
 
     def create_order(self):
         select_date_dialog = SetComponentOrderPendingDialog(
@@ -186,6 +144,7 @@ class OrderWidget(QWidget):
             self._parent_widget.components_inventory.save_component(self.component)
             # self.parent.components_inventory.save_local_copy()
             # self.parent.sync_changes()
+            self._parent_widget.refresh_component(self.component)
             self.load_ui()
 
     def view_order_history(self):
@@ -288,14 +247,7 @@ class ComponentsTab(QWidget, Ui_Form):
 
         self.category: Category | None = None
         self.finished_loading: bool = False
-        self.category_tables: dict[Category, ComponentsTableWidget] = {}
-        self.table_components_widgets: dict[
-            Component,
-            dict[
-                str,
-                QTableWidgetItem | PriorityComboBox | ExchangeRateComboBox | NotesPlainTextEdit | OrderWidget,
-            ],
-        ] = {}
+        self.category_tables: dict[Category, ComponentsTableView] = {}
         self.margins = (15, 15, 5, 5)  # top, bottom, left, right
         self.margin_format = f"margin-top: {self.margins[0]}%; margin-bottom: {self.margins[1]}%; margin-left: {self.margins[2]}%; margin-right: {self.margins[3]}%;"
         self.last_selected_component: str = ""
@@ -340,11 +292,9 @@ class ComponentsTab(QWidget, Ui_Form):
         if new_category_name and ok:
             new_category = Category(new_category_name)
             self.components_inventory.add_category(new_category)
-            table = ComponentsTableWidget(self.tab_widget)
+            table = self.create_category_table()
             self.category_tables.update({new_category: table})
             self.tab_widget.addTab(table, new_category.name)
-            table.rowChanged.connect(self.table_changed)
-            table.cellPressed.connect(self.table_selected_changed)
             self.components_inventory.save_local_copy()
             # self.sync_changes()
             self.update_category_total_stock_costs()
@@ -390,11 +340,9 @@ class ComponentsTab(QWidget, Ui_Form):
                     new_name += " - Copy"
                 new_category = self.components_inventory.duplicate_category(self.category, new_name)
                 self.components_inventory.add_category(new_category)
-                table = ComponentsTableWidget(self.tab_widget)
+                table = self.create_category_table()
                 self.category_tables.update({new_category: table})
                 self.tab_widget.insertTab(self.tab_widget.currentIndex() + 1, table, new_category.name)
-                table.rowChanged.connect(self.table_changed)
-                table.cellPressed.connect(self.table_selected_changed)
                 self.components_inventory.save_local_copy()
                 # self.sync_changes()
                 self.update_category_total_stock_costs()
@@ -420,12 +368,22 @@ class ComponentsTab(QWidget, Ui_Form):
                 self.restore_last_selected_tab()
 
     def load_inventory_vendors(self):
-        self.block_table_signals()
-        for component in self.components_inventory.components:
-            with contextlib.suppress(KeyError):
-                self.table_components_widgets[component]["vendors"].setText("\n".join([vendor.name for vendor in component.vendors]))
-                self.table_components_widgets[component]["vendors"].setToolTip("\n\n".join([vendor.__str__() for vendor in component.vendors]))
-        self.unblock_table_signals()
+        with contextlib.suppress(KeyError):  # Table is not loaded yet
+            self.category_tables[self.category].model().refresh_columns(ComponentsTableColumns.VENDORS.value)
+
+    def create_category_table(self) -> ComponentsTableView:
+        table = ComponentsTableView(self.create_order_widget, self.tab_widget)
+        table.model().itemEdited.connect(self.table_changed)
+        table.model().editFailed.connect(self.table_edit_failed)
+        table.pressed.connect(self.table_selected_changed)
+        return table
+
+    def create_order_widget(self, component: Component, parent: QWidget) -> OrderWidget:
+        order_widget = OrderWidget(component, self)
+        order_widget.setParent(parent)
+        order_widget.orderOpened.connect(self.block_table_signals)
+        order_widget.orderClosed.connect(self.unblock_table_signals)
+        return order_widget
 
     def load_categories(self):
         self.settings_file.load_data()
@@ -444,11 +402,9 @@ class ComponentsTab(QWidget, Ui_Form):
 
         for tab in tab_order:
             if category := self.components_inventory.get_category(tab):
-                table = ComponentsTableWidget(self.tab_widget)
+                table = self.create_category_table()
                 self.category_tables.update({category: table})
                 self.tab_widget.addTab(table, category.name)
-                table.rowChanged.connect(self.table_changed)
-                table.cellPressed.connect(self.table_selected_changed)
                 table.verticalScrollBar().valueChanged.connect(self.save_scroll_position)
         self.tab_widget.currentChanged.connect(self.load_table)
         self.tab_widget.tabOrderChanged.connect(self.save_category_tabs_order)
@@ -462,219 +418,17 @@ class ComponentsTab(QWidget, Ui_Form):
             with contextlib.suppress(
                 KeyError
             ):  # This happens when the updated component is not currently loaded. The UI will be updated when they switch tabs as the data for the component is updated.
-                self.update_component_table(self.category_tables[self.category], update_component)
+                self.refresh_component(update_component)
         else:  # Meaning the component just got added
             # I don't think this will ever run. Edit: Really??
             component = Component(component_data, self.components_inventory)
             self.components_inventory.add_component(component)
-            self.add_component_to_table(
-                self.category_tables[self.category],
-                self.category_tables[self.category].rowCount(),
-                component,
-            )
-
-    def update_component_table(self, current_table: ComponentsTableWidget, component: Component):
-        self.table_components_widgets[component]["part_name"].setText(component.part_name)
-        self.table_components_widgets[component]["part_number"].setText(component.part_number)
-        self.table_components_widgets[component]["unit_quantity"].setText(f"{component.get_category_quantity(self.category):,.2f}")
-        self.table_components_widgets[component]["quantity"].setText(f"{component.quantity:,.2f}")
-        self.table_components_widgets[component]["quantity"].setToolTip(component.latest_change_quantity)
-        self.table_components_widgets[component]["price"].setText(f"${component.price:,.2f}")
-        self.table_components_widgets[component]["shelf_number"].setText(component.shelf_number)
-
-        self.table_components_widgets[component]["notes"].blockSignals(True)
-        self.table_components_widgets[component]["notes"].setPlainText(component.notes)
-        self.table_components_widgets[component]["notes"].blockSignals(False)
-
-        self.table_components_widgets[component]["vendors"].setText("\n".join([vendor.name for vendor in component.vendors]))
-        self.table_components_widgets[component]["vendors"].setToolTip("\n\n".join([vendor.__str__() for vendor in component.vendors]))
-
-        self.table_components_widgets[component]["priority"].blockSignals(True)
-        self.table_components_widgets[component]["priority"].setCurrentIndex(component.priority)
-        if self.table_components_widgets[component]["priority"].currentText() == "Medium":
-            self.table_components_widgets[component]["priority"].setStyleSheet(
-                f"""QComboBox{{background-color: {theme_var("medium-priority")}; border-radius: 0px;}} QComboBox:hover{{border-color: {theme_var("primary-yellow")}}}"""
-            )
-        elif self.table_components_widgets[component]["priority"].currentText() == "High":
-            self.table_components_widgets[component]["priority"].setStyleSheet(
-                f"""QComboBox{{background-color: {theme_var("high-priority")}; border-radius: 0px;}} QComboBox:hover{{border-color: {theme_var("primary-red")}}}"""
-            )
-        else:
-            pass
-        self.table_components_widgets[component]["priority"].blockSignals(True)
-
-        self.table_components_widgets[component]["use_exchange_rate"].blockSignals(True)
-        self.table_components_widgets[component]["use_exchange_rate"].setCurrentText("USD" if component.use_exchange_rate else "CAD")
-        self.table_components_widgets[component]["use_exchange_rate"].blockSignals(True)
-
-        self.table_components_widgets[component]["order_widget"].load_ui()
-        self.update_components_costs()
-        self.update_category_total_stock_costs()
-        self.update_component_row_color(current_table, component)
-
-    def add_component_to_table(self, current_table: ComponentsTableWidget, row_index: int, component: Component):
-        self.table_components_widgets.update({component: {}})
-        self.table_components_widgets[component].update({"row": row_index})
-
-        col_index: int = 0
-
-        current_table.insertRow(row_index)
-        current_table.setRowHeight(row_index, 60)
-
-        # PART NAME
-        table_item_part_name = QTableWidgetItem(component.part_name)
-        table_item_part_name.setFont(self.tables_font)
-        image_path = f"{component.image_path}"  # Adjust path if needed
-
-        tooltip_html = f"""
-        <b>{component.part_name}</b><br>
-        {component.part_number}<br>
-        <img src="{image_path}" width="150"><br>
-        <p>Component is present in:<br>{component.print_categories()}</p>
-        """
-
-        table_item_part_name.setToolTip(tooltip_html)
-        current_table.setItem(row_index, col_index, table_item_part_name)
-        self.table_components_widgets[component].update({"part_name": table_item_part_name})
-
-        col_index += 1
-
-        # PART NUMBER
-        table_item_part_number = QTableWidgetItem(component.part_number)
-        table_item_part_number.setFont(self.tables_font)
-        table_item_part_number.setToolTip(tooltip_html)
-        table_item_part_number.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.setItem(row_index, col_index, table_item_part_number)
-        self.table_components_widgets[component].update({"part_number": table_item_part_number})
-
-        col_index += 1
-
-        # CATEGORY QUANTITY
-        table_item_category_quantity = QTableWidgetItem(f"{component.get_category_quantity(self.category):,.2f}")
-        table_item_category_quantity.setFont(self.tables_font)
-        table_item_category_quantity.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        table_item_category_quantity.setToolTip(f"Unit quantities:\n{component.print_category_quantities()}")
-        current_table.setItem(row_index, col_index, table_item_category_quantity)
-        self.table_components_widgets[component].update({"unit_quantity": table_item_category_quantity})
-
-        col_index += 1
-
-        # ITEM QUANTITY
-        table_item_quantity = QTableWidgetItem(f"{component.quantity:,.2f}")
-        table_item_quantity.setFont(self.tables_font)
-        if not component.latest_change_quantity:
-            component.latest_change_quantity = "Nothing recorded"
-        table_item_quantity.setToolTip(component.latest_change_quantity)
-        table_item_quantity.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.setItem(row_index, col_index, table_item_quantity)
-        self.table_components_widgets[component].update({"quantity": table_item_quantity})
-
-        col_index += 1
-
-        # PRICE
-        converted_price: float = component.price * self.get_exchange_rate() if component.use_exchange_rate else component.price / self.get_exchange_rate()
-
-        table_item_price = QTableWidgetItem(f"${component.price:,.2f} {'USD' if component.use_exchange_rate else 'CAD'}")
-        table_item_price.setFont(self.tables_font)
-        table_item_price.setToolTip(f"${converted_price:,.2f} {'CAD' if component.use_exchange_rate else 'USD'}\n{component.latest_change_price}")
-        table_item_price.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.setItem(
-            row_index,
-            col_index,
-            table_item_price,
-        )
-        self.table_components_widgets[component].update({"price": table_item_price})
-
-        col_index += 1
-
-        # EXCHANGE RATE
-        combo_exchange_rate = ExchangeRateComboBox(
-            parent=self,
-            selected_item="USD" if component.use_exchange_rate else "CAD",
-        )
-        combo_exchange_rate.currentIndexChanged.connect(partial(self.table_changed, row_index))
-        combo_exchange_rate.setStyleSheet("border-radius: 0px;")
-        # layout.addWidget(combo_exchange_rate)
-        current_table.setCellWidget(row_index, col_index, combo_exchange_rate)
-        self.table_components_widgets[component].update({"use_exchange_rate": combo_exchange_rate})
-
-        col_index += 1
-
-        # TOTAL COST
-        table_item_total_cost_in_stock = QTableWidgetItem(f"${component.get_total_cost_in_stock():,.2f} {combo_exchange_rate.currentText()}")
-        table_item_total_cost_in_stock.setFont(self.tables_font)
-        table_item_total_cost_in_stock.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.setItem(
-            row_index,
-            col_index,
-            table_item_total_cost_in_stock,
-        )
-        self.table_components_widgets[component].update({"total_cost_in_stock": table_item_total_cost_in_stock})
-
-        col_index += 1
-
-        # TOTAL UNIT COST
-        table_item_total_unit_cost = QTableWidgetItem(f"${component.get_total_unit_cost(self.category):,.2f} {combo_exchange_rate.currentText()}")
-        table_item_total_unit_cost.setFont(self.tables_font)
-        table_item_total_unit_cost.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.setItem(
-            row_index,
-            col_index,
-            table_item_total_unit_cost,
-        )
-        self.table_components_widgets[component].update({"total_unit_cost": table_item_total_unit_cost})
-
-        col_index += 1
-
-        # PRIORITY
-        combo_priority = PriorityComboBox(self, component.priority)
-        combo_priority.setStyleSheet("border-radius: 0px;")
-        if combo_priority.currentText() == "Medium":
-            combo_priority.setStyleSheet(
-                f"""QComboBox{{background-color: {theme_var("medium-priority")}; border-radius: 0px;}} QComboBox:hover{{border-color: {theme_var("primary-yellow")}}}"""
-            )
-        elif combo_priority.currentText() == "High":
-            combo_priority.setStyleSheet(
-                f"""QComboBox{{background-color: {theme_var("high-priority")}; border-radius: 0px;}} QComboBox:hover{{border-color: {theme_var("primary-red")}}}"""
-            )
-        combo_priority.currentIndexChanged.connect(partial(self.table_changed, row_index))
-        current_table.setCellWidget(row_index, col_index, combo_priority)
-        self.table_components_widgets[component].update({"priority": combo_priority})
-
-        col_index += 1
-
-        # SHELF NUMBER
-        table_item_shelf_number = QTableWidgetItem(component.shelf_number)
-        table_item_shelf_number.setFont(self.tables_font)
-        table_item_shelf_number.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.setItem(row_index, col_index, table_item_shelf_number)
-        self.table_components_widgets[component].update({"shelf_number": table_item_shelf_number})
-
-        col_index += 1
-
-        # NOTES
-        text_notes = NotesPlainTextEdit(self, component.notes, "")
-        text_notes.textChanged.connect(partial(self.table_changed, row_index))
-        current_table.setCellWidget(row_index, col_index, text_notes)
-        self.table_components_widgets[component].update({"notes": text_notes})
-
-        col_index += 1
-
-        vendors_list = QTableWidgetItem("\n".join([vendor.name for vendor in component.vendors]))
-        vendors_list.setToolTip("\n\n".join([vendor.__str__() for vendor in component.vendors]))
-        current_table.setItem(row_index, col_index, vendors_list)
-        self.table_components_widgets[component].update({"vendors": vendors_list})
-
-        col_index += 1
-
-        # ORDER WIDGET
-        order_widget = OrderWidget(component, self)
-        order_widget.orderOpened.connect(self.block_table_signals)
-        order_widget.orderClosed.connect(self.unblock_table_signals)
-        current_table.setCellWidget(row_index, col_index, order_widget)
-        self.table_components_widgets[component].update({"order_widget": order_widget})
+            self.load_table()
 
-        self.update_component_row_color(current_table, component)
+    def refresh_component(self, component: Component):
+        if self.category_tables[self.category].model().refresh_item(component):
+            self.update_components_costs()
+            self.update_category_total_stock_costs()
 
     def load_table(self):
         if category := self.components_inventory.get_category(self.tab_widget.tabText(self.tab_widget.currentIndex())):
@@ -693,23 +447,12 @@ class ComponentsTab(QWidget, Ui_Form):
         if not current_table:
             return
 
-        current_table.blockSignals(True)
-        current_table.clearContents()
-        current_table.setRowCount(0)
-        self.table_components_widgets.clear()
-        row_index = 0
-        for component in self.components_inventory.components:
-            if self.category not in component.categories:
-                continue
-            self.add_component_to_table(current_table, row_index, component)
-
-            row_index += 1
-
-        current_table.blockSignals(False)
+        current_table.model().set_components(self.category, self.components_inventory.get_components_by_category(self.category))
 
         def table_loaded():
             current_table.resizeColumnsToContents()
-            current_table.setColumnWidth(0, 250)
+            current_table.setColumnWidth(ComponentsTableColumns.PART_NAME.value, 250)
+            current_table.setColumnWidth(ComponentsTableColumns.ORDERS.value, 400)  # Order widgets are only opened on the current row
 
         QTimer.singleShot(100, table_loaded)
 
@@ -724,6 +467,20 @@ class ComponentsTab(QWidget, Ui_Form):
         self.save_category_tabs_order()
         self.restore_scroll_position()
 
+    def apply_inventory_changes(self, changes: InventoryChanges) -> bool:
+        """Patches the current table in place, returns False when the tabs have to be rebuilt instead."""
+        if self.category not in self.category_tables or set(self.category_tables) != set(self.components_inventory.get_categories()):
+            return False
+        self.sort_component_inventory()
+        current_table = self.category_tables[self.category]
+        current_table.model().patch_rows(self.components_inventory.get_components_by_category(self.category), changes.updated)
+        if changes.inserted or changes.deleted:
+            self.update_edit_inventory_list_widget()
+            self.update_search_suggestions()
+        self.update_category_total_stock_costs()
+        self.update_components_costs()
+        return True
+
     def add_to_active_purchase_order(self):
         if selected_components := self.get_selected_components():
             self._parent_widget.add_components_to_purchase_order(selected_components)
@@ -751,8 +508,7 @@ class ComponentsTab(QWidget, Ui_Form):
                 for item in selected_items:
                     if vendor := self._parent_widget.purchase_order_manager.get_vendor_by_name(item):
                         component.vendors.append(vendor)
-                self.table_components_widgets[component]["vendors"].setText("\n".join([vendor.name for vendor in component.vendors]))
-                self.table_components_widgets[component]["vendors"].setToolTip("\n\n".join([vendor.__str__() for vendor in component.vendors]))
+            self.category_tables[self.category].model().refresh_columns(ComponentsTableColumns.VENDORS.value)
 
         self.components_inventory.save_components(selected_components)
 
@@ -799,101 +555,16 @@ class ComponentsTab(QWidget, Ui_Form):
             self.last_selected_component = component.name
             self.last_selected_index = self.get_selected_row()
 
-    def table_changed(self, row: int):
-        component = next(
-            (component for component, table_data in self.table_components_widgets.items() if table_data["row"] == row),
-            None,
-        )
-        if not component:
-            return
-        component.part_name = self.table_components_widgets[component]["part_name"].text()
-        component.part_number = self.table_components_widgets[component]["part_number"].text()
-        try:
-            new_unit_quantity = float(
-                sympy.sympify(
-                    self.table_components_widgets[component]["unit_quantity"].text().strip().replace(",", ""),
-                    evaluate=True,
-                )
-            )
-        except sympy.SympifyError:
-            self.set_table_row_color(
-                self.category_tables[self.category],
-                self.table_components_widgets[component]["row"],
-                theme_var("on-error"),
-            )
-            self._parent_widget.status_button.setText(f"Invalid number for {component.name} unit quantity", "red")
-            return
-        try:
-            table_quantity = float(
-                sympy.sympify(
-                    self.table_components_widgets[component]["quantity"].text().strip().replace(",", ""),
-                    evaluate=True,
-                )
-            )
-        except sympy.SympifyError:
-            self.set_table_row_color(
-                self.category_tables[self.category],
-                self.table_components_widgets[component]["row"],
-                theme_var("on-error"),
-            )
-            self._parent_widget.status_button.setText(f"Invalid number for {component.name} quantity", "red")
-            return
-
-        try:
-            new_price = float(
-                sympy.sympify(
-                    self.table_components_widgets[component]["price"].text().replace("USD", "").replace("CAD", "").strip().replace(",", "").replace("$", ""),
-                    evaluate=True,
-                )
-            )
-        except sympy.SympifyError:
-            self.set_table_row_color(
-                self.category_tables[self.category],
-                self.table_components_widgets[component]["row"],
-                theme_var("on-error"),
-            )
-            self._parent_widget.status_button.setText(f"Invalid number for {component.name} price", "red")
-            return
-
-        if component.quantity != table_quantity:
-            component.latest_change_quantity = (
-                f"{os.getlogin().title()} manually set to {table_quantity} from {component.quantity} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
-            )
-        component.price = new_price
-        component.set_category_quantity(self.category, new_unit_quantity)
-        component.quantity = table_quantity
-        component.use_exchange_rate = self.table_components_widgets[component]["use_exchange_rate"].currentText() == "USD"
-        component.priority = self.table_components_widgets[component]["priority"].currentIndex()
-
-        if self.table_components_widgets[component]["priority"].currentText() == "Medium":
-            self.table_components_widgets[component]["priority"].setStyleSheet(
-                f"""QComboBox{{background-color: {theme_var("medium-priority")}; border-radius: 0px;}} QComboBox:hover{{border-color: {theme_var("primary-yellow")}}}"""
-            )
-        elif self.table_components_widgets[component]["priority"].currentText() == "High":
-            self.table_components_widgets[component]["priority"].setStyleSheet(
-                f"""QComboBox{{background-color: {theme_var("high-priority")}; border-radius: 0px;}} QComboBox:hover{{border-color: {theme_var("primary-red")}}}"""
-            )
-        else:
-            self.table_components_widgets[component]["priority"].setStyleSheet("border-radius: 0px;")
-
-        component.shelf_number = self.table_components_widgets[component]["shelf_number"].text()
-        component.notes = self.table_components_widgets[component]["notes"].toPlainText()
+    def table_changed(self, component: Component):
         # self.components_inventory.save_local_copy()
         # self.sync_changes()
         self.components_inventory.save_component(component)
-        self.category_tables[self.category].blockSignals(True)
-        self.table_components_widgets[component]["unit_quantity"].setText(f"{component.get_category_quantity(self.category):,.2f}")
-        self.table_components_widgets[component]["unit_quantity"].setToolTip(f"Unit quantities:\n{component.print_category_quantities()}")
-        self.table_components_widgets[component]["quantity"].setText(f"{component.quantity:,.2f}")
-        self.table_components_widgets[component]["quantity"].setToolTip(component.latest_change_quantity)
-        self.table_components_widgets[component]["price"].setText(f"${component.price:,.2f}")
-        self.category_tables[self.category].blockSignals(False)
-
-        self.update_component_row_color(self.category_tables[self.category], component)
-
         self.update_components_costs()
         self.update_category_total_stock_costs()
 
+    def table_edit_failed(self, component: Component, column_name: str):
+        self._parent_widget.status_button.setText(f"Invalid number for {component.name} {column_name.lower()}", "red")
+
     def load_context_menu(self):
         current_table = self.category_tables[self.category]
         try:
@@ -1090,12 +761,8 @@ class ComponentsTab(QWidget, Ui_Form):
                     continue
                 components_to_save.append(component)
                 component.add_to_category(new_category)
+                self.category_tables[self.category].model().refresh_item(component)
             self.components_inventory.save_components(components_to_save)
-            self.category_tables[self.category].blockSignals(True)
-            self.table_components_widgets[component]["unit_quantity"].setToolTip(f"Unit quantities:\n{component.print_category_quantities()}")
-            self.table_components_widgets[component]["part_name"].setToolTip(f"{component.part_name}\n\nComponent is present in:\n{component.print_categories()}")
-            self.table_components_widgets[component]["part_number"].setToolTip(f"{component.part_number}\n\nComponent is present in:\n{component.print_categories()}")
-            self.category_tables[self.category].blockSignals(False)
             # self.components_inventory.save_local_copy()
             # self.sync_changes()
 
@@ -1254,19 +921,8 @@ class ComponentsTab(QWidget, Ui_Form):
             # self.load_table()
 
     def update_components_costs(self):
-        self.category_tables[self.category].blockSignals(True)
-        total_cost_in_stock = 0.0
-        total_unit_cost = 0.0
-        for component, table_item in self.table_components_widgets.items():
-            converted_price = component.price * self.get_exchange_rate() if component.use_exchange_rate else component.price / self.get_exchange_rate()
-            table_item["price"].setText(f"${component.price:,.2f} {'USD' if component.use_exchange_rate else 'CAD'}")
-            table_item["price"].setToolTip(f"${converted_price:,.2f} {'CAD' if component.use_exchange_rate else 'USD'}\n{component.latest_change_price}")
-            table_item["total_cost_in_stock"].setText(f"${component.get_total_cost_in_stock():,.2f} {'USD' if component.use_exchange_rate else 'CAD'}")
-            total_cost_in_stock += component.get_total_cost_in_stock()
-            table_item["total_unit_cost"].setText(f"${component.get_total_unit_cost(self.category):,.2f} {'USD' if component.use_exchange_rate else 'CAD'}")
-            total_unit_cost += component.get_total_unit_cost(self.category)
-        self.category_tables[self.category].blockSignals(False)
-        self.label_total_unit_cost.setText(f"Total Unit Cost: ${total_unit_cost:,.2f}")
+        self.category_tables[self.category].model().refresh_columns(ComponentsTableColumns.ITEM_PRICE.value, ComponentsTableColumns.TOTAL_UNIT_COST.value)
+        self.label_total_unit_cost.setText(f"Total Unit Cost: ${self.components_inventory.get_total_category_unit_cost(self.category):,.2f}")
 
     def update_category_total_stock_costs(self):
         total_stock_costs = {category.name: self.components_inventory.get_total_category_cost_in_stock(category) for category in self.components_inventory.get_categories()}
@@ -1301,7 +957,6 @@ class ComponentsTab(QWidget, Ui_Form):
         self.gridLayout_category_stock_costs.addWidget(lbl, i + 1, 1)
 
     def set_image(self):
-        current_table = self.category_tables[self.category]
         if component := self.get_selected_component():
             clipboard = QApplication.clipboard()
             image = clipboard.image()
@@ -1309,15 +964,8 @@ class ComponentsTab(QWidget, Ui_Form):
                 temp_path = f"images/{component.part_number.encode('utf-8')}.png"
                 image.save(temp_path)
                 self.upload_component_image(component, temp_path, False)
-
-                tooltip_html = f"""
-                <b>{component.part_name}</b><br>
-                {component.part_number}<br>
-                <img src="{component.image_path}" width="150"><br>
-                <p>Component is present in:<br>{component.print_categories()}</p>
-                """
-                self.table_components_widgets[component]["part_name"].setToolTip(tooltip_html)
-                self.table_components_widgets[component]["part_number"].setToolTip(tooltip_html)
+                forget_thumbnail(component.image_path)
+                self.category_tables[self.category].model().refresh_item(component)
 
     def upload_component_image(self, component: Component, path_to_image: str, save_image: bool = True):
         file_name = os.path.basename(path_to_image)
@@ -1378,7 +1026,7 @@ class ComponentsTab(QWidget, Ui_Form):
                 for component in components:
                     component.red_quantity_limit = set_custom_limit_dialog.get_red_limit()
                     component.yellow_quantity_limit = set_custom_limit_dialog.get_yellow_limit()
-                    self.update_component_row_color(current_table, component)
+                    current_table.model().refresh_item(component)
                 self.components_inventory.save_components(components)
                 # self.components_inventory.save_local_copy()
                 # self.sync_changes()
@@ -1392,18 +1040,15 @@ class ComponentsTab(QWidget, Ui_Form):
             option = dialog.get_option()
             history_file = HistoryFile()
             if option == "Category":
-                self.category_tables[self.category].blockSignals(True)
-                for component, tables_item in self.table_components_widgets.items():
+                for component in self.category_tables[self.category].model().get_items():
                     if add_or_remove == "ADD":
                         component.latest_change_quantity = f"{os.getlogin().title()} Used: All Items in Category - add quantity\nChanged from {component.quantity} to {component.quantity + (component.get_category_quantity(self.category) * multiplier)} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
                         component.quantity = component.quantity + (multiplier * component.get_category_quantity(self.category))
                     elif add_or_remove == "REMOVE":
                         component.latest_change_quantity = f"{os.getlogin().title()} Used: All Items in Category - remove quantity\nChanged from {component.quantity} to {component.quantity - (component.get_category_quantity(self.category) * multiplier)} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
                         component.quantity = component.quantity - (multiplier * component.get_category_quantity(self.category))
-                    tables_item["quantity"].setText(str(component.quantity))
-                    tables_item["quantity"].setToolTip(component.latest_change_quantity)
                     components_to_save.append(component)
-                self.category_tables[self.category].blockSignals(False)
+                self.category_tables[self.category].model().refresh_all()
                 history_file.add_new_to_category(
                     date=datetime.now().strftime("%B %d %A %Y %I:%M:%S %p"),
                     description=f"{'Added' if add_or_remove == 'ADD' else 'Removed'} a multiple of {multiplier} {'quantity' if multiplier == 1 else 'quantities'} from each item in {self.category.name}",
@@ -1414,7 +1059,6 @@ class ComponentsTab(QWidget, Ui_Form):
                 self.update_components_costs()
                 self.select_last_selected_item()
             elif option == "Item":
-                self.category_tables[self.category].blockSignals(True)
                 for component in selected_components:
                     if add_or_remove == "ADD":
                         component.latest_change_quantity = f"{os.getlogin().title()} Used: Selected Item - add quantity\nChanged from {component.quantity} to {component.quantity + multiplier} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
@@ -1427,9 +1071,6 @@ class ComponentsTab(QWidget, Ui_Form):
                         description=f'{"Added" if add_or_remove == "ADD" else "Removed"} {multiplier} {"quantity" if multiplier == 1 else "quantities"} from "{component.part_name}"',
                     )
                     components_to_save.append(component)
-                    self.table_components_widgets[component]["quantity"].setText(str(component.quantity))
-                    self.table_components_widgets[component]["quantity"].setToolTip(component.latest_change_quantity)
-                self.category_tables[self.category].blockSignals(False)
                 self.components_inventory.save_components(components_to_save)
                 # self.components_inventory.save_local_copy()
                 # self.sync_changes()
@@ -1439,10 +1080,9 @@ class ComponentsTab(QWidget, Ui_Form):
     def listWidget_item_changed(self):
         current_table = self.category_tables[self.category]
         selected_item = self.listWidget_itemnames.currentItem().text()
-        for component, table_items in self.table_components_widgets.items():
+        for component in current_table.model().get_items():
             if component.part_name == selected_item or component.part_number == selected_item:
-                current_table.selectRow(table_items["row"])
-                current_table.scrollTo(current_table.model().index(table_items["row"], 0))
+                current_table.select_item(component)
 
     def update_search_suggestions(self):
         current_tab_components = self.components_inventory.get_components_by_category(self.category)
@@ -1479,35 +1119,29 @@ class ComponentsTab(QWidget, Ui_Form):
 
     def select_last_selected_item(self):
         current_table = self.category_tables[self.category]
-        for component, table_items in self.table_components_widgets.items():
+        for component in current_table.model().get_items():
             if component.name == self.last_selected_component:
-                current_table.selectRow(table_items["row"])
-                current_table.scrollTo(current_table.model().index(table_items["row"], 0))
+                current_table.select_item(component)
 
     def get_exchange_rate(self) -> float:
         return self.settings_file.get_value(setting_name="exchange_rate")
 
     def get_selected_components(self) -> list[Component]:
-        selected_components: list[Component] = []
-        selected_rows = self.get_selected_rows()
-        selected_components.extend(component for component, table_items in self.table_components_widgets.items() if table_items["row"] in selected_rows)
-        return selected_components
+        return self.category_tables[self.category].get_selected_items()
 
     def get_selected_component(self) -> Component | None:
         selected_row = self.get_selected_row()
-        for component, table_items in self.table_components_widgets.items():
-            if table_items["row"] == selected_row:
-                self.last_selected_index = selected_row
-                self.last_selected_component = component.name
-                return component
+        if selected_row is not None and (component := self.category_tables[self.category].model().item_at(selected_row)):
+            self.last_selected_index = selected_row
+            self.last_selected_component = component.name
+            return component
 
     def get_selected_rows(self) -> list[int]:
-        rows: set[int] = {item.row() for item in self.category_tables[self.category].selectedItems()}
-        return list(rows)
+        return self.category_tables[self.category].get_selected_rows()
 
     def get_selected_row(self) -> int:
         with contextlib.suppress(IndexError):
-            return self.category_tables[self.category].selectedItems()[0].row()
+            return self.get_selected_rows()[0]
 
     def print_selected_items(self):
         headers = [
@@ -1553,40 +1187,6 @@ class ComponentsTab(QWidget, Ui_Form):
                 f.write(html)
             self._parent_widget.open_print_selected_parts()
 
-    def update_component_row_color(self, table, component: Component):
-        if component.orders:
-            self.set_table_row_color(
-                table,
-                self.table_components_widgets[component]["row"],
-                f"{theme_var('table-order-pending')}",
-            )
-        elif component.quantity <= component.red_quantity_limit:
-            self.set_table_row_color(
-                table,
-                self.table_components_widgets[component]["row"],
-                f"{theme_var('table-red-quantity')}",
-            )
-        elif component.quantity <= component.yellow_quantity_limit:
-            self.set_table_row_color(
-                table,
-                self.table_components_widgets[component]["row"],
-                f"{theme_var('table-yellow-quantity')}",
-            )
-        else:
-            self.set_table_row_color(
-                table,
-                self.table_components_widgets[component]["row"],
-                f"{theme_var('background')}",
-            )
-
-    def set_table_row_color(self, table: ComponentsTableWidget, row_index: int, color: str):
-        for j in range(table.columnCount()):
-            item = table.item(row_index, j)
-            if not item:
-                item = QTableWidgetItem()
-                table.setItem(row_index, j, item)
-            item.setBackground(QColor(color))
-
     def sort_component_inventory(self):
         self.settings_file.load_data()
         if self.settings_file.get_value(setting_name="sort_alphabetical"):
@@ -4,12 +4,10 @@ from datetime import datetime
 from functools import partial
 from typing import TYPE_CHECKING, Literal
 
-import sympy
 from natsort import natsorted
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction, QColor, QCursor, QFont
+from PyQt6.QtGui import QAction, QCursor, QFont
 from PyQt6.QtWidgets import (
-    QAbstractItemView,
     QCheckBox,
     QComboBox,
     QCompleter,
@@ -24,20 +22,20 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QScrollArea,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
-from ui.custom_widgets import CustomTableWidget, CustomTabWidget, FilterButton
+from ui.custom.laser_cut_tab_table_view import LaserCutPartsTableView
+from ui.custom_widgets import CustomTabWidget, FilterButton
 from ui.dialogs.edit_category_dialog import EditCategoryDialog
 from ui.dialogs.items_change_quantity_dialog import ItemsChangeQuantityDialog
 from ui.dialogs.set_custom_limit_dialog import SetCustomLimitDialog
 from ui.dialogs.view_item_history_dialog import ViewItemHistoryDialog
 from ui.icons import Icons
-from ui.theme import theme_var
 from ui.widgets.laser_cut_tab_UI import Ui_Form
 from utils.inventory.category import Category
+from utils.inventory.inventory_changes import InventoryChanges
 from utils.inventory.laser_cut_inventory import LaserCutInventory
 from utils.inventory.laser_cut_part import LaserCutPart
 from utils.settings import Settings
@@ -121,50 +119,6 @@ class EditLaserCutPart(QDialog):
         return self.laser_cut_part_data
 
 
-class LaserCutPartsTableWidget(CustomTableWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._parent_widget: "LaserCutPartsTabWidget" = parent
-        self.setShowGrid(True)
-        self.setSortingEnabled(False)
-        self.setTextElideMode(Qt.TextElideMode.ElideNone)
-        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-
-        self.part_name_column = 0
-        self.price_column = 1
-        self.unit_quantity_column = 2
-        self.quantity_column = 3
-        self.total_cost_in_stock_column = 4
-        # self.paint_column = 5
-        # self.paint_settings_column = 6
-        self.shelf_number_column = 5
-        self.modified_date_column = 6
-
-        self.set_editable_column_index(
-            [
-                self.part_name_column,
-                self.unit_quantity_column,
-                self.quantity_column,
-                self.shelf_number_column,
-                self.modified_date_column,
-            ]
-        )
-        headers: dict[str, int] = {
-            "Part Name": self.part_name_column,
-            "Price": self.price_column,
-            "Quantity per Unit": self.unit_quantity_column,
-            "Quantity in Stock": self.quantity_column,
-            "Total Cost in Stock": self.total_cost_in_stock_column,
-            "Shelf #": self.shelf_number_column,
-            "Modified Date": self.modified_date_column,
-        }
-        self.setColumnCount(len(list(headers.keys())))
-        self.setHorizontalHeaderLabels(headers)
-
-
 class LaserCutPartsTabWidget(CustomTabWidget):
     def __init__(self, parent: QWidget):
         super().__init__(parent)
@@ -172,9 +126,9 @@ class LaserCutPartsTabWidget(CustomTabWidget):
 
 
 class PaintSettingsWidget(QWidget):
-    def __init__(self, laser_cut_part: LaserCutPart, parent: LaserCutPartsTableWidget):
+    def __init__(self, laser_cut_part: LaserCutPart, parent: LaserCutPartsTableView):
         super().__init__(parent)
-        self._parent_widget: LaserCutPartsTableWidget = parent
+        self._parent_widget: LaserCutPartsTableView = parent
         self.signals_blocked = False
         self.laser_cut_part = laser_cut_part
         self.paint_inventory = self.laser_cut_part.paint_inventory
@@ -269,10 +223,10 @@ class PaintWidget(QWidget):
         self,
         laser_cut_part: LaserCutPart,
         paint_settings_widget: PaintSettingsWidget,
-        parent: LaserCutPartsTableWidget,
+        parent: LaserCutPartsTableView,
     ):
         super().__init__(parent)
-        self._parent_widget: LaserCutPartsTableWidget = parent
+        self._parent_widget: LaserCutPartsTableView = parent
 
         self.signals_blocked = False
         self.laser_cut_part = laser_cut_part
@@ -372,11 +326,7 @@ class LaserCutTab(QWidget, Ui_Form):
 
         self.category: Category = None
         self.finished_loading: bool = False
-        self.category_tables: dict[Category, LaserCutPartsTableWidget] = {}
-        self.table_laser_cut_parts_widgets: dict[
-            LaserCutPart,
-            dict[str, QTableWidgetItem | PaintWidget | PaintSettingsWidget],
-        ] = {}
+        self.category_tables: dict[Category, LaserCutPartsTableView] = {}
         self.laser_cut_parts_filter: dict[str, list[FilterButton]] = {}
 
         self.last_selected_laser_cut_part: str = ""
@@ -457,11 +407,9 @@ class LaserCutTab(QWidget, Ui_Form):
         if new_category_name and ok:
             new_category = Category(new_category_name)
             self.laser_cut_parts_inventory.add_category(new_category)
-            table = LaserCutPartsTableWidget(self.tab_widget)
+            table = self.create_category_table()
             self.category_tables.update({new_category: table})
             self.tab_widget.addTab(table, new_category.name)
-            table.rowChanged.connect(self.table_changed)
-            table.cellPressed.connect(self.table_selected_changed)
             # self.laser_cut_parts_inventory.save_local_copy()
             # self.sync_changes()
             self.load_categories()
@@ -514,11 +462,9 @@ class LaserCutTab(QWidget, Ui_Form):
                     new_name += " - Copy"
                 new_category = self.laser_cut_parts_inventory.duplicate_category(self.category, new_name)
                 self.laser_cut_parts_inventory.add_category(new_category)
-                table = LaserCutPartsTableWidget(self.tab_widget)
+                table = self.create_category_table()
                 self.category_tables.update({new_category: table})
                 self.tab_widget.insertTab(self.tab_widget.currentIndex() + 1, table, new_category.name)
-                table.rowChanged.connect(self.table_changed)
-                table.cellPressed.connect(self.table_selected_changed)
                 # self.laser_cut_parts_inventory.save_local_copy()
                 # self.sync_changes()
                 self.load_categories()
@@ -540,6 +486,13 @@ class LaserCutTab(QWidget, Ui_Form):
                 self.load_categories()
                 self.restore_last_selected_tab()
 
+    def create_category_table(self) -> LaserCutPartsTableView:
+        table = LaserCutPartsTableView(self.tab_widget)
+        table.model().itemEdited.connect(self.table_changed)
+        table.model().editFailed.connect(self.table_edit_failed)
+        table.pressed.connect(self.table_selected_changed)
+        return table
+
     def load_categories(self):
         self.settings_file.load_data()
         self.tab_widget.clear()
@@ -557,11 +510,9 @@ class LaserCutTab(QWidget, Ui_Form):
 
         for tab in tab_order:
             if category := self.laser_cut_parts_inventory.get_category(tab):
-                table = LaserCutPartsTableWidget(self.tab_widget)
+                table = self.create_category_table()
                 self.category_tables.update({category: table})
                 self.tab_widget.addTab(table, category.name)
-                table.rowChanged.connect(self.table_changed)
-                table.cellPressed.connect(self.table_selected_changed)
                 table.verticalScrollBar().valueChanged.connect(self.save_scroll_position)
         self.tab_widget.currentChanged.connect(self.load_table)
         self.tab_widget.tabOrderChanged.connect(self.save_category_tabs_order)
@@ -577,151 +528,13 @@ class LaserCutTab(QWidget, Ui_Form):
             with contextlib.suppress(
                 KeyError
             ):  # This happens when the updated laser_cut_part is not currently loaded. The UI will be updated when they switch tabs as the data for the laser_cut_part is updated.
-                self.update_laser_cut_part_table(self.category_tables[self.category], update_laser_cut_part)
+                if self.category_tables[self.category].model().refresh_item(update_laser_cut_part):
+                    self.update_category_total_stock_costs()
         else:  # Meaning the laser_cut_part just got added
             # I don't think this will ever run.
             laser_cut_part = LaserCutPart(laser_cut_part_data, self.laser_cut_parts_inventory)
             self.laser_cut_parts_inventory.add_laser_cut_part(laser_cut_part)
-            self.add_laser_cut_part_to_table(
-                self.category_tables[self.category],
-                self.category_tables[self.category].rowCount(),
-                laser_cut_part,
-            )
-
-    def update_laser_cut_part_table(self, current_table: LaserCutPartsTableWidget, laser_cut_part: LaserCutPart):
-        self.table_laser_cut_parts_widgets[laser_cut_part]["name"].setText(laser_cut_part.name)
-        self.table_laser_cut_parts_widgets[laser_cut_part]["price"].setText(f"${laser_cut_part.prices.price:,.2f}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["unit_quantity"].setText(f"{laser_cut_part.get_category_quantity(self.category):,.2f}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["unit_quantity"].setToolTip(f"Unit quantities:\n{laser_cut_part.print_category_quantities()}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["quantity"].setText(f"{laser_cut_part.inventory_data.quantity:,.2f}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["total_cost"].setText(f"${(laser_cut_part.prices.price * laser_cut_part.inventory_data.quantity):,.2f}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["shelf_number"].setText(laser_cut_part.meta_data.shelf_number)
-        self.table_laser_cut_parts_widgets[laser_cut_part]["modified_date"].setText(laser_cut_part.meta_data.modified_date)
-
-        # self.table_laser_cut_parts_widgets[laser_cut_part]["paint_widget"].block_signals(True)
-        # self.table_laser_cut_parts_widgets[laser_cut_part]["paint_widget"].update_widgets()
-        # self.table_laser_cut_parts_widgets[laser_cut_part]["paint_widget"].block_signals(False)
-
-        # self.table_laser_cut_parts_widgets[laser_cut_part]["paint_settings_widget"].block_signals(True)
-        # self.table_laser_cut_parts_widgets[laser_cut_part]["paint_settings_widget"].update_widgets()
-        # self.table_laser_cut_parts_widgets[laser_cut_part]["paint_settings_widget"].block_signals(False)
-
-        # self.update_all_laser_cut_parts_costs()
-        self.update_category_total_stock_costs()
-        self.update_laser_cut_part_row_color(current_table, laser_cut_part)
-
-    def add_laser_cut_part_to_table(
-        self,
-        current_table: LaserCutPartsTableWidget,
-        row_index: int,
-        laser_cut_part: LaserCutPart,
-    ):
-        current_table.insertRow(row_index)
-        # current_table.setRowHeight(row_index, 80)
-
-        self.table_laser_cut_parts_widgets.update({laser_cut_part: {}})
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"row": row_index})
-
-        table_item_name = QTableWidgetItem(laser_cut_part.name)
-        table_item_name.setFont(self.tables_font)
-        image_path = f"images/{laser_cut_part.meta_data.image_index}"
-        tooltip_html = f"""
-        <b>{laser_cut_part.meta_data.geofile_name}</b><br>
-        <img src="{image_path}" width="150"><br>
-        <p>Laser cut part is present in:<br>{laser_cut_part.print_categories()}</p>
-        """
-
-        table_item_name.setToolTip(tooltip_html)
-        current_table.setItem(row_index, current_table.part_name_column, table_item_name)
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"name": table_item_name})
-
-        # PRICE
-        table_item_price = QTableWidgetItem(f"${laser_cut_part.prices.price:,.2f}")
-        table_item_price.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        table_item_price.setFont(self.tables_font)
-        current_table.setItem(row_index, current_table.price_column, table_item_price)
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"price": table_item_price})
-
-        # CATEGORY QUANTITY
-        table_item_category_quantity = QTableWidgetItem(f"{laser_cut_part.get_category_quantity(self.category):,.2f}")
-        table_item_category_quantity.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        table_item_category_quantity.setFont(self.tables_font)
-        table_item_category_quantity.setToolTip(f"Unit quantities:\n{laser_cut_part.print_category_quantities()}")
-        current_table.setItem(
-            row_index,
-            current_table.unit_quantity_column,
-            table_item_category_quantity,
-        )
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"unit_quantity": table_item_category_quantity})
-
-        # QUANTITY
-        table_item_quantity = QTableWidgetItem(f"{laser_cut_part.inventory_data.quantity:,.2f}")
-        table_item_quantity.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        table_item_quantity.setFont(self.tables_font)
-        current_table.setItem(row_index, current_table.quantity_column, table_item_quantity)
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"quantity": table_item_quantity})
-
-        # TOTAL COST
-        table_item_total_cost = QTableWidgetItem(f"${(laser_cut_part.prices.price * laser_cut_part.inventory_data.quantity):,.2f}")
-        table_item_total_cost.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        table_item_total_cost.setFont(self.tables_font)
-        current_table.setItem(
-            row_index,
-            current_table.total_cost_in_stock_column,
-            table_item_total_cost,
-        )
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"total_cost": table_item_total_cost})
-
-        # PAINT SETTINGS
-        # paint_settings_widget = PaintSettingsWidget(laser_cut_part, current_table)
-        # current_table.setCellWidget(
-        #     row_index,
-        #     current_table.paint_settings_column,
-        #     paint_settings_widget,
-        # )
-        # self.table_laser_cut_parts_widgets[laser_cut_part].update({"paint_settings_widget": paint_settings_widget})
-        # # PAINT
-        # paint_widget = PaintWidget(laser_cut_part, paint_settings_widget, current_table)
-        # current_table.setCellWidget(
-        #     row_index,
-        #     current_table.paint_column,
-        #     paint_widget,
-        # )
-        # self.table_laser_cut_parts_widgets[laser_cut_part].update({"paint_widget": paint_widget})
-        # SHELF NUMBER
-        table_item_shelf_number = QTableWidgetItem(laser_cut_part.meta_data.shelf_number)
-        table_item_shelf_number.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        table_item_shelf_number.setFont(self.tables_font)
-        current_table.setItem(
-            row_index,
-            current_table.shelf_number_column,
-            table_item_shelf_number,
-        )
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"shelf_number": table_item_shelf_number})
-
-        # MODFIED DATE
-        table_item_modified_date = QTableWidgetItem(laser_cut_part.meta_data.modified_date)
-        table_item_modified_date.setFont(self.tables_font)
-        current_table.setItem(
-            row_index,
-            current_table.modified_date_column,
-            table_item_modified_date,
-        )
-        self.table_laser_cut_parts_widgets[laser_cut_part].update({"modified_date": table_item_modified_date})
-
-        if self.category.name != "Recut":
-            if laser_cut_part.inventory_data.quantity <= laser_cut_part.inventory_data.red_quantity_limit:
-                self.set_table_row_color(
-                    current_table,
-                    row_index,
-                    f"{theme_var('table-red-quantity')}",
-                )
-            elif laser_cut_part.inventory_data.quantity <= laser_cut_part.inventory_data.yellow_quantity_limit:
-                self.set_table_row_color(
-                    current_table,
-                    row_index,
-                    f"{theme_var('table-yellow-quantity')}",
-                )
+            self.load_table()
 
     def load_table(self):
         self.category: Category = self.laser_cut_parts_inventory.get_category(self.tab_widget.tabText(self.tab_widget.currentIndex()))
@@ -730,72 +543,59 @@ class LaserCutTab(QWidget, Ui_Form):
         if not self.category:
             return
         current_table = self.category_tables[self.category]
-        current_table.blockSignals(True)
-        current_table.clearContents()
-        current_table.setRowCount(0)
-        self.table_laser_cut_parts_widgets.clear()
-        row_index = 0
+        rows = self.get_table_rows()
+        current_table.model().set_laser_cut_parts(self.category, rows)
+        current_table.resizeColumnsToContents()
+
+        if rows == ["Nothing to show"]:
+            return
+
+        self.save_current_tab()
+        self.save_category_tabs_order()
+        self.restore_scroll_position()
+
+        self.load_context_menu()
+
+    def get_table_rows(self) -> list[LaserCutPart | str]:
+        selected_materials = [button.text() for button in self.laser_cut_parts_filter["materials"] if button.isChecked()]
+        selected_thicknesses = [button.text() for button in self.laser_cut_parts_filter["thicknesses"] if button.isChecked()]
+        search_text = self.lineEdit_search_parts_in_inventory.text()
+        rows: list[LaserCutPart | str] = []
         grouped_laser_cut_parts = self.laser_cut_parts_inventory.get_group_categories(self.laser_cut_parts_inventory.get_laser_cut_parts_by_category(self.category))
         for group, laser_cut_parts in grouped_laser_cut_parts.items():
             group_material = group.split(";")[0]
             group_thickness = group.split(";")[1]
             group_name = group.replace(";", " ")
 
-            if selected_materials := [button.text() for button in self.laser_cut_parts_filter["materials"] if button.isChecked()]:
-                if group_material not in selected_materials:
-                    continue
-
-            if selected_thicknesses := [button.text() for button in self.laser_cut_parts_filter["thicknesses"] if button.isChecked()]:
-                if group_thickness not in selected_thicknesses:
-                    continue
-
-            # We check to see if there are any items to show, if not, we dont loop through the group data
-            for laser_cut_part in laser_cut_parts:
-                if self.lineEdit_search_parts_in_inventory.text() in laser_cut_part.name:
-                    break
-            else:
+            if selected_materials and group_material not in selected_materials:
+                continue
+            if selected_thicknesses and group_thickness not in selected_thicknesses:
                 continue
 
-            current_table.insertRow(row_index)
-            item = QTableWidgetItem(group_name)
-            item.setTextAlignment(4)  # Align text center
-            font = QFont()
-            font.setPointSize(15)
-            item.setFont(font)
-            current_table.setItem(row_index, 0, item)
-            current_table.setSpan(row_index, 0, 1, current_table.columnCount())
-            self.set_table_row_color(current_table, row_index, f"{theme_var('background')}")
-            row_index += 1
-            for laser_cut_part in laser_cut_parts:
-                if self.lineEdit_search_parts_in_inventory.text() not in laser_cut_part.name:
-                    continue
-                if selected_materials := [button.text() for button in self.laser_cut_parts_filter["materials"] if button.isChecked()]:
-                    if laser_cut_part.meta_data.material not in selected_materials:
-                        continue
-
-                if selected_thicknesses := [button.text() for button in self.laser_cut_parts_filter["thicknesses"] if button.isChecked()]:
-                    if laser_cut_part.meta_data.gauge not in selected_thicknesses:
-                        continue
-
-                self.add_laser_cut_part_to_table(current_table, row_index, laser_cut_part)
-                row_index += 1
-
-        current_table.blockSignals(False)
-
-        current_table.resizeColumnsToContents()
-
-        if current_table.rowCount() == 0:
-            current_table.insertRow(0)
-            current_table.setItem(0, 0, QTableWidgetItem("Nothing to show"))
-            current_table.item(0, 0).setFont(self.tables_font)
-            current_table.resizeColumnsToContents()
-            return
+            group_rows = [
+                laser_cut_part
+                for laser_cut_part in laser_cut_parts
+                if search_text in laser_cut_part.name
+                and not (selected_materials and laser_cut_part.meta_data.material not in selected_materials)
+                and not (selected_thicknesses and laser_cut_part.meta_data.gauge not in selected_thicknesses)
+            ]
+            if not group_rows:
+                continue
+            rows.append(group_name)
+            rows.extend(group_rows)
 
-        self.save_current_tab()
-        self.save_category_tabs_order()
-        self.restore_scroll_position()
+        if not rows:
+            rows.append("Nothing to show")
+        return rows
 
-        self.load_context_menu()
+    def apply_inventory_changes(self, changes: InventoryChanges) -> bool:
+        """Patches the current table in place, returns False when the tabs have to be rebuilt instead."""
+        if self.category not in self.category_tables or set(self.category_tables) != set(self.laser_cut_parts_inventory.get_categories()):
+            return False
+        self.laser_cut_parts_inventory.sort_by_quantity()
+        self.category_tables[self.category].model().patch_rows(self.get_table_rows(), changes.updated)
+        self.update_laser_cut_prices()
+        return True
 
     def view_quantity_history(self):
         if selected_laser_cut_part := self.get_selected_laser_cut_part():
@@ -863,12 +663,6 @@ class LaserCutTab(QWidget, Ui_Form):
                     continue
                 laser_cut_parts_to_save.append(laser_cut_part)
                 laser_cut_part.move_to_category(self.category, new_category)
-                self.category_tables[self.category].blockSignals(True)
-                self.table_laser_cut_parts_widgets[laser_cut_part]["unit_quantity"].setToolTip(f"Unit quantities:\n{laser_cut_part.print_category_quantities()}")
-                self.table_laser_cut_parts_widgets[laser_cut_part]["name"].setToolTip(
-                    f"{laser_cut_part.meta_data.geofile_name}\n\n Laser cut part is present in:\n{laser_cut_part.print_categories()}"
-                )
-                self.category_tables[self.category].blockSignals(False)
             self.laser_cut_parts_inventory.save_laser_cut_parts(laser_cut_parts_to_save)
             # self.laser_cut_parts_inventory.save_local_copy()
             # self.sync_changes()
@@ -911,12 +705,7 @@ class LaserCutTab(QWidget, Ui_Form):
                     continue
                 laser_cut_part.add_to_category(new_category)
                 laser_cut_parts_to_save.append(laser_cut_part)
-                self.category_tables[self.category].blockSignals(True)
-                self.table_laser_cut_parts_widgets[laser_cut_part]["unit_quantity"].setToolTip(f"Unit quantities:\n{laser_cut_part.print_category_quantities()}")
-                self.table_laser_cut_parts_widgets[laser_cut_part]["name"].setToolTip(
-                    f"{laser_cut_part.meta_data.geofile_name}\n\n Laser cut part is present in:\n{laser_cut_part.print_categories()}"
-                )
-                self.category_tables[self.category].blockSignals(False)
+                self.category_tables[self.category].model().refresh_item(laser_cut_part)
             self.laser_cut_parts_inventory.save_laser_cut_parts(laser_cut_parts_to_save)
             # self.laser_cut_parts_inventory.save_local_copy()
             # self.sync_changes()
@@ -1050,46 +839,15 @@ class LaserCutTab(QWidget, Ui_Form):
             self.last_selected_laser_cut_part = laser_cut_part.name
             self.last_selected_index = self.get_selected_row()
 
-    def table_changed(self, row: int):
-        laser_cut_part = next(
-            (laser_cut_part for laser_cut_part, table_data in self.table_laser_cut_parts_widgets.items() if table_data["row"] == row),
-            None,
-        )
-        if not laser_cut_part:
-            return
-        old_quantity = laser_cut_part.inventory_data.quantity
-        laser_cut_part.name = self.table_laser_cut_parts_widgets[laser_cut_part]["name"].text()
-        laser_cut_part.set_category_quantity(
-            self.category,
-            float(
-                sympy.sympify(
-                    self.table_laser_cut_parts_widgets[laser_cut_part]["unit_quantity"].text().strip().replace(",", ""),
-                    evaluate=True,
-                )
-            ),
-        )
-        laser_cut_part.inventory_data.quantity = float(
-            sympy.sympify(
-                self.table_laser_cut_parts_widgets[laser_cut_part]["quantity"].text().strip().replace(",", ""),
-                evaluate=True,
-            )
-        )
-        laser_cut_part.meta_data.shelf_number = self.table_laser_cut_parts_widgets[laser_cut_part]["shelf_number"].text()
-        if old_quantity != laser_cut_part.inventory_data.quantity:
-            laser_cut_part.meta_data.modified_date = (
-                f"{os.getlogin().title()} - Manually set to {laser_cut_part.inventory_data.quantity} from {old_quantity} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
-            )
+    def table_changed(self, laser_cut_part: LaserCutPart):
         self.laser_cut_parts_inventory.save_laser_cut_part(laser_cut_part)
         # self.sync_changes()
-        self.category_tables[self.category].blockSignals(True)
-        self.table_laser_cut_parts_widgets[laser_cut_part]["unit_quantity"].setText(f"{laser_cut_part.get_category_quantity(self.category):,.2f}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["unit_quantity"].setToolTip(f"Unit quantities:\n{laser_cut_part.print_category_quantities()}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["quantity"].setText(f"{laser_cut_part.inventory_data.quantity:,.2f}")
-        self.table_laser_cut_parts_widgets[laser_cut_part]["modified_date"].setText(laser_cut_part.meta_data.modified_date)
-        self.category_tables[self.category].blockSignals(False)
         self.update_category_total_stock_costs()
         self.update_laser_cut_prices()
 
+    def table_edit_failed(self, laser_cut_part: LaserCutPart, column_name: str):
+        self.parent.status_button.setText(f"Invalid number for {laser_cut_part.name} {column_name.lower()}", "red")
+
     def update_all_laser_cut_parts_costs(self):
         for laser_cut_part in self.laser_cut_parts_inventory.laser_cut_parts:
             price_per_pound: float = self.sheet_settings.get_price_per_pound(laser_cut_part.meta_data.material)
@@ -1100,11 +858,8 @@ class LaserCutTab(QWidget, Ui_Form):
         # self.sync_changes()
 
     def update_laser_cut_prices(self):
-        self.category_tables[self.category].blockSignals(True)
-        for laser_cut_part, table_items in self.table_laser_cut_parts_widgets.items():
-            table_items["price"].setText(f"${laser_cut_part.prices.price:,.2f}")
-            table_items["total_cost"].setText(f"${laser_cut_part.prices.price * laser_cut_part.inventory_data.quantity:,.2f}")
-        self.category_tables[self.category].blockSignals(False)
+        current_table = self.category_tables[self.category]
+        current_table.model().refresh_columns(current_table.model().price_column, current_table.model().total_cost_in_stock_column)
 
     def update_category_total_stock_costs(self):
         summary: dict[str, float] = {
@@ -1134,7 +889,7 @@ class LaserCutTab(QWidget, Ui_Form):
                 for laser_cut_part in laser_cut_parts:
                     laser_cut_part.inventory_data.red_quantity_limit = set_custom_limit_dialog.get_red_limit()
                     laser_cut_part.inventory_data.yellow_quantity_limit = set_custom_limit_dialog.get_yellow_limit()
-                    self.update_laser_cut_part_row_color(current_table, laser_cut_part)
+                    current_table.model().refresh_item(laser_cut_part)
                 self.laser_cut_parts_inventory.save_laser_cut_parts(laser_cut_parts)
                 # self.laser_cut_parts_inventory.save_local_copy()
                 # self.sync_changes()
@@ -1146,12 +901,8 @@ class LaserCutTab(QWidget, Ui_Form):
             multiplier: int = dialog.get_multiplier()
             option = dialog.get_option()
             if option == "Category":
-                self.category_tables[self.category].blockSignals(True)
                 laser_cut_parts_to_update = []
-                for (
-                    laser_cut_part,
-                    tables_item,
-                ) in self.table_laser_cut_parts_widgets.items():
+                for laser_cut_part in self.category_tables[self.category].model().get_items():
                     if add_or_remove == "ADD":
                         laser_cut_part.meta_data.modified_date = f"{os.getlogin().title()} Used: All Items in Category - add quantity. Changed from {laser_cut_part.inventory_data.quantity} to {laser_cut_part.inventory_data.quantity + (laser_cut_part.get_category_quantity(self.category) * multiplier)} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
                         laser_cut_part.inventory_data.quantity = laser_cut_part.inventory_data.quantity + (multiplier * laser_cut_part.get_category_quantity(self.category))
@@ -1159,9 +910,7 @@ class LaserCutTab(QWidget, Ui_Form):
                         laser_cut_part.meta_data.modified_date = f"{os.getlogin().title()} Used: All Items in Category - remove quantity. Changed from {laser_cut_part.inventory_data.quantity} to {laser_cut_part.inventory_data.quantity - (laser_cut_part.get_category_quantity(self.category) * multiplier)} at {datetime.now().strftime('%B %d %A %Y %I:%M:%S %p')}"
                         laser_cut_part.inventory_data.quantity = laser_cut_part.inventory_data.quantity - (multiplier * laser_cut_part.get_category_quantity(self.category))
                     laser_cut_parts_to_update.append(laser_cut_part)
-                    tables_item["quantity"].setText(str(laser_cut_part.inventory_data.quantity))
-                    tables_item["quantity"].setToolTip(laser_cut_part.meta_data.modified_date)
-                self.category_tables[self.category].blockSignals(False)
+                self.category_tables[self.category].model().refresh_all()
                 # self.laser_cut_parts_inventory.save_local_copy()
                 self.laser_cut_parts_inventory.save_laser_cut_parts(laser_cut_parts_to_update)
                 # self.sync_changes()
@@ -1212,32 +961,26 @@ class LaserCutTab(QWidget, Ui_Form):
 
     def select_last_selected_item(self):
         current_table = self.category_tables[self.category]
-        for laser_cut_part, table_items in self.table_laser_cut_parts_widgets.items():
+        for laser_cut_part in current_table.model().get_items():
             if laser_cut_part.name == self.last_selected_laser_cut_part:
-                current_table.selectRow(table_items["row"])
-                current_table.scrollTo(current_table.model().index(table_items["row"], 0))
+                current_table.select_item(laser_cut_part)
 
     def get_selected_laser_cut_parts(self) -> list[LaserCutPart]:
-        selected_laser_cut_parts: list[LaserCutPart] = []
-        selected_rows = self.get_selected_rows()
-        selected_laser_cut_parts.extend(laser_cut_part for laser_cut_part, table_items in self.table_laser_cut_parts_widgets.items() if table_items["row"] in selected_rows)
-        return selected_laser_cut_parts
+        return self.category_tables[self.category].get_selected_items()
 
     def get_selected_laser_cut_part(self) -> LaserCutPart:
         selected_row = self.get_selected_row()
-        for laser_cut_part, table_items in self.table_laser_cut_parts_widgets.items():
-            if table_items["row"] == selected_row:
-                self.last_selected_index = selected_row
-                self.last_selected_laser_cut_part = laser_cut_part.name
-                return laser_cut_part
+        if selected_row is not None and (laser_cut_part := self.category_tables[self.category].model().item_at(selected_row)):
+            self.last_selected_index = selected_row
+            self.last_selected_laser_cut_part = laser_cut_part.name
+            return laser_cut_part
 
     def get_selected_rows(self) -> list[int]:
-        rows: set[int] = {item.row() for item in self.category_tables[self.category].selectedItems()}
-        return list(rows)
+        return self.category_tables[self.category].get_selected_rows()
 
     def get_selected_row(self) -> int:
         with contextlib.suppress(IndexError):
-            return self.category_tables[self.category].selectedItems()[0].row()
+            return self.get_selected_rows()[0]
 
     def print_selected_items(self):
         headers = [
@@ -1280,34 +1023,6 @@ class LaserCutTab(QWidget, Ui_Form):
                 f.write(html)
             self.parent.open_print_selected_parts()
 
-    def update_laser_cut_part_row_color(self, current_table, laser_cut_part: LaserCutPart):
-        if laser_cut_part.inventory_data.quantity <= laser_cut_part.inventory_data.red_quantity_limit:
-            self.set_table_row_color(
-                current_table,
-                self.table_laser_cut_parts_widgets[laser_cut_part]["row"],
-                f"{theme_var('table-red-quantity')}",
-            )
-        elif laser_cut_part.inventory_data.quantity <= laser_cut_part.inventory_data.yellow_quantity_limit:
-            self.set_table_row_color(
-                current_table,
-                self.table_laser_cut_parts_widgets[laser_cut_part]["row"],
-                f"{theme_var('table-yellow-quantity')}",
-            )
-        else:
-            self.set_table_row_color(
-                current_table,
-                self.table_laser_cut_parts_widgets[laser_cut_part]["row"],
-                theme_var("surface-container-low"),
-            )
-
-    def set_table_row_color(self, table: LaserCutPartsTableWidget, row_index: int, color: str):
-        for j in range(table.columnCount()):
-            item = table.item(row_index, j)
-            if not item:
-                item = QTableWidgetItem()
-                table.setItem(row_index, j, item)
-            item.setBackground(QColor(color))
-
     def sort_laser_cut_parts(self):
         self.laser_cut_parts_inventory.sort_by_quantity()
         self.load_table()
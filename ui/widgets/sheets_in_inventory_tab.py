@@ -1,15 +1,11 @@
 import contextlib
-import os
 from datetime import datetime
 from functools import partial
 from typing import TYPE_CHECKING
 
-import sympy
 from PyQt6.QtCore import QDate, Qt, QThreadPool, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QColor, QCursor, QFont
+from PyQt6.QtGui import QAction, QCursor, QFont
 from PyQt6.QtWidgets import (
-    QAbstractItemView,
-    QComboBox,
     QDateEdit,
     QHBoxLayout,
     QInputDialog,
@@ -17,17 +13,12 @@ from PyQt6.QtWidgets import (
     QMenu,
     QMessageBox,
     QPushButton,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
-from ui.custom_widgets import (
-    CustomTableWidget,
-    CustomTabWidget,
-    HumbleDoubleSpinBox,
-    OrderStatusButton,
-)
+from ui.custom.sheets_tab_table_view import SheetsTableColumns, SheetsTableView
+from ui.custom_widgets import CustomTabWidget, OrderStatusButton
 from ui.dialogs.add_sheet_dialog import AddSheetDialog
 from ui.dialogs.edit_category_dialog import EditCategoryDialog
 from ui.dialogs.select_items_dialog import SelectItemsDialog
@@ -42,6 +33,7 @@ from ui.theme import theme_var
 from ui.widgets.sheets_in_inventory_tab_UI import Ui_Form
 from utils.dialog_buttons import DialogButtons
 from utils.inventory.category import Category
+from utils.inventory.inventory_changes import InventoryChanges
 from utils.inventory.order import Order, OrderDict
 from utils.inventory.sheet import Sheet
 from utils.inventory.sheets_inventory import SheetsInventory
@@ -52,35 +44,6 @@ if TYPE_CHECKING:
     from ui.windows.main_window import MainWindow
 
 
-class SheetsTableWidget(CustomTableWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setShowGrid(True)
-        self.setSortingEnabled(False)
-        self.setTextElideMode(Qt.TextElideMode.ElideNone)
-        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
-
-        self.set_editable_column_index([5, 8])
-        headers: list[str] = [
-            "Thickness",
-            "Material",
-            "Length",
-            "Width",
-            "Cost per Sheet",
-            "Quantity in Stock",
-            "Total Cost in Stock",
-            "Orders",
-            "Notes",
-            "Vendors",
-            "Modified Date",
-        ]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
-
-
 class SheetsTabWidget(CustomTabWidget):
     def __init__(self, parent: QWidget):
         super().__init__(parent)
@@ -149,11 +112,6 @@ class OrderWidget(QWidget):
             v_layout.addWidget(order_status_button)
             v_layout.addWidget(arrival_date)
             self.orders_layout.addLayout(v_layout)
-        self._parent_widget.category_tables[self._parent_widget.category].setColumnWidth(7, 400)  # Widgets don't like being resized with columns
-        self._parent_widget.update_sheet_row_color(
-            self._parent_widget.category_tables[self._parent_widget.category],
-            self.sheet,
-        )
 
     def create_order(self):
         select_date_dialog = SetComponentOrderPendingDialog(
@@ -173,6 +131,7 @@ class OrderWidget(QWidget):
             self._parent_widget.sheets_inventory.save_sheet(self.sheet)
             # self._parent_widget.sheets_inventory.save_local_copy()
             # self._parent_widget.sync_changes()
+            self._parent_widget.refresh_sheet(self.sheet)
             self.load_ui()
 
     def view_order_history(self):
@@ -276,11 +235,7 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
 
         self.category: Category | None = None
         self.finished_loading: bool = False
-        self.category_tables: dict[Category, SheetsTableWidget] = {}
-        self.table_sheets_widgets: dict[
-            Sheet,
-            dict[str, QTableWidgetItem | HumbleDoubleSpinBox | QComboBox | OrderWidget],
-        ] = {}
+        self.category_tables: dict[Category, SheetsTableView] = {}
         self.margins = (15, 15, 5, 5)  # top, bottom, left, right
         self.margin_format = f"margin-top: {self.margins[0]}%; margin-bottom: {self.margins[1]}%; margin-left: {self.margins[2]}%; margin-right: {self.margins[3]}%;"
         self.last_selected_sheet: str = ""
@@ -313,11 +268,9 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
         if new_category_name and ok:
             new_category = Category(new_category_name)
             self.sheets_inventory.add_category(new_category)
-            table = SheetsTableWidget(self.tab_widget)
+            table = self.create_category_table()
             self.category_tables.update({new_category: table})
             self.tab_widget.addTab(table, new_category.name)
-            table.rowChanged.connect(self.table_changed)
-            table.cellPressed.connect(self.table_selected_changed)
             self.sheets_inventory.save_local_copy()
             self.sync_changes()
             self.update_stock_costs()
@@ -358,11 +311,9 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
                     new_name += " - Copy"
                 new_category = self.sheets_inventory.duplicate_category(self.category, new_name)
                 # self.sheets_inventory.add_category(new_category)
-                table = SheetsTableWidget(self.tab_widget)
+                table = self.create_category_table()
                 self.category_tables.update({new_category: table})
                 self.tab_widget.insertTab(self.tab_widget.currentIndex() + 1, table, new_category.name)
-                table.rowChanged.connect(self.table_changed)
-                table.cellPressed.connect(self.table_selected_changed)
                 self.sheets_inventory.save_local_copy()
                 self.sync_changes()
                 self.load_categories()
@@ -385,12 +336,23 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
                 self.restore_last_selected_tab()
 
     def load_inventory_vendors(self):
-        self.block_table_signals()
-        for sheet in self.sheets_inventory.sheets:
-            with contextlib.suppress(KeyError):
-                self.table_sheets_widgets[sheet]["vendors"].setText("\n".join([vendor.name for vendor in sheet.vendors]))
-                self.table_sheets_widgets[sheet]["vendors"].setToolTip("\n\n".join([vendor.__str__() for vendor in sheet.vendors]))
-        self.unblock_table_signals()
+        with contextlib.suppress(KeyError):  # Table is not loaded yet
+            self.category_tables[self.category].model().refresh_columns(SheetsTableColumns.VENDORS.value)
+
+    def create_category_table(self) -> SheetsTableView:
+        table = SheetsTableView(self.sheets_inventory, self.sheet_settings, self.create_order_widget, self.tab_widget)
+        table.model().set_edit_mode(self.checkBox_edit_sheets.isChecked())
+        table.model().itemEdited.connect(self.table_changed)
+        table.model().editFailed.connect(self.table_edit_failed)
+        table.pressed.connect(self.table_selected_changed)
+        return table
+
+    def create_order_widget(self, sheet: Sheet, parent: QWidget) -> OrderWidget:
+        order_widget = OrderWidget(sheet, self)
+        order_widget.setParent(parent)
+        order_widget.orderOpened.connect(self.block_table_signals)
+        order_widget.orderClosed.connect(self.unblock_table_signals)
+        return order_widget
 
     def load_categories(self):
         self.settings_file.load_data()
@@ -409,11 +371,9 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
 
         for tab in tab_order:
             if category := self.sheets_inventory.get_category(tab):
-                table = SheetsTableWidget(self.tab_widget)
+                table = self.create_category_table()
                 self.category_tables.update({category: table})
                 self.tab_widget.addTab(table, category.name)
-                table.rowChanged.connect(self.table_changed)
-                table.cellPressed.connect(self.table_selected_changed)
                 table.verticalScrollBar().valueChanged.connect(self.save_scroll_position)
         self.tab_widget.currentChanged.connect(self.load_table)
         self.tab_widget.tabOrderChanged.connect(self.save_category_tabs_order)
@@ -427,175 +387,27 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
             with contextlib.suppress(
                 KeyError
             ):  # This happens when the updated sheet is not currently loaded. The UI will be updated when they switch tabs as the data for the sheet is updated.
-                self.update_sheet_table(self.category_tables[self.category], updated_sheet)
+                self.refresh_sheet(updated_sheet)
         else:  # Meaning the sheet just got added
             # I don't think this will ever run.
             sheet = Sheet(sheet_data, self.sheets_inventory)
             self.sheets_inventory.sheets.append(sheet)
-            self.add_sheet_to_table(
-                self.category_tables[self.category],
-                self.category_tables[self.category].rowCount(),
-                sheet,
-            )
+            self.sheets_inventory.invalidate_indexes()
+            self.load_table()
 
-    def update_sheet_table(self, current_table: CustomTableWidget, sheet: Sheet):
-        self.table_sheets_widgets[sheet]["thickness"].setCurrentText(sheet.thickness)
-        self.table_sheets_widgets[sheet]["material"].setCurrentText(sheet.material)
-        self.table_sheets_widgets[sheet]["length"].setValue(sheet.length)
-        self.table_sheets_widgets[sheet]["width"].setValue(sheet.width)
-        self.table_sheets_widgets[sheet]["cost"].setText(f"${self.sheets_inventory.get_sheet_cost(sheet):,.2f}")
-        self.table_sheets_widgets[sheet]["quantity"].setText(f"{sheet.quantity:,.0f}")
-        self.table_sheets_widgets[sheet]["total_cost_in_stock"].setText(f"${self.sheets_inventory.get_sheet_cost(sheet) * sheet.quantity:,.2f}")
-        self.table_sheets_widgets[sheet]["order_widget"].load_ui()
-        self.table_sheets_widgets[sheet]["notes"].setText(sheet.notes)
-        self.table_sheets_widgets[sheet]["vendors"].setText("\n".join([vendor.name for vendor in sheet.vendors]))
-        self.table_sheets_widgets[sheet]["vendors"].setToolTip("\n\n".join([vendor.__str__() for vendor in sheet.vendors]))
-        self.table_sheets_widgets[sheet]["modified_date"].setText(sheet.latest_change_quantity)
-        self.update_sheet_row_color(current_table, sheet)
-
-    def add_sheet_to_table(self, current_table: CustomTableWidget, row_index: int, sheet: Sheet):
-        self.table_sheets_widgets.update({sheet: {}})
-        self.table_sheets_widgets[sheet].update({"row": row_index})
-        col_index: int = 0
-        current_table.insertRow(row_index)
-        current_table.setRowHeight(row_index, 60)
-
-        # THICKNESS
-        comboBox_thickness = QComboBox(self)
-        comboBox_thickness.setEnabled(self.checkBox_edit_sheets.isChecked())
-        comboBox_thickness.setStyleSheet("border-radius: none;")
-        comboBox_thickness.wheelEvent = lambda event: event.ignore()
-        comboBox_thickness.addItems(self.sheet_settings.get_thicknesses())
-        comboBox_thickness.setCurrentText(sheet.thickness)
-        comboBox_thickness.currentTextChanged.connect(partial(self.table_changed, row_index))
-        current_table.setCellWidget(row_index, col_index, comboBox_thickness)
-        self.table_sheets_widgets[sheet].update({"thickness": comboBox_thickness})
-        col_index += 1
-
-        # MATERIAL
-        comboBox_material = QComboBox(self)
-        comboBox_material.setEnabled(self.checkBox_edit_sheets.isChecked())
-        comboBox_material.setStyleSheet("border-radius: none;")
-        comboBox_material.wheelEvent = lambda event: event.ignore()
-        comboBox_material.addItems(self.sheet_settings.get_materials())
-        comboBox_material.setCurrentText(sheet.material)
-        comboBox_material.currentTextChanged.connect(partial(self.table_changed, row_index))
-        current_table.setCellWidget(row_index, col_index, comboBox_material)
-        self.table_sheets_widgets[sheet].update({"material": comboBox_material})
-        col_index += 1
-
-        # LENGTH
-        spinbox_length = HumbleDoubleSpinBox(self)
-        spinbox_length.setEnabled(self.checkBox_edit_sheets.isChecked())
-        spinbox_length.setDecimals(3)
-        spinbox_length.setStyleSheet("border-radius: none;")
-        spinbox_length.setValue(sheet.length)
-        spinbox_length.valueChanged.connect(partial(self.table_changed, row_index))
-        current_table.setCellWidget(row_index, col_index, spinbox_length)
-        self.table_sheets_widgets[sheet].update({"length": spinbox_length})
-        col_index += 1
-
-        # WIDTH
-        spinbox_width = HumbleDoubleSpinBox(self)
-        spinbox_width.setEnabled(self.checkBox_edit_sheets.isChecked())
-        spinbox_width.setDecimals(3)
-        spinbox_width.setStyleSheet("border-radius: none;")
-        spinbox_width.setValue(sheet.width)
-        spinbox_width.valueChanged.connect(partial(self.table_changed, row_index))
-        current_table.setCellWidget(row_index, col_index, spinbox_width)
-        self.table_sheets_widgets[sheet].update({"width": spinbox_width})
-        col_index += 1
-
-        # COST
-        cost_per_sheet = self.sheets_inventory.get_sheet_cost(sheet)
-        table_item_cost = QTableWidgetItem(f"${cost_per_sheet:,.2f}")
-        current_table.setItem(
-            row_index,
-            col_index,
-            table_item_cost,
-        )
-        current_table.item(row_index, col_index).setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.item(row_index, col_index).setFont(self.tables_font)
-        self.table_sheets_widgets[sheet].update({"cost": table_item_cost})
-        col_index += 1
-
-        # CURRENT QUANTITY
-        table_item_quantity = QTableWidgetItem(f"{sheet.quantity:,.2f}")
-        current_table.setItem(row_index, col_index, table_item_quantity)
-        current_table.item(row_index, col_index).setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.item(row_index, col_index).setFont(self.tables_font)
-        self.table_sheets_widgets[sheet].update({"quantity": table_item_quantity})
-        col_index += 1
-
-        # COST IN STOCK
-        total_cost_in_stock = cost_per_sheet * sheet.quantity
-        table_item_cost_in_stock = QTableWidgetItem(f"${total_cost_in_stock:,.2f}")
-        current_table.setItem(row_index, col_index, table_item_cost_in_stock)
-        current_table.item(row_index, col_index).setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
-        current_table.item(row_index, col_index).setFont(self.tables_font)
-        self.table_sheets_widgets[sheet].update({"total_cost_in_stock": table_item_cost_in_stock})
-        col_index += 1
-
-        # ORDERS
-        order_widget = OrderWidget(sheet, self)
-        order_widget.orderOpened.connect(self.block_table_signals)
-        order_widget.orderClosed.connect(self.unblock_table_signals)
-        current_table.setCellWidget(row_index, col_index, order_widget)
-        self.table_sheets_widgets[sheet].update({"order_widget": order_widget})
-        col_index += 1
-
-        # NOTES
-        table_item_notes = QTableWidgetItem(sheet.notes)
-        current_table.setItem(row_index, col_index, table_item_notes)
-        current_table.item(row_index, col_index).setFont(self.tables_font)
-        self.table_sheets_widgets[sheet].update({"notes": table_item_notes})
-        col_index += 1
-
-        vendors_list = QTableWidgetItem("\n".join([vendor.name for vendor in sheet.vendors]))
-        vendors_list.setToolTip("\n\n".join([vendor.__str__() for vendor in sheet.vendors]))
-        current_table.setItem(row_index, col_index, vendors_list)
-        self.table_sheets_widgets[sheet].update({"vendors": vendors_list})
-        col_index += 1
-
-        # MODIFIED DATE
-        table_item_modified_date = QTableWidgetItem(sheet.latest_change_quantity)
-        table_item_modified_date.setToolTip(sheet.latest_change_quantity)
-        current_table.setItem(row_index, col_index, table_item_modified_date)
-        current_table.item(row_index, col_index).setFont(self.tables_font)
-        self.table_sheets_widgets[sheet].update({"modified_date": table_item_modified_date})
-
-        self.update_sheet_row_color(current_table, sheet)
+    def refresh_sheet(self, sheet: Sheet):
+        self.category_tables[self.category].model().refresh_item(sheet)
 
     def load_table(self):
         self.category = self.sheets_inventory.get_category(self.tab_widget.tabText(self.tab_widget.currentIndex()))
         current_table = self.category_tables[self.category]
-        current_table.blockSignals(True)
-        current_table.clearContents()
-        current_table.setRowCount(0)
-        self.table_sheets_widgets.clear()
-        row_index = 0
-        for group in self.sheets_inventory.get_all_sheets_material(self.sheets_inventory.get_sheets_by_category(self.category)):
-            current_table.insertRow(row_index)
-            group_table_item = QTableWidgetItem(group)
-            group_table_item.setTextAlignment(4)  # Align text center
-
-            font = QFont()
-            font.setPointSize(15)
-            group_table_item.setFont(font)
-            current_table.setItem(row_index, 0, group_table_item)
-            current_table.setSpan(row_index, 0, 1, current_table.columnCount())
-            self.set_table_row_color(current_table, row_index, f"{theme_var('background')}")
-            row_index += 1
-
-            for sheet in self.sheets_inventory.get_sheets_by_category(self.category):
-                if group != sheet.material:
-                    continue
-                self.add_sheet_to_table(current_table, row_index, sheet)
-                row_index += 1
-
-        current_table.blockSignals(False)
-
-        QTimer.singleShot(100, current_table.resizeColumnsToContents)
+        current_table.model().set_rows(self.get_table_rows())
+
+        def table_loaded():
+            current_table.resizeColumnsToContents()
+            current_table.setColumnWidth(SheetsTableColumns.ORDERS.value, 400)  # Order widgets are only opened on the current row
+
+        QTimer.singleShot(100, table_loaded)
 
         if current_table.contextMenuPolicy() != Qt.ContextMenuPolicy.CustomContextMenu:
             current_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -658,11 +470,28 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
 
             current_table.customContextMenuRequested.connect(partial(self.open_group_menu, menu))
 
-        current_table.setColumnWidth(7, 400)  # Widgets don't like being resized with columns
         self.save_current_tab()
         self.save_category_tabs_order()
         self.restore_scroll_position()
 
+    def get_table_rows(self) -> list[Sheet | str]:
+        sheets = self.sheets_inventory.get_sheets_by_category(self.category)
+        rows: list[Sheet | str] = []
+        for group in self.sheets_inventory.get_all_sheets_material(sheets):
+            rows.append(group)
+            rows.extend(sheet for sheet in sheets if sheet.material == group)
+        return rows
+
+    def apply_inventory_changes(self, changes: InventoryChanges) -> bool:
+        """Patches the current table in place, returns False when the tabs have to be rebuilt instead."""
+        if self.category not in self.category_tables or set(self.category_tables) != set(self.sheets_inventory.get_categories()):
+            return False
+        self.sheets_inventory.sort_by_thickness()
+        self.category_tables[self.category].model().patch_rows(self.get_table_rows(), changes.updated)
+        self.update_sheet_costs()
+        self.update_stock_costs()
+        return True
+
     def add_to_active_purchase_order(self):
         if selected_sheets := self.get_selected_sheets():
             self._parent_widget.add_sheets_to_purchase_order(selected_sheets)
@@ -690,6 +519,7 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
                 for item in selected_items:
                     if vendor := self._parent_widget.purchase_order_manager.get_vendor_by_name(item):
                         sheet.vendors.append(vendor)
+            self.category_tables[self.category].model().refresh_columns(SheetsTableColumns.VENDORS.value)
 
         self.sheets_inventory.save_sheets(selected_sheets)
 
@@ -724,47 +554,19 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
             self.last_selected_sheet = sheet.name
             self.last_selected_index = self.get_selected_row()
 
-    def table_changed(self, row: int):
-        sheet = next(
-            (sheet for sheet, table_data in self.table_sheets_widgets.items() if table_data["row"] == row),
-            None,
-        )
-        if not sheet:
-            return
-        old_quantity = sheet.quantity
-        sheet.quantity = float(
-            sympy.sympify(
-                self.table_sheets_widgets[sheet]["quantity"].text().strip().replace(",", ""),
-                evaluate=True,
-            )
-        )
-        if old_quantity != sheet.quantity:
-            sheet.has_sent_warning = False
-            sheet.latest_change_quantity = (
-                f"{os.getlogin().title()} - Manually set to {sheet.quantity} from {old_quantity} quantity at {str(datetime.now().strftime('%B %d %A %Y %I:%M:%S %p'))}"
-            )
-        sheet.notes = self.table_sheets_widgets[sheet]["notes"].text()
-        sheet.material = self.table_sheets_widgets[sheet]["material"].currentText()
-        sheet.thickness = self.table_sheets_widgets[sheet]["thickness"].currentText()
-        sheet.length = self.table_sheets_widgets[sheet]["length"].value()
-        sheet.width = self.table_sheets_widgets[sheet]["width"].value()
+    def table_changed(self, sheet: Sheet):
         self.sheets_inventory.save_sheet(sheet)
         self.sheets_inventory.save_local_copy()
         # self.sync_changes()
-        self.category_tables[self.category].blockSignals(True)
-        self.table_sheets_widgets[sheet]["quantity"].setText(f"{sheet.quantity:,.2f}")
-        self.table_sheets_widgets[sheet]["modified_date"].setText(sheet.latest_change_quantity)
-        self.category_tables[self.category].blockSignals(False)
-        self.update_sheet_row_color(self.category_tables[self.category], sheet)
         self.update_sheet_costs()
         self.update_stock_costs()
 
+    def table_edit_failed(self, sheet: Sheet, column_name: str):
+        self._parent_widget.status_button.setText(f"Invalid number for {sheet.get_name()} {column_name.lower()}", "red")
+
     def toggle_edit_mode(self):
-        for table_data in self.table_sheets_widgets.values():
-            table_data["material"].setEnabled(self.checkBox_edit_sheets.isChecked())
-            table_data["thickness"].setEnabled(self.checkBox_edit_sheets.isChecked())
-            table_data["length"].setEnabled(self.checkBox_edit_sheets.isChecked())
-            table_data["width"].setEnabled(self.checkBox_edit_sheets.isChecked())
+        for table in self.category_tables.values():
+            table.model().set_edit_mode(self.checkBox_edit_sheets.isChecked())
 
     def add_new_sheet(self):
         add_sheet_dialog = AddSheetDialog(None, self.category, self.sheets_inventory, self.sheet_settings, self)
@@ -801,13 +603,7 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
             self.sheets_inventory.add_sheet(new_sheet, sheet_added)
 
     def update_sheet_costs(self):
-        self.category_tables[self.category].blockSignals(True)
-        for sheet, table_items in self.table_sheets_widgets.items():
-            cost_per_sheet = self.sheets_inventory.get_sheet_cost(sheet)
-            table_item_cost_in_stock = cost_per_sheet * sheet.quantity
-            table_items["cost"].setText(f"${cost_per_sheet:,.2f}")
-            table_items["total_cost_in_stock"].setText(f"${table_item_cost_in_stock:,.2f}")
-        self.category_tables[self.category].blockSignals(False)
+        self.category_tables[self.category].model().refresh_columns(SheetsTableColumns.COST_PER_SHEET.value, SheetsTableColumns.TOTAL_COST_IN_STOCK.value)
 
     def set_custom_quantity_limit(self):
         current_table = self.category_tables[self.category]
@@ -823,7 +619,7 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
                 for sheet in sheets:
                     sheet.red_quantity_limit = set_custom_limit_dialog.get_red_limit()
                     sheet.yellow_quantity_limit = set_custom_limit_dialog.get_yellow_limit()
-                    self.update_sheet_row_color(current_table, sheet)
+                    current_table.model().refresh_item(sheet)
                 self.sheets_inventory.save_local_copy()
                 self.sync_changes()
 
@@ -849,32 +645,26 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
 
     def select_last_selected_item(self):
         current_table = self.category_tables[self.category]
-        for sheet, table_items in self.table_sheets_widgets.items():
+        for sheet in current_table.model().get_items():
             if sheet.name == self.last_selected_sheet:
-                current_table.selectRow(table_items["row"])
-                current_table.scrollTo(current_table.model().index(table_items["row"], 0))
+                current_table.select_item(sheet)
 
     def get_selected_sheets(self) -> list[Sheet]:
-        selected_sheets: list[Sheet] = []
-        selected_rows = self.get_selected_rows()
-        selected_sheets.extend(sheet for sheet, table_items in self.table_sheets_widgets.items() if table_items["row"] in selected_rows)
-        return selected_sheets
+        return self.category_tables[self.category].get_selected_items()
 
     def get_selected_sheet(self) -> Sheet | None:
         selected_row = self.get_selected_row()
-        for sheet, table_items in self.table_sheets_widgets.items():
-            if table_items["row"] == selected_row:
-                self.last_selected_index = selected_row
-                self.last_selected_sheet = sheet.name
-                return sheet
+        if selected_row is not None and (sheet := self.category_tables[self.category].model().item_at(selected_row)):
+            self.last_selected_index = selected_row
+            self.last_selected_sheet = sheet.name
+            return sheet
 
     def get_selected_rows(self) -> list[int]:
-        rows: set[int] = {item.row() for item in self.category_tables[self.category].selectedItems()}
-        return list(rows)
+        return self.category_tables[self.category].get_selected_rows()
 
     def get_selected_row(self) -> int:
         with contextlib.suppress(IndexError):
-            return self.category_tables[self.category].selectedItems()[0].row()
+            return self.get_selected_rows()[0]
 
     def print_selected_items(self):
         headers = [
@@ -911,40 +701,6 @@ class SheetsInInventoryTab(QWidget, Ui_Form):
                 f.write(html)
             self._parent_widget.open_print_selected_parts()
 
-    def update_sheet_row_color(self, table, sheet: Sheet):
-        if sheet.orders:
-            self.set_table_row_color(
-                table,
-                self.table_sheets_widgets[sheet]["row"],
-                f"{theme_var('table-order-pending')}",
-            )
-        elif sheet.quantity <= sheet.red_quantity_limit:
-            self.set_table_row_color(
-                table,
-                self.table_sheets_widgets[sheet]["row"],
-                f"{theme_var('table-red-quantity')}",
-            )
-        elif sheet.quantity <= sheet.yellow_quantity_limit:
-            self.set_table_row_color(
-                table,
-                self.table_sheets_widgets[sheet]["row"],
-                f"{theme_var('table-yellow-quantity')}",
-            )
-        else:
-            self.set_table_row_color(
-                table,
-                self.table_sheets_widgets[sheet]["row"],
-                f"{theme_var('background')}",
-            )
-
-    def set_table_row_color(self, table: SheetsTableWidget, row_index: int, color: str):
-        for j in range(table.columnCount()):
-            item = table.item(row_index, j)
-            if not item:
-                item = QTableWidgetItem()
-                table.setItem(row_index, j, item)
-            item.setBackground(QColor(color))
-
     def sort_sheets(self):
         self.sheets_inventory.sort_by_thickness()
         self.load_table()
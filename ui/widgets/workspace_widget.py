@@ -516,6 +516,7 @@ class WorkspaceWidget(QWidget, Ui_Form):
     def load_workspace_job_response(self, response: tuple[Job, QTreeWidgetItem, dict, int]):
         job, item, response, status_code = response
         if status_code == 200:
+            self.workspace.index_job(job)  # The parts and the flowtag timeline were loaded again
             if self._parent_widget.pushButton_view_parts.isChecked():
                 all_laser_cut_parts = job.get_all_laser_cut_parts()
                 if not all_laser_cut_parts:
@@ -635,6 +636,7 @@ class WorkspaceWidget(QWidget, Ui_Form):
                     workspace_laser_cut_part_group_item,
                 ) = self.get_workspace_laser_cut_part_group_item_by_name(part_name)
                 if workspace_laser_cut_part_group and workspace_laser_cut_part_group_item:
+                    self.workspace.update_filter_indexes(workspace_laser_cut_part_group.laser_cut_parts)
                     self.update_part_tree_widget_item(
                         workspace_laser_cut_part_group,
                         workspace_laser_cut_part_group_item,
@@ -754,6 +756,7 @@ class WorkspaceWidget(QWidget, Ui_Form):
         self.parts_tree_widget.blockSignals(True)
         self.parts_tree_widget.clear()
         self.parts_tree_index.clear()
+        self.workspace.filter_indexes.clear()
 
         font = QFont()
         font.setPointSize(15)
@@ -941,7 +944,8 @@ class WorkspaceWidget(QWidget, Ui_Form):
         elif entry_type == "laser_cut_part":
             for parent_tree_item in self.parts_parent_tree_items.values():
                 for child in parent_tree_item["children"]:
-                    if child["group"].update_entry(entry_data):
+                    if laser_cut_part := child["group"].update_entry(entry_data):
+                        self.workspace.update_filter_indexes([laser_cut_part])
                         self.update_part_tree_widget_item(child["group"], child["item"])
 
     def get_workspace_laser_cut_part_group_item_by_name(
@@ -991,7 +995,8 @@ class WorkspaceWidget(QWidget, Ui_Form):
             if part_type == "laser_cut_part":
                 if result := self.get_workspace_laser_cut_part_group_item_by_name(part_name):
                     group, item = result
-                    group.update_entry(entry_data)
+                    if laser_cut_part := group.update_entry(entry_data):
+                        self.workspace.update_filter_indexes([laser_cut_part])
                     entries_to_update[part_type].update({part_name: (group, item)})
                     # self.update_part_tree_widget_item(group, item)
             elif part_type == "assembly":
@@ -112,6 +112,7 @@ from utils.inventory.sheet import Sheet
 from utils.inventory.sheets_inventory import SheetsInventory
 from utils.inventory.structural_steel_inventory import StructuralSteelInventory
 from utils.ip_utils import get_server_ip_address, get_server_port
+from utils.nest_image_cache import UploadedImages
 from utils.po import check_po_directories
 from utils.purchase_order.purchase_order import PurchaseOrder
 from utils.purchase_order.purchase_order_manager import PurchaseOrderManager
@@ -125,6 +126,7 @@ from utils.structural_steel_settings.structural_steel_settings import (
 from utils.threads.add_job_to_production_planner_thread import (
     AddJobToProductionPlannerThread,
 )
+from utils.threads.changes_batcher import ChangesBatcher
 from utils.threads.changes_thread import ChangesThread
 from utils.threads.check_for_updates_thread import CheckForUpdatesThread
 from utils.threads.download_thread import DownloadThread
@@ -136,12 +138,13 @@ from utils.threads.send_email_thread import SendEmailThread
 from utils.threads.send_sheet_report_thread import SendReportThread
 from utils.workers.auth.connect import ConnectWorker
 from utils.workers.auth.is_client_trusted import IsClientTrustedWorker
+from utils.workers.http_transport import HttpTransport
 from utils.workers.jobs.delete_job import DeleteJobWorker
 from utils.workers.jobs.get_all_jobs import GetAllJobsWorker
 from utils.workers.jobs.job_loader_controller import JobLoaderController
 from utils.workers.jobs.save_job import SaveJobWorker
 from utils.workers.jobs.update_job_setting import UpdateJobSettingWorker
-from utils.workers.runnable_chain import RunnableChain
+from utils.workers.runnable_graph import RunnableGraph
 from utils.workers.upload_files import UploadFilesWorker
 from utils.workers.utils.get_order_number import GetOrderNumberWorker
 from utils.workers.utils.set_order_number import SetOrderNumberWorker
@@ -307,6 +310,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.categories: list[Category] = []
         self.active_layout: QVBoxLayout = None
         self.downloading_changes = False
+        self.changes_batcher = ChangesBatcher(parent=self)
+        self.uploaded_images = UploadedImages()
+        self.changes_batcher.batchReady.connect(self.changes_response)
         self.finished_downloading_all_files = False
         self.finished_loading_tabs = False
         self.files_downloaded_count = 0
@@ -369,19 +375,16 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.start_intilization_chain()
 
     def start_intilization_chain(self):
-        self._initialize_chain = RunnableChain(self)
+        # Everything is fetched at once, only real data dependencies are enforced, see load_inventories
+        self._initialize_graph = RunnableGraph(self, name="StartupLoader")
 
-        connect_worker = ConnectWorker(__version__)
-        is_client_trusted_worker = IsClientTrustedWorker()
-        get_order_number_worker = GetOrderNumberWorker()
-
-        self._initialize_chain.add(connect_worker, self.user_connected)
-        self._initialize_chain.add(is_client_trusted_worker, self.handle_client_data)
-        self._initialize_chain.add(get_order_number_worker, self.get_order_number_response)
+        self._initialize_graph.add("connect", ConnectWorker(__version__), self.user_connected)
+        self._initialize_graph.add("is_client_trusted", IsClientTrustedWorker(), self.handle_client_data)
+        self._initialize_graph.add("get_order_number", GetOrderNumberWorker(), self.get_order_number_response)
 
-        self._initialize_chain.finished.connect(self.load_inventories)
+        self.load_inventories(self._initialize_graph)
 
-        self._initialize_chain.start()
+        self._initialize_graph.start()
 
     def user_connected(self, response, next_step: Callable):
         self.status_button.setText(response.get("message", "User data updated"), "lime")
@@ -397,7 +400,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.status_button.setText(f"Order number: {self.order_number}", "lime")
         next_step()
 
-    def load_inventories(self):
+    def load_inventories(self, graph: RunnableGraph):
         self.sheet_settings = SheetSettings()
         self.structural_steel_settings = StructuralSteelSettings()
         self.workspace_settings = WorkspaceSettings()
@@ -424,30 +427,30 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.download_all_files()
 
-        # --- Setup flags ---
-        self._sheets_loaded = False
-        self._components_loaded = False
-
-        # --- Define shared checker function ---
-        def check_and_load_po_menus():
-            if self._sheets_loaded and self._components_loaded:
-                self.load_po_menus()
-
-        # --- Define on_loaded wrappers ---
-        def sheets_loaded_wrapper():
-            self.load_sheets_inventory_tab()
-            self._sheets_loaded = True
-            check_and_load_po_menus()
-
-        def components_loaded_wrapper():
-            self.load_components_inventory_tab()
-            self._components_loaded = True
-            check_and_load_po_menus()
+        # --- Load inventories, from the local cache first when there is one ---
+        sheets_ready, sheets_synced = self.sheets_inventory.add_load_steps(graph)
+        components_ready, components_synced = self.components_inventory.add_load_steps(graph)
+        coatings_ready, _ = self.paint_inventory.add_load_steps(graph, depends_on=[components_ready])
+        laser_cut_parts_ready, laser_cut_parts_synced = self.laser_cut_parts_inventory.add_load_steps(graph, depends_on=[coatings_ready])
+        purchase_orders_linked = self.purchase_order_manager.add_load_steps(graph, depends_on=[sheets_synced, components_synced])
+
+        # --- Build UI as soon as its data is in ---
+        graph.add_task("load_sheets_inventory_tab", self.load_sheets_inventory_tab, [sheets_ready])
+        graph.add_task("load_components_inventory_tab", self.load_components_inventory_tab, [components_ready])
+        graph.add_task("load_laser_cut_inventory_tab", self.load_laser_cut_inventory_tab, [laser_cut_parts_ready])
+        graph.add_task(
+            "populate_po_menus",
+            self.populate_po_menus,
+            [purchase_orders_linked, "load_sheets_inventory_tab", "load_components_inventory_tab"],
+        )
 
-        # --- Load inventories ---
-        self.sheets_inventory.load_data(on_loaded=sheets_loaded_wrapper)
-        self.components_inventory.load_data(on_loaded=components_loaded_wrapper)
-        self.laser_cut_parts_inventory.load_data(on_loaded=self.load_laser_cut_inventory_tab)
+        # --- Redraw tabs that were drawn from the cache once the server changes are merged ---
+        if sheets_ready != sheets_synced:
+            graph.add_task("refresh_sheets_inventory_tab", self.refresh_sheets_inventory_tab, [sheets_synced, "load_sheets_inventory_tab"])
+        if components_ready != components_synced:
+            graph.add_task("refresh_components_inventory_tab", self.refresh_components_inventory_tab, [components_synced, "load_components_inventory_tab"])
+        if laser_cut_parts_ready != laser_cut_parts_synced:
+            graph.add_task("refresh_laser_cut_inventory_tab", self.refresh_laser_cut_inventory_tab, [laser_cut_parts_synced, "load_laser_cut_inventory_tab"])
 
     def setup_tab_buttons(self):
         self.menu_tab_manager = ButtonManagerWidget(self)
@@ -924,20 +927,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.is_sheets_inventory_ui_loaded = True
         self.should_update_sheets_in_inventory_tab = False
 
+    def refresh_sheets_inventory_tab(self):
+        self.should_update_sheets_in_inventory_tab = True
+        self.update_sheets_inventory_tab()
+
     def update_sheets_inventory_tab(self):
         if not self.should_update_sheets_in_inventory_tab:
             return
         if self.tab_text(self.stackedWidget.currentIndex()) == "sheets_in_inventory_tab":
+            changes = self.sheets_inventory.take_changes()
             self.sheets_inventory_tab_widget.block_table_signals()
-            self.sheets_inventory_tab_widget.load_categories()
-            self.sheets_inventory.sort_by_thickness()
-            self.sheets_inventory_tab_widget.restore_last_selected_tab()
-            self.sheets_inventory_tab_widget.update_stock_costs()
+            if changes is None or not self.sheets_inventory_tab_widget.apply_inventory_changes(changes):
+                self.sheets_inventory_tab_widget.load_categories()
+                self.sheets_inventory.sort_by_thickness()
+                self.sheets_inventory_tab_widget.restore_last_selected_tab()
+                self.sheets_inventory_tab_widget.update_stock_costs()
             self.sheets_inventory_tab_widget.unblock_table_signals()
             self.should_update_sheets_in_inventory_tab = False
 
     def load_components_inventory_tab(self):
-        self.paint_inventory.load_data(on_loaded=self.load_paint_inventory_tab)  # Paint inventory is depdendent on components inventory
         # We load these because components tab is depended on them, they might be loaded ahead of time or they might not be
         self.load_job_planning_tab()
         self.load_job_quoting_tab()
@@ -949,13 +957,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.is_components_inventory_ui_loaded = True
         self.should_update_components_in_inventory_tab = False
 
+    def refresh_components_inventory_tab(self):
+        self.should_update_components_in_inventory_tab = True
+        self.update_components_inventory_tab()
+
     def update_components_inventory_tab(self):
         if not self.should_update_components_in_inventory_tab:
             return
         if self.tab_text(self.stackedWidget.currentIndex()) == "components_tab":
+            changes = self.components_inventory.take_changes()
             self.components_tab_widget.block_table_signals()
-            self.components_tab_widget.load_categories()
-            self.components_tab_widget.sort_components()
+            if changes is None or not self.components_tab_widget.apply_inventory_changes(changes):
+                self.components_tab_widget.load_categories()
+                self.components_tab_widget.sort_components()
             self.components_tab_widget.unblock_table_signals()
             self.should_update_components_in_inventory_tab = False
 
@@ -970,13 +984,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.is_laser_cut_parts_inventory_ui_loaded = True
         self.should_update_laser_cut_inventory_tab = False
 
+    def refresh_laser_cut_inventory_tab(self):
+        self.should_update_laser_cut_inventory_tab = True
+        self.update_laser_cut_inventory_tab()
+
     def update_laser_cut_inventory_tab(self):
         if not self.should_update_laser_cut_inventory_tab:
             return
         if self.tab_text(self.stackedWidget.currentIndex()) == "laser_cut_tab":
+            changes = self.laser_cut_parts_inventory.take_changes()
             self.laser_cut_parts_tab_widget.block_table_signals()
-            self.laser_cut_parts_tab_widget.load_categories()
-            self.laser_cut_parts_tab_widget.sort_laser_cut_parts()
+            if changes is None or not self.laser_cut_parts_tab_widget.apply_inventory_changes(changes):
+                self.laser_cut_parts_tab_widget.load_categories()
+                self.laser_cut_parts_tab_widget.sort_laser_cut_parts()
             self.laser_cut_parts_tab_widget.unblock_table_signals()
             self.should_update_laser_cut_inventory_tab = False
 
@@ -1204,6 +1224,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     # * \/ UPDATE UI ELEMENTS \/
     def load_po_menus(self):
+        self.purchase_order_manager.load_data(on_finished=self.populate_po_menus)
+
+    def populate_po_menus(self):
         def load_purchase_order_menu():
             self.menuPurchase_Orders_2.clear()
             organized_purchase_orders = self.purchase_order_manager.get_organized_purchase_orders()
@@ -1248,13 +1271,10 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 action.triggered.connect(partial(self.edit_shipping_address, shipping_address))
                 self.menuEdit_Shiping_Addresses.addAction(action)
 
-        def after_load():
-            load_purchase_order_menu()
-            load_vendors_menu()
-            load_shipping_addresses_menu()
-            QTimer.singleShot(250, self.load_inventory_vendors)
-
-        self.purchase_order_manager.load_data(on_finished=after_load)
+        load_purchase_order_menu()
+        load_vendors_menu()
+        load_shipping_addresses_menu()
+        QTimer.singleShot(250, self.load_inventory_vendors)
 
     def set_color_theme(self, theme: str):
         self.settings_file.set_value("theme", theme)
@@ -2365,12 +2385,26 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 images_to_upload.extend(laser_cut_part.meta_data.image_index for laser_cut_part in nest.laser_cut_parts)
                 images_to_upload.extend(nest.image_path for nest in nests)
 
-            images = set(images_to_upload)
-            self.upload_files(list(images))
+            changed_images = self.uploaded_images.get_changed_images(list(set(images_to_upload)))
+            if not changed_images:
+                self.status_button.setText("Nest images are already uploaded", "lime")
+                return
+            self.upload_thread = UploadFilesWorker(list(changed_images))
+            self.upload_thread.signals.success.connect(
+                lambda response: self.uploaded_images.mark_uploaded({image_path: changed_images[image_path] for image_path in response["successful"]})
+            )
+            self.upload_thread.signals.success.connect(self.upload_thread_response)
+            QThreadPool.globalInstance().start(self.upload_thread)
         except Exception as e:
             logging.error(f"Error uploading images: {e}")
             self.status_button.setText(f"Error uploading images: {e}", "red")
 
+    def queue_changes(self, responses: str | list[str]):
+        if isinstance(responses, str) or not responses:
+            self.changes_response(responses)
+        else:
+            self.changes_batcher.add(responses)
+
     def changes_response(self, responses: str | list[str]):
         logging.info(f"changes_response: {responses}")
 
@@ -2403,72 +2437,77 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.status_button.setText("Syncing", "yellow")
         self.downloading_changes = True
 
-        first_resp = responses[0]
-
-        # Dispatch map for single endpoint cases
-        dispatch_single = {
-            "reload_saved_quotes": self.load_saved_quoted_thread,
-            "reload_saved_jobs": self.load_jobs_worker,
-        }
-
-        # Check simple reload keywords first
-        if first_resp in dispatch_single:
-            dispatch_single[first_resp]()
-            set_status(f"Synced: {first_resp}")
-            logging.info(f"Synced: {first_resp}")
-            return
+        # Endpoint keys in the order they are checked, a batch can hold changes for several endpoints
+        endpoint_keys = (
+            "reload_saved_quotes",
+            "reload_saved_jobs",
+            "vendors/get_all",
+            "purchase_orders/get_all",
+            "shipping_addresses/get_all",
+            "jobs/get_all",
+            "workspace/get_entry",
+            "sheets_inventory/get_sheet",
+            "sheets_inventory/get_all",
+            "components_inventory/get_component",
+            "components_inventory/get_all",
+            "laser_cut_parts_inventory/get_laser_cut_part",
+            "laser_cut_parts_inventory/get_all",
+            "workspace/get_entries_by_name",
+        )
+        changes: dict[str, list[str]] = {}
+        for resp in responses:
+            key = next((key for key in endpoint_keys if key in resp), "files")
+            changes.setdefault(key, []).append(resp)
 
-        # Endpoint-specific checks
-        if any(key in first_resp for key in ("vendors/get_all", "purchase_orders/get_all", "shipping_addresses/get_all")):
-            self.load_po_menus()
+        if "reload_saved_quotes" in changes:
+            self.load_saved_quoted_thread()
 
-        elif "jobs/get_all" in first_resp:
+        if "reload_saved_jobs" in changes or "jobs/get_all" in changes:
             self.load_jobs_worker()
 
-        elif "workspace/get_entry" in first_resp and tab_name == "workspace_tab":
-            entry_id = extract_last(first_resp)
-            worker = GetWorkspaceEntryWorker(entry_id)
-            # worker.signals.success.connect(self.get_workspace_entry_response)
-            QThreadPool.globalInstance().start(worker)
+        if any(key in changes for key in ("vendors/get_all", "purchase_orders/get_all", "shipping_addresses/get_all")):
+            self.load_po_menus()
 
-        elif "sheets_inventory/get_sheet" in first_resp:
-            for resp in responses:
-                sheet_id = extract_last(resp)
-                self.sheets_inventory.get_sheet(sheet_id, on_finished=self.get_sheet_response)
+        if "workspace/get_entry" in changes and tab_name == "workspace_tab":
+            for resp in changes["workspace/get_entry"]:
+                entry_id = extract_last(resp)
+                worker = GetWorkspaceEntryWorker(entry_id)
+                # worker.signals.success.connect(self.get_workspace_entry_response)
+                QThreadPool.globalInstance().start(worker)
 
-        elif "sheets_inventory/get_all" in first_resp:
+        # A full reload already covers any single items changed in the same batch
+        if "sheets_inventory/get_all" in changes:
             self.should_update_sheets_in_inventory_tab = True
             self.sheets_inventory.load_data(on_loaded=self.update_sheets_inventory_tab)
+        elif "sheets_inventory/get_sheet" in changes:
+            self.sheets_inventory.get_sheets([extract_last(resp) for resp in changes["sheets_inventory/get_sheet"]], on_finished=self.get_sheets_response)
 
-        elif "components_inventory/get_component" in first_resp:
-            for resp in responses:
-                comp_id = extract_last(resp)
-                self.components_inventory.get_component(comp_id, on_finished=self.get_component_response)
-
-        elif "components_inventory/get_all" in first_resp:
+        if "components_inventory/get_all" in changes:
             self.should_update_components_in_inventory_tab = True
             self.components_inventory.load_data(on_loaded=self.update_components_inventory_tab)
+        elif "components_inventory/get_component" in changes:
+            self.components_inventory.get_components(
+                [extract_last(resp) for resp in changes["components_inventory/get_component"]], on_finished=self.get_components_response
+            )
 
-        elif "laser_cut_parts_inventory/get_laser_cut_part" in first_resp:
-            for resp in responses:
-                part_id = extract_last(resp)
-                self.laser_cut_parts_inventory.get_laser_cut_part(part_id, on_finished=self.get_laser_cut_part_response)
-
-        elif "laser_cut_parts_inventory/get_all" in first_resp:
+        if "laser_cut_parts_inventory/get_all" in changes:
             self.should_update_laser_cut_inventory_tab = True
             self.laser_cut_parts_inventory.load_data(on_loaded=self.update_laser_cut_inventory_tab)
+        elif "laser_cut_parts_inventory/get_laser_cut_part" in changes:
+            self.laser_cut_parts_inventory.get_laser_cut_parts(
+                [extract_last(resp) for resp in changes["laser_cut_parts_inventory/get_laser_cut_part"]], on_finished=self.get_laser_cut_parts_response
+            )
 
-        elif "workspace/get_entries_by_name" in first_resp:
-            for resp in responses:
-                job_id, entry_name = extract_job_id_and_name(resp)
-                worker = GetWorkspaceEntriesByNameWorker(job_id, entry_name)
-                # worker.signals.success.connect(self.get_workspace_entries_response)
-                QThreadPool.globalInstance().start(worker)
+        for resp in changes.get("workspace/get_entries_by_name", []):
+            job_id, entry_name = extract_job_id_and_name(resp)
+            worker = GetWorkspaceEntriesByNameWorker(job_id, entry_name)
+            # worker.signals.success.connect(self.get_workspace_entries_response)
+            QThreadPool.globalInstance().start(worker)
 
-        else:
-            self.download_files(responses)
+        if "files" in changes:
+            self.download_files(changes["files"])
 
-        set_status(f"Synced: {first_resp}")
+        set_status(f"Synced: {responses[0]}" if len(responses) == 1 else f"Synced: {len(responses)} changes")
         logging.info(f"Synced: {responses}")
 
     # def get_workspace_entry_response(self, entry_data: dict, status_code: int):
@@ -2483,34 +2522,29 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     # def get_workspace_entries_response(self, entries_data: list[dict]):
     # self.workspace_tab_widget.update_entries(entries_data)
 
-    def get_sheet_response(self, sheet_data: dict):
+    def get_sheets_response(self, sheets_data: list[dict]):
         try:
+            self.sheets_inventory.update_sheets_data(sheets_data)
             self.should_update_sheets_in_inventory_tab = True
-            self.sheets_inventory_tab_widget.block_table_signals()
-            self.sheets_inventory_tab_widget.update_sheet(sheet_data)
-            self.sheets_inventory_tab_widget.unblock_table_signals()
-        except Exception:
-            self.status_button.setText(f"Error: {sheet_data}", "red")
+            self.update_sheets_inventory_tab()
+        except Exception as e:
+            self.status_button.setText(f"Error: {e}", "red")
 
-    def get_component_response(self, component_data: dict):
+    def get_components_response(self, components_data: list[dict]):
         try:
+            self.components_inventory.update_components_data(components_data)
             self.should_update_components_in_inventory_tab = True
-            self.components_tab_widget.block_table_signals()
-            self.components_tab_widget.update_component(component_data)
-            self.components_tab_widget.unblock_table_signals()
+            self.update_components_inventory_tab()
         except Exception as e:
             self.status_button.setText(f"Error: {e}", "red")
-            print(e)
 
-    def get_laser_cut_part_response(self, laser_cut_part_data):
+    def get_laser_cut_parts_response(self, laser_cut_parts_data: list[dict]):
         try:
-            self.should_update_laser_cut_parts_in_inventory_tab = True
-            self.laser_cut_parts_tab_widget.block_table_signals()
-            self.laser_cut_parts_tab_widget.update_laser_cut_part(laser_cut_part_data)
-            self.laser_cut_parts_tab_widget.unblock_table_signals()
+            self.laser_cut_parts_inventory.update_laser_cut_parts_data(laser_cut_parts_data)
+            self.should_update_laser_cut_inventory_tab = True
+            self.update_laser_cut_inventory_tab()
         except Exception as e:
             self.status_button.setText(f"Error: {e}", "red")
-            print(e)
 
     def data_received(self, data):
         if "timed out" in str(data).lower() or "fail" in str(data).lower():
@@ -2527,7 +2561,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def start_changes_thread(self):
         changes_thread = ChangesThread(self)  # 5 minutes
-        changes_thread.signal.connect(self.changes_response)
+        changes_thread.signal.connect(self.queue_changes)
         self.threads.append(changes_thread)
         changes_thread.start()
 
@@ -2695,8 +2729,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         )
         self.threads.append(load_nest_thread)
         load_nest_thread.signal.connect(self.load_nests_for_job_response)
+        load_nest_thread.progress.connect(self.load_nests_progress)
         load_nest_thread.start()
 
+    def load_nests_progress(self, files_loaded: int, total_files: int, nest_file: str):
+        self.status_button.setText(f"Processing nests ({files_loaded}/{total_files}): {os.path.basename(nest_file)}", "yellow")
+
     # TODO: Update existing LCP's with the ones in the nest
     def load_nests_for_job_response(self, nests: Union[list[Nest], str]):
         if isinstance(nests, str):
@@ -2794,6 +2832,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         )
         self.threads.append(load_nest_thread)
         load_nest_thread.signal.connect(self.load_nests_for_workspace_response)
+        load_nest_thread.progress.connect(self.load_nests_progress)
         load_nest_thread.start()
         load_nest_thread.wait()
 
@@ -2857,7 +2896,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             for laser_cut_part in nest.laser_cut_parts:
                 part_name = laser_cut_part.name
                 if part_name not in part_dict:
-                    new_part = LaserCutPart(laser_cut_part.to_dict(), self.laser_cut_parts_inventory)
+                    new_part = laser_cut_part.clone()
                     new_part.inventory_data.quantity = laser_cut_part.meta_data.quantity_on_sheet * nest.sheet_count
                     part_dict[part_name] = new_part
                 else:
@@ -3408,6 +3447,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     def closeEvent(self, event):
         self.save_geometry()
         self.save_menu_tab_order()
+        HttpTransport.instance().log_stats()
         super().closeEvent(event)
 
     # * /\ OVERIDDEN UI EVENTS /
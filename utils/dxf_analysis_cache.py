@@ -0,0 +1,57 @@
+import os
+
+import msgspec
+
+from config.environments import Environment
+from utils.dxf_analyzer import DxfAnalysis, DxfAnalyzer
+
+DXF_ANALYSIS_CACHE_LOCATION = f"{Environment.DATA_PATH}/data/cache/dxf_analysis"
+
+
+class CachedDxfAnalysis(DxfAnalysis):
+    preview_path: str  # Empty if the preview could not be rendered
+
+
+class DxfAnalysisCache:
+    """Analysis results and previews of DXF files, keyed by a hash of the file's contents."""
+
+    def __init__(self, cache_location: str = DXF_ANALYSIS_CACHE_LOCATION):
+        self.cache_location = cache_location
+        os.makedirs(self.cache_location, exist_ok=True)
+
+    def get_analysis_path(self, digest: str) -> str:
+        return f"{self.cache_location}/{digest}.json"
+
+    def get_preview_path(self, digest: str) -> str:
+        return f"{self.cache_location}/{digest}.png"
+
+    def get(self, digest: str) -> CachedDxfAnalysis | None:
+        try:
+            with open(self.get_analysis_path(digest), "rb") as file:
+                return msgspec.json.decode(file.read())
+        except (OSError, msgspec.DecodeError):
+            return None
+
+    def add(self, digest: str, analysis: CachedDxfAnalysis):
+        temp_path = f"{self.get_analysis_path(digest)}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(msgspec.json.encode(analysis))
+        os.replace(temp_path, self.get_analysis_path(digest))
+
+
+def analyze_dxf(dxf_path: str, digest: str, cache_location: str = DXF_ANALYSIS_CACHE_LOCATION) -> CachedDxfAnalysis:
+    """Analyses a DXF and stores the result, meant to run in a worker process."""
+    cache = DxfAnalysisCache(cache_location)
+    dxf_analyzer = DxfAnalyzer(dxf_path)
+
+    preview_path = cache.get_preview_path(digest)
+    temp_path = f"{preview_path}.{os.getpid()}.tmp"
+    dxf_analyzer.save_preview_image(temp_path)
+    if os.path.isfile(temp_path):
+        os.replace(temp_path, preview_path)
+    else:
+        preview_path = ""
+
+    analysis: CachedDxfAnalysis = dxf_analyzer.get_analysis() | {"preview_path": preview_path}
+    cache.add(digest, analysis)
+    return analysis
@@ -1,18 +1,96 @@
+from functools import cached_property
+from typing import TypedDict
+
+import numpy as np
 import trimesh
 from trimesh.path import Path2D
+from trimesh.path.entities import Arc, Line
+
+
+class DxfAnalysis(TypedDict):
+    cutting_length: float
+    cutting_area: float
+    units: str
+    dimensions: dict[str, float | str]
+    piercing_points: int
+
+
+def dxf_analysis_to_string(analysis: DxfAnalysis) -> str:
+    return f"""Cutting length: {analysis["cutting_length"]:,.2f} {analysis["units"]}
+Cutting area: {analysis["cutting_area"]:,.2f} {analysis["units"]}^2
+Units: {analysis["units"]}
+Dimensions: {analysis["dimensions"]}
+Piercing points: {analysis["piercing_points"]}"""
 
 
 class DxfAnalyzer:
-    def __init__(self, dxf_path: str):
+    """Cutting metrics of a 2D DXF, each one is only computed once.
+
+    Lines and arcs are measured together with NumPy over the vertex array, other entities (splines)
+    use their own length(). vectorized=False measures every entity one at a time like before, it is
+    kept to compare against.
+    """
+
+    def __init__(self, dxf_path: str, vectorized: bool = True):
         self.dxf_path = dxf_path
+        self.vectorized = vectorized
         self.shape = trimesh.load(dxf_path, force="2D")
 
         if not isinstance(self.shape, Path2D):
             raise ValueError("DXF did not load as a 2D shape")
 
-    def get_cutting_length(self) -> float:
-        total = 0.0
+    @cached_property
+    def cutting_length(self) -> float:
+        if not self.vectorized:
+            return self.get_entities_length(self.shape.entities)
+
+        vertices = np.asarray(self.shape.vertices, dtype=np.float64)
+        lines: list[Line] = []
+        arcs: list[Arc] = []
+        others: list = []
         for entity in self.shape.entities:
+            if isinstance(entity, Line):
+                lines.append(entity)
+            elif isinstance(entity, Arc) and len(entity.points) == 3:
+                arcs.append(entity)
+            else:
+                others.append(entity)
+        return self.get_lines_length(vertices, lines) + self.get_arcs_length(vertices, arcs) + self.get_entities_length(others)
+
+    def get_lines_length(self, vertices: np.ndarray, lines: list[Line]) -> float:
+        if not lines:
+            return 0.0
+        starts = np.concatenate([line.points[:-1] for line in lines])
+        ends = np.concatenate([line.points[1:] for line in lines])
+        return float(np.linalg.norm(vertices[ends] - vertices[starts], axis=1).sum())
+
+    def get_arcs_length(self, vertices: np.ndarray, arcs: list[Arc]) -> float:
+        if not arcs:
+            return 0.0
+        points = np.array([arc.points for arc in arcs], dtype=np.int64)
+        closed = np.array([arc.closed for arc in arcs], dtype=bool)
+        start, middle, end = vertices[points[:, 0]], vertices[points[:, 1]], vertices[points[:, 2]]
+
+        to_start = start - middle
+        to_end = end - middle
+        chord = end - start
+        twice_area = np.abs(to_start[:, 0] * to_end[:, 1] - to_start[:, 1] * to_end[:, 0])
+        colinear = twice_area < 1e-12
+        if colinear.any():
+            print(f"Skipping {int(colinear.sum())} invalid arcs in {self.dxf_path}: arc is colinear")
+
+        twice_area = twice_area[~colinear]
+        to_start, to_end, chord, closed = to_start[~colinear], to_end[~colinear], chord[~colinear], closed[~colinear]
+        # Circumradius of the three points, R = abc / (4 * area)
+        radius = np.linalg.norm(to_start, axis=1) * np.linalg.norm(to_end, axis=1) * np.linalg.norm(chord, axis=1) / (2 * twice_area)
+        # The inscribed angle at the middle point is half of the arc that does not go through it
+        middle_angle = np.arctan2(twice_area, np.einsum("ij,ij->i", to_start, to_end))
+        span = np.where(closed, 2 * np.pi, 2 * np.pi - 2 * middle_angle)
+        return float(np.sum(radius * span))
+
+    def get_entities_length(self, entities: list) -> float:
+        total = 0.0
+        for entity in entities:
             try:
                 total += entity.length(self.shape.vertices)
             except ValueError as e:
@@ -23,13 +101,12 @@ class DxfAnalyzer:
                     raise
         return float(total)
 
-    def get_cutting_area(self) -> float:
+    @cached_property
+    def cutting_area(self) -> float:
         return float(self.shape.area)
 
-    def get_units(self) -> str:
-        return str(self.shape.units)
-
-    def get_dimensions(self) -> dict[str, float]:
+    @cached_property
+    def dimensions(self) -> dict[str, float | str]:
         bounds = self.shape.bounds
         length = float(bounds[1][0] - bounds[0][0])
         width = float(bounds[1][1] - bounds[0][1])
@@ -39,8 +116,27 @@ class DxfAnalyzer:
             "units": self.shape.units,
         }
 
+    @cached_property
+    def piercing_points(self) -> int:
+        if not self.vectorized:
+            return len(self.shape.discrete)
+        # One pierce per closed path, counting them does not need the discretized outlines
+        return len(self.shape.paths)
+
+    def get_cutting_length(self) -> float:
+        return self.cutting_length
+
+    def get_cutting_area(self) -> float:
+        return self.cutting_area
+
+    def get_units(self) -> str:
+        return str(self.shape.units)
+
+    def get_dimensions(self) -> dict[str, float | str]:
+        return self.dimensions
+
     def get_piercing_points(self) -> int:
-        return len(self.shape.discrete)
+        return self.piercing_points
 
     def save_preview_image(self, path: str = "images/preview.png", resolution=(100, 100)) -> None:
         try:
@@ -55,16 +151,46 @@ class DxfAnalyzer:
         except Exception as e:
             print(f"[ERROR] Failed to render preview for {self.dxf_path}: {e}")
 
+    def get_analysis(self) -> DxfAnalysis:
+        return {
+            "cutting_length": self.get_cutting_length(),
+            "cutting_area": self.get_cutting_area(),
+            "units": self.get_units(),
+            "dimensions": self.get_dimensions(),
+            "piercing_points": self.get_piercing_points(),
+        }
+
     def __str__(self):
-        return f"""Cutting length: {self.get_cutting_length():,.2f} {self.get_units()}
-Cutting area: {self.get_cutting_area():,.2f} {self.get_units()}^2
-Units: {self.get_units()}
-Dimensions: {self.get_dimensions()}
-Piercing points: {self.get_piercing_points()}"""
+        return dxf_analysis_to_string(self.get_analysis())
 
 
 if __name__ == "__main__":
-    DXF_FILE = r"dxf test files/TP6A-20.dxf"
+    # Benchmark against measuring one entity at a time: python -m utils.dxf_analyzer dxfs/*.dxf
+    import sys
+    import time
 
-    analyzer = DxfAnalyzer(DXF_FILE)
-    print(analyzer)
+    dxf_paths = sys.argv[1:] or [r"dxf test files/TP6A-20.dxf"]
+    failures = 0
+    total_legacy_time = total_vectorized_time = 0.0
+    for dxf_path in dxf_paths:
+        results: dict[bool, tuple[DxfAnalysis, float]] = {}
+        for vectorized in (False, True):
+            analyzer = DxfAnalyzer(dxf_path, vectorized=vectorized)
+            analyzer.cutting_area  # Same for both, keep it out of the timing
+            start_time = time.perf_counter()
+            analysis = analyzer.get_analysis()
+            str(analyzer)
+            results[vectorized] = (analysis, time.perf_counter() - start_time)
+        (expected, legacy_time), (analysis, vectorized_time) = results[False], results[True]
+        total_legacy_time += legacy_time
+        total_vectorized_time += vectorized_time
+        mismatched = [
+            key
+            for key in ("cutting_length", "piercing_points")
+            if not np.isclose(expected[key], analysis[key], rtol=1e-9, atol=1e-9)
+        ]
+        failures += bool(mismatched)
+        print(f"{'FAIL' if mismatched else 'ok  '} {dxf_path}: legacy {legacy_time * 1000:.1f} ms, vectorized {vectorized_time * 1000:.1f} ms {mismatched or ''}")
+    if total_vectorized_time:
+        print(f"{len(dxf_paths)} files, {total_legacy_time / total_vectorized_time:.1f}x faster")
+    sys.exit(1 if failures else 0)
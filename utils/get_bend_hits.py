@@ -1,21 +1,79 @@
 import os
 import re
 import sys
+from typing import TypedDict
 
 import fitz
+import msgspec
+
+from config.environments import Environment
 
 program_directory = os.path.dirname(os.path.realpath(sys.argv[0]))
 regex = re.compile(r"(UP|DOWN)\d+°(?:R[\d.]+)?")
 
+BEND_HITS_CACHE_LOCATION = f"{Environment.DATA_PATH}/data/cache/bend_hits"
+
+
+class BendHitsPage(TypedDict):
+    page: int
+    hits: list[str]
+    rects: list[tuple[float, float, float, float]]  # Bounding box of the text block each hit is in
+
+
+class BendHits(TypedDict):
+    count: int
+    pages: list[BendHitsPage]  # Only pages with hits
+
+
+def find_bend_hits(pdf_path: str) -> BendHits:
+    """Scans a drawing one text block at a time.
+
+    Blocks are separated by newlines in the page text, which a hit can not span either, so the count
+    is the same as scanning the whole text.
+    """
+    bend_hits: BendHits = {"count": 0, "pages": []}
+    with fitz.open(pdf_path) as pdf_file:
+        for page_number, page in enumerate(pdf_file):
+            page_hits: BendHitsPage = {"page": page_number, "hits": [], "rects": []}
+            for x0, y0, x1, y1, text, *_ in page.get_text("blocks"):
+                for match in regex.finditer(text.replace(" ", "")):
+                    page_hits["hits"].append(match.group())
+                    page_hits["rects"].append((x0, y0, x1, y1))
+            if page_hits["hits"]:
+                bend_hits["count"] += len(page_hits["hits"])
+                bend_hits["pages"].append(page_hits)
+    return bend_hits
+
 
 def get_bend_hits(pdf_path: str) -> int:
-    pdf_path.replace("\\", "/")
-    pdf_file = fitz.open(pdf_path)
-    pages = list(range(pdf_file.page_count))
-    page_lines = []
-    for pg in range(pdf_file.page_count):
-        if pg in pages:
-            page = pdf_file[pg]
-            page_lines.append(page.get_text("text").replace(" ", ""))
-    all_text = "".join(page_lines)
-    return len(regex.findall(all_text))
+    return find_bend_hits(pdf_path)["count"]
+
+
+class BendHitsCache:
+    """Bend hits of drawings, keyed by a hash of the PDF's contents."""
+
+    def __init__(self, cache_location: str = BEND_HITS_CACHE_LOCATION):
+        self.cache_location = cache_location
+        os.makedirs(self.cache_location, exist_ok=True)
+
+    def get(self, digest: str) -> BendHits | None:
+        try:
+            with open(f"{self.cache_location}/{digest}.json", "rb") as file:
+                return msgspec.json.decode(file.read())
+        except (OSError, msgspec.DecodeError):
+            return None
+
+    def add(self, digest: str, bend_hits: BendHits):
+        temp_path = f"{self.cache_location}/{digest}.json.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(msgspec.json.encode(bend_hits))
+        os.replace(temp_path, f"{self.cache_location}/{digest}.json")
+
+
+def find_bend_hits_cached(pdf_path: str, digest: str, cache_location: str = BEND_HITS_CACHE_LOCATION) -> BendHits:
+    """Meant to run in a worker process."""
+    cache = BendHitsCache(cache_location)
+    if (bend_hits := cache.get(digest)) is None:
+        bend_hits = find_bend_hits(pdf_path)
+        cache.add(digest, bend_hits)
+    return bend_hits
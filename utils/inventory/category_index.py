@@ -0,0 +1,76 @@
+from typing import Callable, Generic, Iterable, TypeVar
+
+from utils.inventory.category import Category
+
+T = TypeVar("T")
+
+
+class CategoryIndex(Generic[T]):
+    """Category -> members index with running per-category totals.
+
+    Members keep the inventory's order. Aggregates are functions of (item, category) and their
+    totals are adjusted by the difference when refresh() is called for edited items, so a quantity
+    or price change does not rescan the inventory. Membership changes, renames, reloads and sorts
+    go through invalidate() and the index is rebuilt on the next read.
+    """
+
+    def __init__(self, aggregates: dict[str, Callable[[T, Category], float]] | None = None):
+        self.aggregates = aggregates or {}
+        self._members: dict[str, list[T]] = {}
+        self._totals: dict[str, dict[str, float]] = {}
+        self._snapshots: dict[int, dict[str, dict[str, float]]] = {}
+        self._category_names: dict[int, str] = {}
+        self._dirty = True
+
+    def invalidate(self):
+        self._dirty = True
+
+    def rebuild(self, items: Iterable[T]):
+        self._members.clear()
+        self._totals.clear()
+        self._snapshots.clear()
+        self._category_names.clear()
+        for item in items:
+            snapshot = self._snapshot(item)
+            self._snapshots[id(item)] = snapshot
+            for category in item.categories:
+                self._category_names[id(category)] = category.name
+            for category_name, values in snapshot.items():
+                self._members.setdefault(category_name, []).append(item)
+                totals = self._totals.setdefault(category_name, dict.fromkeys(self.aggregates, 0.0))
+                for aggregate, value in values.items():
+                    totals[aggregate] += value
+        self._dirty = False
+
+    def refresh(self, items: Iterable[T]):
+        if self._dirty:
+            return  # Everything is recomputed on the next read anyway
+        for item in items:
+            old_snapshot = self._snapshots.get(id(item))
+            new_snapshot = self._snapshot(item)
+            if old_snapshot is None or old_snapshot.keys() != new_snapshot.keys():
+                self._dirty = True  # New item or its categories changed, members need rebuilding
+                return
+            for category_name, values in new_snapshot.items():
+                totals = self._totals[category_name]
+                for aggregate, value in values.items():
+                    totals[aggregate] += value - old_snapshot[category_name][aggregate]
+            self._snapshots[id(item)] = new_snapshot
+
+    def get_members(self, items: Iterable[T], category: Category) -> list[T]:
+        self._ensure_built(items, category)
+        return list(self._members.get(category.name, []))
+
+    def get_total(self, items: Iterable[T], category: Category, aggregate: str) -> float:
+        self._ensure_built(items, category)
+        if totals := self._totals.get(category.name):
+            return totals[aggregate]
+        return 0.0
+
+    def _ensure_built(self, items: Iterable[T], category: Category):
+        # Category.rename() changes the key in place, catch it here instead of trusting every caller.
+        if self._dirty or self._category_names.get(id(category), category.name) != category.name:
+            self.rebuild(items)
+
+    def _snapshot(self, item: T) -> dict[str, dict[str, float]]:
+        return {category.name: {aggregate: function(item, category) for aggregate, function in self.aggregates.items()} for category in item.categories}
@@ -1,9 +1,11 @@
 import copy
 from typing import TYPE_CHECKING, TypedDict
 
+import msgspec
+
 from utils.inventory.category import Category
 from utils.inventory.inventory_item import InventoryItem
-from utils.inventory.order import Order, OrderDict
+from utils.inventory.order import Order, OrderDict, OrderRecord
 from utils.purchase_order.vendor import Vendor
 
 if TYPE_CHECKING:
@@ -35,8 +37,32 @@ class ComponentDict(TypedDict):
     category_quantities: dict[str, float]
 
 
+class ComponentRecord(msgspec.Struct):
+    id: int = -1
+    name: str = ""
+    part_number: str = ""
+    part_name: str = ""
+    quantity: float = 0.0
+    latest_change_quantity: str = "Nothing recorded"
+    price: float = 0.0
+    saved_price: float = 0.0
+    latest_change_price: str = "Nothing recorded"
+    use_exchange_rate: bool = False
+    priority: int = 0
+    shelf_number: str = ""
+    notes: str = ""
+    image_path: str = ""
+    red_quantity_limit: float = 10.0
+    yellow_quantity_limit: float = 20.0
+    quantity_to_order: float = 0.0
+    vendor_ids: list[int] = []
+    orders: list[OrderRecord] = []
+    categories: list[str] = []
+    category_quantities: dict[str, float] = {}
+
+
 class Component(InventoryItem):
-    def __init__(self, data: ComponentDict, components_inventory):
+    def __init__(self, data: ComponentDict | ComponentRecord, components_inventory):
         super().__init__()
         self.components_inventory: ComponentsInventory = components_inventory
         self.id: int = -1
@@ -113,7 +139,11 @@ class Component(InventoryItem):
     def print_category_quantities(self) -> str:
         return "".join(f"{i + 1}. {category.name}: {self.get_category_quantity(category)}\n" for i, category in enumerate(self.categories))
 
-    def load_data(self, data: ComponentDict):
+    def load_data(self, data: ComponentDict | ComponentRecord):
+        if isinstance(data, ComponentRecord):
+            self.load_record(data)
+            return
+
         self.id = data.get("id", -1)
         self.part_number = data.get("part_number", "")
         self.name = self.part_number
@@ -150,9 +180,74 @@ class Component(InventoryItem):
             if category.name in categories:
                 self.categories.append(category)
 
+    def load_record(self, record: ComponentRecord):
+        """Same as load_data, for components that were decoded straight into records."""
+        self.id = record.id
+        self.part_number = record.part_number
+        self.name = self.part_number
+        self.quantity = record.quantity
+        self.category_quantities.clear()
+        for category_name, unit_quantity in record.category_quantities.items():
+            category = self.components_inventory.get_category(category_name)
+            self.category_quantities.update({category: unit_quantity})
+        self.part_name = record.part_name
+        self.price = record.price
+        self.saved_price = record.saved_price
+        self.use_exchange_rate = record.use_exchange_rate
+        self.priority = record.priority
+        self.shelf_number = record.shelf_number
+        self.notes = record.notes
+        self.image_path = record.image_path
+        self.latest_change_quantity = record.latest_change_quantity
+        self.latest_change_price = record.latest_change_price
+        self.red_quantity_limit = record.red_quantity_limit
+        self.yellow_quantity_limit = record.yellow_quantity_limit
+
+        self.quantity_to_order = record.quantity_to_order
+
+        self._vendor_ids = record.vendor_ids
+
+        self.orders.clear()
+        for order_record in record.orders:
+            self.add_order(Order(order_record))
+
+        self.categories.clear()
+        categories = set(record.categories)
+        for category in self.components_inventory.get_categories():
+            if category.name in categories:
+                self.categories.append(category)
+
     def get_copy(self) -> "Component":
         return copy.deepcopy(self)
 
+    def clone(self) -> "Component":
+        """Same as Component(self.to_dict(), self.components_inventory) without going through a dict, categories and vendors are shared."""
+        component = Component.__new__(Component)
+        component.components_inventory = self.components_inventory
+        component.id = self.id
+        component.name = self.name
+        component.part_number = self.part_number
+        component.part_name = self.part_name
+        component.quantity = self.quantity
+        component.categories = self.categories.copy()
+        component.category_quantities = {category: self.category_quantities.get(category, 1.0) for category in self.categories}
+        component.price = self.price
+        component.saved_price = self.saved_price
+        component.use_exchange_rate = self.use_exchange_rate
+        component.priority = self.priority
+        component.shelf_number = self.shelf_number
+        component.notes = self.notes
+        component.image_path = self.image_path
+        component.latest_change_quantity = self.latest_change_quantity
+        component.latest_change_price = self.latest_change_price
+        component.red_quantity_limit = self.red_quantity_limit
+        component.yellow_quantity_limit = self.yellow_quantity_limit
+        component.orders = [Order(order.to_dict()) for order in self.orders]
+        component.quantity_to_order = self.quantity_to_order
+        component.vendors = self.vendors.copy()
+        component._vendor_ids = self._vendor_ids.copy()
+        return component
+
     def to_dict(self) -> ComponentDict:
         return {
             "id": self.id,
@@ -177,3 +272,28 @@ class Component(InventoryItem):
             "categories": [category.name for category in self.categories],
             "category_quantities": {category.name: self.category_quantities.get(category, 1.0) for category in self.categories},
         }
+
+    def to_record(self) -> ComponentRecord:
+        return ComponentRecord(
+            id=self.id,
+            name=self.name,
+            part_number=self.part_number,
+            part_name=self.part_name,
+            quantity=round(self.quantity, 2),
+            latest_change_quantity=self.latest_change_quantity,
+            price=round(self.price, 2),
+            saved_price=round(self.saved_price, 2),
+            latest_change_price=self.latest_change_price,
+            use_exchange_rate=self.use_exchange_rate,
+            priority=self.priority,
+            shelf_number=self.shelf_number,
+            notes=self.notes,
+            image_path=self.image_path,
+            red_quantity_limit=self.red_quantity_limit,
+            yellow_quantity_limit=self.yellow_quantity_limit,
+            quantity_to_order=self.quantity_to_order,
+            vendor_ids=list({vendor.id for vendor in self.vendors}),
+            orders=[order.to_record() for order in self.orders],
+            categories=[category.name for category in self.categories],
+            category_quantities={category.name: self.category_quantities.get(category, 1.0) for category in self.categories},
+        )
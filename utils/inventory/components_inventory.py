@@ -1,21 +1,23 @@
-from typing import Callable
+from functools import partial
+from typing import Callable, Iterable
 
-import msgspec
 from natsort import natsorted
 from PyQt6.QtCore import QThreadPool
 
 from utils.inventory.category import Category
-from utils.inventory.component import Component
+from utils.inventory.component import Component, ComponentRecord
 from utils.inventory.inventory import Inventory
+from utils.inventory.inventory_changes import InventoryChanges
 from utils.workers.components_inventory.add_component import AddComponentWorker
-from utils.workers.components_inventory.get_all_components import GetAllComponentsWorker
 from utils.workers.components_inventory.get_categories import (
     GetComponentsCategoriesWorker,
 )
+from utils.workers.components_inventory.get_changes import GetComponentsChangesWorker
 from utils.workers.components_inventory.get_component import GetComponentWorker
+from utils.workers.components_inventory.get_components import GetComponentsWorker
 from utils.workers.components_inventory.remove_components import RemoveComponentsWorker
 from utils.workers.components_inventory.update_components import UpdateComponentsWorker
-from utils.workers.runnable_chain import RunnableChain
+from utils.workers.runnable_graph import RunnableGraph
 
 
 class ComponentsInventory(Inventory):
@@ -23,6 +25,16 @@ class ComponentsInventory(Inventory):
         super().__init__("components_inventory")
         self.components: list[Component] = []
 
+        self.id_index = self.add_index(lambda component: component.id)
+        self.name_index = self.add_index(lambda component: component.name)
+        self.part_name_index = self.add_index(lambda component: component.part_name)
+        self.set_category_aggregates(
+            {
+                "stock_cost": lambda component, category: component.get_total_cost_in_stock(),
+                "unit_cost": lambda component, category: component.get_total_unit_cost(category),
+            }
+        )
+
     def index(self, component: Component | str) -> int:
         if isinstance(component, Component):
             return self.components.index(component)
@@ -47,36 +59,28 @@ class ComponentsInventory(Inventory):
     def get_components_by_category(self, category: str | Category) -> list[Component]:
         if isinstance(category, str):
             category = self.get_category(category)
-        return [component for component in self.components if category in component.categories]
+        return self.category_index.get_members(self.components, category)
 
     def get_total_stock_cost_for_similar_categories(self, text: str) -> float:
         total = 0.0
         used_components: set[str] = set()
         for category in self.get_categories():
             if text in category.name:
-                for component in self.components:
-                    if category in component.categories and component.name not in used_components:
+                for component in self.category_index.get_members(self.components, category):
+                    if component.name not in used_components:
                         total += component.get_total_cost_in_stock()
                         used_components.add(component.name)
         return total
 
     def get_total_category_cost_in_stock(self, category: Category | str) -> float:
-        total = 0.0
         if isinstance(category, str):
             category = self.get_category(category)
-        for component in self.components:
-            if category in component.categories:
-                total += component.get_total_cost_in_stock()
-        return total
+        return self.category_index.get_total(self.components, category, "stock_cost")
 
     def get_total_category_unit_cost(self, category: Category | str) -> float:
-        total = 0.0
         if isinstance(category, str):
             category = self.get_category(category)
-        for component in self.components:
-            if category in component.categories:
-                total += component.get_total_unit_cost(category)
-        return total
+        return self.category_index.get_total(self.components, category, "unit_cost")
 
     def add_component(self, component: Component, on_finished: Callable | None = None):
         worker = AddComponentWorker(component)
@@ -89,6 +93,7 @@ class ComponentsInventory(Inventory):
         data, component = response
         component.id = data["id"]
         self.components.append(component)
+        self.invalidate_indexes()
 
     def remove_components(self, components: list[Component], on_finished: Callable | None = None):
         worker = RemoveComponentsWorker(components)
@@ -107,12 +112,14 @@ class ComponentsInventory(Inventory):
                 if component.id == component_r.id:
                     self.components.remove(component)
                     break
+        self.invalidate_indexes()
         # self.save_local_copy()
 
     def save_component(self, component: Component):
         self.save_components([component])
 
     def save_components(self, components: list[Component]):
+        self.refresh_indexes(components)
         worker = UpdateComponentsWorker(components)
         worker.signals.success.connect(self.save_local_copy)
         QThreadPool.globalInstance().start(worker)
@@ -122,48 +129,54 @@ class ComponentsInventory(Inventory):
         worker.signals.success.connect(on_finished)
         QThreadPool.globalInstance().start(worker)
 
+    def get_components(self, component_ids: list[int | str], on_finished: Callable | None = None):
+        worker = GetComponentsWorker(component_ids)
+        worker.signals.success.connect(on_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def update_components_data(self, components_data: list[dict | ComponentRecord]) -> InventoryChanges:
+        return self.reconcile_items(self.components, components_data, lambda data: Component(data, self))
+
     def update_component_data(self, component_id: int, data: dict) -> Component | None:
-        for component in self.components:
-            if component.id == component_id:
-                component.load_data(data)
-                return component
+        if component := self.get_component_by_id(component_id):
+            component.load_data(data)
+            self.name_index.invalidate()
+            self.part_name_index.invalidate()
+            self.category_index.refresh([component])
+            return component
         return None
 
     def duplicate_category(self, category_to_duplicate: Category, new_category_name: str) -> Category:
         new_category = Category(new_category_name)
         super().add_category(new_category)
-        for component in self.get_components_by_category(category_to_duplicate):
+        components_to_duplicate = self.get_components_by_category(category_to_duplicate)
+        for component in components_to_duplicate:
             component.add_to_category(new_category)
-        self.save_components(self.get_components_by_category(category_to_duplicate))
+        self.category_index.invalidate()
+        self.save_components(components_to_duplicate)
         return new_category
 
     def delete_category(self, category: str | Category) -> Category:
         deleted_category = super().delete_category(category)
-        for component in self.get_components_by_category(deleted_category):
+        components_to_remove = self.get_components_by_category(deleted_category)
+        for component in components_to_remove:
             component.remove_from_category(deleted_category)
-        self.save_components(self.get_components_by_category(deleted_category))
+        self.category_index.invalidate()
+        self.save_components(components_to_remove)
         return deleted_category
 
     def get_component_by_name(self, component_name: str) -> Component | None:
-        return next(
-            (component for component in self.components if component.name == component_name),
-            None,
-        )
+        return self.name_index.get(self.components, component_name)
 
     def get_component_by_part_name(self, component_name: str) -> Component | None:
-        return next(
-            (component for component in self.components if component.part_name == component_name),
-            None,
-        )
+        return self.part_name_index.get(self.components, component_name)
 
     def get_component_by_id(self, component_id: int) -> Component | None:
-        return next(
-            (component for component in self.components if component.id == component_id),
-            None,
-        )
+        return self.id_index.get(self.components, component_id)
 
     def sort_by_quantity(self, ascending: bool) -> list[Component]:
         self.components = natsorted(self.components, key=lambda component: component.quantity, reverse=ascending)
+        self.category_index.invalidate()  # Members follow inventory order
         return self.components
 
     def sort_by_name(self, ascending: bool) -> list[Component]:
@@ -172,25 +185,42 @@ class ComponentsInventory(Inventory):
             key=lambda component: component.part_name,
             reverse=ascending,
         )
+        self.category_index.invalidate()
         return self.components
 
-    def save_local_copy(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "wb") as file:
-            file.write(msgspec.json.encode(self.to_dict()))
-
     def load_data(self, on_loaded: Callable | None = None):
-        self.chain = RunnableChain()
-
-        get_categories_worker = GetComponentsCategoriesWorker()
-        get_all_components_worker = GetAllComponentsWorker()
-
-        self.chain.add(get_categories_worker, self.get_categories_response)
-        self.chain.add(get_all_components_worker, self.get_all_components_response)
+        self.graph = RunnableGraph(name="ComponentsInventoryLoader")
+        self.add_load_steps(self.graph)
 
         if on_loaded:
-            self.chain.finished.connect(on_loaded)
-
-        self.chain.start()
+            self.graph.finished.connect(on_loaded)
+
+        self.graph.start()
+
+    def add_load_steps(self, graph: RunnableGraph, depends_on: Iterable[str] = ()) -> tuple[str, str]:
+        """Returns the step after which components are usable and the step after which they match the server."""
+        ready_step = "components_inventory/get_changes"
+        if self.synced_at:
+            since = self.synced_at
+        elif cache := self.read_cache():
+            since = cache["synced_at"]
+            ready_step = "components_inventory/load_cache"
+            graph.add_task(ready_step, partial(self.load_cache_data, cache), depends_on)
+            depends_on = [ready_step]
+        else:
+            graph.add("components_inventory/get_categories", GetComponentsCategoriesWorker(), self.get_categories_response, depends_on)
+            graph.add("components_inventory/get_all", GetComponentsChangesWorker(None), self.get_changes_response, ["components_inventory/get_categories", *depends_on])
+            return "components_inventory/get_all", "components_inventory/get_all"
+
+        graph.add("components_inventory/get_categories", GetComponentsCategoriesWorker(), self.get_categories_response, depends_on)
+        graph.add("components_inventory/get_changes", GetComponentsChangesWorker(since), self.get_changes_response, ["components_inventory/get_categories"])
+        return ready_step, "components_inventory/get_changes"
+
+    def load_cache_data(self, cache: dict):
+        data = cache["data"]
+        self.categories.from_list(data.get("categories", []))
+        self.replace_items(self.components, [Component(component_data, self) for component_data in data.get("components", [])])
+        self.synced_at = cache["synced_at"]
 
     def get_categories_response(self, response: list[str], next_step: Callable):
         try:
@@ -199,11 +229,8 @@ class ComponentsInventory(Inventory):
             self.categories.clear()
         next_step()
 
-    def get_all_components_response(self, response: list[dict], next_step: Callable):
-        self.components.clear()
-        for component_data in response:
-            component = Component(component_data, self)
-            self.components.append(component)
+    def get_changes_response(self, response: dict, next_step: Callable):
+        self.merge_changes(self.components, response, lambda data: Component(data, self))
         self.save_local_copy()
         next_step()
 
@@ -1,15 +1,32 @@
+import contextlib
+import logging
 import os
+import time
+from typing import Callable
+
+import msgspec
 
 from config.environments import Environment
 from utils.inventory.categories import Categories
 from utils.inventory.category import Category
+from utils.inventory.category_index import CategoryIndex
+from utils.inventory.inventory_changes import InventoryChanges, reconcile
+from utils.inventory.item_index import ItemIndex
 
 
 class Inventory:
+    CACHE_VERSION = 1  # Bump when an item's to_dict() layout changes so stale caches are ignored
+
     def __init__(self, filename: str):
         self.categories: Categories = Categories()
         self.filename: str = filename.replace(".json", "")
         self.FOLDER_LOCATION: str = f"{Environment.DATA_PATH}/data"
+        self.CACHE_LOCATION: str = f"{Environment.DATA_PATH}/data/cache"
+        self.synced_at: str | None = None  # Cursor the server issued with the last full load or delta merge
+        self.indexes: list[ItemIndex] = []
+        self.category_index: CategoryIndex = CategoryIndex()
+        # Changes since the tables last caught up, None when the items were replaced and tables have to reload
+        self.pending_changes: InventoryChanges | None = None
         self.__create_file()
 
     def __create_file(self):
@@ -20,6 +37,95 @@ class Inventory:
         with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "w", encoding="utf-8") as file:
             file.write("{}")
 
+    def to_dict(self) -> dict:
+        raise NotImplementedError
+
+    def add_index(self, key: Callable[[object], object]) -> ItemIndex:
+        index = ItemIndex(key)
+        self.indexes.append(index)
+        return index
+
+    def set_category_aggregates(self, aggregates: dict[str, Callable[[object, Category], float]]):
+        self.category_index = CategoryIndex(aggregates)
+
+    def invalidate_indexes(self):
+        for index in self.indexes:
+            index.invalidate()
+        self.category_index.invalidate()
+
+    def refresh_indexes(self, items: list):
+        # Saves are how edits reach the server: names may have changed, quantities and prices
+        # usually did, but the category members are only patched, not rebuilt.
+        for index in self.indexes:
+            index.invalidate()
+        self.category_index.refresh(items)
+
+    def save_local_copy(self):
+        data = self.to_dict()
+        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "wb") as file:
+            file.write(msgspec.json.encode(data))
+        if self.synced_at:
+            self.save_cache(data)
+
+    def save_cache(self, data: dict):
+        os.makedirs(self.CACHE_LOCATION, exist_ok=True)
+        cache_path = f"{self.CACHE_LOCATION}/{self.filename}.json"
+        with open(f"{cache_path}.tmp", "wb") as file:
+            file.write(
+                msgspec.json.encode(
+                    {
+                        "cache_version": self.CACHE_VERSION,
+                        "synced_at": self.synced_at,
+                        "data": data,
+                    }
+                )
+            )
+        os.replace(f"{cache_path}.tmp", cache_path)  # Never leave a half written cache behind
+
+    def remove_cache(self):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(f"{self.CACHE_LOCATION}/{self.filename}.json")
+
+    def read_cache(self) -> dict | None:
+        try:
+            with open(f"{self.CACHE_LOCATION}/{self.filename}.json", "rb") as file:
+                cache = msgspec.json.decode(file.read())
+        except (OSError, msgspec.DecodeError):
+            return None
+        if not isinstance(cache, dict) or cache.get("cache_version") != self.CACHE_VERSION:
+            return None
+        if not cache.get("synced_at") or not isinstance(cache.get("data"), dict):
+            return None
+        return cache
+
+    def reconcile_items(self, items: list, updated_data: list[dict], create_item: Callable[[dict], object], deleted_ids=(), full: bool = False) -> InventoryChanges:
+        # Items are updated in place so anything holding a reference to them (tables, orders) stays valid.
+        start_time = time.perf_counter()
+        changes = reconcile(items, updated_data, create_item, deleted_ids, full)
+        logging.info(f"{self.filename}: reconciled {len(updated_data)} items in {(time.perf_counter() - start_time) * 1000:.1f} ms ({changes})")
+        if changes:
+            self.invalidate_indexes()
+        if self.pending_changes is not None:
+            self.pending_changes.merge(changes)
+        return changes
+
+    def replace_items(self, items: list, new_items: list):
+        items[:] = new_items
+        self.invalidate_indexes()
+        self.pending_changes = None
+
+    def take_changes(self) -> InventoryChanges | None:
+        """Returns what changed since the last call, None means the tables need a full reload."""
+        changes = self.pending_changes
+        self.pending_changes = InventoryChanges()
+        return changes
+
+    def merge_changes(self, items: list, changes: dict, create_item: Callable[[dict], object]):
+        self.reconcile_items(items, changes["updated"], create_item, changes["deleted"], full=changes["full"])
+        self.synced_at = changes["timestamp"]
+        if not self.synced_at:  # The server sent no cursor, so the next load starts over with get_all
+            self.remove_cache()
+
     def get_categories(self) -> list[Category]:
         return self.categories.categories
 
@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Iterable, TypeVar
+
+import msgspec
+
+T = TypeVar("T")
+
+
+@dataclass
+class InventoryChanges(Generic[T]):
+    """What a reload did to an inventory's items, so tables can patch rows instead of redrawing."""
+
+    inserted: list[T] = field(default_factory=list)
+    deleted: list[T] = field(default_factory=list)
+    updated: list[T] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.deleted or self.updated)
+
+    def __str__(self) -> str:
+        return f"{len(self.inserted)} inserted, {len(self.deleted)} deleted, {len(self.updated)} updated"
+
+    def merge(self, other: "InventoryChanges[T]"):
+        for name in ("inserted", "deleted", "updated"):
+            items: list[T] = getattr(self, name)
+            seen = {id(item) for item in items}
+            items.extend(item for item in getattr(other, name) if id(item) not in seen)
+
+
+def get_data_id(data: dict | msgspec.Struct):
+    return data.get("id") if isinstance(data, dict) else data.id
+
+
+def reconcile(
+    items: list[T],
+    updated_data: list[dict | msgspec.Struct],
+    create_item: Callable[[dict | msgspec.Struct], T],
+    deleted_ids: Iterable = (),
+    full: bool = False,
+) -> InventoryChanges[T]:
+    """Patches items in place from server data, matched by id.
+
+    With full=True updated_data is the whole inventory, anything missing from it is deleted and the
+    server's order is kept. Items whose to_dict() already matches their data are not reloaded.
+    Rows can be dicts or records decoded with msgspec, load_data and create_item get them as is.
+    Records are compared against the item's to_record(), so items loaded from records need one.
+    """
+    changes: InventoryChanges[T] = InventoryChanges()
+    existing = {item.id: item for item in items}
+    if full:
+        deleted_ids = existing.keys() - {get_data_id(data) for data in updated_data}
+    deleted_ids = set(deleted_ids)
+    if deleted_ids:
+        changes.deleted = [item for item in items if item.id in deleted_ids]
+        items[:] = [item for item in items if item.id not in deleted_ids]
+
+    ordered: list[T] = []
+    for data in updated_data:
+        if item := existing.get(get_data_id(data)):
+            if (item.to_dict() if isinstance(data, dict) else item.to_record()) != data:
+                item.load_data(data)
+                changes.updated.append(item)
+        else:
+            item = create_item(data)
+            changes.inserted.append(item)
+            if not full:
+                items.append(item)
+        ordered.append(item)
+    if full:
+        items[:] = ordered
+    return changes
@@ -0,0 +1,54 @@
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class ItemIndex(Generic[T]):
+    """Hash index over inventory items, keyed by something like id or name.
+
+    Inventories call invalidate() whenever items are added, removed, reloaded or saved (which is
+    how renames reach the server), the index is rebuilt on the next lookup. A hit whose key no
+    longer matches (renamed but not saved yet) also triggers a rebuild so lookups never go stale.
+    """
+
+    def __init__(self, key: Callable[[T], Hashable]):
+        self.key = key
+        self._items: dict[Hashable, T] = {}
+        self._dirty = True
+
+    def invalidate(self):
+        self._dirty = True
+
+    def rebuild(self, items: Iterable[T]):
+        self._items.clear()
+        for item in items:
+            self._items.setdefault(self.key(item), item)  # First match wins, same as the old next(...) scans
+        self._dirty = False
+
+    def get(self, items: Iterable[T], key: Hashable) -> T | None:
+        if self._dirty:
+            self.rebuild(items)
+        item = self._items.get(key)
+        if item is not None and self.key(item) != key:
+            self.rebuild(items)
+            item = self._items.get(key)
+        return item
+
+
+if __name__ == "__main__":
+    import timeit
+    from dataclasses import dataclass
+
+    @dataclass
+    class Part:
+        id: int
+        name: str
+
+    for size in (1_000, 10_000, 100_000):
+        parts = [Part(i, f"Part {i}") for i in range(size)]
+        index: ItemIndex[Part] = ItemIndex(lambda part: part.name)
+        index.rebuild(parts)
+        target = parts[-1].name
+        scan = timeit.timeit(lambda: next((part for part in parts if part.name == target), None), number=100) / 100
+        indexed = timeit.timeit(lambda: index.get(parts, target), number=100_000) / 100_000
+        print(f"{size:>7} parts: linear scan {scan * 1e6:>10.2f}us, indexed {indexed * 1e6:.3f}us")
@@ -1,28 +1,32 @@
 import os
 from datetime import datetime
-from typing import Callable, Literal, Union
+from functools import partial
+from typing import Callable, Iterable, Literal, Union
 
-import msgspec
 from natsort import natsorted
 from PyQt6.QtCore import QThreadPool
 
 from utils.inventory.category import Category
 from utils.inventory.inventory import Inventory
-from utils.inventory.laser_cut_part import LaserCutPart
+from utils.inventory.inventory_changes import InventoryChanges
+from utils.inventory.laser_cut_part import LaserCutPart, LaserCutPartRecord
 from utils.inventory.paint_inventory import PaintInventory
 from utils.sheet_settings.sheet_settings import SheetSettings
 from utils.workers.laser_cut_parts_inventory.add_laser_cut_parts import (
     AddLaserCutPartsWorker,
 )
-from utils.workers.laser_cut_parts_inventory.get_all_laser_cut_parts import (
-    GetAllLaserCutPartsWorker,
-)
 from utils.workers.laser_cut_parts_inventory.get_categories import (
     GetLaserCutPartsCategoriesWorker,
 )
+from utils.workers.laser_cut_parts_inventory.get_changes import (
+    GetLaserCutPartsChangesWorker,
+)
 from utils.workers.laser_cut_parts_inventory.get_laser_cut_part import (
     GetLaserCutPartWorker,
 )
+from utils.workers.laser_cut_parts_inventory.get_laser_cut_parts import (
+    GetLaserCutPartsWorker,
+)
 from utils.workers.laser_cut_parts_inventory.remove_laser_cut_parts import (
     RemoveLaserCutPartsWorker,
 )
@@ -32,7 +36,7 @@ from utils.workers.laser_cut_parts_inventory.update_laser_cut_parts import (
 from utils.workers.laser_cut_parts_inventory.upsert_quantities import (
     UpsertQuantitiesWorker,
 )
-from utils.workers.runnable_chain import RunnableChain
+from utils.workers.runnable_graph import RunnableGraph
 from utils.workspace.workspace_settings import WorkspaceSettings
 
 
@@ -46,6 +50,10 @@ class LaserCutInventory(Inventory):
         self.laser_cut_parts: list[LaserCutPart] = []
         self.recut_parts: list[LaserCutPart] = []
 
+        self.id_index = self.add_index(lambda laser_cut_part: laser_cut_part.id)
+        self.name_index = self.add_index(lambda laser_cut_part: laser_cut_part.name)
+        self.set_category_aggregates({"stock_cost": lambda laser_cut_part, category: laser_cut_part.prices.price * laser_cut_part.inventory_data.quantity})
+
     def get_all_part_names(self) -> list[str]:
         return [laser_cut_part.name for laser_cut_part in self.laser_cut_parts]
 
@@ -55,7 +63,7 @@ class LaserCutInventory(Inventory):
         if category.name == "Recut":
             return self.recut_parts
         else:
-            return [laser_cut_part for laser_cut_part in self.laser_cut_parts if category in laser_cut_part.categories]
+            return self.category_index.get_members(self.laser_cut_parts, category)
 
     def get_group_categories(self, laser_cut_parts: list[LaserCutPart]) -> dict[str, list[LaserCutPart]]:
         group: dict[str, list[LaserCutPart]] = {}
@@ -67,10 +75,9 @@ class LaserCutInventory(Inventory):
         return {key: group[key] for key in natsorted(group.keys())}
 
     def get_category_parts_total_stock_cost(self, category: Category):
-        total_stock_cost = 0.0
-        for laser_cut_part in self.get_laser_cut_parts_by_category(category):
-            total_stock_cost += laser_cut_part.prices.price * laser_cut_part.inventory_data.quantity
-        return total_stock_cost
+        if category.name == "Recut":
+            return self.get_recut_parts_total_stock_cost()
+        return self.category_index.get_total(self.laser_cut_parts, category, "stock_cost")
 
     def get_recut_parts_total_stock_cost(self) -> float:
         total_stock_cost = 0.0
@@ -194,6 +201,7 @@ class LaserCutInventory(Inventory):
         for laser_cut_part in laser_cut_parts:
             laser_cut_part.id = data["id"]
             self.laser_cut_parts.append(laser_cut_part)
+        self.invalidate_indexes()
 
     def remove_laser_cut_parts(self, laser_cut_parts: list[LaserCutPart], on_finished: Callable | None = None):
         worker = RemoveLaserCutPartsWorker(laser_cut_parts)
@@ -207,12 +215,14 @@ class LaserCutInventory(Inventory):
         data, laser_cut_parts = response
         for laser_cut_part in laser_cut_parts:
             self.laser_cut_parts.remove(laser_cut_part)
+        self.invalidate_indexes()
         # self.save_local_copy()
 
     def save_laser_cut_part(self, laser_cut_part: LaserCutPart):
         self.save_laser_cut_parts([laser_cut_part])
 
     def save_laser_cut_parts(self, laser_cut_parts: list[LaserCutPart]):
+        self.refresh_indexes(laser_cut_parts)
         worker = UpdateLaserCutPartsWorker(laser_cut_parts)
         worker.signals.success.connect(self.save_local_copy)
         QThreadPool.globalInstance().start(worker)
@@ -222,30 +232,43 @@ class LaserCutInventory(Inventory):
         worker.signals.success.connect(on_finished)
         QThreadPool.globalInstance().start(worker)
 
+    def get_laser_cut_parts(self, laser_cut_part_ids: list[int | str], on_finished: Callable | None = None):
+        worker = GetLaserCutPartsWorker(laser_cut_part_ids)
+        worker.signals.success.connect(on_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def update_laser_cut_parts_data(self, laser_cut_parts_data: list[dict | LaserCutPartRecord]) -> InventoryChanges:
+        return self.reconcile_items(self.laser_cut_parts, laser_cut_parts_data, lambda data: LaserCutPart(data, self))
+
     def update_laser_cut_part_data(
         self,
         laser_cut_part_id: int,
         data: dict,
     ) -> LaserCutPart | None:
-        for laser_cut_part in self.laser_cut_parts:
-            if laser_cut_part.id == laser_cut_part_id:
-                laser_cut_part.load_data(data)
-                return laser_cut_part
+        if laser_cut_part := self.get_laser_cut_part_by_id(laser_cut_part_id):
+            laser_cut_part.load_data(data)
+            self.name_index.invalidate()
+            self.category_index.refresh([laser_cut_part])
+            return laser_cut_part
         return None
 
     def duplicate_category(self, category_to_duplicate: Category, new_category_name: str) -> Category:
         new_category = Category(new_category_name)
         super().add_category(new_category)
-        for laser_cut_part in self.get_laser_cut_parts_by_category(category_to_duplicate):
+        laser_cut_parts_to_duplicate = self.get_laser_cut_parts_by_category(category_to_duplicate)
+        for laser_cut_part in laser_cut_parts_to_duplicate:
             laser_cut_part.add_to_category(new_category)
-        self.save_laser_cut_parts(self.get_laser_cut_parts_by_category(new_category))
+        self.category_index.invalidate()
+        self.save_laser_cut_parts(laser_cut_parts_to_duplicate)
         return new_category
 
     def delete_category(self, category: str | Category) -> Category:
         deleted_category = super().delete_category(category)
-        for laser_cut_part in self.get_laser_cut_parts_by_category(deleted_category):
+        laser_cut_parts_to_remove = self.get_laser_cut_parts_by_category(deleted_category)
+        for laser_cut_part in laser_cut_parts_to_remove:
             laser_cut_part.remove_from_category(deleted_category)
-        self.save_laser_cut_parts(self.get_laser_cut_parts_by_category(deleted_category))
+        self.category_index.invalidate()
+        self.save_laser_cut_parts(laser_cut_parts_to_remove)
         return deleted_category
 
     def rename_category(self, original: str | Category, new_name: str) -> Category:
@@ -259,17 +282,18 @@ class LaserCutInventory(Inventory):
 
         original.rename(new_name)
 
-        for laser_cut_part in self.get_laser_cut_parts_by_category(original):
+        for laser_cut_part in original_laser_cut_parts:
             laser_cut_part.add_to_category(original)
 
-        self.save_laser_cut_parts(self.get_laser_cut_parts_by_category(original))
+        self.category_index.invalidate()
+        self.save_laser_cut_parts(original_laser_cut_parts)
         return original
 
     def get_laser_cut_part_by_name(self, laser_cut_part_name: str) -> LaserCutPart | None:
-        return next(
-            (laser_cut_part for laser_cut_part in self.laser_cut_parts if laser_cut_part.name == laser_cut_part_name),
-            None,
-        )
+        return self.name_index.get(self.laser_cut_parts, laser_cut_part_name)
+
+    def get_laser_cut_part_by_id(self, laser_cut_part_id: int) -> LaserCutPart | None:
+        return self.id_index.get(self.laser_cut_parts, laser_cut_part_id)
 
     def get_recut_part_by_name(self, recut_part_name: str) -> LaserCutPart | None:
         return next(
@@ -280,25 +304,53 @@ class LaserCutInventory(Inventory):
     def sort_by_quantity(self) -> list[LaserCutPart]:
         self.laser_cut_parts = natsorted(self.laser_cut_parts, key=lambda laser_cut_part: laser_cut_part.inventory_data.quantity)
         self.recut_parts = natsorted(self.recut_parts, key=lambda recut_part: recut_part.inventory_data.quantity)
+        self.category_index.invalidate()  # Members follow inventory order
         return self.laser_cut_parts
 
-    def save_local_copy(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "wb") as file:
-            file.write(msgspec.json.encode(self.to_dict()))
-
     def load_data(self, on_loaded: Callable | None = None):
-        self.chain = RunnableChain()
-
-        get_categories_worker = GetLaserCutPartsCategoriesWorker()
-        get_all_laser_cut_parts_worker = GetAllLaserCutPartsWorker()
-
-        self.chain.add(get_categories_worker, self.get_categories_response)
-        self.chain.add(get_all_laser_cut_parts_worker, self.get_all_laser_cut_parts_response)
+        self.graph = RunnableGraph(name="LaserCutInventoryLoader")
+        self.add_load_steps(self.graph)
 
         if on_loaded:
-            self.chain.finished.connect(on_loaded)
+            self.graph.finished.connect(on_loaded)
+
+        self.graph.start()
+
+    def add_load_steps(self, graph: RunnableGraph, depends_on: Iterable[str] = ()) -> tuple[str, str]:
+        """Returns the step after which parts are usable and the step after which they match the server."""
+        # Parts resolve their paint items while hydrating, so startup passes the coatings step in depends_on.
+        ready_step = "laser_cut_parts_inventory/get_changes"
+        if self.synced_at:
+            since = self.synced_at
+        elif cache := self.read_cache():
+            since = cache["synced_at"]
+            ready_step = "laser_cut_parts_inventory/load_cache"
+            graph.add_task(ready_step, partial(self.load_cache_data, cache), depends_on)
+            depends_on = [ready_step]
+        else:
+            graph.add("laser_cut_parts_inventory/get_categories", GetLaserCutPartsCategoriesWorker(), self.get_categories_response, depends_on)
+            graph.add(
+                "laser_cut_parts_inventory/get_all",
+                GetLaserCutPartsChangesWorker(None),
+                self.get_changes_response,
+                ["laser_cut_parts_inventory/get_categories", *depends_on],
+            )
+            return "laser_cut_parts_inventory/get_all", "laser_cut_parts_inventory/get_all"
+
+        graph.add("laser_cut_parts_inventory/get_categories", GetLaserCutPartsCategoriesWorker(), self.get_categories_response, depends_on)
+        graph.add(
+            "laser_cut_parts_inventory/get_changes",
+            GetLaserCutPartsChangesWorker(since),
+            self.get_changes_response,
+            ["laser_cut_parts_inventory/get_categories"],
+        )
+        return ready_step, "laser_cut_parts_inventory/get_changes"
 
-        self.chain.start()
+    def load_cache_data(self, cache: dict):
+        data = cache["data"]
+        self.categories.from_list(data.get("categories", []))
+        self.replace_items(self.laser_cut_parts, [LaserCutPart(laser_cut_part_data, self) for laser_cut_part_data in data.get("laser_cut_parts", [])])
+        self.synced_at = cache["synced_at"]
 
     def get_categories_response(self, response: list, next_step: Callable):
         try:
@@ -307,12 +359,9 @@ class LaserCutInventory(Inventory):
             self.categories.clear()
         next_step()
 
-    def get_all_laser_cut_parts_response(self, response: dict, next_step: Callable):
-        self.laser_cut_parts.clear()
-        for component_data in response:
-            component = LaserCutPart(component_data, self)
-            self.laser_cut_parts.append(component)
-        # self.save_local_copy()
+    def get_changes_response(self, response: dict, next_step: Callable):
+        self.merge_changes(self.laser_cut_parts, response, lambda data: LaserCutPart(data, self))
+        self.save_local_copy()
         next_step()
 
     def to_dict(self) -> dict[str, Union[dict[str, object], list[object]]]:
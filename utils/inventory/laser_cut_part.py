@@ -1,14 +1,16 @@
 import copy
-import dataclasses
-from dataclasses import dataclass, field, fields
-from typing import TYPE_CHECKING, Any, Optional, TypedDict, Union, cast
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, TypedDict, Union
 
-from utils.dxf_analyzer import DxfAnalyzer
+import msgspec
+
+from utils.dxf_analyzer import DxfAnalysis
 from utils.inventory.category import Category
 from utils.inventory.inventory_item import InventoryItem
-from utils.inventory.paint import PaintData, PaintDataDict
-from utils.inventory.powder import PowderData, PowderDataDict
-from utils.inventory.primer import PrimerData, PrimerDataDict
+from utils.inventory.paint import PaintData, PaintDataDict, PaintDataRecord
+from utils.inventory.powder import PowderData, PowderDataDict, PowderDataRecord
+from utils.inventory.primer import PrimerData, PrimerDataDict, PrimerDataRecord
+from utils.inventory.record_data import RecordData
 from utils.sheet_settings.sheet_settings import SheetSettings
 from utils.workspace.flowtag import Flowtag, FlowtagDict
 from utils.workspace.flowtag_data import FlowtagData, FlowtagDataDict
@@ -22,37 +24,36 @@ if TYPE_CHECKING:
 
 
 class InventoryDataDict(TypedDict):
-    quantity: int
-    red_quantity_limit: int
-    yellow_quantity_limit: int
+    quantity: float
+    red_quantity_limit: float
+    yellow_quantity_limit: float
 
 
-@dataclass
-class InventoryData:
-    quantity: int = 0
-    red_quantity_limit: int = 4
-    yellow_quantity_limit: int = 10
+class InventoryDataRecord(msgspec.Struct):
+    quantity: float = 0.0
+    red_quantity_limit: float = 4.0
+    yellow_quantity_limit: float = 10.0
 
-    def __init__(self, data: Optional[InventoryDataDict], laser_cut_inventory: "LaserCutInventory"):
-        self.laser_cut_inventory = laser_cut_inventory
 
-        for f in fields(self.__class__):
-            if f.default is not dataclasses.MISSING:
-                setattr(self, f.name, f.default)
-            elif f.default_factory is not dataclasses.MISSING:
-                setattr(self, f.name, f.default_factory())
+@dataclass(slots=True)
+class InventoryData(RecordData):
+    record_type = InventoryDataRecord
 
-        if data:
-            for f in fields(self.__class__):
-                if f.name in data:
-                    setattr(self, f.name, data[f.name])
+    quantity: float = 0.0
+    red_quantity_limit: float = 4.0
+    yellow_quantity_limit: float = 10.0
+    laser_cut_inventory: Optional["LaserCutInventory"] = field(default=None, repr=False, compare=False)
 
-    def to_dict(self) -> InventoryDataDict:
-        return {
-            "quantity": self.quantity,
-            "red_quantity_limit": self.red_quantity_limit,
-            "yellow_quantity_limit": self.yellow_quantity_limit,
-        }
+    def __init__(self, data: Optional[InventoryDataDict], laser_cut_inventory: "LaserCutInventory"):
+        self.load_dict(data)
+        self.laser_cut_inventory = laser_cut_inventory
+
+    @classmethod
+    def from_record(cls, record: InventoryDataRecord, laser_cut_inventory: "LaserCutInventory") -> "InventoryData":
+        inventory_data = cls.__new__(cls)
+        inventory_data.load_record(record)
+        inventory_data.laser_cut_inventory = laser_cut_inventory
+        return inventory_data
 
 
 class MetaDataDict(TypedDict):
@@ -77,8 +78,7 @@ class MetaDataDict(TypedDict):
     quantity_on_sheet: int
 
 
-@dataclass
-class MetaData:
+class MetaDataRecord(msgspec.Struct):
     machine_time: float = 0.0
     weight: float = 0.0
     part_number: str = ""
@@ -97,22 +97,35 @@ class MetaData:
     modified_date: str = ""
     bend_hits: int = 0
     notes: str = ""
-    quantity_on_sheet: int = 0
+    quantity_on_sheet: int | None = 0  # None for parts grouped across nests
 
-    def __init__(self, data: Optional[MetaDataDict]):
-        for f in fields(self.__class__):
-            if f.default is not dataclasses.MISSING:
-                setattr(self, f.name, f.default)
-            elif f.default_factory is not dataclasses.MISSING:
-                setattr(self, f.name, f.default_factory())
 
-        if data:
-            for f in fields(self.__class__):
-                if f.name in data:
-                    setattr(self, f.name, data[f.name])
+@dataclass(slots=True)
+class MetaData(RecordData):
+    record_type = MetaDataRecord
 
-    def to_dict(self) -> MetaDataDict:
-        return cast(MetaDataDict, {f.name: getattr(self, f.name) for f in fields(self)})
+    machine_time: float = 0.0
+    weight: float = 0.0
+    part_number: str = ""
+    image_index: str = ""
+    surface_area: float = 0.0
+    cutting_length: float = 0.0
+    file_name: str = ""
+    piercing_time: float = 0.0
+    piercing_points: int = 0
+    gauge: str = ""
+    material: str = ""
+    shelf_number: str = ""
+    sheet_dim: str = ""
+    part_dim: str = ""
+    geofile_name: str = ""
+    modified_date: str = ""
+    bend_hits: int = 0
+    notes: str = ""
+    quantity_on_sheet: int = 0
+
+    def __init__(self, data: Optional[MetaDataDict]):
+        self.load_dict(data)
 
 
 class PricesDict(TypedDict):
@@ -126,8 +139,7 @@ class PricesDict(TypedDict):
     matched_to_sheet_cost_price: float
 
 
-@dataclass
-class Prices:
+class PricesRecord(msgspec.Struct):
     price: float = 0.0
     cost_of_goods: float = 0.0
     bend_cost: float = 0.0
@@ -137,20 +149,22 @@ class Prices:
     cost_for_powder_coating: float = 0.0
     matched_to_sheet_cost_price: float = 0.0
 
-    def __init__(self, data: Optional[PricesDict]):
-        for f in fields(self.__class__):
-            if f.default is not dataclasses.MISSING:
-                setattr(self, f.name, f.default)
-            elif f.default_factory is not dataclasses.MISSING:
-                setattr(self, f.name, f.default_factory())
 
-        if data:
-            for f in fields(self.__class__):
-                if f.name in data:
-                    setattr(self, f.name, data[f.name])
+@dataclass(slots=True)
+class Prices(RecordData):
+    record_type = PricesRecord
+
+    price: float = 0.0
+    cost_of_goods: float = 0.0
+    bend_cost: float = 0.0
+    labor_cost: float = 0.0
+    cost_for_paint: float = 0.0
+    cost_for_primer: float = 0.0
+    cost_for_powder_coating: float = 0.0
+    matched_to_sheet_cost_price: float = 0.0
 
-    def to_dict(self) -> PricesDict:
-        return cast(PricesDict, {f.name: getattr(self, f.name) for f in fields(self)})
+    def __init__(self, data: Optional[PricesDict]):
+        self.load_dict(data)
 
 
 class WorkspaceDataDict(TypedDict):
@@ -161,39 +175,54 @@ class WorkspaceDataDict(TypedDict):
     flow_tag_data: FlowtagDataDict
 
 
-@dataclass
-class WorkspaceData:
+class WorkspaceDataRecord(msgspec.Struct):
+    bending_files: list[str] = []
+    welding_files: list[str] = []
+    cnc_milling_files: list[str] = []
+    flowtag: dict = {}
+    flowtag_data: dict = {}
+
+
+@dataclass(slots=True)
+class WorkspaceData(RecordData):
+    record_type = WorkspaceDataRecord
+
     bending_files: list[str] = field(default_factory=list)
     welding_files: list[str] = field(default_factory=list)
     cnc_milling_files: list[str] = field(default_factory=list)
     flowtag: Optional[Flowtag] = None
     flowtag_data: Optional[FlowtagData] = None
+    workspace_settings: Optional[WorkspaceSettings] = field(default=None, repr=False, compare=False)
 
     def __init__(self, data: Optional[WorkspaceDataDict], workspace_settings: WorkspaceSettings):
+        data = data or {}
+        self.load_dict(data)
         self.workspace_settings = workspace_settings
-        for f in fields(self.__class__):
-            if f.default is not dataclasses.MISSING:
-                setattr(self, f.name, f.default)
-            elif f.default_factory is not dataclasses.MISSING:
-                setattr(self, f.name, f.default_factory())
-
-        if data:
-            for f in fields(self.__class__):
-                if f.name in ["flowtag", "flow_tag_data"]:
-                    continue
-                if f.name in data:
-                    setattr(self, f.name, data[f.name])
-
-        self.flowtag = Flowtag(data.get("flowtag", {}), self.workspace_settings)
+        self.flowtag = self.workspace_settings.get_shared_flowtag(data.get("flowtag", {}))
         self.flowtag_data = FlowtagData(self.flowtag)
         self.flowtag_data.load_data(data.get("flow_tag_data", {}))
 
+    @classmethod
+    def from_record(cls, record: WorkspaceDataRecord, workspace_settings: WorkspaceSettings) -> "WorkspaceData":
+        workspace_data = cls.__new__(cls)
+        workspace_data.load_record(record)
+        workspace_data.workspace_settings = workspace_settings
+        workspace_data.flowtag = workspace_settings.get_shared_flowtag(record.flowtag)
+        workspace_data.flowtag_data = FlowtagData(workspace_data.flowtag)
+        workspace_data.flowtag_data.load_data({})  # Same as __init__, which reads flow_tag_data and that key is never written
+        return workspace_data
+
+    def clone(self) -> "WorkspaceData":
+        """The flowtag is shared, FlowtagData is copied."""
+        workspace_data = RecordData.clone(self)
+        workspace_data.flowtag_data = self.flowtag_data.clone()
+        return workspace_data
+
     def to_dict(self) -> WorkspaceDataDict:
-        result: dict[str, Any] = {}
-        for f in fields(self.__class__):
-            value = getattr(self, f.name)
-            result[f.name] = value.to_dict() if hasattr(value, "to_dict") else value
-        return cast(WorkspaceDataDict, result)
+        data = RecordData.to_dict(self)
+        data["flowtag"] = self.flowtag.to_dict()
+        data["flowtag_data"] = self.flowtag_data.to_dict()
+        return data
 
 
 class LaserCutPartDict(TypedDict):
@@ -210,6 +239,20 @@ class LaserCutPartDict(TypedDict):
     workspace_data: WorkspaceDataDict
 
 
+class LaserCutPartRecord(msgspec.Struct):
+    id: int = -1
+    name: str = ""
+    categories: list[str] = []
+    category_quantities: dict[str, float] = {}
+    inventory_data: InventoryDataRecord = msgspec.field(default_factory=InventoryDataRecord)
+    meta_data: MetaDataRecord = msgspec.field(default_factory=MetaDataRecord)
+    prices: PricesRecord = msgspec.field(default_factory=PricesRecord)
+    paint_data: PaintDataRecord = msgspec.field(default_factory=PaintDataRecord)
+    primer_data: PrimerDataRecord = msgspec.field(default_factory=PrimerDataRecord)
+    powder_data: PowderDataRecord = msgspec.field(default_factory=PowderDataRecord)
+    workspace_data: WorkspaceDataRecord = msgspec.field(default_factory=WorkspaceDataRecord)
+
+
 class LaserCutPart(InventoryItem):
     PIERCING_TIME = 2.73157894737  # seconds per piercing point
     CUT_TIME_PER_INCH = 2.87897096597  # seconds per inch of cutting length
@@ -237,7 +280,11 @@ class LaserCutPart(InventoryItem):
         self.recut_count_notes: int = 0
         self.nest: Nest | None = None
 
-    def load_data(self, data: LaserCutPartDict):
+    def load_data(self, data: LaserCutPartDict | LaserCutPartRecord):
+        if isinstance(data, LaserCutPartRecord):
+            self.load_record(data)
+            return
+
         self.id = data.get("id", -1)
         self.name = data.get("name", "")
 
@@ -248,15 +295,34 @@ class LaserCutPart(InventoryItem):
         self.primer_data = PrimerData(data.get("primer_data", {}))
         self.powder_data = PowderData(data.get("powder_data", {}))
         self.workspace_data = WorkspaceData(data.get("workspace_data", {}), self.workspace_settings)
-
-        category_names = set(data.get("categories", []))
+        self.load_categories(data.get("categories", []), data.get("category_quantities", {}))
+        self.finish_loading()
+
+    def load_record(self, record: LaserCutPartRecord):
+        """Same as load_data, for parts that were decoded straight into records."""
+        self.id = record.id
+        self.name = record.name
+
+        self.inventory_data = InventoryData.from_record(record.inventory_data, self.laser_cut_inventory)
+        self.meta_data = MetaData.from_record(record.meta_data)
+        self.prices = Prices.from_record(record.prices)
+        self.paint_data = PaintData.from_record(record.paint_data)
+        self.primer_data = PrimerData.from_record(record.primer_data)
+        self.powder_data = PowderData.from_record(record.powder_data)
+        self.workspace_data = WorkspaceData.from_record(record.workspace_data, self.workspace_settings)
+        self.load_categories(record.categories, record.category_quantities)
+        self.finish_loading()
+
+    def load_categories(self, category_names: list[str], category_quantities: dict[str, float]):
+        category_names = set(category_names)
         self.categories = [category for category in self.laser_cut_inventory.get_categories() if category.name in category_names]
 
         self.category_quantities: dict[Category, float] = {}
-        for name, qty in data.get("category_quantities", {}).items():
+        for name, qty in category_quantities.items():
             if category := self.laser_cut_inventory.get_category(name):
                 self.category_quantities[category] = qty
 
+    def finish_loading(self):
         self.paint_data.paint_item = self.paint_inventory.get_paint(self.paint_data.paint_name)
         self.primer_data.primer_item = self.paint_inventory.get_primer(self.primer_data.primer_name)
         self.powder_data.powder_item = self.paint_inventory.get_powder(self.powder_data.powder_name)
@@ -386,14 +452,16 @@ class LaserCutPart(InventoryItem):
     def calculate_machine_time_from_length(self, L: float) -> float:
         return float(0.00001 * L**2 + 0.00389 * L + 0.25198)
 
-    def calculate_machine_time_from_length_and_piercing_points(self, L: float, P: float) -> float:
+    @staticmethod
+    def calculate_machine_time_from_length_and_piercing_points(L: float, P: float) -> float:
         # return float(
         #     0.00000 * L**3 + 0.00000 * L**2 * P + -0.00000 * L * P**2 + 0.00000 * P**3 + -0.00001 * L**2 + -0.00010 * L * P + 0.00011 * P**2 + 0.00816 * L + 0.01222 * P + 0.04308
         # )
         time = -0.00001 * L**2 - 0.00010 * L * P + 0.00011 * P**2 + 0.00816 * L + 0.01222 * P + 0.04308
         return max(0.0, float(time))
 
-    def calculate_piercing_time(self, L: float, P: float) -> float:
+    @staticmethod
+    def calculate_piercing_time(L: float, P: float) -> float:
         # return float(0.00000 * L**2 * P + -0.00000 * L * P**2 + 0.00000 * P**3 + -0.00010 * L * P + 0.00011 * P**2 + 0.01222 * P)
         time = -0.00010 * L * P + 0.00011 * P**2 + 0.01222 * P
         return max(0.0, float(time))
@@ -404,11 +472,11 @@ class LaserCutPart(InventoryItem):
             return self.meta_data.surface_area * pounds_per_square_inch
         return 0.0
 
-    def load_dxf_settings(self, dxf_analyzer: DxfAnalyzer):
-        self.meta_data.surface_area = dxf_analyzer.get_cutting_area()
-        self.meta_data.cutting_length = dxf_analyzer.get_cutting_length()
-        self.meta_data.piercing_points = dxf_analyzer.get_piercing_points()
-        dimensions = dxf_analyzer.get_dimensions()
+    def load_dxf_settings(self, dxf_analysis: DxfAnalysis):
+        self.meta_data.surface_area = dxf_analysis["cutting_area"]
+        self.meta_data.cutting_length = dxf_analysis["cutting_length"]
+        self.meta_data.piercing_points = dxf_analysis["piercing_points"]
+        dimensions = dxf_analysis["dimensions"]
         self.meta_data.part_dim = f"{dimensions['length']} x {dimensions['width']}"
         self.meta_data.piercing_time = self.calculate_piercing_time(self.meta_data.cutting_length, self.meta_data.piercing_points)
         self.meta_data.machine_time = self.calculate_machine_time_from_length_and_piercing_points(self.meta_data.cutting_length, self.meta_data.piercing_points)
@@ -439,6 +507,33 @@ class LaserCutPart(InventoryItem):
     def get_copy(self) -> "LaserCutPart":
         return copy.deepcopy(self)
 
+    def clone(self) -> "LaserCutPart":
+        """Same as LaserCutPart(self.to_dict(), self.laser_cut_inventory) without going through a dict.
+
+        Flowtags, categories and paint items are shared with this part, everything else is copied.
+        """
+        laser_cut_part = LaserCutPart.__new__(LaserCutPart)
+        laser_cut_part.laser_cut_inventory = self.laser_cut_inventory
+        laser_cut_part.paint_inventory = self.paint_inventory
+        laser_cut_part.workspace_settings = self.workspace_settings
+        laser_cut_part.sheet_settings = self.sheet_settings
+
+        laser_cut_part.id = self.id
+        laser_cut_part.name = self.name
+        laser_cut_part.categories = self.categories.copy()
+        laser_cut_part.category_quantities = {category: self.category_quantities.get(category, 1.0) for category in self.categories}
+        laser_cut_part.inventory_data = self.inventory_data.clone()
+        laser_cut_part.meta_data = self.meta_data.clone()
+        laser_cut_part.prices = self.prices.clone()
+        laser_cut_part.paint_data = self.paint_data.clone()
+        laser_cut_part.primer_data = self.primer_data.clone()
+        laser_cut_part.powder_data = self.powder_data.clone()
+        laser_cut_part.workspace_data = self.workspace_data.clone()
+
+        laser_cut_part.recut_count_notes = 0
+        laser_cut_part.nest = None
+        return laser_cut_part
+
     def to_dict(self) -> LaserCutPartDict:
         return {
             "id": self.id,
@@ -453,3 +548,109 @@ class LaserCutPart(InventoryItem):
             "powder_data": self.powder_data.to_dict(),
             "workspace_data": self.workspace_data.to_dict(),
         }
+
+    def to_record(self) -> LaserCutPartRecord:
+        """Same as to_dict, to compare against rows that were decoded into records."""
+        return LaserCutPartRecord(
+            id=self.id,
+            name=self.name,
+            categories=[category.name for category in self.categories],
+            category_quantities={category.name: self.category_quantities.get(category, 1.0) for category in self.categories},
+            inventory_data=self.inventory_data.to_record(),
+            meta_data=self.meta_data.to_record(),
+            prices=self.prices.to_record(),
+            paint_data=self.paint_data.to_record(),
+            primer_data=self.primer_data.to_record(),
+            powder_data=self.powder_data.to_record(),
+            workspace_data=self.workspace_data.to_record(),
+        )
+
+
+if __name__ == "__main__":
+    # Construction, to_dict, clone and memory of the per part records and a 20k part payload: python -m utils.inventory.laser_cut_part
+    import sys
+    import time
+    import tracemalloc
+
+    RECORD_COUNT = 100_000
+    records = {
+        InventoryData: InventoryData(None, None).to_dict(),
+        MetaData: MetaData(None).to_dict() | {"weight": 1.5, "notes": "Benchmark"},
+        Prices: Prices(None).to_dict(),
+        PaintData: PaintData(None).to_dict(),
+        PrimerData: PrimerData(None).to_dict(),
+        PowderData: PowderData(None).to_dict(),
+    }
+    for record_class, data in records.items():
+        args = (data, None) if record_class is InventoryData else (data,)
+        start_time = time.perf_counter()
+        instances = [record_class(*args) for _ in range(RECORD_COUNT)]
+        construction_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        for instance in instances:
+            instance.to_dict()
+        to_dict_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        for instance in instances:
+            instance.clone()
+        clone_time = time.perf_counter() - start_time
+        del instances
+
+        tracemalloc.start()
+        instances = [record_class(*args) for _ in range(RECORD_COUNT)]
+        memory = tracemalloc.get_traced_memory()[0] - sys.getsizeof(instances)
+        tracemalloc.stop()
+        del instances
+        print(
+            f"{record_class.__name__}: {construction_time / RECORD_COUNT * 1e6:.2f} us to construct, {to_dict_time / RECORD_COUNT * 1e6:.2f} us to_dict, {clone_time / RECORD_COUNT * 1e6:.2f} us to clone, {memory / RECORD_COUNT:.0f} bytes each"
+        )
+
+    # Parsing and hydrating a get_all payload, as dicts and as records
+    PAYLOAD_PART_COUNT = 20_000
+    payload = msgspec.json.encode(
+        [
+            LaserCutPartRecord(
+                id=i,
+                name=f"Part {i}",
+                categories=["Benchmark"],
+                meta_data=MetaDataRecord(machine_time=i / 100, gauge="16", material="304 SS", notes="Benchmark"),
+                workspace_data=WorkspaceDataRecord(bending_files=[f"Part {i}.pdf"]),
+            )
+            for i in range(PAYLOAD_PART_COUNT)
+        ]
+    )
+    decoder = msgspec.json.Decoder(list[LaserCutPartRecord], strict=False)
+    for name, decode, hydrate in (
+        (
+            "dicts",
+            msgspec.json.decode,
+            lambda data: (
+                InventoryData(data.get("inventory_data", {}), None),
+                MetaData(data.get("meta_data", {})),
+                Prices(data.get("prices", {})),
+                PaintData(data.get("paint_data", {})),
+                PrimerData(data.get("primer_data", {})),
+                PowderData(data.get("powder_data", {})),
+            ),
+        ),
+        (
+            "records",
+            decoder.decode,
+            lambda record: (
+                InventoryData.from_record(record.inventory_data, None),
+                MetaData.from_record(record.meta_data),
+                Prices.from_record(record.prices),
+                PaintData.from_record(record.paint_data),
+                PrimerData.from_record(record.primer_data),
+                PowderData.from_record(record.powder_data),
+            ),
+        ),
+    ):
+        start_time = time.perf_counter()
+        rows = decode(payload)
+        parse_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        for row in rows:
+            hydrate(row)
+        hydrate_time = time.perf_counter() - start_time
+        print(f"{PAYLOAD_PART_COUNT} parts as {name}: {parse_time * 1000:.1f} ms to parse, {hydrate_time * 1000:.1f} ms to hydrate")
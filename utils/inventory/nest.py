@@ -1,9 +1,10 @@
 from typing import TypedDict
 
+import msgspec
 from natsort import natsorted
 
 from utils.inventory.laser_cut_inventory import LaserCutInventory
-from utils.inventory.laser_cut_part import LaserCutPart, LaserCutPartDict
+from utils.inventory.laser_cut_part import LaserCutPart, LaserCutPartDict, LaserCutPartRecord
 from utils.inventory.sheet import Sheet, SheetDict
 from utils.sheet_settings.sheet_settings import SheetSettings
 
@@ -21,10 +22,23 @@ class NestDict(TypedDict):
     cutting_method: str
 
 
+class NestRecord(msgspec.Struct):
+    sheet: dict  # Required, nests without one use the old format and are decoded as dicts
+    id: int = -1
+    name: str = ""
+    cutting_method: str = "CO2"
+    sheet_count: float = 0.0
+    scrap_percentage: float = 0.0
+    sheet_cut_time: float = 0.0
+    image_path: str = "images/404.jpeg"
+    notes: str = ""
+    laser_cut_parts: list[LaserCutPartRecord] = []
+
+
 class Nest:
     def __init__(
         self,
-        data: NestDict,
+        data: NestDict | NestRecord,
         sheet_settings: SheetSettings,
         laser_cut_inventory: LaserCutInventory,
     ):
@@ -85,6 +99,28 @@ class Nest:
     def sort_laser_cut_parts(self):
         self.laser_cut_parts = natsorted(self.laser_cut_parts, key=lambda laser_cut_part: laser_cut_part.meta_data.part_number)
 
+    def clone(self) -> "Nest":
+        """Same as Nest(self.to_dict(), self.sheet_settings, self.laser_cut_inventory) without going through a dict for the parts."""
+        nest = Nest.__new__(Nest)
+        nest.id = self.id
+        nest.name = self.name
+        nest.cutting_method = self.cutting_method
+        nest.notes = self.notes
+        nest.sheet_settings = self.sheet_settings
+        nest.laser_cut_inventory = self.laser_cut_inventory
+        nest.sheet_count = self.sheet_count
+        nest.scrap_percentage = self.scrap_percentage
+        nest.sheet_cut_time = self.sheet_cut_time
+        nest.image_path = self.image_path
+        nest.laser_cut_parts = []
+        for laser_cut_part in self.laser_cut_parts:
+            new_laser_cut_part = laser_cut_part.clone()
+            new_laser_cut_part.nest = nest
+            nest.laser_cut_parts.append(new_laser_cut_part)
+        nest.sheet = Sheet(self.sheet.to_dict(), None)
+        nest.is_custom = False
+        return nest
+
     def get_nest_recut_part_summary(self) -> str:
         summary = ""
         for part in self.laser_cut_parts:
@@ -95,7 +131,11 @@ class Nest:
                     summary += f"{part.name} has {part.recut_count_notes} recuts\n"
         return summary
 
-    def load_data(self, data: NestDict):
+    def load_data(self, data: NestDict | NestRecord):
+        if isinstance(data, NestRecord):
+            self.load_record(data)
+            return
+
         self.id = data.get("id", -1)
         self.name = data.get("name", "")
         self.cutting_method = data.get("cutting_method", "CO2")
@@ -131,6 +171,23 @@ class Nest:
             )
             self.sheet.name = "nest_sheet"
 
+    def load_record(self, record: NestRecord):
+        """Same as load_data, for nests that were decoded straight into records."""
+        self.id = record.id
+        self.name = record.name
+        self.cutting_method = record.cutting_method
+        self.notes = record.notes
+        self.sheet_count = record.sheet_count
+        self.scrap_percentage = record.scrap_percentage
+        self.sheet_cut_time = record.sheet_cut_time
+        self.image_path = record.image_path
+        self.laser_cut_parts.clear()
+        for laser_cut_part_record in record.laser_cut_parts:
+            laser_cut_part = LaserCutPart(laser_cut_part_record, self.laser_cut_inventory)
+            laser_cut_part.nest = self
+            self.laser_cut_parts.append(laser_cut_part)
+        self.sheet = Sheet(record.sheet, None)
+
     def to_dict(self) -> NestDict:
         return {
             "id": self.id,
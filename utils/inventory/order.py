@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, TypedDict
 
+import msgspec
+
 if TYPE_CHECKING:
     from utils.purchase_order.purchase_order import PurchaseOrder
 
@@ -13,6 +15,14 @@ class OrderDict(TypedDict):
     notes: str
 
 
+class OrderRecord(msgspec.Struct):
+    purchase_order_id: int = -1
+    expected_arrival_time: str = ""
+    order_pending_quantity: float = 0.0
+    order_pending_date: str = ""
+    notes: str = "No notes provided"
+
+
 @dataclass
 class Order:
     purchase_order_id: int = -1
@@ -21,7 +31,7 @@ class Order:
     order_pending_date: str = ""
     notes: str = ""
 
-    def __init__(self, data: OrderDict):
+    def __init__(self, data: OrderDict | OrderRecord):
         self._purchase_order: "PurchaseOrder | None" = None
         self.load_data(data)
 
@@ -31,13 +41,24 @@ class Order:
     def set_purchase_order(self, purchase_order: "PurchaseOrder") -> None:
         self._purchase_order = purchase_order
 
-    def load_data(self, data: OrderDict) -> None:
+    def load_data(self, data: OrderDict | OrderRecord) -> None:
+        if isinstance(data, OrderRecord):
+            self.load_record(data)
+            return
+
         self.purchase_order_id = data.get("purchase_order_id", -1)
         self.expected_arrival_time = data.get("expected_arrival_time", "")
         self.quantity = data.get("order_pending_quantity", 0.0)
         self.order_pending_date = data.get("order_pending_date", "")
         self.notes = data.get("notes", "No notes provided") or "No notes provided"
 
+    def load_record(self, record: OrderRecord) -> None:
+        self.purchase_order_id = record.purchase_order_id
+        self.expected_arrival_time = record.expected_arrival_time
+        self.quantity = record.order_pending_quantity
+        self.order_pending_date = record.order_pending_date
+        self.notes = record.notes or "No notes provided"
+
     def __str__(self) -> str:
         if self._purchase_order:
             po_str = f"Purchase Order: {self._purchase_order.meta_data.vendor.name} #{self._purchase_order.meta_data.purchase_order_number}\n"
@@ -78,3 +99,12 @@ class Order:
             "order_pending_date": self.order_pending_date,
             "notes": self.notes,
         }
+
+    def to_record(self) -> OrderRecord:
+        return OrderRecord(
+            purchase_order_id=self._purchase_order.id if self._purchase_order else -1,
+            expected_arrival_time=self.expected_arrival_time,
+            order_pending_quantity=self.quantity,
+            order_pending_date=self.order_pending_date,
+            notes=self.notes,
+        )
@@ -1,7 +1,10 @@
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, TypedDict, Union
 
+import msgspec
+
 from utils.inventory.coating_item import CoatingItem, CoatingTypes
+from utils.inventory.record_data import RecordData
 
 if TYPE_CHECKING:
     from utils.inventory.paint_inventory import PaintInventory
@@ -13,28 +16,23 @@ class PaintDataDict(TypedDict):
     paint_overspray: float
 
 
-@dataclass
-class PaintData:
+class PaintDataRecord(msgspec.Struct):
+    uses_paint: bool = False
+    paint_name: str = ""
+    paint_overspray: float = 66.67
+
+
+@dataclass(slots=True)
+class PaintData(RecordData):
+    record_type = PaintDataRecord
+
     uses_paint: bool = False
     paint_name: str = ""
     paint_item: Optional[CoatingItem] = None
     paint_overspray: float = 66.67
 
     def __init__(self, data: Optional[PaintDataDict]):
-        for f in fields(self.__class__):
-            setattr(self, f.name, f.default)
-
-        if data:
-            for f in fields(self.__class__):
-                if f.name in data:
-                    setattr(self, f.name, data[f.name])
-
-    def to_dict(self) -> PaintDataDict:
-        return {
-            "uses_paint": self.uses_paint,
-            "paint_name": self.paint_name,
-            "paint_overspray": self.paint_overspray,
-        }
+        self.load_dict(data)
 
 
 class Paint(CoatingItem):
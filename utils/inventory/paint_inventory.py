@@ -1,7 +1,10 @@
 import contextlib
-from typing import Callable, Optional, Union
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable, Iterable, Optional, Union
 
 import msgspec
+import numpy as np
 from PyQt6.QtCore import QThreadPool
 
 from utils.inventory.coating_item import CoatingItem, CoatingTypes
@@ -10,7 +13,7 @@ from utils.inventory.inventory import Inventory
 from utils.inventory.laser_cut_part import LaserCutPart
 from utils.workers.coatings_inventory.get_all_coatings import GetAllCoatingsWorker
 from utils.workers.coatings_inventory.update_coatings import UpdateCoatingsWorker
-from utils.workers.runnable_chain import RunnableChain
+from utils.workers.runnable_graph import RunnableGraph
 
 
 class PaintInventory(Inventory):
@@ -22,15 +25,29 @@ class PaintInventory(Inventory):
         self.paints: list[CoatingItem] = []
         self.powders: list[CoatingItem] = []
 
+        # Coatings can be renamed in place, so a hit is checked and a miss falls back to a scan
+        self.primers_by_name: dict[str, CoatingItem] = {}
+        self.paints_by_name: dict[str, CoatingItem] = {}
+        self.powders_by_name: dict[str, CoatingItem] = {}
+
+    def _get_coating(self, coatings: list[CoatingItem], coatings_by_name: dict[str, CoatingItem], name: str) -> Optional[CoatingItem]:
+        if (coating := coatings_by_name.get(name)) and coating.part_name == name:
+            return coating
+        if coating := next((coating for coating in coatings if coating.part_name == name), None):
+            coatings_by_name.clear()
+            coatings_by_name.update((coating.part_name, coating) for coating in reversed(coatings))  # First one wins, like the scan
+        return coating
+
     def add_primer(self, primer: CoatingItem):
         self.primers.append(primer)
 
     def remove_primer(self, primer: CoatingItem):
         with contextlib.suppress(ValueError):  # Already removed
             self.primers.remove(primer)
+            self.primers_by_name.pop(primer.part_name, None)
 
     def get_primer(self, name: str) -> Optional[CoatingItem]:
-        return next((primer for primer in self.primers if primer.part_name == name), None)
+        return self._get_coating(self.primers, self.primers_by_name, name)
 
     def get_all_primers(self) -> list[str]:
         return [primer.part_name for primer in self.primers]
@@ -51,9 +68,10 @@ class PaintInventory(Inventory):
     def remove_paint(self, paint: CoatingItem):
         with contextlib.suppress(ValueError):  # Already removed
             self.paints.remove(paint)
+            self.paints_by_name.pop(paint.part_name, None)
 
     def get_paint(self, name: str) -> Optional[CoatingItem]:
-        return next((paint for paint in self.paints if paint.part_name == name), None)
+        return self._get_coating(self.paints, self.paints_by_name, name)
 
     def get_all_paints(self) -> list[str]:
         return [paint.part_name for paint in self.paints]
@@ -74,9 +92,10 @@ class PaintInventory(Inventory):
     def remove_powder(self, powder: CoatingItem):
         with contextlib.suppress(ValueError):  # Already removed
             self.powders.remove(powder)
+            self.powders_by_name.pop(powder.part_name, None)
 
     def get_powder(self, name: str) -> Optional[CoatingItem]:
-        return next((powder for powder in self.powders if powder.part_name == name), None)
+        return self._get_coating(self.powders, self.powders_by_name, name)
 
     def get_all_powders(self) -> list[str]:
         return [powder.part_name for powder in self.powders]
@@ -91,6 +110,44 @@ class PaintInventory(Inventory):
                         return estimated_lbs_needed * powder.component.price
         return 0.0
 
+    def get_coating_costs(self, laser_cut_parts: list[LaserCutPart], mil_thickness: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Primer, paint and powder cost of every part, same as get_primer_cost, get_paint_cost and get_powder_cost.
+
+        Coatings are looked up once per part, the math is done for all parts at once.
+        """
+        surface_areas: list[float] = []
+        primers: list[tuple[float, float, float]] = []  # Price per gallon, coverage, overspray
+        paints: list[tuple[float, float, float]] = []  # Price per gallon, coverage, overspray
+        powders: list[tuple[float, float, float]] = []  # Price per pound, gravity, transfer efficiency
+        for laser_cut_part in laser_cut_parts:
+            surface_areas.append(laser_cut_part.meta_data.surface_area)
+
+            primer_data = laser_cut_part.primer_data
+            primer = self.get_primer(primer_data.primer_name) if primer_data.uses_primer else None
+            primers.append((primer.component.price, primer.average_coverage, primer_data.primer_overspray) if primer and primer.component else (0.0, 1.0, 0.0))
+
+            paint_data = laser_cut_part.paint_data
+            paint = self.get_paint(paint_data.paint_name) if paint_data.uses_paint else None
+            paints.append((paint.component.price, paint.average_coverage, paint_data.paint_overspray) if paint and paint.component else (0.0, 1.0, 0.0))
+
+            powder_data = laser_cut_part.powder_data
+            powder = self.get_powder(powder_data.powder_name) if powder_data.uses_powder else None
+            powders.append((powder.component.price, powder.gravity, powder_data.powder_transfer_efficiency) if powder and powder.component else (0.0, 1.0, 100.0))
+
+        coated_areas = (np.array(surface_areas, dtype=float) * 2) / 144  # Square feet, both sides
+        primer_prices, primer_coverages, primer_oversprays = np.array(primers, dtype=float).reshape(-1, 3).T
+        paint_prices, paint_coverages, paint_oversprays = np.array(paints, dtype=float).reshape(-1, 3).T
+        powder_prices, powder_gravities, powder_transfer_efficiencies = np.array(powders, dtype=float).reshape(-1, 3).T
+
+        # Division by zero gives 0.0, like the ZeroDivisionError in the single part methods
+        with np.errstate(divide="ignore", invalid="ignore"):
+            primer_costs = np.where(primer_coverages != 0, primer_prices * ((coated_areas / primer_coverages) * ((primer_oversprays / 100) + 1)), 0.0)
+            paint_costs = np.where(paint_coverages != 0, paint_prices * ((coated_areas / paint_coverages) * ((paint_oversprays / 100) + 1)), 0.0)
+            powder_thickness = powder_gravities * mil_thickness
+            estimated_sq_ft_coverages = (192.3 / powder_thickness) * (powder_transfer_efficiencies / 100)
+            powder_costs = np.where((powder_thickness != 0) & (estimated_sq_ft_coverages != 0), (coated_areas / estimated_sq_ft_coverages) * powder_prices, 0.0)
+        return primer_costs, paint_costs, powder_costs
+
     def save_coatings(self, coatings: list[CoatingItem]):
         worker = UpdateCoatingsWorker(coatings)
         worker.signals.finished.connect(self.save_local_copy)
@@ -99,49 +156,71 @@ class PaintInventory(Inventory):
     def save(self):
         self.save_coatings(self.primers + self.paints + self.powders)
 
-    def save_local_copy(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "wb") as file:
-            file.write(msgspec.json.encode(self.to_dict()))
-
     def load_data(self, on_loaded: Callable | None = None):
         try:
-            self.categories.from_list(
-                [
-                    CoatingTypes.POWDER.value,
-                    CoatingTypes.PAINT.value,
-                    CoatingTypes.PRIMER.value,
-                ]
-            )
-
-            self.chain = RunnableChain()
-
-            get_all_coatings_worker = GetAllCoatingsWorker()
-
-            self.chain.add(get_all_coatings_worker, self.load_data_response)
+            self.graph = RunnableGraph(name="PaintInventoryLoader")
+            self.add_load_steps(self.graph)
 
             if on_loaded:
-                self.chain.finished.connect(on_loaded)
+                self.graph.finished.connect(on_loaded)
 
-            self.chain.start()
+            self.graph.start()
         except KeyError:  # Inventory was just created
             return
         except msgspec.DecodeError:  # Inventory file got cleared
             self._reset_file()
             self.load_data()
 
+    def add_load_steps(self, graph: RunnableGraph, depends_on: Iterable[str] = ()) -> tuple[str, str]:
+        """Returns the step after which coatings are usable and the step after which they match the server."""
+        # Coatings look up their component on load, so startup passes the components step in depends_on.
+        self.categories.from_list(
+            [
+                CoatingTypes.POWDER.value,
+                CoatingTypes.PAINT.value,
+                CoatingTypes.PRIMER.value,
+            ]
+        )
+        ready_step = "coatings_inventory/get_all"
+        if not self.synced_at and (cache := self.read_cache()):
+            ready_step = "coatings_inventory/load_cache"
+            graph.add_task(ready_step, partial(self.load_cache_data, cache), depends_on)
+            depends_on = [ready_step]
+        # There are only a handful of coatings, so they are always refreshed in full rather than by delta.
+        graph.add("coatings_inventory/get_all", GetAllCoatingsWorker(), self.load_data_response, depends_on)
+        return ready_step, "coatings_inventory/get_all"
+
+    def load_cache_data(self, cache: dict):
+        self.load_coatings(cache["data"].get("coatings", []))
+        self.synced_at = cache["synced_at"]
+
     def load_data_response(self, response: dict[str, list[dict[str, object]]], next_step: Callable):
+        self.load_coatings(response)
+        self.synced_at = datetime.now(timezone.utc).isoformat()  # Never sent back, coatings are not synced by delta
+        self.save_local_copy()
+        next_step()
+
+    def load_coatings(self, coatings_data: list[dict[str, object]]):
+        # Reuse coatings by id, laser cut parts keep references to them as their paint/primer/powder items.
+        existing_coatings = {coating.id: coating for coating in self.primers + self.paints + self.powders}
         self.primers.clear()
         self.paints.clear()
         self.powders.clear()
-
-        for coating_data in response:
+        self.primers_by_name.clear()
+        self.paints_by_name.clear()
+        self.powders_by_name.clear()
+
+        for coating_data in coatings_data:
+            if coating := existing_coatings.get(coating_data.get("id")):
+                coating.load_data(coating_data)
+            else:
+                coating = CoatingItem(coating_data, self)
             if coating_data["coating_type"] == CoatingTypes.PRIMER.value:
-                self.add_primer(CoatingItem(coating_data, self))
+                self.add_primer(coating)
             elif coating_data["coating_type"] == CoatingTypes.PAINT.value:
-                self.add_paint(CoatingItem(coating_data, self))
+                self.add_paint(coating)
             elif coating_data["coating_type"] == CoatingTypes.POWDER.value:
-                self.add_powder(CoatingItem(coating_data, self))
-        next_step()
+                self.add_powder(coating)
 
     def to_dict(self) -> dict[str, Union[dict[str, object], list[object]]]:
         return {
@@ -1,7 +1,10 @@
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, TypedDict, Union, cast
 
+import msgspec
+
 from utils.inventory.coating_item import CoatingItem, CoatingTypes
+from utils.inventory.record_data import RecordData
 
 if TYPE_CHECKING:
     from utils.inventory.paint_inventory import PaintInventory
@@ -13,28 +16,23 @@ class PowderDataDict(TypedDict):
     powder_transfer_efficiency: float
 
 
-@dataclass
-class PowderData:
+class PowderDataRecord(msgspec.Struct):
+    uses_powder: bool = False
+    powder_name: str = ""
+    powder_transfer_efficiency: float = 66.67
+
+
+@dataclass(slots=True)
+class PowderData(RecordData):
+    record_type = PowderDataRecord
+
     uses_powder: bool = False
     powder_name: str = ""
     powder_item: Optional[CoatingItem] = None
     powder_transfer_efficiency: float = 66.67
 
     def __init__(self, data: Optional[PowderDataDict]):
-        for f in fields(self.__class__):
-            setattr(self, f.name, f.default)
-
-        if data:
-            for f in fields(self.__class__):
-                if f.name in data:
-                    setattr(self, f.name, data[f.name])
-
-    def to_dict(self) -> PowderDataDict:
-        return {
-            "uses_powder": self.uses_powder,
-            "powder_name": self.powder_name,
-            "powder_transfer_efficiency": self.powder_transfer_efficiency,
-        }
+        self.load_dict(data)
 
 
 class Powder(CoatingItem):
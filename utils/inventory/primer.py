@@ -1,7 +1,10 @@
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, TypedDict, Union, cast
 
+import msgspec
+
 from utils.inventory.coating_item import CoatingItem, CoatingTypes
+from utils.inventory.record_data import RecordData
 
 if TYPE_CHECKING:
     from utils.inventory.paint_inventory import PaintInventory
@@ -13,28 +16,23 @@ class PrimerDataDict(TypedDict):
     primer_overspray: float
 
 
-@dataclass
-class PrimerData:
+class PrimerDataRecord(msgspec.Struct):
+    uses_primer: bool = False
+    primer_name: str = ""
+    primer_overspray: float = 66.67
+
+
+@dataclass(slots=True)
+class PrimerData(RecordData):
+    record_type = PrimerDataRecord
+
     uses_primer: bool = False
     primer_name: str = ""
     primer_item: Optional[CoatingItem] = None
     primer_overspray: float = 66.67
 
     def __init__(self, data: Optional[PrimerDataDict]):
-        for f in fields(self.__class__):
-            setattr(self, f.name, f.default)
-
-        if data:
-            for f in fields(self.__class__):
-                if f.name in data:
-                    setattr(self, f.name, data[f.name])
-
-    def to_dict(self) -> PrimerDataDict:
-        return {
-            "uses_primer": self.uses_primer,
-            "primer_name": self.primer_name,
-            "primer_overspray": self.primer_overspray,
-        }
+        self.load_dict(data)
 
 
 class Primer(CoatingItem):
@@ -0,0 +1,73 @@
+import dataclasses
+from functools import cache
+from typing import Any, Callable, ClassVar
+
+import msgspec
+
+
+@cache
+def get_record_data_fields(data_class: type["RecordData"]) -> tuple[tuple[str, bool, Any, Callable[[], Any] | None], ...]:
+    """(name, is on the record, default, default_factory) for every field of a RecordData dataclass."""
+    record_field_names = {record_field.name for record_field in msgspec.structs.fields(data_class.record_type)}
+    return tuple(
+        (
+            data_field.name,
+            data_field.name in record_field_names,
+            None if data_field.default is dataclasses.MISSING else data_field.default,
+            None if data_field.default_factory is dataclasses.MISSING else data_field.default_factory,
+        )
+        for data_field in dataclasses.fields(data_class)
+    )
+
+
+@cache
+def get_record_field_names(record_type: type[msgspec.Struct]) -> tuple[str, ...]:
+    return tuple(record_field.name for record_field in msgspec.structs.fields(record_type))
+
+
+class RecordData:
+    """Loading, cloning and serializing for the slotted dataclasses behind a msgspec record.
+
+    Everything goes through dataclasses.fields() and the fields of record_type, so a new field only
+    has to be declared on the dataclass, its record and its dict. Fields that are not on the record,
+    like an inventory or a coating item, start at their default and are set by the subclass.
+    """
+
+    __slots__ = ()
+    record_type: ClassVar[type[msgspec.Struct]]
+
+    @classmethod
+    def from_record(cls, record: msgspec.Struct):
+        instance = cls.__new__(cls)
+        instance.load_record(record)
+        return instance
+
+    def load_dict(self, data: dict | None):
+        data = data or {}
+        for name, is_record_field, default, default_factory in get_record_data_fields(type(self)):
+            if is_record_field and name in data:
+                setattr(self, name, data[name])
+            else:
+                setattr(self, name, default_factory() if default_factory else default)
+
+    def load_record(self, record: msgspec.Struct):
+        for name, is_record_field, default, default_factory in get_record_data_fields(type(self)):
+            if is_record_field:
+                setattr(self, name, getattr(record, name))
+            else:
+                setattr(self, name, default_factory() if default_factory else default)
+
+    def clone(self):
+        """Lists are copied and everything else is shared, subclasses copy whatever they don't share."""
+        data_class = type(self)
+        instance = data_class.__new__(data_class)
+        for name, *_ in get_record_data_fields(data_class):
+            value = getattr(self, name)
+            setattr(instance, name, value.copy() if isinstance(value, list) else value)
+        return instance
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in get_record_field_names(self.record_type)}
+
+    def to_record(self) -> msgspec.Struct:
+        return self.record_type(**self.to_dict())
@@ -1,18 +1,20 @@
-from typing import Callable
+from functools import partial
+from typing import Callable, Iterable
 
-import msgspec
 from natsort import natsorted
 from PyQt6.QtCore import QThread, QThreadPool
 
 from utils.inventory.category import Category
 from utils.inventory.inventory import Inventory
+from utils.inventory.inventory_changes import InventoryChanges
 from utils.inventory.sheet import Sheet
 from utils.sheet_settings.sheet_settings import SheetSettings
-from utils.workers.runnable_chain import RunnableChain
+from utils.workers.runnable_graph import RunnableGraph
 from utils.workers.sheets_inventory.add_sheet import AddSheetWorker
-from utils.workers.sheets_inventory.get_all_sheets import GetAllSheetsWorker
 from utils.workers.sheets_inventory.get_categories import GetSheetCategoriesWorker
+from utils.workers.sheets_inventory.get_changes import GetSheetsChangesWorker
 from utils.workers.sheets_inventory.get_sheet import GetSheetWorker
+from utils.workers.sheets_inventory.get_sheets import GetSheetsWorker
 from utils.workers.sheets_inventory.remove_sheets import RemoveSheetsWorker
 from utils.workers.sheets_inventory.update_sheets import (
     UpdateSheetsWorker,
@@ -25,6 +27,9 @@ class SheetsInventory(Inventory):
         self.sheets: list[Sheet] = []
         self.sheet_settings = sheet_settings
 
+        self.id_index = self.add_index(lambda sheet: sheet.id)
+        self.name_index = self.add_index(lambda sheet: sheet.get_name())
+
     def get_all_sheets_material(self, sheets: list[Sheet] | None = None) -> list[str]:
         materials: set[str] = set()
         if sheets:
@@ -36,10 +41,10 @@ class SheetsInventory(Inventory):
     def get_sheets_by_category(self, category: str | Category) -> list[Sheet]:
         if isinstance(category, str):
             category = self.get_category(category)
-        return [sheet for sheet in self.sheets if category in sheet.categories]
+        return self.category_index.get_members(self.sheets, category)
 
     def get_sheet_by_id(self, sheet_id: int) -> Sheet | None:
-        return next((sheet for sheet in self.sheets if sheet.id == sheet_id), None)
+        return self.id_index.get(self.sheets, sheet_id)
 
     def add_sheet(self, new_sheet: Sheet, on_finished: Callable | None = None):
         worker = AddSheetWorker(new_sheet)
@@ -52,6 +57,7 @@ class SheetsInventory(Inventory):
         data, sheet = response
         sheet.id = data["id"]
         self.sheets.append(sheet)
+        self.invalidate_indexes()
         # self.save_local_copy()
 
     def remove_sheets(self, sheets: list[Sheet], on_finished: Callable | None = None):
@@ -69,11 +75,13 @@ class SheetsInventory(Inventory):
         for sheet in sheets:
             self.sheets.remove(sheet)
             # self.save_local_copy()
+        self.invalidate_indexes()
 
     def save_sheet(self, sheet: Sheet):
         self.save_sheets([sheet])
 
     def save_sheets(self, sheets: list[Sheet]):
+        self.refresh_indexes(sheets)  # Thickness, material or size may have changed the sheet name
         worker = UpdateSheetsWorker(sheets)
         worker.signals.success.connect(self.save_local_copy)
         QThreadPool.globalInstance().start(worker)
@@ -83,11 +91,20 @@ class SheetsInventory(Inventory):
         worker.signals.success.connect(on_finished)
         QThreadPool.globalInstance().start(worker)
 
+    def get_sheets(self, sheet_ids: list[int | str], on_finished: Callable | None = None):
+        worker = GetSheetsWorker(sheet_ids)
+        worker.signals.success.connect(on_finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def update_sheets_data(self, sheets_data: list[dict]) -> InventoryChanges:
+        return self.reconcile_items(self.sheets, sheets_data, lambda data: Sheet(data, self))
+
     def update_sheet_data(self, sheet_id: int, data: dict) -> Sheet | None:
-        for sheet in self.sheets:
-            if sheet.id == sheet_id:
-                sheet.load_data(data)
-                return sheet
+        if sheet := self.get_sheet_by_id(sheet_id):
+            sheet.load_data(data)
+            self.name_index.invalidate()
+            self.category_index.refresh([sheet])
+            return sheet
         return None
 
     def duplicate_category(self, category_to_duplicate: Category, new_category_name: str) -> Category:
@@ -96,6 +113,7 @@ class SheetsInventory(Inventory):
         sheets_to_duplicate = self.get_sheets_by_category(category_to_duplicate)
         for sheet in sheets_to_duplicate:
             sheet.add_to_category(new_category)
+        self.category_index.invalidate()
         self.save_sheets(sheets_to_duplicate)
         return new_category
 
@@ -104,6 +122,7 @@ class SheetsInventory(Inventory):
         sheets_to_remove = self.get_sheets_by_category(deleted_category)
         for sheet in sheets_to_remove:
             sheet.remove_from_category(deleted_category)
+        self.category_index.invalidate()
         self.save_sheets(sheets_to_remove)
         return deleted_category
 
@@ -124,36 +143,54 @@ class SheetsInventory(Inventory):
         return total
 
     def get_sheet_by_name(self, sheet_name: str) -> Sheet | None:
-        return next((sheet for sheet in self.sheets if sheet.get_name() == sheet_name), None)
+        return self.name_index.get(self.sheets, sheet_name)
 
     def exists(self, other: Sheet) -> bool:
-        return any(sheet.get_name() == other.get_name() for sheet in self.sheets)
+        return self.get_sheet_by_name(other.get_name()) is not None
 
     def sort_by_material(self) -> list[Sheet]:
         self.sheets = natsorted(self.sheets, key=lambda sheet: sheet.material)
+        self.category_index.invalidate()  # Members follow inventory order
         return self.sheets
 
     def sort_by_thickness(self) -> list[Sheet]:
         self.sheets = natsorted(self.sheets, key=lambda sheet: sheet.thickness)
+        self.category_index.invalidate()
         return self.sheets
 
-    def save_local_copy(self):
-        with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "wb") as file:
-            file.write(msgspec.json.encode(self.to_dict()))
-
     def load_data(self, on_loaded: Callable | None = None):
-        self.chain = RunnableChain()
-
-        get_categories_worker = GetSheetCategoriesWorker()
-        get_all_sheets_worker = GetAllSheetsWorker()
-
-        self.chain.add(get_categories_worker, self.get_categories_response)
-        self.chain.add(get_all_sheets_worker, self.get_all_sheets_response)
+        self.graph = RunnableGraph(name="SheetsInventoryLoader")
+        self.add_load_steps(self.graph)
 
         if on_loaded:
-            self.chain.finished.connect(on_loaded)
+            self.graph.finished.connect(on_loaded)
+
+        self.graph.start()
+
+    def add_load_steps(self, graph: RunnableGraph, depends_on: Iterable[str] = ()) -> tuple[str, str]:
+        """Returns the step after which sheets are usable and the step after which they match the server."""
+        ready_step = "sheets_inventory/get_changes"
+        if self.synced_at:
+            since = self.synced_at
+        elif cache := self.read_cache():
+            since = cache["synced_at"]
+            ready_step = "sheets_inventory/load_cache"
+            graph.add_task(ready_step, partial(self.load_cache_data, cache), depends_on)
+            depends_on = [ready_step]
+        else:
+            graph.add("sheets_inventory/get_categories", GetSheetCategoriesWorker(), self.get_categories_response, depends_on)
+            graph.add("sheets_inventory/get_all", GetSheetsChangesWorker(None), self.get_changes_response, ["sheets_inventory/get_categories", *depends_on])
+            return "sheets_inventory/get_all", "sheets_inventory/get_all"
+
+        graph.add("sheets_inventory/get_categories", GetSheetCategoriesWorker(), self.get_categories_response, depends_on)
+        graph.add("sheets_inventory/get_changes", GetSheetsChangesWorker(since), self.get_changes_response, ["sheets_inventory/get_categories"])
+        return ready_step, "sheets_inventory/get_changes"
 
-        self.chain.start()
+    def load_cache_data(self, cache: dict):
+        data = cache["data"]
+        self.categories.from_list(data.get("categories", []))
+        self.replace_items(self.sheets, [Sheet(sheet_data, self) for sheet_data in data.get("sheets", [])])
+        self.synced_at = cache["synced_at"]
 
     def get_categories_response(self, response: list, next_step: Callable):
         try:
@@ -162,11 +199,8 @@ class SheetsInventory(Inventory):
             self.categories.clear()
         next_step()
 
-    def get_all_sheets_response(self, response: dict, next_step: Callable):
-        self.sheets.clear()
-        for sheet_data in response:
-            sheet = Sheet(sheet_data, self)
-            self.sheets.append(sheet)
+    def get_changes_response(self, response: dict, next_step: Callable):
+        self.merge_changes(self.sheets, response, lambda data: Sheet(data, self))
         self.save_local_copy()
         next_step()
 
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import shutil
+from typing import Callable
+
+import msgspec
+
+from config.environments import Environment
+
+NEST_IMAGE_CACHE_LOCATION = f"{Environment.DATA_PATH}/data/cache/nest_images"
+
+
+def file_digest(file_path: str) -> str:
+    with open(file_path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+class NestImageCache:
+    """Pictures extracted from nest PDFs, keyed by a hash of the image's stream bytes.
+
+    The same part picture shows up on many nests and every re-import of a nest, so it is only decoded
+    and resized the first time. Files are written through a temporary name so worker processes
+    extracting the same picture at once never see half written files.
+    """
+
+    def __init__(self, cache_location: str = NEST_IMAGE_CACHE_LOCATION):
+        self.cache_location = cache_location
+        os.makedirs(self.cache_location, exist_ok=True)
+        self.files: dict[str, str] = {os.path.splitext(file_name)[0]: file_name for file_name in os.listdir(self.cache_location) if not file_name.endswith(".tmp")}
+
+    def get_key(self, stream: bytes, variant: str) -> str:
+        return f"{hashlib.sha1(stream).hexdigest()}-{variant}"
+
+    def copy_to(self, key: str, file_path_without_ext: str) -> bool:
+        if not (file_name := self.files.get(key)):
+            return False
+        shutil.copyfile(f"{self.cache_location}/{file_name}", f"{file_path_without_ext}{os.path.splitext(file_name)[1]}")
+        return True
+
+    def add(self, key: str, ext: str, save: Callable[[str], None]) -> str:
+        file_name = f"{key}.{ext}"
+        temp_path = f"{self.cache_location}/{file_name}.{os.getpid()}.tmp"
+        save(temp_path)
+        os.replace(temp_path, f"{self.cache_location}/{file_name}")
+        self.files[key] = file_name
+        return f"{self.cache_location}/{file_name}"
+
+
+class UploadedImages:
+    """Digests of the images this client already uploaded, so unchanged ones are not sent again."""
+
+    def __init__(self, file_path: str = f"{Environment.DATA_PATH}/data/cache/uploaded_images.json"):
+        self.file_path = file_path
+        self.digests: dict[str, str] = {}
+        self.load_data()
+
+    def load_data(self):
+        try:
+            with open(self.file_path, "rb") as file:
+                self.digests = msgspec.json.decode(file.read())
+        except (OSError, msgspec.DecodeError):
+            self.digests = {}
+
+    def save_data(self):
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        with open(self.file_path, "wb") as file:
+            file.write(msgspec.json.encode(self.digests))
+
+    def get_changed_images(self, image_paths: list[str]) -> dict[str, str]:
+        """Returns {image_path: digest} for the images that were never uploaded or changed since."""
+        changed_images: dict[str, str] = {}
+        for image_path in image_paths:
+            try:
+                digest = file_digest(image_path)
+            except OSError:
+                changed_images[image_path] = ""  # Let the upload report it
+                continue
+            if self.digests.get(os.path.basename(image_path)) != digest:
+                changed_images[image_path] = digest
+        return changed_images
+
+    def mark_uploaded(self, digests: dict[str, str]):
+        self.digests.update({os.path.basename(image_path): digest for image_path, digest in digests.items() if digest})
+        self.save_data()
@@ -0,0 +1,226 @@
+import io
+import os
+import re
+import shutil
+from typing import Iterator, TypedDict
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from utils.nest_image_cache import NestImageCache
+
+# Field patterns for nest reports, the same ones that used to run as separate passes over the whole text.
+NEST_FIELD_REGEXES: dict[str, str] = {
+    "part_path": r"GEOFILE NAME: ([a-zA-z]:\\[\w\W]{1,300}\.[Gg][Ee][Oo])",
+    "geofile_name": r"GEOFILE NAME: (.:[\s\S]*?\.[Gg][Ee][Oo])",
+    "machining_time": r"MACHINING TIME: (\d{1,}.\d{1,}) min",
+    "sheet_cut_time": r"MACHINING TIME: NC postprocessor (\d{1,} : \d{1,} : \d{1,})",
+    "weight": r"WEIGHT: (\d{1,}.\d{1,}) lb",
+    "surface_area": r"SURFACE: (\d{1,}.\d{1,})  in2",
+    "cutting_length": r"CUTTING LENGTH: (\d{1,}.\d{1,})  in|CUTTING LENGTH: (\d{1,})  in",
+    "quantity": r"  NUMBER: (\d{1,})",
+    "part_number": r"PART NUMBER: (\d{1,})",
+    "sheet_quantity": r"PROGRAMME RUNS:  \/  SCRAP: (\d{1,})|PROGRAM RUNS:  \/  SCRAP: (\d{1,})",
+    "scrap_percentage": r"PROGRAMME RUNS:  \/  SCRAP: \d{1,}  \/  (\d{1,}.\d{1,}) %|PROGRAM RUNS:  \/  SCRAP: \d{1,}  \/  (\d{1,}.\d{1,}) %",
+    "piercing_time": r"PIERCING TIME (\d{1,}.\d{1,})  s",
+    "material_id": r"MATERIAL ID \(SHEET\):.{1,}(ST|SS|AL)-\d{1,}",
+    "gauge": r"MATERIAL ID \(SHEET\):.{1,}\w{2}-(\d{1,})",
+    "sheet_dimension": r"BLANK: (\d{1,}\.\d{1,} x \d{1,}\.\d{1,}) x \d{1,}\.\d{1,}",
+    "part_dimensions": r"DIMENSIONS: (\d{1,}\.\d{1,} x \d{1,}\.\d{1,})",
+    "piercing_points": r"NUMBER OF PIERCING POINTS: (\d{1,})",
+}
+
+# Every field pattern starts with one of these keywords, so one scan for keywords finds every candidate match.
+NEST_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "GEOFILE NAME: ": ("part_path", "geofile_name"),
+    "MACHINING TIME: ": ("machining_time", "sheet_cut_time"),
+    "WEIGHT: ": ("weight",),
+    "SURFACE: ": ("surface_area",),
+    "CUTTING LENGTH: ": ("cutting_length",),
+    "  NUMBER: ": ("quantity",),
+    "PART NUMBER: ": ("part_number",),
+    "PROGRAMME RUNS: ": ("sheet_quantity", "scrap_percentage"),
+    "PROGRAM RUNS: ": ("sheet_quantity", "scrap_percentage"),
+    "PIERCING TIME ": ("piercing_time",),
+    "MATERIAL ID (SHEET):": ("material_id", "gauge"),
+    "BLANK: ": ("sheet_dimension",),
+    "DIMENSIONS: ": ("part_dimensions",),
+    "NUMBER OF PIERCING POINTS: ": ("piercing_points",),
+}
+
+
+class NestPartRecord(TypedDict):
+    part_path: str
+    geofile_name: str
+    quantity: int
+    machining_time: float
+    weight: float
+    surface_area: float
+    cutting_length: float
+    piercing_time: float
+    piercing_points: int
+    part_number: str
+    part_dimensions: str
+
+
+def pdf_to_text(pdf_path: str) -> str:
+    with fitz.open(pdf_path) as pdf_file:
+        text = "".join(page.get_text("text") for page in pdf_file)
+    # Same newlines the text had after being round tripped through output.txt
+    return text.replace("\r\n", "\n").replace("\r", "\n").replace(" \n", " ")
+
+
+class NestParser:
+    """Parses the text of one nest report in a single pass.
+
+    Keywords are found with one scan and each field pattern is only tried where its keyword is. A field
+    never matches inside its own previous match, which gives what re.finditer over the whole text gave
+    for every field (no keyword can start inside another one).
+    """
+
+    field_regexes = {field: re.compile(regex, re.MULTILINE) for field, regex in NEST_FIELD_REGEXES.items()}
+    keyword_regex = re.compile("|".join(re.escape(keyword) for keyword in NEST_KEYWORDS))
+
+    def __init__(self, text: str):
+        self.text = text
+        self.values: dict[str, list[str]] = {field: [] for field in NEST_FIELD_REGEXES}
+        self.tokenize()
+
+    def tokenize(self):
+        field_ends = dict.fromkeys(NEST_FIELD_REGEXES, 0)
+        for keyword_match in self.keyword_regex.finditer(self.text):
+            position = keyword_match.start()
+            for field in NEST_KEYWORDS[keyword_match.group()]:
+                if position < field_ends[field]:
+                    continue
+                if match := self.field_regexes[field].match(self.text, position):
+                    self.values[field].append(match.group(1) if match.group(1) is not None else match.group(2))
+                    field_ends[field] = max(match.end(), position + 1)
+
+    def get_value(self, field: str) -> str:
+        return self.values[field][0]
+
+    def get_sheet_cut_time(self) -> float:
+        hours, minutes, seconds = self.get_value("sheet_cut_time").replace(" : ", ":").split(":")
+        return (float(hours) * 3600) + (float(minutes) * 60) + float(seconds)  # seconds
+
+    def iter_parts(self) -> Iterator[NestPartRecord]:
+        # Fields are paired by their order in the report, a missing one raises IndexError like it always has
+        for i in range(len(self.values["part_path"])):
+            yield {
+                "part_path": self.values["part_path"][i],
+                "geofile_name": self.values["geofile_name"][i],
+                "quantity": int(self.values["quantity"][i]),
+                "machining_time": float(self.values["machining_time"][i]),
+                "weight": float(self.values["weight"][i]),
+                "surface_area": float(self.values["surface_area"][i]),
+                "cutting_length": float(self.values["cutting_length"][i]),
+                "piercing_time": float(self.values["piercing_time"][i]),
+                "piercing_points": int(self.values["piercing_points"][i]),
+                "part_number": self.values["part_number"][i],
+                "part_dimensions": self.values["part_dimensions"][i],
+            }
+
+
+def extract_nest_images(pdf_path: str, images_directory: str, image_prefix: str = "", size_of_picture: int = 100, image_cache: NestImageCache | None = None) -> int:
+    """Saves the nest and part pictures as {image_prefix}nest-N and {image_prefix}part-N, returns how many were saved."""
+    image_count: int = 0
+    with fitz.open(pdf_path) as pdf_file:
+        for page in pdf_file:
+            for img in page.get_images():
+                xref, width, height = img[0], img[2], img[3]
+                if width == 48 and height == 48:
+                    continue
+                is_nest_picture = width == 580 and height == 440
+                file_path = f"{images_directory}/{image_prefix}{'nest' if is_nest_picture else 'part'}-{image_count}"
+                image_count += 1
+
+                key = image_cache.get_key(pdf_file.xref_stream_raw(xref), "nest" if is_nest_picture else f"part{size_of_picture}") if image_cache else ""
+                if image_cache and image_cache.copy_to(key, file_path):
+                    continue
+
+                base_image = pdf_file.extract_image(xref)
+                image_ext = base_image["ext"]
+                image = Image.open(io.BytesIO(base_image["image"]))
+                if not is_nest_picture:
+                    image = image.resize(
+                        (size_of_picture, size_of_picture),
+                        Image.Resampling.LANCZOS,
+                    )
+                if image_cache:
+                    cached_path = image_cache.add(key, image_ext, lambda temp_path: image.save(temp_path, format=Image.registered_extensions().get(f".{image_ext}")))
+                    shutil.copyfile(cached_path, f"{file_path}.{image_ext}")
+                else:
+                    image.save(f"{file_path}.{image_ext}")
+    return image_count
+
+
+def load_nest_file(pdf_path: str, images_directory: str, image_prefix: str, material_id: dict, size_of_picture: int = 100, image_cache_location: str | None = None) -> dict:
+    """Extracts the pictures and parses one nest PDF.
+
+    Only plain data goes in and out so it can run in a worker process, image names are relative to
+    images_directory and without the .jpeg extension.
+    """
+    extract_nest_images(pdf_path, images_directory, image_prefix, size_of_picture, NestImageCache(image_cache_location) if image_cache_location else None)
+    nest_parser = NestParser(pdf_to_text(pdf_path))
+
+    sheet_material: str = material_id["cutting_methods"][nest_parser.get_value("material_id")]["name"]
+    sheet_gauge: str = nest_parser.get_value("gauge")
+    if int(sheet_gauge) >= 50:  # 1/2 inch
+        sheet_material = "Laser Grade Plate"
+    sheet_gauge = material_id["thickness_ids"][sheet_gauge]
+
+    image_index: int = 0
+    nest_image = f"{image_prefix}nest-{image_index}"
+    laser_cut_parts: list[dict] = []
+    for part in nest_parser.iter_parts():
+        laser_cut_parts.append(
+            part
+            | {
+                "name": part["part_path"].split("\\")[-1].replace("\n", "").replace(".GEO", "").replace(".geo", "").strip(),
+                "image_index": f"{image_prefix}part-{image_index}",
+            }
+        )
+        image_index += 1
+    if os.path.isfile(f"{images_directory}/{image_prefix}nest-{image_index}.jpeg"):
+        nest_image = f"{image_prefix}nest-{image_index}"
+
+    return {
+        "name": os.path.basename(pdf_path),
+        "file_name": pdf_path,
+        "sheet_count": int(nest_parser.get_value("sheet_quantity")),
+        "scrap_percentage": float(nest_parser.get_value("scrap_percentage")),
+        "sheet_dimension": nest_parser.get_value("sheet_dimension"),
+        "sheet_cut_time": nest_parser.get_sheet_cut_time(),  # seconds
+        "gauge": sheet_gauge,
+        "material": sheet_material,
+        "image_path": nest_image,
+        "laser_cut_parts": laser_cut_parts,
+    }
+
+
+if __name__ == "__main__":
+    # Regression check against the old one regex pass per field parser: python -m utils.nest_parser nests/*.pdf
+    import sys
+    import time
+
+    def legacy_values(text: str) -> dict[str, list[str]]:
+        values: dict[str, list[str]] = {}
+        for field, regex in NEST_FIELD_REGEXES.items():
+            values[field] = [match.group(1) if match.group(1) is not None else match.group(2) for match in re.finditer(regex, text, re.MULTILINE)]
+        return values
+
+    failures = 0
+    for pdf_path in sys.argv[1:]:
+        text = pdf_to_text(pdf_path)
+        start_time = time.perf_counter()
+        expected = legacy_values(text)
+        legacy_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        parser = NestParser(text)
+        parts = list(parser.iter_parts())
+        parser_time = time.perf_counter() - start_time
+        mismatched = [field for field in NEST_FIELD_REGEXES if expected[field] != parser.values[field]]
+        failures += bool(mismatched)
+        print(f"{'FAIL' if mismatched else 'ok  '} {pdf_path}: {len(parts)} parts, legacy {legacy_time * 1000:.1f} ms, single pass {parser_time * 1000:.1f} ms {mismatched or ''}")
+    sys.exit(1 if failures else 0)
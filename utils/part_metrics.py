@@ -0,0 +1,155 @@
+import csv
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterator
+
+import msgspec
+
+from utils.dxf_analysis_cache import DXF_ANALYSIS_CACHE_LOCATION, DxfAnalysisCache, analyze_dxf
+from utils.get_bend_hits import BEND_HITS_CACHE_LOCATION, find_bend_hits_cached
+from utils.inventory.laser_cut_part import LaserCutPart, LaserCutPartDict
+from utils.nest_image_cache import file_digest
+
+if TYPE_CHECKING:
+    from utils.inventory.laser_cut_inventory import LaserCutInventory
+
+PART_METRICS_CSV_COLUMNS = [
+    "name",
+    "dxf_path",
+    "pdf_path",
+    "cutting_length",
+    "surface_area",
+    "piercing_points",
+    "part_dim",
+    "material",
+    "gauge",
+    "weight",
+    "bend_hits",
+    "piercing_time",
+    "machine_time",
+]
+
+
+def find_part_files(job_directory: str) -> dict[str, dict[str, str]]:
+    """Returns {part name: {"dxf": path, "pdf": path}}, a bending PDF belongs to the DXF with the same name."""
+    dxf_paths: dict[str, str] = {}
+    pdf_paths: dict[str, str] = {}
+    for directory, _, file_names in os.walk(job_directory):
+        for file_name in file_names:
+            name, ext = os.path.splitext(file_name)
+            if ext.lower() == ".dxf":
+                dxf_paths.setdefault(name, os.path.join(directory, file_name))
+            elif ext.lower() == ".pdf":
+                pdf_paths.setdefault(name, os.path.join(directory, file_name))
+
+    if unmatched_pdfs := pdf_paths.keys() - dxf_paths.keys():
+        logging.info(f"Ignoring {len(unmatched_pdfs)} PDFs without a DXF of the same name")
+    return {name: {"dxf": dxf_path, "pdf": pdf_paths.get(name, "")} for name, dxf_path in sorted(dxf_paths.items())}
+
+
+def analyze_part_files(dxf_path: str, pdf_path: str, cache_location: str, bend_hits_cache_location: str) -> dict:
+    """Runs in a worker process, results come from and go to the same caches as the planning widget."""
+    digest = file_digest(dxf_path)
+    dxf_analysis = DxfAnalysisCache(cache_location).get(digest) or analyze_dxf(dxf_path, digest, cache_location)
+    return {
+        "dxf_analysis": dxf_analysis,
+        "bend_hits": find_bend_hits_cached(pdf_path, file_digest(pdf_path), bend_hits_cache_location)["count"] if pdf_path else 0,
+    }
+
+
+def create_part_metrics(
+    name: str,
+    dxf_path: str,
+    pdf_path: str,
+    metrics: dict,
+    material: str = "",
+    thickness: str = "",
+    pounds_per_square_foot: float = 0.0,
+) -> LaserCutPartDict:
+    """Same values the planning widget sets when a DXF and a bending PDF are dropped on a part.
+
+    Weight is only known when the material and thickness are, same as LaserCutPart.calculate_weight.
+    """
+    dxf_analysis = metrics["dxf_analysis"]
+    cutting_length = dxf_analysis["cutting_length"]
+    piercing_points = dxf_analysis["piercing_points"]
+    dimensions = dxf_analysis["dimensions"]
+    return {
+        "name": name,
+        "meta_data": {
+            "file_name": name,
+            "cutting_length": cutting_length,
+            "surface_area": dxf_analysis["cutting_area"],
+            "piercing_points": piercing_points,
+            "part_dim": f"{dimensions['length']} x {dimensions['width']}",
+            "material": material,
+            "gauge": thickness,
+            "weight": dxf_analysis["cutting_area"] * (pounds_per_square_foot / 144),
+            "bend_hits": metrics["bend_hits"],
+            "piercing_time": LaserCutPart.calculate_piercing_time(cutting_length, piercing_points),
+            "machine_time": LaserCutPart.calculate_machine_time_from_length_and_piercing_points(cutting_length, piercing_points),
+        },
+        "prices": {"bend_cost": metrics["bend_hits"]},
+        "workspace_data": {
+            "cnc_milling_files": [dxf_path],
+            "bending_files": [pdf_path] if pdf_path else [],
+        },
+    }
+
+
+def iter_job_part_metrics(
+    job_directory: str,
+    max_workers: int | None = None,
+    cache_location: str = DXF_ANALYSIS_CACHE_LOCATION,
+    bend_hits_cache_location: str = BEND_HITS_CACHE_LOCATION,
+    material: str = "",
+    thickness: str = "",
+    pounds_per_square_foot: float = 0.0,
+) -> Iterator[tuple[str, LaserCutPartDict | None, str]]:
+    """Yields (part name, part metrics, error) as parts finish, parts are analysed in parallel."""
+    part_files = find_part_files(job_directory)
+    logging.info(f"Analysing {len(part_files)} parts in {job_directory}")
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        futures = {executor.submit(analyze_part_files, files["dxf"], files["pdf"], cache_location, bend_hits_cache_location): name for name, files in part_files.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            files = part_files[name]
+            try:
+                yield name, create_part_metrics(name, files["dxf"], files["pdf"], future.result(), material, thickness, pounds_per_square_foot), ""
+            except Exception as e:
+                yield name, None, str(e)
+
+
+def save_part_metrics(file_path: str, parts: list[LaserCutPartDict], failed: dict[str, str]):
+    """Writes a CSV if file_path ends with .csv, otherwise JSON that load_part_metrics can read back."""
+    if file_path.lower().endswith(".csv"):
+        with open(file_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=PART_METRICS_CSV_COLUMNS)
+            writer.writeheader()
+            for part in parts:
+                meta_data = part["meta_data"]
+                writer.writerow(
+                    {column: meta_data.get(column, "") for column in PART_METRICS_CSV_COLUMNS}
+                    | {
+                        "name": part["name"],
+                        "dxf_path": part["workspace_data"]["cnc_milling_files"][0],
+                        "pdf_path": next(iter(part["workspace_data"]["bending_files"]), ""),
+                    }
+                )
+    else:
+        with open(file_path, "wb") as file:
+            file.write(msgspec.json.format(msgspec.json.encode({"parts": parts, "failed": failed}), indent=4))
+
+
+def load_part_metrics(file_path: str, laser_cut_inventory: "LaserCutInventory") -> list[LaserCutPart]:
+    """Creates laser cut parts from a JSON manifest, ready to be added to an assembly."""
+    with open(file_path, "rb") as file:
+        manifest = msgspec.json.decode(file.read())
+    laser_cut_parts: list[LaserCutPart] = []
+    for part in manifest["parts"]:
+        laser_cut_part = LaserCutPart(part, laser_cut_inventory)
+        if not laser_cut_part.meta_data.weight:  # Manifest was written without a material, or with one this client doesn't know
+            laser_cut_part.meta_data.weight = laser_cut_part.calculate_weight()
+        laser_cut_parts.append(laser_cut_part)
+    return laser_cut_parts
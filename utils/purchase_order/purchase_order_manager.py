@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Iterable
 
 from natsort import natsorted
 from PyQt6.QtCore import QThreadPool
@@ -17,6 +17,7 @@ from utils.workers.purchase_orders.get_all_purchase_orders import GetAllPurchase
 from utils.workers.purchase_orders.get_purchase_order import GetPurchaseOrderWorker
 from utils.workers.purchase_orders.save_purchase_order import SavePurchaseOrderWorker
 from utils.workers.runnable_chain import RunnableChain
+from utils.workers.runnable_graph import RunnableGraph
 from utils.workers.sheets_inventory.update_sheets import UpdateSheetsWorker
 from utils.workers.shipping_addresses.delete_shipping_address import DeleteShippingAddressWorker
 from utils.workers.shipping_addresses.get_all_shipping_addresses import GetAllShippingAddresses
@@ -39,22 +40,25 @@ class PurchaseOrderManager:
         self.shipping_addresses: list[ShippingAddress] = []
 
     def load_data(self, on_finished: Callable | None = None):
-        self.chain = RunnableChain()
-
-        get_vendors_worker = GetAllVendors()
-        get_purchase_orders_worker = GetAllPurchaseOrders()
-        get_shipping_addresses_worker = GetAllShippingAddresses()
-
-        self.chain.add(get_vendors_worker, self.get_vendors_thread_response)
-        self.chain.add(get_purchase_orders_worker, self.get_purchase_orders_thread_response)
-        self.chain.add(get_shipping_addresses_worker, self.get_shipping_addresses_thread_response)
+        self.graph = RunnableGraph(name="PurchaseOrderManagerLoader")
+        self.add_load_steps(self.graph)
 
         if on_finished:
-            self.chain.finished.connect(on_finished)
-
-        self.chain.finished.connect(self.link_purchase_orders_with_inventory_items)
-
-        self.chain.start()
+            self.graph.finished.connect(on_finished)
+
+        self.graph.start()
+
+    def add_load_steps(self, graph: RunnableGraph, depends_on: Iterable[str] = ()) -> str:
+        # Linking needs the sheets and components, pass their steps in depends_on when they load in the same graph.
+        graph.add("vendors/get_all", GetAllVendors(), self.get_vendors_thread_response)
+        graph.add("purchase_orders/get_all", GetAllPurchaseOrders(), self.get_purchase_orders_thread_response)
+        graph.add("shipping_addresses/get_all", GetAllShippingAddresses(), self.get_shipping_addresses_thread_response)
+        graph.add_task(
+            "link_purchase_orders_with_inventory_items",
+            self.link_purchase_orders_with_inventory_items,
+            ["vendors/get_all", "purchase_orders/get_all", "shipping_addresses/get_all", *depends_on],
+        )
+        return "link_purchase_orders_with_inventory_items"
 
     def get_vendors_thread_response(self, response: list[VendorDict], next_step: Callable):
         self.vendors.clear()
@@ -52,6 +52,14 @@ class ServerSettings(TypedDict):
     port: int
 
 
+class HttpTransportSettings(TypedDict):
+    pool_connections: int
+    pool_maxsize: int
+    pool_block: bool
+    max_retries: int
+    backoff_factor: float
+
+
 class SortSettings(TypedDict):
     ascending: bool
     descending: bool
@@ -74,6 +82,7 @@ class SettingsDict(TypedDict, total=False):
     bring_along_sub_assemblies: bool
     sort_alphabatical: bool
     server: ServerSettings
+    http_transport: HttpTransportSettings
     geometry: Geometry
     last_opened: str
     last_toolbox_tab: int
@@ -117,6 +126,13 @@ DEFAULT_SETTINGS: SettingsDict = {
         "ip": "invi.go",
         "port": 80,
     },
+    "http_transport": {
+        "pool_connections": 4,
+        "pool_maxsize": 16,
+        "pool_block": True,
+        "max_retries": 3,
+        "backoff_factor": 0.3,
+    },
     "geometry": {"x": 200, "y": 200, "width": 1200, "height": 600},
     "last_opened": str(datetime.now()),
     "last_toolbox_tab": 0,
@@ -0,0 +1,19 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from utils.get_bend_hits import BEND_HITS_CACHE_LOCATION, BendHits, BendHitsCache, find_bend_hits_cached
+from utils.threads.file_analysis_service import FileAnalysisService
+
+
+class BendHitsService(FileAnalysisService):
+    """Bend hits of drawing PDFs, see FileAnalysisService."""
+
+    def __init__(self, cache_location: str = BEND_HITS_CACHE_LOCATION, parent=None):
+        super().__init__(parent)
+        self.cache_location = cache_location
+        self.cache = BendHitsCache(cache_location)
+
+    def get_cached(self, digest: str) -> BendHits | None:
+        return self.cache.get(digest)
+
+    def submit(self, executor: ProcessPoolExecutor, file_path: str, digest: str) -> Future:
+        return executor.submit(find_bend_hits_cached, file_path, digest, self.cache_location)
@@ -0,0 +1,44 @@
+import logging
+
+from PyQt6.QtCore import QElapsedTimer, QObject, QTimer, pyqtSignal
+
+
+class ChangesBatcher(QObject):
+    """Collects change notifications for a short window so a burst of them is handled as one batch.
+
+    Paths are de-duplicated in arrival order. The window restarts on every notification but a batch
+    is never held back longer than max_delay_ms.
+    """
+
+    batchReady = pyqtSignal(list)
+
+    def __init__(self, window_ms: int = 250, max_delay_ms: int = 1000, parent=None):
+        super().__init__(parent)
+        self.window_ms = window_ms
+        self.max_delay_ms = max_delay_ms
+        self.pending: dict[str, None] = {}
+        self.notifications = 0
+        self.age = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def add(self, paths: list[str]):
+        if not self.pending:
+            self.age.start()
+        self.notifications += 1
+        self.pending.update(dict.fromkeys(paths))
+        if self.age.elapsed() >= self.max_delay_ms:
+            self.flush()
+        else:
+            self.timer.start(min(self.window_ms, self.max_delay_ms - self.age.elapsed()))
+
+    def flush(self):
+        self.timer.stop()
+        if not self.pending:
+            return
+        paths = list(self.pending)
+        logging.info(f"ChangesBatcher: {self.notifications} notifications coalesced into {len(paths)} changes")
+        self.pending.clear()
+        self.notifications = 0
+        self.batchReady.emit(paths)
@@ -0,0 +1,19 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from utils.dxf_analysis_cache import DXF_ANALYSIS_CACHE_LOCATION, CachedDxfAnalysis, DxfAnalysisCache, analyze_dxf
+from utils.threads.file_analysis_service import FileAnalysisService
+
+
+class DxfAnalysisService(FileAnalysisService):
+    """Cutting metrics and previews of DXF files, see FileAnalysisService."""
+
+    def __init__(self, cache_location: str = DXF_ANALYSIS_CACHE_LOCATION, parent=None):
+        super().__init__(parent)
+        self.cache_location = cache_location
+        self.cache = DxfAnalysisCache(cache_location)
+
+    def get_cached(self, digest: str) -> CachedDxfAnalysis | None:
+        return self.cache.get(digest)
+
+    def submit(self, executor: ProcessPoolExecutor, file_path: str, digest: str) -> Future:
+        return executor.submit(analyze_dxf, file_path, digest, self.cache_location)
@@ -0,0 +1,88 @@
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from utils.nest_image_cache import file_digest
+
+
+class FileAnalysisService(QObject):
+    """Analyses files in worker processes, callbacks are called on the GUI thread as results come in.
+
+    Results are cached by the file's contents, so the same file is only analysed once. The process
+    pool is shared by every service, a file requested again while it is still being analysed waits on
+    the same job. Subclasses provide get_cached() and submit().
+    """
+
+    executor: ProcessPoolExecutor | None = None
+    digests: dict[str, tuple[int, int, str]] = {}  # path: (modified time, size, digest)
+    analysisDone = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pending: dict[str, Future] = {}
+        self.analysisDone.connect(self.call_back, Qt.ConnectionType.QueuedConnection)
+
+    @classmethod
+    def get_executor(cls) -> ProcessPoolExecutor:
+        if FileAnalysisService.executor is None:
+            FileAnalysisService.executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return FileAnalysisService.executor
+
+    def get_digest(self, file_path: str) -> str:
+        # Files are only hashed again when they were modified
+        stat = os.stat(file_path)
+        modified_time, size, digest = self.digests.get(file_path, (0, 0, ""))
+        if (modified_time, size) != (stat.st_mtime_ns, stat.st_size) or not digest:
+            digest = file_digest(file_path)
+            self.digests[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def get_cached(self, digest: str) -> Any | None:
+        raise NotImplementedError
+
+    def submit(self, executor: ProcessPoolExecutor, file_path: str, digest: str) -> Future:
+        raise NotImplementedError
+
+    def analyze(
+        self,
+        file_path: str,
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[str], None],
+    ):
+        try:
+            digest = self.get_digest(file_path)
+        except OSError as e:
+            self.analysisDone.emit(on_failed, str(e))
+            return
+
+        if (result := self.get_cached(digest)) is not None:
+            self.analysisDone.emit(on_finished, result)
+            return
+
+        if not (future := self.pending.get(digest)):
+            logging.info(f"Analysing {file_path}")
+            future = self.submit(self.get_executor(), file_path, digest)
+            future.add_done_callback(lambda _: self.pending.pop(digest, None))
+            self.pending[digest] = future
+        future.add_done_callback(partial(self.analysis_finished, file_path, on_finished, on_failed))
+
+    def analysis_finished(
+        self,
+        file_path: str,
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[str], None],
+        future: Future,
+    ):
+        # Runs on the executor's thread, the callbacks are queued to the GUI thread
+        if error := future.exception():
+            logging.error(f"Failed to analyse {file_path}: {error}")
+            self.analysisDone.emit(on_failed, str(error))
+        else:
+            self.analysisDone.emit(on_finished, future.result())
+
+    def call_back(self, callback: Callable, result: Any):
+        callback(result)
@@ -1,6 +1,7 @@
 import os
 import shutil
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -10,12 +11,15 @@ from utils.inventory.components_inventory import ComponentsInventory
 from utils.inventory.laser_cut_inventory import LaserCutInventory
 from utils.inventory.laser_cut_part import LaserCutPart
 from utils.inventory.nest import Nest
+from utils.nest_image_cache import NEST_IMAGE_CACHE_LOCATION
+from utils.nest_parser import load_nest_file
 from utils.sheet_settings.sheet_settings import SheetSettings
 from utils.threads.load_nest_file_thread import LoadNestFileThread
 
 
 class LoadNestsThread(LoadNestFileThread):
     signal = pyqtSignal(list)  # list[Nest]
+    progress = pyqtSignal(int, int, str)  # files loaded, total files, file
 
     def __init__(
         self,
@@ -29,99 +33,83 @@ class LoadNestsThread(LoadNestFileThread):
         self.nest_files = nest_files
         self.nests: list[Nest] = []
 
+    def load_nest_files(self) -> list[dict]:
+        """Every PDF is independent, so they are loaded in worker processes, results keep the order of nest_files."""
+        images_directory = f"{self.program_directory}/images"
+        material_id = self.sheet_settings.material_id
+        results: list[dict] = [{}] * len(self.nest_files)
+        if len(self.nest_files) == 1:  # Not worth starting a process for
+            results[0] = load_nest_file(self.nest_files[0], images_directory, "0-", material_id, self.size_of_picture, NEST_IMAGE_CACHE_LOCATION)
+            self.progress.emit(1, 1, self.nest_files[0])
+            return results
+
+        with ProcessPoolExecutor(max_workers=min(len(self.nest_files), os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(load_nest_file, nest_file, images_directory, f"{i}-", material_id, self.size_of_picture, NEST_IMAGE_CACHE_LOCATION): i for i, nest_file in enumerate(self.nest_files)
+            }
+            for files_loaded, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                results[i] = future.result()
+                self.progress.emit(files_loaded, len(self.nest_files), self.nest_files[i])
+        return results
+
+    def create_nest(self, nest_data: dict) -> Nest:
+        nest = Nest(
+            {
+                "name": nest_data["name"],
+                "sheet_count": nest_data["sheet_count"],
+                "gauge": nest_data["gauge"],
+                "material": nest_data["material"],
+                "scrap_percentage": nest_data["scrap_percentage"],
+                "sheet_cut_time": nest_data["sheet_cut_time"],  # seconds
+                "image_path": nest_data["image_path"],
+            },
+            self.sheet_settings,
+            self.laser_cut_inventory,
+        )
+        sheet_dimension: str = nest_data["sheet_dimension"]
+        nest.sheet.length = float(sheet_dimension.strip().replace(" x ", "x").split("x")[0])
+        nest.sheet.width = float(sheet_dimension.strip().replace(" x ", "x").split("x")[1])
+        for part in nest_data["laser_cut_parts"]:
+            laser_cut_part = LaserCutPart(
+                {},  # type: ignore
+                self.laser_cut_inventory,
+            )
+            laser_cut_part.name = part["name"]
+            laser_cut_part.inventory_data.quantity = part["quantity"] * nest_data["sheet_count"]
+            laser_cut_part.load_part_data(
+                {
+                    "machine_time": part["machining_time"],
+                    "weight": part["weight"],
+                    "part_number": part["part_number"],
+                    "image_index": part["image_index"],
+                    "surface_area": part["surface_area"],
+                    "cutting_length": part["cutting_length"],
+                    "file_name": nest_data["file_name"],
+                    "piercing_time": part["piercing_time"],
+                    "piercing_points": part["piercing_points"],
+                    "gauge": nest_data["gauge"],
+                    "material": nest_data["material"],
+                    "sheet_dim": sheet_dimension,
+                    "part_dim": part["part_dimensions"],
+                    "geofile_name": part["geofile_name"],
+                    "shelf_number": "",
+                    "modified_date": datetime.now().strftime("%B %d %Y %I:%M:%S %p"),
+                    "bend_hits": 0,
+                    "notes": "",
+                    "quantity_on_sheet": part["quantity"],
+                }
+            )
+            laser_cut_part.nest = nest
+            nest.add_laser_cut_part(laser_cut_part)
+        return nest
+
     def run(self):
         try:
             Path(f"{self.program_directory}/images").mkdir(parents=True, exist_ok=True)
-            self.extract_images_from_pdf(self.nest_files)
-            image_index: int = 0
-            for nest in self.nest_files:
-                # variables
-                nest_name: str = os.path.basename(nest)
-                nest_data = self.convert_pdf_to_text(nest)
-                quantity_multiplier: int = int(self.get_values_from_text(nest_data, self.sheet_quantity_regex)[0])
-                scrap_percentage: float = float(self.get_values_from_text(nest_data, self.scrap_percentage_regex)[0])
-                sheet_dimension: str = self.get_values_from_text(nest_data, self.sheet_dimension_regex)[0]
-                sheet_material: str = self.material_id_to_name(self.get_values_from_text(nest_data, self.material_id_regex)[0])
-                sheet_gauge: str = self.get_values_from_text(nest_data, self.gauge_regex)[0]
-                sheet_cut_time: str = self.get_values_from_text(nest_data, self.sheet_cut_time_regex)[0]
-                (
-                    sheet_cut_time_hours,
-                    sheet_cut_time_minutes,
-                    sheet_cut_time_seconds,
-                ) = sheet_cut_time.replace(" : ", ":").split(":")
-                total_sheet_cut_time = (float(sheet_cut_time_hours) * 3600) + (float(sheet_cut_time_minutes) * 60) + float(sheet_cut_time_seconds)  # seconds
-
-                # lists
-                _quantities: list[str] = self.get_values_from_text(nest_data, self.quantity_regex)
-                quantities: list[int] = [int(quantity) for quantity in _quantities]
-                machining_times: list[str] = self.get_values_from_text(nest_data, self.machinging_time_regex)
-                weights: list[str] = self.get_values_from_text(nest_data, self.weight_regex)
-                surface_areas: list[str] = self.get_values_from_text(nest_data, self.surface_area_regex)
-                part_dimensions: list[str] = self.get_values_from_text(nest_data, self.part_dimensions_regex)
-                cutting_lengths: list[str] = self.get_values_from_text(nest_data, self.cutting_length_regex)
-                piercing_times: list[str] = self.get_values_from_text(nest_data, self.piercing_time_regex)
-                part_numbers: list[str] = self.get_values_from_text(nest_data, self.part_number_regex)
-                parts: list[str] = self.get_values_from_text(nest_data, self.part_path_regex)
-                piercing_points: list[str] = self.get_values_from_text(nest_data, self.piercing_points_regex)
-                geofile_names: list[str] = self.get_values_from_text(nest_data, self.geofile_name)
-                # Sheet information:
-                if int(sheet_gauge) >= 50:  # 1/2 inch
-                    sheet_material = "Laser Grade Plate"
-                sheet_gauge = self.material_id_to_number(sheet_gauge)
-                nest_object = Nest(
-                    {
-                        "name": nest_name,
-                        "sheet_count": quantity_multiplier,
-                        "gauge": sheet_gauge,
-                        "material": sheet_material,
-                        "scrap_percentage": scrap_percentage,
-                        "sheet_cut_time": total_sheet_cut_time,  # seconds
-                        "image_path": f"nest-{image_index}",
-                    },
-                    self.sheet_settings,
-                    self.laser_cut_inventory,
-                )
-                nest_object.sheet.length = float(sheet_dimension.strip().replace(" x ", "x").split("x")[0])
-                nest_object.sheet.width = float(sheet_dimension.strip().replace(" x ", "x").split("x")[1])
-                self.nests.append(nest_object)
-                for i, part_name in enumerate(parts):
-                    part_name = part_name.split("\\")[-1].replace("\n", "").replace(".GEO", "").replace(".geo", "").strip()
-                    laser_cut_part = LaserCutPart(
-                        {},  # type: ignore
-                        self.laser_cut_inventory,
-                    )
-                    laser_cut_part.name = part_name
-                    laser_cut_part.inventory_data.quantity = int(quantities[i]) * quantity_multiplier
-                    laser_cut_part.load_part_data(
-                        {
-                            "machine_time": float(machining_times[i]),
-                            "weight": float(weights[i]),
-                            "part_number": part_numbers[i],
-                            "image_index": f"part-{image_index}",
-                            "surface_area": float(surface_areas[i]),
-                            "cutting_length": float(cutting_lengths[i]),
-                            "file_name": nest,
-                            "piercing_time": float(piercing_times[i]),
-                            "piercing_points": int(piercing_points[i]),
-                            "gauge": sheet_gauge,
-                            "material": sheet_material,
-                            "sheet_dim": sheet_dimension,
-                            "part_dim": part_dimensions[i],
-                            "geofile_name": geofile_names[i],
-                            "shelf_number": "",
-                            "modified_date": datetime.now().strftime("%B %d %Y %I:%M:%S %p"),
-                            "bend_hits": 0,
-                            "notes": "",
-                            "quantity_on_sheet": int(quantities[i]),
-                        }
-                    )
-                    laser_cut_part.nest = nest_object
-                    nest_object.add_laser_cut_part(laser_cut_part)
-                    image_index += 1
-                if os.path.isfile(f"./images/nest-{image_index}.jpeg"):
-                    nest_object.image_path = f"nest-{image_index}"
-                    image_index += 1
-            # os.remove(f"{self.program_directory}/output.txt")
+            for nest_data in self.load_nest_files():
+                nest = nest_data["file_name"]
+                self.nests.append(self.create_nest(nest_data))
             for nest in self.nests:
                 try:
                     image_name = nest.name.split("/")[-1].replace(".pdf", "")
@@ -17,11 +17,11 @@ class ConnectWorker(BaseWorker):
         self.logger.info(f"Requesting client data from {self.url}")
         payload = {"client_name": self.client_name, "version": self.version}
         try:
-            with requests.Session() as session:
-                response = session.post(self.url, json=payload, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                response_data = msgspec.json.decode(response.content)
-                return response_data
+            session = self.session
+            response = session.post(self.url, json=payload, headers=self.headers, timeout=10)
+            response.raise_for_status()
+            response_data = msgspec.json.decode(response.content)
+            return response_data
         except requests.HTTPError as http_err:
             self.signals.error.emit(f"HTTP error occurred: {http_err}", http_err.response.status_code)
         except requests.RequestException as err:
@@ -11,11 +11,11 @@ class IsClientTrustedWorker(BaseWorker):
 
     def do_work(self):
         try:
-            with requests.Session() as session:
-                response = session.get(self.url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                response_data = response.json()
-                return response_data
+            session = self.session
+            response = session.get(self.url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+            response_data = response.json()
+            return response_data
         except requests.HTTPError as http_err:
             self.signals.error.emit(f"HTTP error occurred: {http_err}", http_err.response.status_code)
         except requests.RequestException as err:
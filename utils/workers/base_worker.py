@@ -4,9 +4,11 @@ import logging
 import socket
 import time
 
+import requests
 from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 from utils.ip_utils import get_server_ip_address, get_server_port, get_server_protocol
+from utils.workers.http_transport import HttpTransport
 
 
 class WorkerSignals(QObject):
@@ -16,6 +18,9 @@ class WorkerSignals(QObject):
 
 
 class BaseWorker(QRunnable):
+    # Set on workers whose POSTs can be repeated safely, the transport then retries them like GETs.
+    retry_all_methods = False
+
     def __init__(self, name="BaseWorker"):
         super().__init__()
         self.signals = WorkerSignals()
@@ -31,6 +36,11 @@ class BaseWorker(QRunnable):
             "X-Client-Address": socket.gethostname(),
         }
 
+    @property
+    def session(self) -> requests.Session:
+        # Resolved lazily so the session belongs to the pool thread running do_work().
+        return HttpTransport.instance().session(self.retry_all_methods)
+
     def run(self) -> None:
         start = time.perf_counter()
         try:
@@ -11,19 +11,19 @@ class GetAllCoatingsWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Requesting all coatings from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                all_coatings = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            all_coatings = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(all_coatings, list):
-                raise ValueError("Invalid data format received")
+        if not isinstance(all_coatings, list):
+            raise ValueError("Invalid data format received")
 
-            return all_coatings
+        return all_coatings
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
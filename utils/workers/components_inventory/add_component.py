@@ -1,5 +1,4 @@
 import msgspec
-import requests
 
 from utils.inventory.component import Component
 from utils.workers.base_worker import BaseWorker
@@ -15,21 +14,21 @@ class AddComponentWorker(BaseWorker):
         self.logger.info(f"Adding new component via POST to {self.url}")
         data = self.component.to_dict()
 
-        with requests.Session() as session:
-            response = session.post(self.url, json=data, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.post(self.url, json=data, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                response_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            response_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(response_data, dict) or "id" not in response_data:
-                raise ValueError("Invalid data format received")
+        if not isinstance(response_data, dict) or "id" not in response_data:
+            raise ValueError("Invalid data format received")
 
-            response_data["component_data"] = {
-                "id": response_data["id"],
-                "data": data,
-            }
+        response_data["component_data"] = {
+            "id": response_data["id"],
+            "data": data,
+        }
 
-            return (response_data, self.component)
+        return (response_data, self.component)
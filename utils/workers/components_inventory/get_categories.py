@@ -11,19 +11,19 @@ class GetComponentsCategoriesWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Requesting components categories from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                categories = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            categories = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(categories, list):
-                raise ValueError("Invalid format received")
+        if not isinstance(categories, list):
+            raise ValueError("Invalid format received")
 
-            return categories
+        return categories
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
@@ -0,0 +1,7 @@
+from utils.inventory.component import ComponentRecord
+from utils.workers.get_inventory_changes import GetInventoryChangesWorker
+
+
+class GetComponentsChangesWorker(GetInventoryChangesWorker):
+    def __init__(self, since: str | None):
+        super().__init__("components_inventory", since, name="GetComponentsChangesWorker", record_type=ComponentRecord)
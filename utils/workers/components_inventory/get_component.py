@@ -12,19 +12,19 @@ class GetComponentWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Fetching component ID {self.component_id} from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                component_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            component_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(component_data, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(component_data, dict):
+            raise ValueError("Invalid data format received")
 
-            return component_data
+        return component_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
@@ -0,0 +1,7 @@
+from utils.inventory.component import ComponentRecord
+from utils.workers.get_inventory_items import GetInventoryItemsWorker
+
+
+class GetComponentsWorker(GetInventoryItemsWorker):
+    def __init__(self, component_ids: list[int | str]):
+        super().__init__("components_inventory", "get_component", component_ids, name="GetComponentsWorker", record_type=ComponentRecord)
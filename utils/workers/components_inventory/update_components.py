@@ -1,5 +1,4 @@
 import msgspec
-import requests
 
 from utils.inventory.component import Component
 from utils.workers.base_worker import BaseWorker
@@ -15,11 +14,11 @@ class UpdateComponentsWorker(BaseWorker):
         self.logger.info(f"Sending update for {len(self.components)} components to {self.url}")
 
         data = [component.to_dict() for component in self.components]
-        with requests.Session() as session:
-            response = session.post(self.url, json=data, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            try:
-                response_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("JSON parse error from server")
-            return response_data
+        session = self.session
+        response = session.post(self.url, json=data, headers=self.headers, timeout=10)
+        response.raise_for_status()
+        try:
+            response_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("JSON parse error from server")
+        return response_data
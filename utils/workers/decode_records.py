@@ -0,0 +1,46 @@
+import logging
+from functools import cache
+
+import msgspec
+
+# Record types that already logged a fallback, a schema mismatch would otherwise be logged on every sync
+fallback_record_types: set[type] = set()
+
+
+@cache
+def get_records_decoder(record_type: type) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(list[record_type], strict=False)
+
+
+@cache
+def get_record_decoder(record_type: type) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(record_type, strict=False)
+
+
+def decode_records(content: bytes | msgspec.Raw, record_type: type | None = None) -> object:
+    """Decodes a JSON list of rows straight into record_type Structs in one pass.
+
+    If any row does not fit the schema the payload is decoded into plain dicts instead, the objects
+    built from these rows accept either. Invalid JSON still raises msgspec.DecodeError.
+    """
+    if record_type is not None:
+        try:
+            return get_records_decoder(record_type).decode(content)
+        except msgspec.ValidationError as e:
+            log_fallback(record_type, e)
+    return msgspec.json.decode(content)
+
+
+def decode_record(content: bytes | msgspec.Raw, record_type: type) -> object:
+    """Same as decode_records, for a payload that is a single object."""
+    try:
+        return get_record_decoder(record_type).decode(content)
+    except msgspec.ValidationError as e:
+        log_fallback(record_type, e)
+    return msgspec.json.decode(content)
+
+
+def log_fallback(record_type: type, error: msgspec.ValidationError):
+    if record_type not in fallback_record_types:
+        fallback_record_types.add(record_type)
+        logging.warning(f"Payload does not match {record_type.__name__}, decoding it as dicts: {error}")
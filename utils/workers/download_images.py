@@ -13,20 +13,20 @@ class DownloadImagesWorker(BaseWorker):
 
     def do_work(self):
         try:
-            with requests.Session() as session:
-                for file_to_download in self.files_to_download:
-                    try:
-                        url = self.file_url + file_to_download
-                        response = session.get(url, headers=self.headers, timeout=10)
-                        response.raise_for_status()
-
-                        os.makedirs(os.path.dirname(file_to_download), exist_ok=True)
-                        with open(file_to_download, "wb") as file:
-                            file.write(response.content)
-
-                    except requests.RequestException as e:
-                        self.signals.error.emit(f"{e} - {file_to_download}", 500)
-                        return  # Exit early on failure
+            session = self.session
+            for file_to_download in self.files_to_download:
+                try:
+                    url = self.file_url + file_to_download
+                    response = session.get(url, headers=self.headers, timeout=10)
+                    response.raise_for_status()
+
+                    os.makedirs(os.path.dirname(file_to_download), exist_ok=True)
+                    with open(file_to_download, "wb") as file:
+                        file.write(response.content)
+
+                except requests.RequestException as e:
+                    self.signals.error.emit(f"{e} - {file_to_download}", 500)
+                    return  # Exit early on failure
 
             return "Successfully downloaded"
 
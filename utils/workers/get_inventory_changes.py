@@ -0,0 +1,98 @@
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+
+import msgspec
+import requests
+
+from utils.workers.base_worker import BaseWorker
+from utils.workers.decode_records import decode_records
+
+# How far back the server's Date header is moved to cover in-flight writes, merging is idempotent.
+SYNC_OVERLAP = timedelta(minutes=5)
+# Status codes meaning the server can't produce a delta, so a full reload is done instead.
+DELTA_UNSUPPORTED_STATUS_CODES = (400, 404, 405, 410, 501)
+
+
+def get_server_timestamp(response: requests.Response) -> str | None:
+    """The sync cursor for a response, taken from the server's clock and never the local one."""
+    try:
+        return (parsedate_to_datetime(response.headers["Date"]) - SYNC_OVERLAP).isoformat()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class GetInventoryChangesWorker(BaseWorker):
+    """Returns {"full": bool, "timestamp": str | None, "updated": list[dict], "deleted": list[int]}.
+
+    Asks for rows changed since the given timestamp and falls back to get_all if there is no
+    timestamp yet or the server can't produce a delta, in which case "full" is True and "updated"
+    holds every row. The returned timestamp is the next cursor, it is issued by the server and is
+    None if the server sent none. Rows are decoded into record_type when it is given.
+    """
+
+    def __init__(self, inventory_path: str, since: str | None, name: str = "GetInventoryChangesWorker", record_type: type | None = None):
+        super().__init__(name=name)
+        self.since = since
+        self.record_type = record_type
+        self.changes_url = f"{self.DOMAIN}/{inventory_path}/get_changes"
+        self.get_all_url = f"{self.DOMAIN}/{inventory_path}/get_all"
+
+    def do_work(self) -> dict:
+        session = self.session
+        if self.since:
+            if changes := self.get_changes(session):
+                return changes
+            self.logger.info(f"Server could not produce a delta, requesting everything from {self.get_all_url}")
+        return self.get_all(session)
+
+    def get_changes(self, session: requests.Session) -> dict | None:
+        self.logger.info(f"Requesting changes since {self.since} from {self.changes_url}")
+        response = session.get(self.changes_url, params={"since": self.since}, headers=self.headers, timeout=10)
+
+        if response.status_code not in DELTA_UNSUPPORTED_STATUS_CODES:
+            response.raise_for_status()
+            try:
+                changes = msgspec.json.decode(response.content, type=dict[str, msgspec.Raw])
+                changes = {key: decode_records(value, self.record_type) if key == "updated" else msgspec.json.decode(value) for key, value in changes.items()}
+            except msgspec.DecodeError:
+                changes = None
+
+            if isinstance(changes, dict) and isinstance(changes.get("updated"), list) and isinstance(changes.get("deleted", []), list):
+                # Without a cursor from the server the next delta could miss rows, so reload instead
+                if timestamp := changes.get("timestamp") or get_server_timestamp(response):
+                    return {
+                        "full": False,
+                        "timestamp": timestamp,
+                        "updated": changes["updated"],
+                        "deleted": changes.get("deleted", []),
+                    }
+        return None
+
+    def get_all(self, session: requests.Session) -> dict:
+        self.logger.info(f"Requesting everything from {self.get_all_url}")
+        response = session.get(self.get_all_url, headers=self.headers, timeout=10)
+        response.raise_for_status()
+
+        try:
+            all_items = decode_records(response.content, self.record_type)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
+
+        if not isinstance(all_items, list):
+            raise ValueError("Invalid data format received")
+
+        return {"full": True, "timestamp": get_server_timestamp(response), "updated": all_items, "deleted": []}
+
+    def handle_exception(self, e):
+        if isinstance(e, requests.exceptions.Timeout):
+            self.signals.error.emit({"error": "Request timed out"}, 408)
+        elif isinstance(e, requests.exceptions.ConnectionError):
+            self.signals.error.emit({"error": "Could not connect to the server"}, 503)
+        elif isinstance(e, requests.exceptions.HTTPError):
+            self.signals.error.emit({"error": f"HTTP Error: {str(e)}"}, e.response.status_code)
+        elif isinstance(e, requests.exceptions.RequestException):
+            self.signals.error.emit({"error": f"Request failed: {str(e)}"}, 500)
+        elif isinstance(e, ValueError):
+            self.signals.error.emit({"error": str(e)}, 500)
+        else:
+            super().handle_exception(e)
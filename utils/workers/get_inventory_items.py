@@ -0,0 +1,68 @@
+import msgspec
+import requests
+
+from utils.workers.base_worker import BaseWorker
+from utils.workers.decode_records import decode_records
+from utils.workers.get_inventory_changes import DELTA_UNSUPPORTED_STATUS_CODES
+
+
+class GetInventoryItemsWorker(BaseWorker):
+    """Returns the rows for a batch of ids as a list of dicts, ids the server no longer has are left out.
+
+    Asks for every id in one request and falls back to one get per id, over the same kept-alive
+    connection, if the server has no bulk endpoint. Rows are decoded into record_type when it is given.
+    """
+
+    def __init__(self, inventory_path: str, item_path: str, ids: list[int | str], name: str = "GetInventoryItemsWorker", record_type: type | None = None):
+        super().__init__(name=name)
+        self.ids = ids
+        self.record_type = record_type
+        self.bulk_url = f"{self.DOMAIN}/{inventory_path}/get_by_ids"
+        self.item_url = f"{self.DOMAIN}/{inventory_path}/{item_path}"
+
+    def do_work(self) -> list[dict]:
+        self.logger.info(f"Fetching {len(self.ids)} ids from {self.bulk_url}")
+        session = self.session
+        response = session.post(self.bulk_url, json={"ids": self.ids}, headers=self.headers, timeout=10)
+
+        if response.status_code not in DELTA_UNSUPPORTED_STATUS_CODES:
+            response.raise_for_status()
+            try:
+                items = decode_records(response.content, self.record_type)
+            except msgspec.DecodeError:
+                items = None
+
+            if isinstance(items, list) and all(isinstance(item, (dict, msgspec.Struct)) for item in items):
+                return items
+
+        self.logger.info(f"Server has no bulk endpoint, fetching ids one at a time from {self.item_url}")
+        items: list[dict] = []
+        for item_id in self.ids:
+            response = session.get(f"{self.item_url}/{item_id}", headers=self.headers, timeout=10)
+            if response.status_code == 404:  # Deleted since the notification was sent
+                continue
+            response.raise_for_status()
+
+            try:
+                item = msgspec.json.decode(response.content)
+            except msgspec.DecodeError:
+                raise ValueError("Failed to decode server response")
+
+            if not isinstance(item, dict):
+                raise ValueError("Invalid data format received")
+            items.append(item)
+        return items
+
+    def handle_exception(self, e):
+        if isinstance(e, requests.exceptions.Timeout):
+            self.signals.error.emit({"error": "Request timed out"}, 408)
+        elif isinstance(e, requests.exceptions.ConnectionError):
+            self.signals.error.emit({"error": "Could not connect to the server"}, 503)
+        elif isinstance(e, requests.exceptions.HTTPError):
+            self.signals.error.emit({"error": f"HTTP Error: {str(e)}"}, e.response.status_code)
+        elif isinstance(e, requests.exceptions.RequestException):
+            self.signals.error.emit({"error": f"Request failed: {str(e)}"}, 500)
+        elif isinstance(e, ValueError):
+            self.signals.error.emit({"error": str(e)}, 500)
+        else:
+            super().handle_exception(e)
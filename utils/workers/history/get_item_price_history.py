@@ -17,19 +17,19 @@ class GetItemPriceHistoryWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Requesting sheet history from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                item_history = msgspec.json.decode(response.content)
-            except msgspec.DecodeError as e:
-                raise ValueError("Failed to decode server response") from e
+        try:
+            item_history = msgspec.json.decode(response.content)
+        except msgspec.DecodeError as e:
+            raise ValueError("Failed to decode server response") from e
 
-            if not isinstance(item_history, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(item_history, dict):
+            raise ValueError("Invalid data format received")
 
-            return item_history
+        return item_history
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
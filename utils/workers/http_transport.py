@@ -0,0 +1,199 @@
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from utils.settings import Settings
+
+RETRY_STATUS_CODES = (502, 503, 504)
+ID_SEGMENT_PATTERN = re.compile(r"/\d+(?=/|$)")
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    reused_connections: int = 0
+    new_connections: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    status_codes: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, float | int | dict[int, int]]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "reused_connections": self.reused_connections,
+            "new_connections": self.new_connections,
+            "average_time": self.average_time,
+            "max_time": self.max_time,
+            "status_codes": dict(self.status_codes),
+        }
+
+
+class TransportStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: dict[str, EndpointStats] = {}
+
+    @staticmethod
+    def endpoint_key(method: str, url: str) -> str:
+        # Collapse numeric ids so "/jobs/get_job/12" and "/jobs/get_job/13" share one bucket.
+        path = ID_SEGMENT_PATTERN.sub("/{id}", urlsplit(url).path)
+        return f"{method} {path}"
+
+    def record(self, method: str, url: str, elapsed: float, reused: bool, status_code: int | None):
+        key = self.endpoint_key(method, url)
+        with self._lock:
+            stats = self.endpoints.setdefault(key, EndpointStats())
+            stats.requests += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            if reused:
+                stats.reused_connections += 1
+            else:
+                stats.new_connections += 1
+            if status_code is None:
+                stats.errors += 1
+            else:
+                stats.status_codes[status_code] = stats.status_codes.get(status_code, 0) + 1
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self.endpoints.items()}
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    def __init__(self, stats: TransportStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        # urllib3 only bumps num_connections when it has to open a socket, so an unchanged
+        # count means the request went over a kept-alive connection. Under heavy concurrency
+        # on one host this is an approximation, which is fine for diagnostics.
+        pool = self.poolmanager.connection_from_url(request.url)
+        opened_before = pool.num_connections
+        start = time.perf_counter()
+        status_code = None
+        try:
+            response = super().send(request, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            self.stats.record(
+                request.method,
+                request.url,
+                time.perf_counter() - start,
+                reused=pool.num_connections == opened_before,
+                status_code=status_code,
+            )
+
+
+class HttpTransport:
+    """Process-wide HTTP transport shared by every worker.
+
+    One connection pool (per host) is shared by all threads; each thread gets its own
+    ``requests.Session`` mounted on that pool since sessions themselves are not thread-safe.
+    """
+
+    _instance: "HttpTransport | None" = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger("HttpTransport")
+        settings = Settings().get_value("http_transport") or {}
+
+        self.pool_connections: int = settings.get("pool_connections", 4)
+        self.pool_maxsize: int = settings.get("pool_maxsize", 16)
+        self.pool_block: bool = settings.get("pool_block", True)
+        self.max_retries: int = settings.get("max_retries", 3)
+        self.backoff_factor: float = settings.get("backoff_factor", 0.3)
+
+        self.stats = TransportStats()
+        # Only idempotent methods are retried by default, a POST that timed out may already have been applied.
+        self.adapter = self.create_adapter(Retry.DEFAULT_ALLOWED_METHODS)
+        # For workers whose POSTs are safe to repeat, see BaseWorker.retry_all_methods.
+        self.retry_all_methods_adapter = self.create_adapter(None)
+        self.default_headers = {
+            "Connection": "keep-alive",
+            **make_headers(accept_encoding=True),
+        }
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    def create_adapter(self, allowed_methods: frozenset[str] | None) -> PooledHTTPAdapter:
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=allowed_methods,
+            raise_on_status=False,
+        )
+        return PooledHTTPAdapter(
+            self.stats,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=retry,
+        )
+
+    @classmethod
+    def instance(cls) -> "HttpTransport":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def session(self, retry_all_methods: bool = False) -> requests.Session:
+        attribute = "retry_all_methods_session" if retry_all_methods else "session"
+        session: requests.Session | None = getattr(self._local, attribute, None)
+        if session is None:
+            adapter = self.retry_all_methods_adapter if retry_all_methods else self.adapter
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(self.default_headers)
+            setattr(self._local, attribute, session)
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def get_stats(self) -> dict[str, dict]:
+        return self.stats.snapshot()
+
+    def log_stats(self):
+        for endpoint, stats in sorted(self.get_stats().items()):
+            self.logger.info(
+                f"{endpoint}: {stats['requests']} request(s), avg {stats['average_time'] * 1000:.1f}ms, "
+                f"max {stats['max_time'] * 1000:.1f}ms, reused {stats['reused_connections']}, new {stats['new_connections']}, "
+                f"errors {stats['errors']}"
+            )
+
+    def close(self):
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self.adapter.close()
+        self.retry_all_methods_adapter.close()
+        self._local = threading.local()
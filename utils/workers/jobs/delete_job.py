@@ -11,7 +11,7 @@ class DeleteJobWorker(BaseWorker):
 
     def do_work(self):
         try:
-            response = requests.post(self.url, headers=self.headers, timeout=10)
+            response = self.session.post(self.url, headers=self.headers, timeout=10)
             response_data = msgspec.json.decode(response.content)
             return response_data
         except requests.HTTPError as http_err:
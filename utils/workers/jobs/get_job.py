@@ -2,6 +2,8 @@ import msgspec
 import requests
 
 from utils.workers.base_worker import BaseWorker
+from utils.workers.decode_records import decode_record
+from utils.workspace.job import JobRecord
 
 
 class GetJobWorker(BaseWorker):
@@ -10,19 +12,19 @@ class GetJobWorker(BaseWorker):
         self.url = f"{self.DOMAIN}/jobs/get_job/{job_id}"
 
     def do_work(self):
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                response_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            response_data = decode_record(response.content, JobRecord)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(response_data, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(response_data, (dict, JobRecord)):
+            raise ValueError("Invalid data format received")
 
-            return response_data
+        return response_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
@@ -21,16 +21,16 @@ class SaveJobWorker(BaseWorker):
                     "application/json",
                 )
             }
-            with requests.Session() as session:
-                response = session.post(
-                    self.upload_url,
-                    files=files,
-                    headers=self.headers,
-                    timeout=10,
-                )
-                response.raise_for_status()
-                response_data = msgspec.json.decode(response.content)
-                return response_data
+            session = self.session
+            response = session.post(
+                self.upload_url,
+                files=files,
+                headers=self.headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+            response_data = msgspec.json.decode(response.content)
+            return response_data
         except requests.HTTPError as http_err:
             self.signals.error.emit(f"HTTP error occurred: {http_err}", http_err.response.status_code)
         except requests.RequestException as err:
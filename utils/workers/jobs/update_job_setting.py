@@ -1,5 +1,3 @@
-import requests
-
 from utils.workers.base_worker import BaseWorker
 
 
@@ -17,14 +15,14 @@ class UpdateJobSettingWorker(BaseWorker):
                 "key": self.key,
                 "value": self.value,
             }
-            with requests.Session() as session:
-                response = session.post(
-                    self.url,
-                    data=data,
-                    headers=self.headers,
-                    timeout=10,
-                )
-                response.raise_for_status()
-                return self.job_id
+            session = self.session
+            response = session.post(
+                self.url,
+                data=data,
+                headers=self.headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+            return self.job_id
         except Exception as e:
             self.signals.error.emit(str(e), self.job_id)
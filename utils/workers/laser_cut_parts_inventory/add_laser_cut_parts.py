@@ -1,5 +1,4 @@
 import msgspec
-import requests
 
 from utils.inventory.laser_cut_part import LaserCutPart
 from utils.workers.base_worker import BaseWorker
@@ -17,21 +16,21 @@ class AddLaserCutPartsWorker(BaseWorker):
         for laser_cut_part in self.laser_cut_parts:
             data.append(laser_cut_part.to_dict())
 
-        with requests.Session() as session:
-            response = session.post(self.url, json=data, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.post(self.url, json=data, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                response_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            response_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(response_data, dict) or "id" not in response_data:
-                raise ValueError("Invalid data format received")
+        if not isinstance(response_data, dict) or "id" not in response_data:
+            raise ValueError("Invalid data format received")
 
-            response_data["laser_cut_part_data"] = {
-                "id": response_data["id"],
-                "data": data,
-            }
+        response_data["laser_cut_part_data"] = {
+            "id": response_data["id"],
+            "data": data,
+        }
 
-            return (response_data, self.laser_cut_parts)
+        return (response_data, self.laser_cut_parts)
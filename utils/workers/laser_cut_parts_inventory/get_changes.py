@@ -0,0 +1,7 @@
+from utils.inventory.laser_cut_part import LaserCutPartRecord
+from utils.workers.get_inventory_changes import GetInventoryChangesWorker
+
+
+class GetLaserCutPartsChangesWorker(GetInventoryChangesWorker):
+    def __init__(self, since: str | None):
+        super().__init__("laser_cut_parts_inventory", since, name="GetLaserCutPartsChangesWorker", record_type=LaserCutPartRecord)
@@ -12,19 +12,19 @@ class GetLaserCutPartWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Fetching laser_cut_part ID {self.laser_cut_part_id} from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                laser_cut_part_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            laser_cut_part_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(laser_cut_part_data, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(laser_cut_part_data, dict):
+            raise ValueError("Invalid data format received")
 
-            return laser_cut_part_data
+        return laser_cut_part_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
@@ -0,0 +1,7 @@
+from utils.inventory.laser_cut_part import LaserCutPartRecord
+from utils.workers.get_inventory_items import GetInventoryItemsWorker
+
+
+class GetLaserCutPartsWorker(GetInventoryItemsWorker):
+    def __init__(self, laser_cut_part_ids: list[int | str]):
+        super().__init__("laser_cut_parts_inventory", "get_laser_cut_part", laser_cut_part_ids, name="GetLaserCutPartsWorker", record_type=LaserCutPartRecord)
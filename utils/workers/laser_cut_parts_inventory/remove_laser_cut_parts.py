@@ -1,5 +1,4 @@
 import msgspec
-import requests
 
 from utils.inventory.laser_cut_part import LaserCutPart
 from utils.workers.base_worker import BaseWorker
@@ -17,9 +16,9 @@ class RemoveLaserCutPartsWorker(BaseWorker):
         for laser_cut_part in self.laser_cut_parts:
             data.append(laser_cut_part.id)
 
-        with requests.Session() as session:
-            response = session.post(self.url, json=data, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            response_data = msgspec.json.decode(response.content)
+        session = self.session
+        response = session.post(self.url, json=data, headers=self.headers, timeout=10)
+        response.raise_for_status()
+        response_data = msgspec.json.decode(response.content)
 
-            return (response_data, self.laser_cut_parts)
+        return (response_data, self.laser_cut_parts)
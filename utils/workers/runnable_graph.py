@@ -0,0 +1,194 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+from utils.workers.base_worker import BaseWorker
+
+
+@dataclass
+class RunnableGraphNode:
+    name: str
+    worker: BaseWorker | None
+    callback: Callable
+    depends_on: set[str] = field(default_factory=set)
+
+    result: object = None
+    has_result: bool = False
+    failed: bool = False
+    started_at: float = 0.0
+    fetched_at: float = 0.0
+    finished_at: float = 0.0
+    done: bool = False
+    applying: bool = False
+
+
+class RunnableGraph(QObject):
+    """Dependency-graph version of RunnableChain.
+
+    All workers start immediately, dependencies only order the callbacks: a node's
+    callback(result, next_step) runs once its result is in and its dependencies are done.
+    Tasks (nodes without a worker) are plain callables. Failed nodes don't block the graph.
+    """
+
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None, name: str = "RunnableGraph") -> None:
+        super().__init__(parent)
+        self.name = name
+        self.logger = logging.getLogger(name)
+        self.nodes: dict[str, RunnableGraphNode] = {}
+        self.started = False
+        self.start_time = 0.0
+        self.end_time = 0.0
+
+    def add(self, name: str, worker: BaseWorker, callback: Callable, depends_on: Iterable[str] = ()):
+        return self._add_node(RunnableGraphNode(name, worker, callback, set(depends_on)))
+
+    def add_task(self, name: str, callback: Callable, depends_on: Iterable[str] = ()):
+        return self._add_node(RunnableGraphNode(name, None, callback, set(depends_on)))
+
+    def _add_node(self, node: RunnableGraphNode):
+        if node.name in self.nodes:
+            raise ValueError(f"Node '{node.name}' already exists in {self.name}")
+        self.nodes[node.name] = node
+        return self
+
+    def start(self):
+        self._validate()
+        self.started = True
+        self.start_time = time.perf_counter()
+
+        if not self.nodes:
+            self._finish()
+            return
+
+        for node in self.nodes.values():
+            if node.worker is None:
+                continue
+            node.started_at = time.perf_counter()
+            node.worker.signals.success.connect(lambda result, node=node: self._worker_success(node, result))
+            node.worker.signals.error.connect(lambda error, code, node=node: self._worker_error(node, error, code))
+            QThreadPool.globalInstance().start(node.worker)
+
+        self._run_ready_nodes()
+
+    def _validate(self):
+        for node in self.nodes.values():
+            if missing := node.depends_on - self.nodes.keys():
+                raise ValueError(f"Node '{node.name}' depends on unknown node(s): {', '.join(sorted(missing))}")
+
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at node '{name}' in {self.name}")
+            visiting.add(name)
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.nodes:
+            visit(name)
+
+    def _worker_success(self, node: RunnableGraphNode, result):
+        # Some workers emit error and then success(None); the first signal wins.
+        if node.has_result:
+            return
+        node.result = result
+        node.has_result = True
+        node.fetched_at = time.perf_counter()
+        self._run_ready_nodes()
+
+    def _worker_error(self, node: RunnableGraphNode, error, code: int):
+        if node.has_result:
+            return
+        self.logger.warning(f"[{self.name}] Node '{node.name}' failed: {error} (status {code})")
+        node.failed = True
+        node.has_result = True
+        node.fetched_at = time.perf_counter()
+        self._run_ready_nodes()
+
+    def _is_ready(self, node: RunnableGraphNode) -> bool:
+        if node.done or node.applying:
+            return False
+        if node.worker is not None and not node.has_result:
+            return False
+        return all(self.nodes[dependency].done for dependency in node.depends_on)
+
+    def _run_ready_nodes(self):
+        for node in list(self.nodes.values()):
+            if self._is_ready(node):
+                self._apply(node)
+
+    def _apply(self, node: RunnableGraphNode):
+        node.applying = True
+        if node.worker is None:
+            node.started_at = time.perf_counter()
+            node.fetched_at = node.started_at
+
+        def next_step():
+            self._complete(node)
+
+        try:
+            if node.worker is None:
+                node.callback()
+                next_step()
+            elif node.failed:
+                next_step()
+            else:
+                node.callback(node.result, next_step)
+        except Exception:
+            self.logger.exception(f"[{self.name}] Node '{node.name}' callback raised")
+            next_step()
+
+    def _complete(self, node: RunnableGraphNode):
+        if node.done:
+            return
+        node.done = True
+        node.applying = False
+        node.finished_at = time.perf_counter()
+        node.result = None  # Don't keep large payloads alive after they are applied
+
+        if all(n.done for n in self.nodes.values()):
+            self._finish()
+        else:
+            self._run_ready_nodes()
+
+    def _finish(self):
+        self.end_time = time.perf_counter()
+        self.logger.info(self.get_timing_report())
+        self.finished.emit()
+
+    def get_timings(self) -> dict[str, dict[str, float | bool]]:
+        timings: dict[str, dict[str, float | bool]] = {}
+        for node in self.nodes.values():
+            timings[node.name] = {
+                "started": node.started_at - self.start_time,
+                "fetch_time": node.fetched_at - node.started_at,
+                "waiting_on_dependencies": max(0.0, node.finished_at - node.fetched_at - self._callback_time(node)),
+                "finished": node.finished_at - self.start_time,
+                "failed": node.failed,
+            }
+        return timings
+
+    def _callback_time(self, node: RunnableGraphNode) -> float:
+        # Dependencies are done before a callback starts, so the callback itself is whatever
+        # time passed after the last dependency (or the fetch) finished.
+        ready_at = max([node.fetched_at] + [self.nodes[dependency].finished_at for dependency in node.depends_on])
+        return node.finished_at - ready_at
+
+    def get_timing_report(self) -> str:
+        lines = [f"[{self.name}] finished in {self.end_time - self.start_time:.2f}s"]
+        for name, timing in sorted(self.get_timings().items(), key=lambda item: item[1]["finished"]):
+            lines.append(
+                f"    {name:<45} fetch {timing['fetch_time']:.2f}s, waited {timing['waiting_on_dependencies']:.2f}s, "
+                f"done at {timing['finished']:.2f}s{' (failed)' if timing['failed'] else ''}"
+            )
+        return "\n".join(lines)
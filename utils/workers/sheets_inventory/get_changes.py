@@ -0,0 +1,6 @@
+from utils.workers.get_inventory_changes import GetInventoryChangesWorker
+
+
+class GetSheetsChangesWorker(GetInventoryChangesWorker):
+    def __init__(self, since: str | None):
+        super().__init__("sheets_inventory", since, name="GetSheetsChangesWorker")
@@ -12,19 +12,19 @@ class GetSheetWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Fetching sheet ID {self.sheet_id} from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                sheet_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            sheet_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(sheet_data, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(sheet_data, dict):
+            raise ValueError("Invalid data format received")
 
-            return sheet_data
+        return sheet_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
@@ -0,0 +1,6 @@
+from utils.workers.get_inventory_items import GetInventoryItemsWorker
+
+
+class GetSheetsWorker(GetInventoryItemsWorker):
+    def __init__(self, sheet_ids: list[int | str]):
+        super().__init__("sheets_inventory", "get_sheet", sheet_ids, name="GetSheetsWorker")
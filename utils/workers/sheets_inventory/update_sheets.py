@@ -1,5 +1,4 @@
 import msgspec
-import requests
 
 from utils.inventory.sheet import Sheet
 from utils.workers.base_worker import BaseWorker
@@ -16,11 +15,11 @@ class UpdateSheetsWorker(BaseWorker):
 
         data = [sheet.to_dict() for sheet in self.sheets]
 
-        with requests.Session() as session:
-            response = session.post(self.url, json=data, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            try:
-                response_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("JSON parse error from server")
-            return response_data
+        session = self.session
+        response = session.post(self.url, json=data, headers=self.headers, timeout=10)
+        response.raise_for_status()
+        try:
+            response_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("JSON parse error from server")
+        return response_data
@@ -12,14 +12,14 @@ class DeleteShippingAddressWorker(BaseWorker):
 
     def do_work(self):
         try:
-            with requests.Session() as session:
-                response = session.post(
-                    self.url,
-                    headers=self.headers,
-                    timeout=10,
-                )
-                response.raise_for_status()
-                return self.shipping_address_id
+            session = self.session
+            response = session.post(
+                self.url,
+                headers=self.headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+            return self.shipping_address_id
         except requests.HTTPError as http_err:
             self.signals.error.emit(f"HTTP error occurred: {http_err}", http_err.response.status_code)
         except requests.RequestException as err:
@@ -10,10 +10,10 @@ class GetAllShippingAddresses(BaseWorker):
 
     def do_work(self):
         try:
-            with requests.Session() as session:
-                response = session.get(self.url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                return response.json()
+            session = self.session
+            response = session.get(self.url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+            return response.json()
         except requests.HTTPError as http_err:
             self.signals.error.emit(f"HTTP error occurred: {http_err}", http_err.response.status_code)
         except requests.RequestException as err:
@@ -20,16 +20,16 @@ class SaveShippingAddressWorker(BaseWorker):
                     "application/json",
                 )
             }
-            with requests.Session() as session:
-                response = session.post(
-                    self.upload_url,
-                    files=files,
-                    headers=self.headers,
-                    timeout=10,
-                )
-                response.raise_for_status()
-                response_data = msgspec.json.decode(response.content)
-                return (response_data, self.shipping_address)
+            session = self.session
+            response = session.post(
+                self.upload_url,
+                files=files,
+                headers=self.headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+            response_data = msgspec.json.decode(response.content)
+            return (response_data, self.shipping_address)
         except requests.HTTPError as http_err:
             self.signals.error.emit(f"HTTP error occurred: {http_err}", http_err.response.status_code)
         except requests.RequestException as err:
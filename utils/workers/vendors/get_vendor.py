@@ -10,19 +10,19 @@ class GetVendorWorker(BaseWorker):
         self.url = f"{self.DOMAIN}/vendors/get_vendor/{job_id}"
 
     def do_work(self):
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                response_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            response_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(response_data, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(response_data, dict):
+            raise ValueError("Invalid data format received")
 
-            return response_data
+        return response_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
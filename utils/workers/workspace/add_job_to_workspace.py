@@ -15,19 +15,19 @@ class AddJobToWorkspaceWorker(BaseWorker):
         self.logger.info(f"Adding job to workspace: {self.job}")
         job_data = msgspec.json.encode(self.job.to_dict())
 
-        with requests.Session() as session:
-            response = session.post(self.url, data=job_data, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.post(self.url, data=job_data, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                response_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("JSON parse error from server")
+        try:
+            response_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("JSON parse error from server")
 
-            if not isinstance(response_data, dict):
-                raise ValueError("Unexpected response format")
+        if not isinstance(response_data, dict):
+            raise ValueError("Unexpected response format")
 
-            return response_data
+        return response_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
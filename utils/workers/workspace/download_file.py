@@ -2,8 +2,6 @@
 
 import os
 
-import requests
-
 from config.environments import Environment
 from utils.workers.base_worker import BaseWorker
 
@@ -23,35 +21,35 @@ class WorkspaceDownloadWorker(BaseWorker):
 
     def do_work(self):
         try:
-            with requests.Session() as session:
-                for file_to_download in self.files_to_download:
-                    url = f"{self.file_url}/{file_to_download}"
-                    response = session.get(
-                        url,
-                        headers=self.headers,
-                        timeout=10,
-                    )
-                    file_name = os.path.basename(file_to_download)
-                    file_ext = file_name.split(".")[-1].upper()
-                    save_dir = os.path.join(self.download_directory, file_ext)
-                    os.makedirs(save_dir, exist_ok=True)
-                    save_path = os.path.join(save_dir, file_name)
-
-                    if response.status_code == 200:
-                        with open(save_path, "wb") as file:
-                            file.write(response.content)
-
-                        self.logger.info(f"Downloaded: {file_name}")
-
-                        if self.open_when_done:
-                            return (
-                                file_ext,
-                                file_name,
-                                self.open_when_done,
-                            )  # Used in PDF Viewer
-                    else:
-                        self.signals.error.emit(response.text, response.status_code)
-                        self.logger.error(f"Failed to download {file_name}: {response.text}")
+            session = self.session
+            for file_to_download in self.files_to_download:
+                url = f"{self.file_url}/{file_to_download}"
+                response = session.get(
+                    url,
+                    headers=self.headers,
+                    timeout=10,
+                )
+                file_name = os.path.basename(file_to_download)
+                file_ext = file_name.split(".")[-1].upper()
+                save_dir = os.path.join(self.download_directory, file_ext)
+                os.makedirs(save_dir, exist_ok=True)
+                save_path = os.path.join(save_dir, file_name)
+
+                if response.status_code == 200:
+                    with open(save_path, "wb") as file:
+                        file.write(response.content)
+
+                    self.logger.info(f"Downloaded: {file_name}")
+
+                    if self.open_when_done:
+                        return (
+                            file_ext,
+                            file_name,
+                            self.open_when_done,
+                        )  # Used in PDF Viewer
+                else:
+                    self.signals.error.emit(response.text, response.status_code)
+                    self.logger.error(f"Failed to download {file_name}: {response.text}")
 
         except Exception as e:
             self.signals.error.emit(str(e), 500)
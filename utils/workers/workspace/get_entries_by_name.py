@@ -16,19 +16,19 @@ class GetWorkspaceEntriesByNameWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Requesting entries for job {self.job_id} with name '{self.entry_name}' from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                job_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            job_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(job_data, list):
-                raise ValueError("Invalid data format received")
+        if not isinstance(job_data, list):
+            raise ValueError("Invalid data format received")
 
-            return job_data
+        return job_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
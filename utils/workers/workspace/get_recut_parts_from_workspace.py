@@ -15,19 +15,19 @@ class GetRecutPartsFromWorkspaceWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Requesting recut parts from: {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                job_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            job_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(job_data, (list, dict)):
-                raise ValueError("Invalid data format received")
+        if not isinstance(job_data, (list, dict)):
+            raise ValueError("Invalid data format received")
 
-            return job_data
+        return job_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
@@ -12,19 +12,19 @@ class GetWorkspaceEntryWorker(BaseWorker):
 
     def do_work(self):
         self.logger.info(f"Requesting entry with ID {self.entry_id} from {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            try:
-                entry_data = msgspec.json.decode(response.content)
-            except msgspec.DecodeError:
-                raise ValueError("Failed to decode server response")
+        try:
+            entry_data = msgspec.json.decode(response.content)
+        except msgspec.DecodeError:
+            raise ValueError("Failed to decode server response")
 
-            if not isinstance(entry_data, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(entry_data, dict):
+            raise ValueError("Invalid data format received")
 
-            return entry_data
+        return entry_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
@@ -1,5 +1,4 @@
 import msgspec
-import requests
 from PyQt6.QtWidgets import QTreeWidgetItem
 
 from utils.inventory.component import Component
@@ -30,22 +29,22 @@ class LoadJobFromWorkspaceWorker(BaseWorker):
 
     def do_work(self):
         self.logger.debug(f"Sending GET request to: {self.url}")
-        with requests.Session() as session:
-            response = session.get(self.url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.get(self.url, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            job_data = msgspec.json.decode(response.content)
+        job_data = msgspec.json.decode(response.content)
 
-            self.job.load_data({"job_data": job_data["data"]})
+        self.job.load_data({"job_data": job_data["data"]})
 
-            for child in job_data.get("children", []):
-                if child["type"] == "assembly":
-                    assembly = Assembly({"assembly_data": child["data"]}, self.job)
-                    assembly.id = child["id"]
-                    self.job.add_assembly(assembly)
-                    self._process_children(self.job, assembly, child.get("children", []))
+        for child in job_data.get("children", []):
+            if child["type"] == "assembly":
+                assembly = Assembly({"assembly_data": child["data"]}, self.job)
+                assembly.id = child["id"]
+                self.job.add_assembly(assembly)
+                self._process_children(self.job, assembly, child.get("children", []))
 
-            return (self.job, self.item, job_data, 200)
+        return (self.job, self.item, job_data, 200)
 
     def _process_children(self, job: Job, parent: Assembly, children: list[dict]):
         for child in children:
@@ -50,15 +50,15 @@ class UpdateWorkspaceEntriesWorker(BaseWorker):
 
         self.logger.info(f"Sending {len(batch_payload)} entries for update")
 
-        with requests.Session() as session:
-            response = session.post(
-                self.url,
-                data=msgspec.json.encode(batch_payload),
-                headers=self.headers,
-                timeout=30,
-            )
-            response.raise_for_status()
-            return msgspec.json.decode(response.content)
+        session = self.session
+        response = session.post(
+            self.url,
+            data=msgspec.json.encode(batch_payload),
+            headers=self.headers,
+            timeout=30,
+        )
+        response.raise_for_status()
+        return msgspec.json.decode(response.content)
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
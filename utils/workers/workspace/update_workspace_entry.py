@@ -44,21 +44,21 @@ class UpdateWorkspaceEntryWorker(BaseWorker):
 
         self.logger.info(f"Updating entry {self.entry_id} of type {self.entry_type}")
 
-        with requests.Session() as session:
-            response = session.post(self.url, json=data, headers=self.headers, timeout=10)
-            response.raise_for_status()
+        session = self.session
+        response = session.post(self.url, json=data, headers=self.headers, timeout=10)
+        response.raise_for_status()
 
-            job_data = msgspec.json.decode(response.content)
-            job_data["entry_data"] = {
-                "id": self.entry_id,
-                "type": self.entry_type,
-                "data": data,
-            }
+        job_data = msgspec.json.decode(response.content)
+        job_data["entry_data"] = {
+            "id": self.entry_id,
+            "type": self.entry_type,
+            "data": data,
+        }
 
-            if not isinstance(job_data, dict):
-                raise ValueError("Invalid data format received")
+        if not isinstance(job_data, dict):
+            raise ValueError("Invalid data format received")
 
-            return job_data
+        return job_data
 
     def handle_exception(self, e):
         if isinstance(e, requests.exceptions.Timeout):
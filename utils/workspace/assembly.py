@@ -1,16 +1,19 @@
+import copy
 import dataclasses
 from dataclasses import dataclass, field, fields
 from typing import TYPE_CHECKING, Any, Optional, TypedDict, cast
 
+import msgspec
+
 from utils.inventory.angle_bar import AngleBar
-from utils.inventory.component import Component, ComponentDict
+from utils.inventory.component import Component, ComponentDict, ComponentRecord
 from utils.inventory.dom_round_tube import DOMRoundTube
 from utils.inventory.flat_bar import FlatBar
-from utils.inventory.laser_cut_part import LaserCutPart, LaserCutPartDict
-from utils.inventory.paint import PaintData, PaintDataDict
+from utils.inventory.laser_cut_part import LaserCutPart, LaserCutPartDict, LaserCutPartRecord
+from utils.inventory.paint import PaintData, PaintDataDict, PaintDataRecord
 from utils.inventory.pipe import Pipe
-from utils.inventory.powder import PowderData, PowderDataDict
-from utils.inventory.primer import PrimerData, PrimerDataDict
+from utils.inventory.powder import PowderData, PowderDataDict, PowderDataRecord
+from utils.inventory.primer import PrimerData, PrimerDataDict, PrimerDataRecord
 from utils.inventory.rectangular_bar import RectangularBar
 from utils.inventory.rectangular_tube import RectangularTube
 from utils.inventory.round_bar import RoundBar
@@ -48,6 +51,9 @@ class Prices:
                 if f.name in data:
                     setattr(self, f.name, data[f.name])
 
+    def clone(self) -> "Prices":
+        return copy.copy(self)
+
     def to_dict(self) -> PricesDict:
         return cast(PricesDict, {f.name: getattr(self, f.name) for f in fields(self)})
 
@@ -79,6 +85,9 @@ class MetaData:
                 if f.name in data:
                     setattr(self, f.name, data[f.name])
 
+    def clone(self) -> "MetaData":
+        return copy.copy(self)
+
     def to_dict(self) -> MetaDataDict:
         return cast(MetaDataDict, {f.name: getattr(self, f.name) for f in fields(self)})
 
@@ -119,10 +128,17 @@ class WorkspaceData:
                 if f.name in data:
                     setattr(self, f.name, data[f.name])
 
-        self.flowtag = Flowtag(data.get("flowtag", {}), self.workspace_settings)
+        self.flowtag = self.workspace_settings.get_shared_flowtag(data.get("flowtag", {}))
         self.flowtag_data = FlowtagData(self.flowtag)
         self.flowtag_data.load_data(data.get("flow_tag_data", {}))
 
+    def clone(self) -> "WorkspaceData":
+        """The flowtag is shared, FlowtagData is copied."""
+        workspace_data = copy.copy(self)
+        workspace_data.assembly_files = self.assembly_files.copy()
+        workspace_data.flowtag_data = self.flowtag_data.clone()
+        return workspace_data
+
     def to_dict(self) -> WorkspaceDataDict:
         result: dict[str, Any] = {}
         for f in fields(self.__class__):
@@ -146,6 +162,20 @@ class AssemblyDict(TypedDict):
     sub_assemblies: list["AssemblyDict"]
 
 
+class AssemblyRecord(msgspec.Struct):
+    id: int = -1
+    name: str = ""
+    meta_data: dict = {}
+    prices: dict = {}
+    workspace_data: dict = {}
+    primer_data: PrimerDataRecord = msgspec.field(default_factory=PrimerDataRecord)
+    paint_data: PaintDataRecord = msgspec.field(default_factory=PaintDataRecord)
+    powder_data: PowderDataRecord = msgspec.field(default_factory=PowderDataRecord)
+    laser_cut_parts: list[LaserCutPartRecord] = []
+    components: list[ComponentRecord] = []
+    sub_assemblies: list["AssemblyRecord"] = []
+
+
 class Assembly:
     id: int
     name: str
@@ -158,23 +188,34 @@ class Assembly:
     components: list[Component]
     sub_assemblies: list["Assembly"]
 
-    def __init__(self, assembly_data: AssemblyDict, job: "Job"):
+    def __init__(self, assembly_data: AssemblyDict | AssemblyRecord, job: "Job"):
         self.job = job
 
         self.workspace_settings: WorkspaceSettings = self.job.workspace_settings
         self.paint_inventory = self.job.job_manager.paint_inventory
         self.parent_assembly: "Assembly | None" = None
-
-        self.id = assembly_data.get("id", -1)
-        self.name = assembly_data.get("name", "")
-        self.meta_data = MetaData(assembly_data.get("meta_data", {}))
-        self.workspace_data = WorkspaceData(assembly_data.get("workspace_data", {}), self.workspace_settings)
-        self.prices = Prices(assembly_data.get("prices", {}))
-        self.primer_data = PrimerData(assembly_data.get("primer_data", {}))
+        self.cache: dict[str, Any] = {}  # Flattened descendants and totals, see invalidate_cache
+
+        if isinstance(assembly_data, AssemblyRecord):
+            self.id = assembly_data.id
+            self.name = assembly_data.name
+            self.meta_data = MetaData(assembly_data.meta_data)
+            self.workspace_data = WorkspaceData(assembly_data.workspace_data, self.workspace_settings)
+            self.prices = Prices(assembly_data.prices)
+            self.primer_data = PrimerData.from_record(assembly_data.primer_data)
+            self.paint_data = PaintData.from_record(assembly_data.paint_data)
+            self.powder_data = PowderData.from_record(assembly_data.powder_data)
+        else:
+            self.id = assembly_data.get("id", -1)
+            self.name = assembly_data.get("name", "")
+            self.meta_data = MetaData(assembly_data.get("meta_data", {}))
+            self.workspace_data = WorkspaceData(assembly_data.get("workspace_data", {}), self.workspace_settings)
+            self.prices = Prices(assembly_data.get("prices", {}))
+            self.primer_data = PrimerData(assembly_data.get("primer_data", {}))
+            self.paint_data = PaintData(assembly_data.get("paint_data", {}))
+            self.powder_data = PowderData(assembly_data.get("powder_data", {}))
         self.primer_data.primer_item = self.paint_inventory.get_primer(self.primer_data.primer_name)
-        self.paint_data = PaintData(assembly_data.get("paint_data", {}))
         self.paint_data.paint_item = self.paint_inventory.get_paint(self.paint_data.paint_name)
-        self.powder_data = PowderData(assembly_data.get("powder_data", {}))
         self.powder_data.powder_item = self.paint_inventory.get_powder(self.powder_data.powder_name)
 
         self.laser_cut_parts: list[LaserCutPart] = []
@@ -187,6 +228,35 @@ class Assembly:
 
         self.load_data(assembly_data)
 
+    def clone(self, job: "Job") -> "Assembly":
+        """Same as Assembly(self.to_dict(), job) without going through a dict, sub assemblies are added with add_sub_assembly.
+
+        Flowtags and paint items are shared, parts, components and sub assemblies are cloned.
+        """
+        assembly = Assembly.__new__(Assembly)
+        assembly.job = job
+        assembly.workspace_settings = job.workspace_settings
+        assembly.paint_inventory = job.job_manager.paint_inventory
+        assembly.parent_assembly = None
+        assembly.cache = {}
+
+        assembly.id = self.id
+        assembly.name = self.name
+        assembly.meta_data = self.meta_data.clone()
+        assembly.workspace_data = self.workspace_data.clone()
+        assembly.prices = self.prices.clone()
+        assembly.primer_data = self.primer_data.clone()
+        assembly.paint_data = self.paint_data.clone()
+        assembly.powder_data = self.powder_data.clone()
+
+        assembly.laser_cut_parts = [laser_cut_part.clone() for laser_cut_part in self.laser_cut_parts]
+        assembly.components = [component.clone() for component in self.components]
+        assembly.structural_steel_items = []  # Not serialized either
+        assembly.sub_assemblies = []
+        for sub_assembly in self.sub_assemblies:
+            assembly.add_sub_assembly(sub_assembly.clone(job))
+        return assembly
+
     def is_assembly_finished(self) -> bool:
         return
         return self.current_flow_tag_index >= len(self.workspace_data.flowtag.tags)
@@ -213,17 +283,35 @@ class Assembly:
                 return False
         return True
 
+    def invalidate_cache(self):
+        """Drops the cached lists and totals of this assembly, its parents and its job.
+
+        Called by everything that adds or removes items here, has to be called after changing
+        quantities, weights or expected times of this assembly or its parts.
+        """
+        assembly = self
+        while True:
+            assembly.cache.clear()
+            if assembly.parent_assembly is None:
+                break
+            assembly = assembly.parent_assembly
+        assembly.job.invalidate_cache()
+
     def add_laser_cut_part(self, laser_cut_part: LaserCutPart):
         self.laser_cut_parts.append(laser_cut_part)
+        self.invalidate_cache()
 
     def remove_laser_cut_part(self, laser_cut_part: LaserCutPart):
         self.laser_cut_parts.remove(laser_cut_part)
+        self.invalidate_cache()
 
     def add_component(self, component: Component):
         self.components.append(component)
+        self.invalidate_cache()
 
     def remove_component(self, component: Component):
         self.components.remove(component)
+        self.invalidate_cache()
 
     def get_current_tag(self) -> Optional[Tag]:
         try:
@@ -242,9 +330,8 @@ class Assembly:
         return name
 
     def get_weight(self) -> float:
-        weight: float = 0.0
-        for laser_cut_part in self.laser_cut_parts:
-            weight += laser_cut_part.meta_data.weight
+        if (weight := self.cache.get("weight")) is None:
+            weight = self.cache["weight"] = sum(laser_cut_part.meta_data.weight for laser_cut_part in self.laser_cut_parts)
         return weight
 
     def get_master_assembly(self) -> "Assembly":
@@ -257,9 +344,11 @@ class Assembly:
         assembly.parent_assembly = self
         assembly.job = self.job
         self.sub_assemblies.append(assembly)
+        self.invalidate_cache()
 
     def remove_sub_assembly(self, assembly) -> "Assembly":
         self.sub_assemblies.remove(assembly)
+        self.invalidate_cache()
         return assembly
 
     def get_sub_assemblies(self) -> list["Assembly"]:
@@ -275,16 +364,22 @@ class Assembly:
         self.name = new_name
 
     def get_all_sub_assemblies(self) -> list["Assembly"]:
-        assemblies: list["Assembly"] = []
-        assemblies.extend(self.sub_assemblies)
-        for sub_assembly in self.sub_assemblies:
-            assemblies.extend(sub_assembly.get_all_sub_assemblies())
-        return assemblies
+        if (assemblies := self.cache.get("all_sub_assemblies")) is None:
+            assemblies = self.cache["all_sub_assemblies"] = self.sub_assemblies.copy()
+            for sub_assembly in self.sub_assemblies:
+                assemblies.extend(sub_assembly.get_all_sub_assemblies())
+        return assemblies.copy()
 
     def get_all_laser_cut_parts(self) -> list[LaserCutPart]:
-        return self.laser_cut_parts + [part for sub_assembly in self.get_all_sub_assemblies() for part in sub_assembly.laser_cut_parts]
+        if (laser_cut_parts := self.cache.get("all_laser_cut_parts")) is None:
+            laser_cut_parts = self.cache["all_laser_cut_parts"] = self.laser_cut_parts.copy()
+            for sub_assembly in self.sub_assemblies:
+                laser_cut_parts.extend(sub_assembly.get_all_laser_cut_parts())
+        return laser_cut_parts.copy()
 
     def get_expected_time_to_complete(self) -> int:
+        if (total_time := self.cache.get("expected_time_to_complete")) is not None:
+            return total_time
         total_time: int = sum(laser_cut_part.get_expected_time_to_complete() * laser_cut_part.inventory_data.quantity for laser_cut_part in self.laser_cut_parts)
         if self.workspace_data.flowtag_data:
             for tag in self.workspace_data.flowtag_data.tags_data:
@@ -292,9 +387,14 @@ class Assembly:
                     total_time += expected_time_to_complete
         for sub_assembly in self.sub_assemblies:
             total_time += sub_assembly.get_expected_time_to_complete()
-        return total_time * self.meta_data.quantity
+        self.cache["expected_time_to_complete"] = total_time * self.meta_data.quantity
+        return self.cache["expected_time_to_complete"]
+
+    def load_data(self, data: AssemblyDict | AssemblyRecord):
+        if isinstance(data, AssemblyRecord):
+            self.load_record(data)
+            return
 
-    def load_data(self, data):
         self.laser_cut_parts.clear()
         laser_cut_parts = data.get("laser_cut_parts", [])
         for laser_cut_part_data in laser_cut_parts:
@@ -361,7 +461,23 @@ class Assembly:
         sub_assemblies = data.get("sub_assemblies", [])
         for sub_assembly_data in sub_assemblies:
             sub_assembly = Assembly(sub_assembly_data, self.job)
-            self.sub_assemblies.append(sub_assembly)
+            self.add_sub_assembly(sub_assembly)
+        self.invalidate_cache()  # In case there were no sub assemblies
+
+    def load_record(self, record: AssemblyRecord):
+        """Same as load_data, for assemblies that were decoded straight into records."""
+        self.laser_cut_parts.clear()
+        for laser_cut_part_record in record.laser_cut_parts:
+            self.add_laser_cut_part(LaserCutPart(laser_cut_part_record, self.job.laser_cut_inventory))
+
+        self.components.clear()
+        for component_record in record.components:
+            self.add_component(Component(component_record, self.job.components_inventory))
+
+        self.sub_assemblies.clear()
+        for sub_assembly_record in record.sub_assemblies:
+            self.add_sub_assembly(Assembly(sub_assembly_record, self.job))
+        self.invalidate_cache()  # In case there were no sub assemblies
 
     def to_dict(self) -> AssemblyDict:
         return {
@@ -31,6 +31,10 @@ class Flowtag:
         self.add_quantity_tag: Tag | None = None
         self.remove_quantity_tag: Tag | None = None
 
+        self.index_version = -1
+        self.lowered_tag_names: list[str] = []
+        self.similar_tags: dict[str, Optional[Tag]] = {}
+
         self.load_data(data)
 
     def get_flow_string(self) -> str:
@@ -55,27 +59,37 @@ class Flowtag:
             if tag := self.workspace_settings.get_tag(tag):
                 self.add_tag(tag)
 
+    def get_lowered_tag_names(self) -> list[str]:
+        if self.index_version != self.workspace_settings.index_version:
+            self.lowered_tag_names = [tag.name.lower() for tag in self.tags]
+            self.similar_tags.clear()
+            self.index_version = self.workspace_settings.index_version
+        return self.lowered_tag_names
+
     def has_tag(self, tag_name: str) -> bool:
-        return any(tag.name.lower() == tag_name.lower() for tag in self.tags)
+        return tag_name.lower() in self.get_lowered_tag_names()
 
     def contains(self, texts: list[str]) -> bool:
-        for text in texts:
-            for tag in self.tags:
-                if text.lower() in tag.name.lower():
-                    return True
-        return False
+        lowered_tag_names = self.get_lowered_tag_names()
+        return any(text.lower() in tag_name for text in texts for tag_name in lowered_tag_names)
 
     def get_tag_with_similar_name(self, tag_name: str) -> Optional[Tag]:
-        return next(
-            (tag for tag in self.tags if tag_name.lower() in tag.name.lower()),
-            None,
-        )
+        lowered_tag_names = self.get_lowered_tag_names()
+        keyword = tag_name.lower()
+        try:
+            return self.similar_tags[keyword]
+        except KeyError:
+            tag = next((self.tags[i] for i, name in enumerate(lowered_tag_names) if keyword in name), None)
+            self.similar_tags[keyword] = tag
+            return tag
 
     def add_tag(self, tag: Tag):
         self.tags.append(tag)
+        self.index_version = -1
 
     def remove_tag(self, tag: Tag):
         self.tags.remove(tag)
+        self.index_version = -1
 
     def get_tooltip(self) -> str:
         return f"{self.name}: {self.get_flow_string()}\nAdd Quantity: {self.add_quantity_tag}\nRemoved Quantity: {self.remove_quantity_tag}"
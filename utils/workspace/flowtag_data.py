@@ -29,6 +29,11 @@ class FlowtagData:
                 )
                 self.tags_data.update({tag: tag_data})
 
+    def clone(self) -> "FlowtagData":
+        flowtag_data = FlowtagData(self.flowtag)
+        flowtag_data.tags_data = {tag: tag_data.copy() for tag, tag_data in self.tags_data.items()}
+        return flowtag_data
+
     def get_tag(self, tag_name: str) -> Tag | None:
         return next((tag for tag in self.tags_data if tag.name == tag_name), None)
 
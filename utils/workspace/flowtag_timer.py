@@ -40,13 +40,16 @@ class TagTimer:
 class FlowtagTimer:
     def __init__(self, data: dict[str, FlowtagTimerDict], flow_tag: Flowtag):
         self.recorded_data: dict[Tag, TagTimer] = {}
+        self.tags_by_name: dict[str, Tag] = {}
         self.flow_tag = flow_tag
         self.load_data(data)
 
     def load_data(self, data: dict[str, FlowtagTimerDict]):
         self.recorded_data.clear()
+        self.tags_by_name.clear()
         for tag in self.flow_tag:
             self.recorded_data.update({tag: TagTimer(data.get(tag.name, []))})
+            self.tags_by_name.setdefault(tag.name, tag)
 
     def start_timer(self):
         self.recorded_data[self.flow_tag.tags[0]].start()
@@ -56,19 +59,15 @@ class FlowtagTimer:
 
     def start(self, tag_name: Union[Tag, str]):
         if isinstance(tag_name, str):
-            for tag in self.recorded_data:
-                if tag.name == tag_name:
-                    self.recorded_data[tag].start()
-                    break
+            if tag := self.tags_by_name.get(tag_name):
+                self.recorded_data[tag].start()
         elif isinstance(tag_name, Tag):
             self.recorded_data[tag_name].start()
 
     def stop(self, tag_name: Union[Tag, str]):
         if isinstance(tag_name, str):
-            for tag in self.recorded_data:
-                if tag.name == tag_name:
-                    self.recorded_data[tag].stop()
-                    break
+            if tag := self.tags_by_name.get(tag_name):
+                self.recorded_data[tag].stop()
         elif isinstance(tag_name, Tag):
             self.recorded_data[tag_name].stop()
 
@@ -1,16 +1,17 @@
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import msgspec
 from natsort import natsorted
 
 from ui.icons import Icons
 from ui.theme import theme_var
 from utils.inventory.component import Component
 from utils.inventory.laser_cut_part import LaserCutPart
-from utils.inventory.nest import Nest
+from utils.inventory.nest import Nest, NestRecord
 from utils.purchase_order.business_info import BusinessInfo
 from utils.purchase_order.contact_info import ContactInfo
-from utils.workspace.assembly import Assembly
+from utils.workspace.assembly import Assembly, AssemblyRecord
 from utils.workspace.job_flowtag_timeline import JobFlowtagTimeline
 from utils.workspace.job_price_calculator import JobPriceCalculator
 from utils.workspace.tag import Tag
@@ -69,8 +70,14 @@ class JobColor(Enum):
         return next((color.value[0] for color in cls if color.value[1] == job_status), default_color)
 
 
+class JobRecord(msgspec.Struct):
+    job_data: dict = {}
+    nests: list[NestRecord] = []
+    assemblies: list[AssemblyRecord] = []
+
+
 class Job:
-    def __init__(self, data: dict, job_manager):
+    def __init__(self, data: dict | JobRecord, job_manager):
         self.id = -1
         self.name: str = ""
         self.order_number: float = 0.0
@@ -81,6 +88,7 @@ class Job:
         self.assemblies: list[Assembly] = []
         self.nests: list[Nest] = []
         self.moved_job_to_workspace = False
+        self.cache: dict[str, Any] = {}  # Flattened assemblies and totals, see invalidate_cache
 
         self.job_manager: JobManager = job_manager
         self.status = JobStatus.PLANNING
@@ -98,7 +106,7 @@ class Job:
         self.laser_cut_inventory = self.job_manager.laser_cut_inventory
         self.paint_inventory = self.job_manager.paint_inventory
         self.structural_steel_inventory = self.job_manager.structural_steel_inventory
-        self.price_calculator = JobPriceCalculator(self, self.sheet_settings, self.paint_inventory, data.get("price_settings", {}))
+        self.price_calculator = JobPriceCalculator(self, self.sheet_settings, self.paint_inventory, data.get("price_settings", {}) if isinstance(data, dict) else {})
 
         self.unsaved_changes = False
         self.downloaded_from_server = False
@@ -126,12 +134,21 @@ class Job:
 
     def changes_made(self):
         self.unsaved_changes = True
+        # Quantities and weights are edited in place, so every total could be stale
+        for assembly in self.get_all_assemblies():
+            assembly.cache.clear()
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        self.cache.clear()
 
     def add_assembly(self, assembly: Assembly):
         self.assemblies.append(assembly)
+        self.invalidate_cache()
 
     def remove_assembly(self, assembly: Assembly):
         self.assemblies.remove(assembly)
+        self.invalidate_cache()
 
     def add_nest(self, nest: Nest):
         self.nests.append(nest)
@@ -144,9 +161,8 @@ class Job:
         for assembly in self.get_all_assemblies():
             for assembly_laser_cut_part in assembly.laser_cut_parts:
                 unit_quantity = assembly_laser_cut_part.inventory_data.quantity
-                new_laser_cut_part = LaserCutPart(assembly_laser_cut_part.to_dict(), self.laser_cut_inventory)
+                new_laser_cut_part = assembly_laser_cut_part.clone()
                 new_laser_cut_part.inventory_data.quantity = unit_quantity * assembly.meta_data.quantity
-                new_laser_cut_part.prices.matched_to_sheet_cost_price = assembly_laser_cut_part.prices.matched_to_sheet_cost_price
 
                 if existing_component := laser_cut_part_dict.get(new_laser_cut_part.name):
                     existing_component.inventory_data.quantity += new_laser_cut_part.inventory_data.quantity
@@ -164,7 +180,7 @@ class Job:
         for assembly in self.get_all_assemblies():
             for assembly_component in assembly.components:
                 unit_quantity = assembly_component.quantity
-                new_component = Component(assembly_component.to_dict(), self.components_inventory)
+                new_component = assembly_component.clone()
                 new_component.quantity = unit_quantity * assembly.meta_data.quantity
                 if existing_component := components_dict.get(new_component.name):
                     existing_component.quantity += new_component.quantity
@@ -185,25 +201,26 @@ class Job:
         self.grouped_components = natsorted(self.grouped_components, key=lambda laser_cut_part: laser_cut_part.name)
 
     def get_net_weight(self) -> float:
-        total_weight = 0.0
-        for assembly in self.get_all_assemblies():
-            for laser_cut_part in assembly.laser_cut_parts:
-                total_weight += laser_cut_part.meta_data.weight * laser_cut_part.inventory_data.quantity * assembly.meta_data.quantity
+        if (total_weight := self.cache.get("net_weight")) is None:
+            total_weight = 0.0
+            for assembly in self.get_all_assemblies():
+                for laser_cut_part in assembly.laser_cut_parts:
+                    total_weight += laser_cut_part.meta_data.weight * laser_cut_part.inventory_data.quantity * assembly.meta_data.quantity
+            self.cache["net_weight"] = total_weight
         return total_weight
 
     def get_all_assemblies(self) -> list[Assembly]:
-        assemblies: list[Assembly] = []
-        assemblies.extend(self.assemblies)
-        for assembly in self.assemblies:
-            assemblies.extend(assembly.get_all_sub_assemblies())
-        return assemblies
+        if (assemblies := self.cache.get("all_assemblies")) is None:
+            assemblies = self.cache["all_assemblies"] = self.assemblies.copy()
+            for assembly in self.assemblies:
+                assemblies.extend(assembly.get_all_sub_assemblies())
+        return assemblies.copy()
 
     def get_all_laser_cut_parts(self) -> list[LaserCutPart]:
         """Laser cut parts in all assemblies."""
-        laser_cut_parts: list[LaserCutPart] = []
-        for assembly in self.get_all_assemblies():
-            laser_cut_parts.extend(assembly.laser_cut_parts)
-        return laser_cut_parts
+        if (laser_cut_parts := self.cache.get("all_laser_cut_parts")) is None:
+            laser_cut_parts = self.cache["all_laser_cut_parts"] = [laser_cut_part for assembly in self.get_all_assemblies() for laser_cut_part in assembly.laser_cut_parts]
+        return laser_cut_parts.copy()
 
     def get_all_nested_laser_cut_parts(self) -> list[LaserCutPart]:
         """Laser cut parts in nests excluding assembly laser cut parts."""
@@ -218,10 +235,9 @@ class Job:
         return self.group_laser_cut_parts()
 
     def get_all_components(self) -> list[Component]:
-        components: list[Component] = []
-        for assembly in self.get_all_assemblies():
-            components.extend(assembly.components)
-        return components
+        if (components := self.cache.get("all_components")) is None:
+            components = self.cache["all_components"] = [component for assembly in self.get_all_assemblies() for component in assembly.components]
+        return components.copy()
 
     def get_grouped_components(self) -> list[Component]:
         return self.group_components()
@@ -295,7 +311,11 @@ class Job:
     def is_job_finished(self) -> bool:
         return all(assembly.is_assembly_finished() for assembly in self.get_all_assemblies())
 
-    def load_data(self, data: dict[str, dict[str, object]]):
+    def load_data(self, data: dict[str, dict[str, object]] | JobRecord):
+        if isinstance(data, JobRecord):
+            self.load_record(data)
+            return
+
         self.load_settings(data)
 
         nests_data = data.get("nests", [])
@@ -308,6 +328,7 @@ class Job:
         assemblies_data = data.get("assemblies", [])
 
         self.assemblies.clear()
+        self.invalidate_cache()
         for assembly_data in assemblies_data:
             assembly = Assembly(assembly_data, self)
             self.add_assembly(assembly)
@@ -315,6 +336,46 @@ class Job:
         # Because we need laser cut parts
         self.flowtag_timeline.load_data(data.get("job_data", {}).get("flowtag_timeline", {}))
 
+    def load_record(self, record: JobRecord):
+        """Same as load_data, for jobs that were decoded straight into records."""
+        self.load_settings({"job_data": record.job_data})
+
+        self.nests.clear()
+        for nest_record in record.nests:
+            self.add_nest(Nest(nest_record, self.sheet_settings, self.laser_cut_inventory))
+
+        self.assemblies.clear()
+        self.invalidate_cache()
+        for assembly_record in record.assemblies:
+            self.add_assembly(Assembly(assembly_record, self))
+
+        # Because we need laser cut parts
+        self.flowtag_timeline.load_data(record.job_data.get("flowtag_timeline", {}))
+
+    def clone(self) -> "Job":
+        """Same as Job(self.to_dict(), self.job_manager) without going through a dict.
+
+        Assemblies and nests are cloned, parts keep their prices so they are not matched to the sheet price again.
+        """
+        new_job = Job({}, self.job_manager)
+        new_job.id = self.id
+        new_job.name = self.name
+        new_job.order_number = self.order_number
+        new_job.PO_number = self.PO_number
+        new_job.ship_to = self.ship_to
+        new_job.starting_date = self.starting_date
+        new_job.ending_date = self.ending_date
+        new_job.status = self.status
+        new_job.color = JobColor.get_color(self.status)
+        new_job.moved_job_to_workspace = self.moved_job_to_workspace
+        new_job.price_calculator.load_settings(self.price_calculator.to_dict())
+
+        new_job.nests = [nest.clone() for nest in self.nests]
+        new_job.assemblies = [assembly.clone(new_job) for assembly in self.assemblies]
+        new_job.invalidate_cache()
+        new_job.flowtag_timeline.tags_data = {tag: tag_data.copy() for tag, tag_data in self.flowtag_timeline.tags_data.items()}
+        return new_job
+
     def to_dict(self):
         self.unsaved_changes = False
         return {
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from utils.inventory.component import Component
@@ -13,6 +14,22 @@ if TYPE_CHECKING:
     from utils.workspace.job import Job
 
 
+@lru_cache(maxsize=None)
+def get_overhead_factor(profit_margin: float, overhead: float, iterations: int = 10) -> float:
+    """What a cost is multiplied by to add overhead and profit margin.
+
+    Closed form of unit_price = (cost + unit_price * overhead) / (1 - profit_margin) started at 0
+    and repeated iterations times, which is cost * scale * (1 + ratio + ... + ratio ** (iterations - 1)).
+    """
+    if profit_margin == 1:
+        scale, ratio = 1.0, overhead / 0.00000001
+    else:
+        scale, ratio = 1 / (1 - profit_margin), overhead / (1 - profit_margin)
+    if ratio == 1:
+        return scale * iterations
+    return scale * (1 - ratio**iterations) / (1 - ratio)
+
+
 class JobPriceCalculator:
     def __init__(
         self,
@@ -48,44 +65,26 @@ class JobPriceCalculator:
         cost: float,
         max_iterations: int = 10,
     ):
-        unit_price = 0
-        for _ in range(max_iterations):
-            try:
-                unit_price = (cost + (unit_price * self.item_overhead)) / (1 - self.item_profit_margin)
-            except ZeroDivisionError:
-                unit_price = cost + (unit_price * self.item_overhead) / 0.00000001
-        return unit_price
+        return cost * get_overhead_factor(self.item_profit_margin, self.item_overhead, max_iterations)
 
     def calculate_component_overhead(self, cost: float, max_iterations: int = 10) -> float:
         profit_margin = self.item_profit_margin if self.components_use_profit_margin else 0
         overhead = self.item_overhead if self.components_use_overhead else 0
-
-        unit_price = 0
-        for _ in range(max_iterations):
-            try:
-                unit_price = (cost + (unit_price * overhead)) / (1 - profit_margin)
-            except ZeroDivisionError:
-                unit_price = cost + (unit_price * overhead) / 0.00000001
-        return unit_price
+        return cost * get_overhead_factor(profit_margin, overhead, max_iterations)
 
     def calculate_sheet_overhead(
         self,
         cost: float,
         max_iterations: int = 10,
     ):
-        unit_price = 0
-        for _ in range(max_iterations):
-            try:
-                unit_price = (cost + (unit_price * self.sheet_overhead)) / (1 - self.sheet_profit_margin)
-            except ZeroDivisionError:
-                unit_price = cost + (unit_price * self.sheet_overhead) / 0.00000001
-        return unit_price
+        return cost * get_overhead_factor(self.sheet_profit_margin, self.sheet_overhead, max_iterations)
 
     def get_job_cost(self) -> float:
-        total = 0.0
-        for assembly in self.job.assemblies:
-            total += self.get_assembly_cost(assembly)
-        return total
+        # Same as adding up get_assembly_cost of every top level assembly, sub assemblies are not multiplied by their parents quantity there either
+        return sum(
+            (self.get_laser_cut_parts_cost(assembly.laser_cut_parts) + self.get_components_cost(assembly.components)) * assembly.meta_data.quantity
+            for assembly in self.job.get_all_assemblies()
+        )
 
     def get_job_weight(self) -> float:
         total_weight = 0.0
@@ -100,10 +99,19 @@ class JobPriceCalculator:
         return total
 
     def get_laser_cut_parts_cost(self, laser_cut_parts: list[LaserCutPart]) -> float:
-        total = 0.0
-        for laser_cut_part in laser_cut_parts:
-            total += self.get_laser_cut_part_cost(laser_cut_part) * laser_cut_part.inventory_data.quantity
-        return total
+        # Overhead is proportional to cost, so it is added once to the total
+        base_costs = self.get_laser_cut_parts_base_costs(laser_cut_parts)
+        return self.calculate_laser_cut_part_overhead(sum(base_cost * laser_cut_part.inventory_data.quantity for laser_cut_part, base_cost in zip(laser_cut_parts, base_costs)))
+
+    def get_laser_cut_parts_costs(self, laser_cut_parts: list[LaserCutPart]) -> list[float]:
+        """Unit prices of all parts, same as get_laser_cut_part_cost for each."""
+        factor = get_overhead_factor(self.item_profit_margin, self.item_overhead)
+        return [base_cost * factor for base_cost in self.get_laser_cut_parts_base_costs(laser_cut_parts)]
+
+    def get_laser_cut_parts_base_costs(self, laser_cut_parts: list[LaserCutPart]) -> list[float]:
+        """Same as get_laser_cut_part_base_cost for each part, coatings are priced in one batch."""
+        coating_costs = zip(*(costs.tolist() for costs in self.paint_inventory.get_coating_costs(laser_cut_parts, self.mil_thickness)))
+        return [self.get_laser_cut_part_base_cost(laser_cut_part, *costs) for laser_cut_part, costs in zip(laser_cut_parts, coating_costs)]
 
     def get_laser_cut_part_cost_of_bending(self, laser_cut_part: LaserCutPart) -> float:
         return laser_cut_part.prices.bend_cost
@@ -133,30 +141,37 @@ class JobPriceCalculator:
             )
         )
 
-    def get_laser_cut_part_cost(self, laser_cut_part: LaserCutPart) -> float:
+    def get_laser_cut_part_base_cost(
+        self,
+        laser_cut_part: LaserCutPart,
+        cost_for_priming: float | None = None,
+        cost_for_painting: float | None = None,
+        cost_for_powder_coating: float | None = None,
+    ) -> float:
+        """Cost of goods, bending, labor and coatings before overhead and profit margin."""
+        if cost_for_priming is None:
+            cost_for_priming = self.paint_inventory.get_primer_cost(laser_cut_part)
+        if cost_for_painting is None:
+            cost_for_painting = self.paint_inventory.get_paint_cost(laser_cut_part)
+        if cost_for_powder_coating is None:
+            cost_for_powder_coating = self.paint_inventory.get_powder_cost(laser_cut_part, self.mil_thickness)
         return (
-            self.calculate_laser_cut_part_overhead(
-                self.get_laser_cut_part_cost_of_goods(laser_cut_part),
-            )
-            + self.calculate_laser_cut_part_overhead(
-                self.get_laser_cut_part_cost_of_bending(laser_cut_part),
-            )
-            + self.calculate_laser_cut_part_overhead(
-                laser_cut_part.prices.labor_cost,
-            )
-            + self.get_laser_cut_part_cost_for_painting(laser_cut_part)
+            self.get_laser_cut_part_cost_of_goods(laser_cut_part)
+            + self.get_laser_cut_part_cost_of_bending(laser_cut_part)
+            + laser_cut_part.prices.labor_cost
+            + cost_for_priming
+            + cost_for_painting
+            + cost_for_powder_coating
         )
 
+    def get_laser_cut_part_cost(self, laser_cut_part: LaserCutPart) -> float:
+        return self.calculate_laser_cut_part_overhead(self.get_laser_cut_part_base_cost(laser_cut_part))
+
     def get_components_cost(self, components: list[Component]) -> float:
-        total = 0.0
-        for component in components:
-            total += self.get_component_cost(component) * component.quantity
-        return total
+        return self.calculate_component_overhead(sum(component.price * component.quantity for component in components))
 
     def get_component_cost(self, component: Component) -> float:
-        if self.components_use_profit_margin or self.components_use_overhead:
-            return self.calculate_component_overhead(component.price)
-        return component.price
+        return self.calculate_component_overhead(component.price)
 
     def get_cutting_cost(self, nest: Nest) -> float:
         return ((nest.sheet_cut_time * nest.sheet_count) / 3600) * self.cost_for_laser
@@ -180,44 +195,40 @@ class JobPriceCalculator:
         return total_sheet_cost
 
     def update_laser_cut_parts_to_sheet_price(self):
-        target_value = self.get_total_cost_for_sheets()
+        """Adds the same amount to every part's cost of goods so the job costs as much as its sheets.
 
-        MAX_ITERATIONS = 200
-        TOLERANCE = 1
-        iteration_count = 0
+        Job cost is linear in that amount, so two cost evaluations give the exact amount (secant method).
+        """
+        target_value = self.get_total_cost_for_sheets()
 
         all_laser_cut_parts = self.job.get_all_laser_cut_parts()
-        for laser_cut_part in all_laser_cut_parts:
-            laser_cut_part.prices.matched_to_sheet_cost_price = laser_cut_part.prices.cost_of_goods
-
-        def _adjust_item_price(laser_cut_parts: list[LaserCutPart], amount: float):
-            for laser_cut_part in laser_cut_parts:
-                laser_cut_part.prices.matched_to_sheet_cost_price += amount
-
-        new_item_cost = self.get_job_cost()
-        difference = round(new_item_cost - target_value, 2)
-        amount_changed: float = 0
-        run_count: int = 0
-        while abs(difference) > TOLERANCE and iteration_count < MAX_ITERATIONS:
-            run_count += 1
-            if difference > 0:  # Need to decrease cost for items
-                _adjust_item_price(all_laser_cut_parts, -(abs(difference) / 1000))
-            else:  # Need to increase cost for items
-                _adjust_item_price(all_laser_cut_parts, abs(difference) / 1000)
-            new_item_cost = self.get_job_cost()
-            amount_changed += abs(difference) / 10000
-            difference = round(new_item_cost - target_value, 2)
-            iteration_count += 1
-            if (math.isinf(difference) and difference > 0) or (math.isinf(difference) and difference < 0):
-                break
+
+        def _set_item_price(amount: float):
+            for laser_cut_part in all_laser_cut_parts:
+                laser_cut_part.prices.matched_to_sheet_cost_price = laser_cut_part.prices.cost_of_goods + amount
+
+        _set_item_price(0.0)
+        cost_without_amount = self.get_job_cost()
+        _set_item_price(1.0)
+        cost_per_amount = self.get_job_cost() - cost_without_amount
+
+        amount = (target_value - cost_without_amount) / cost_per_amount if cost_per_amount else 0.0
+        if not math.isfinite(amount):
+            amount = 0.0
+        _set_item_price(amount)
 
     def update_laser_cut_parts_cost(self):
-        for laser_cut_part in self.job.get_all_laser_cut_parts():
-            laser_cut_part.prices.cost_for_primer = self.paint_inventory.get_primer_cost(laser_cut_part)
-            laser_cut_part.prices.cost_for_paint = self.paint_inventory.get_paint_cost(laser_cut_part)
-            laser_cut_part.prices.cost_for_powder_coating = self.paint_inventory.get_powder_cost(laser_cut_part, self.mil_thickness)
-            laser_cut_part.prices.cost_of_goods = self.get_laser_cut_part_cost_of_goods(laser_cut_part)
-            laser_cut_part.prices.price = round(self.get_laser_cut_part_cost(laser_cut_part), 2)
+        factor = get_overhead_factor(self.item_profit_margin, self.item_overhead)
+        laser_cut_parts = self.job.get_all_laser_cut_parts()
+        primer_costs, paint_costs, powder_costs = (costs.tolist() for costs in self.paint_inventory.get_coating_costs(laser_cut_parts, self.mil_thickness))
+        for laser_cut_part, cost_for_primer, cost_for_paint, cost_for_powder_coating in zip(laser_cut_parts, primer_costs, paint_costs, powder_costs):
+            prices = laser_cut_part.prices
+            prices.cost_for_primer = cost_for_primer
+            prices.cost_for_paint = cost_for_paint
+            prices.cost_for_powder_coating = cost_for_powder_coating
+            prices.cost_of_goods = self.get_laser_cut_part_cost_of_goods(laser_cut_part)
+            base_cost = self.get_laser_cut_part_base_cost(laser_cut_part, prices.cost_for_primer, prices.cost_for_paint, prices.cost_for_powder_coating)
+            prices.price = round(base_cost * factor, 2)
 
     def load_settings(self, settings: dict[str, float]):
         self.item_profit_margin = settings.get("item_profit_margin", 0.36)
@@ -0,0 +1,172 @@
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from utils.inventory.laser_cut_part import LaserCutPart
+from utils.workspace.tag import Tag
+from utils.workspace.workspace_filter import WorkspaceFilter
+
+if TYPE_CHECKING:
+    from utils.workspace.job import Job
+
+
+def parse_tag_date(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %I:%M %p").date()
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def get_trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class LaserCutPartFilterIndex:
+    """Indexes the laser cut parts of a job by everything the workspace filter looks at.
+
+    A filter change becomes a few set operations instead of checking every part, the result is kept
+    until the filter, the job's timeline or a part changes. Parts that are changed in place have to be
+    passed to update_laser_cut_parts.
+    """
+
+    def __init__(self, job: "Job"):
+        self.job = job
+        self.laser_cut_parts: set[LaserCutPart] = set()
+        self.materials: dict[str, set[LaserCutPart]] = {}
+        self.thicknesses: dict[str, set[LaserCutPart]] = {}
+        self.paints: dict[str, set[LaserCutPart]] = {}
+        self.trigrams: dict[str, set[LaserCutPart]] = {}
+        self.search_fields: dict[LaserCutPart, tuple[str, str, str]] = {}
+        self.index_keys: dict[LaserCutPart, tuple[str, str, list[str], set[str]]] = {}
+
+        # Only built when filtering by date, the current tag is not always set
+        self.current_tags: Optional[dict[Tag, set[LaserCutPart]]] = None
+        # Keyed on the tag's raw starting and ending dates, so an edited timeline is parsed again
+        self.tag_date_ranges: dict[Tag, tuple[str, str, tuple[date, date]]] = {}
+
+        self.filter_signature: Optional[tuple] = None
+        self.visible_laser_cut_parts: set[LaserCutPart] = set()
+
+        for laser_cut_part in job.get_all_laser_cut_parts():
+            self.add_laser_cut_part(laser_cut_part)
+
+    def add_laser_cut_part(self, laser_cut_part: LaserCutPart):
+        material = laser_cut_part.meta_data.material
+        thickness = laser_cut_part.meta_data.gauge
+        all_paints = laser_cut_part.get_all_paints()
+        paints = all_paints.split()
+        search_fields = (
+            laser_cut_part.name.lower(),
+            f"{laser_cut_part.meta_data.gauge} {laser_cut_part.meta_data.material}".lower(),
+            all_paints.lower(),
+        )
+        trigrams = set().union(*(get_trigrams(search_field) for search_field in search_fields))
+
+        self.laser_cut_parts.add(laser_cut_part)
+        self.materials.setdefault(material, set()).add(laser_cut_part)
+        self.thicknesses.setdefault(thickness, set()).add(laser_cut_part)
+        for paint in paints:
+            self.paints.setdefault(paint, set()).add(laser_cut_part)
+        for trigram in trigrams:
+            self.trigrams.setdefault(trigram, set()).add(laser_cut_part)
+        self.search_fields[laser_cut_part] = search_fields
+        self.index_keys[laser_cut_part] = (material, thickness, paints, trigrams)
+
+    def remove_laser_cut_part(self, laser_cut_part: LaserCutPart):
+        material, thickness, paints, trigrams = self.index_keys.pop(laser_cut_part)
+        self.laser_cut_parts.discard(laser_cut_part)
+        self.materials[material].discard(laser_cut_part)
+        self.thicknesses[thickness].discard(laser_cut_part)
+        for paint in paints:
+            self.paints[paint].discard(laser_cut_part)
+        for trigram in trigrams:
+            self.trigrams[trigram].discard(laser_cut_part)
+        del self.search_fields[laser_cut_part]
+
+    def update_laser_cut_parts(self, laser_cut_parts: Iterable[LaserCutPart]) -> bool:
+        """Re-indexes the parts that belong to this job, returns True if there were any."""
+        updated = False
+        for laser_cut_part in laser_cut_parts:
+            if laser_cut_part in self.laser_cut_parts:
+                self.remove_laser_cut_part(laser_cut_part)
+                self.add_laser_cut_part(laser_cut_part)
+                updated = True
+        if updated:
+            self.current_tags = None
+            self.tag_date_ranges.clear()
+            self.filter_signature = None
+        return updated
+
+    def get_visible_laser_cut_parts(self, workspace_filter: WorkspaceFilter) -> set[LaserCutPart]:
+        signature = (workspace_filter.get_signature(), self.get_timeline_signature() if workspace_filter.enable_date_range else ())
+        if signature != self.filter_signature:
+            self.visible_laser_cut_parts = self.filter(workspace_filter)
+            self.filter_signature = signature
+        return self.visible_laser_cut_parts
+
+    def filter(self, workspace_filter: WorkspaceFilter) -> set[LaserCutPart]:
+        visible_laser_cut_parts = self.laser_cut_parts
+        for checkbox_states, index in (
+            (workspace_filter.material_filter, self.materials),
+            (workspace_filter.thickness_filter, self.thicknesses),
+            (workspace_filter.paint_filter, self.paints),
+        ):
+            if checked_names := [name for name, is_checked in checkbox_states.items() if is_checked]:
+                visible_laser_cut_parts = visible_laser_cut_parts & set().union(*(index.get(name, ()) for name in checked_names))
+
+        if workspace_filter.enable_date_range and workspace_filter.date_range:
+            filter_start = workspace_filter.date_range[0].toPyDate() if workspace_filter.date_range[0] else None
+            filter_end = workspace_filter.date_range[1].toPyDate() if workspace_filter.date_range[1] else None
+            visible_laser_cut_parts = visible_laser_cut_parts & self.get_laser_cut_parts_within_date_range(filter_start, filter_end)
+
+        if search_text := workspace_filter.search_text.lower().strip():
+            queries = [query.strip() for query in search_text.split(",")]
+            visible_laser_cut_parts = visible_laser_cut_parts & self.search(queries)
+
+        return visible_laser_cut_parts
+
+    def search(self, queries: list[str]) -> set[LaserCutPart]:
+        """Parts with any query in their name, gauge and material, or paints."""
+        found: set[LaserCutPart] = set()
+        for query in queries:
+            if len(query) < 3:
+                candidates = self.laser_cut_parts
+            else:
+                trigram_sets = sorted((self.trigrams.get(trigram, set()) for trigram in get_trigrams(query)), key=len)
+                candidates = trigram_sets[0].intersection(*trigram_sets[1:])
+            found.update(laser_cut_part for laser_cut_part in candidates if any(query in search_field for search_field in self.search_fields[laser_cut_part]))
+        return found
+
+    def get_timeline_signature(self) -> tuple:
+        return tuple((tag, tag_data.get("starting_date"), tag_data.get("ending_date")) for tag, tag_data in self.job.flowtag_timeline.tags_data.items())
+
+    def get_tag_date_range(self, tag: Tag) -> Optional[tuple[date, date]]:
+        if not (tag_data := self.job.flowtag_timeline.tags_data.get(tag)):
+            return None
+        starting_date, ending_date = tag_data["starting_date"], tag_data["ending_date"]
+        cached = self.tag_date_ranges.get(tag)
+        if cached is None or cached[:2] != (starting_date, ending_date):
+            cached = (starting_date, ending_date, (parse_tag_date(starting_date), parse_tag_date(ending_date)))
+            self.tag_date_ranges[tag] = cached
+        return cached[2]
+
+    def get_laser_cut_parts_within_date_range(self, filter_start: Optional[date], filter_end: Optional[date]) -> set[LaserCutPart]:
+        if self.current_tags is None:
+            self.current_tags = {}
+            for laser_cut_part in self.laser_cut_parts:
+                if tag := laser_cut_part.get_current_tag():
+                    self.current_tags.setdefault(tag, set()).add(laser_cut_part)
+
+        laser_cut_parts: set[LaserCutPart] = set()
+        for tag, tag_laser_cut_parts in self.current_tags.items():
+            if not (tag_date_range := self.get_tag_date_range(tag)):
+                continue
+            tag_start, tag_end = tag_date_range
+            if filter_start and not filter_end:
+                is_within_date_range = tag_start <= filter_start <= tag_end
+            elif filter_start and filter_end:
+                is_within_date_range = not (tag_end < filter_start or tag_start > filter_end)
+            else:
+                is_within_date_range = True
+            if is_within_date_range:
+                laser_cut_parts.update(tag_laser_cut_parts)
+        return laser_cut_parts
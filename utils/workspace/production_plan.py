@@ -17,8 +17,7 @@ class ProductionPlan(Workspace):
 
     @override
     def add_job(self, job: Job) -> Job:
-        new_job = Job(job.to_dict(), self.job_manager)
+        new_job = job.clone()
         new_job.flowtag_timeline = job.flowtag_timeline
-        new_job.load_settings(job.to_dict())
         self.jobs.append(new_job)
         return new_job
@@ -7,10 +7,10 @@ import msgspec
 from config.environments import Environment
 from utils.inventory.component import Component
 from utils.inventory.laser_cut_part import LaserCutPart
-from utils.inventory.nest import Nest
 from utils.workspace.assembly import Assembly
 from utils.workspace.job import Job
 from utils.workspace.job_manager import JobManager
+from utils.workspace.laser_cut_part_filter_index import LaserCutPartFilterIndex
 from utils.workspace.workspace_assemply_group import WorkspaceAssemblyGroup
 from utils.workspace.workspace_filter import SortingMethod, WorkspaceFilter
 from utils.workspace.workspace_laser_cut_part_group import WorkspaceLaserCutPartGroup
@@ -35,6 +35,7 @@ class Workspace:
         self.sheet_settings = self.job_manager.sheet_settings
         self.components_inventory = self.job_manager.components_inventory
         self.workspace_filter = WorkspaceFilter()
+        self.filter_indexes: dict[Job, LaserCutPartFilterIndex] = {}
 
         # NOTE Non serialized variables
         self.grouped_components: list[Component] = []
@@ -44,66 +45,10 @@ class Workspace:
         # self.load_data()
 
     def deep_split_job_copy(self, job: Job) -> Job:
-        new_job = Job({}, self.job_manager)
-        new_job.load_settings(job.to_dict())
+        new_job = job.clone()
         new_job.flowtag_timeline = job.flowtag_timeline
-        self.copy_assemblies(job.assemblies, new_job, job.ending_date)
-        self.copy_nests(job.nests, new_job)
         return new_job
 
-    def copy_assemblies(
-        self,
-        assemblies: list[Assembly],
-        parent: Union[Job, Assembly],
-        job_ending_date: str,
-    ):
-        for assembly in assemblies:
-            new_assembly = Assembly(assembly.to_dict(), parent if isinstance(parent, Job) else parent.job)
-            new_assembly.laser_cut_parts.clear()
-            new_assembly.components.clear()
-            new_assembly.structural_steel_items.clear()
-            new_assembly.sub_assemblies.clear()
-            #
-            # if isinstance(parent, Job):
-            #     parent_starting_date = datetime.strptime(parent.starting_date, "%Y-%m-%d %I:%M %p")
-            # elif isinstance(parent, Assembly):
-            #     parent_starting_date = datetime.strptime(parent.workspace_data.starting_date, "%Y-%m-%d %I:%M %p")
-            # else:
-            #     parent_starting_date = datetime.now()
-
-            # calculated_starting_date = parent_starting_date - timedelta(days=7.0)
-            # calculated_ending_date = calculated_starting_date + timedelta(days=assembly.workspace_data.expected_time_to_complete)
-            #
-            # new_assembly.workspace_data.starting_date = calculated_starting_date.strftime("%Y-%m-%d %I:%M %p")
-            # new_assembly.workspace_data.ending_date = calculated_ending_date.strftime("%Y-%m-%d %I:%M %p")
-
-            if isinstance(parent, Job):
-                parent.add_assembly(new_assembly)
-            else:
-                parent.add_sub_assembly(new_assembly)
-
-            if assembly.laser_cut_parts:
-                self.copy_laser_cut_parts(assembly.laser_cut_parts, new_assembly)
-            if assembly.components:
-                self.copy_components(assembly.components, new_assembly)
-            if assembly.sub_assemblies:
-                self.copy_assemblies(assembly.sub_assemblies, new_assembly, job_ending_date)
-
-    def copy_nests(self, nests: list[Nest], job: Job):
-        for nest in nests:
-            new_nest = Nest(nest.to_dict(), self.sheet_settings, self.laser_cut_inventory)
-            job.add_nest(new_nest)
-
-    def copy_components(self, components: list[Component], assembly: Assembly):
-        for component in components:
-            new_component = Component(component.to_dict(), self.components_inventory)
-            assembly.add_component(new_component)
-
-    def copy_laser_cut_parts(self, laser_cut_parts: list[LaserCutPart], assembly: Assembly):
-        for part in laser_cut_parts:
-            new_part = LaserCutPart(part.to_dict(), self.laser_cut_inventory)
-            assembly.add_laser_cut_part(new_part)
-
     def add_job(self, job: Job) -> Job:
         new_job = self.deep_split_job_copy(job)
         self.jobs.append(new_job)
@@ -111,6 +56,20 @@ class Workspace:
 
     def remove_job(self, job: Job):
         self.jobs.remove(job)
+        self.filter_indexes.pop(job, None)
+
+    def index_job(self, job: Job) -> LaserCutPartFilterIndex:
+        """Has to be called whenever the parts or the timeline of a job are loaded again."""
+        self.filter_indexes[job] = LaserCutPartFilterIndex(job)
+        return self.filter_indexes[job]
+
+    def get_filter_index(self, job: Job) -> LaserCutPartFilterIndex:
+        return self.filter_indexes.get(job) or self.index_job(job)
+
+    def update_filter_indexes(self, laser_cut_parts: list[LaserCutPart]):
+        """Re-indexes parts that were changed in place."""
+        for filter_index in self.filter_indexes.values():
+            filter_index.update_laser_cut_parts(laser_cut_parts)
 
     def get_all_assemblies(self) -> list[Assembly]:
         assemblies: list[Assembly] = []
@@ -250,25 +209,14 @@ class Workspace:
         return any(q in name or q in material or q in paints for q in queries)
 
     def get_filtered_laser_cut_parts(self, job: Job) -> list[LaserCutPart]:
-        parts: list[LaserCutPart] = []
-
-        for part in job.get_all_laser_cut_parts():
-            if not self.is_within_date_range(part, job):
-                continue
-            if not self.is_material_match(part):
-                continue
-            if not self.is_thickness_match(part):
-                continue
-            if not self.is_paint_match(part):
-                continue
-            if not self.is_text_search_match(part):
-                continue
-
-            parts.append(part)
-
-        return parts
+        visible_laser_cut_parts = self.get_filter_index(job).get_visible_laser_cut_parts(self.workspace_filter)
+        return [part for part in job.get_all_laser_cut_parts() if part in visible_laser_cut_parts]
 
     def is_part_group_hidden(self, group: WorkspaceLaserCutPartGroup, job: Job) -> bool:
+        if job is not None:
+            visible_laser_cut_parts = self.get_filter_index(job).get_visible_laser_cut_parts(self.workspace_filter)
+            return not any(part in visible_laser_cut_parts for part in group.laser_cut_parts)
+
         for part in group.laser_cut_parts:
             if (
                 self.is_within_date_range(part, job)
@@ -367,6 +315,7 @@ class Workspace:
             return
 
         self.jobs.clear()
+        self.filter_indexes.clear()
 
         jobs = data.get("jobs", [])
 
@@ -25,3 +25,14 @@ class WorkspaceFilter:
         self.sorting_method: SortingMethod = SortingMethod.A_TO_Z
         self.date_range: tuple[QDate, QDate] = ()
         self.enable_date_range: bool = False
+
+    def get_signature(self) -> tuple:
+        """Changes whenever the filtered parts could change, sorting and the current tag do not filter parts."""
+        date_range = tuple(date.toPyDate() if date else None for date in self.date_range) if self.enable_date_range else ()
+        return (
+            frozenset(name for name, is_checked in self.material_filter.items() if is_checked),
+            frozenset(name for name, is_checked in self.thickness_filter.items() if is_checked),
+            frozenset(name for name, is_checked in self.paint_filter.items() if is_checked),
+            self.search_text.lower().strip(),
+            date_range,
+        )
@@ -20,7 +20,7 @@ class WorkspaceHistory:
         self.load_data()
 
     def add_job(self, job: Job):
-        new_job = Job(job.to_dict(), self.job_manager)
+        new_job = job.clone()
         self.jobs.append(new_job)
 
     def remove_job(self, job: Job):
@@ -17,16 +17,22 @@ class WorkspaceSettings:
         self.notes: str = ""
         self.tags: list[Tag] = []
         self.flow_tags_group: list[Flowtags] = []
+        self.shared_flowtags: dict[tuple, Flowtag] = {}
+        self.tags_by_name: dict[str, Tag] = {}
+        self.flow_tags_by_name: dict[str, Flowtag] = {}
+        self.index_version = 0
         self.__create_file()
         self.load_data()
 
     def create_group(self, name: str) -> Flowtags:
         flow_tags = Flowtags(name)
         self.flow_tags_group.append(flow_tags)
+        self.update_indexes()
         return flow_tags
 
     def delete_group(self, group: Flowtags):
         self.flow_tags_group.remove(group)
+        self.update_indexes()
 
     def get_flow_tag_group(self, name: str) -> Flowtags:
         for group in self.flow_tags_group:
@@ -35,9 +41,27 @@ class WorkspaceSettings:
 
     def add_tag(self, tag: Tag):
         self.tags.append(tag)
+        self.shared_flowtags.clear()
+        self.update_indexes()
 
     def remove_tag(self, tag: Tag):
         self.tags.remove(tag)
+        self.shared_flowtags.clear()
+        self.update_indexes()
+
+    def update_indexes(self):
+        """Has to be called after tags or flow tags are renamed or changed outside of these methods.
+
+        Flow tags rebuild their own tag name tables when index_version changes.
+        """
+        self.tags_by_name.clear()
+        for tag in self.tags:
+            self.tags_by_name.setdefault(tag.name, tag)
+        self.flow_tags_by_name.clear()
+        for flow_tag_group in self.flow_tags_group:
+            for flow_tag in flow_tag_group:
+                self.flow_tags_by_name.setdefault(str(flow_tag), flow_tag)
+        self.index_version += 1
 
     def get_all_tags(self) -> list[str]:
         return [tag.name for tag in self.tags]
@@ -49,13 +73,34 @@ class WorkspaceSettings:
         return statuses
 
     def get_tag(self, tag_name: str) -> Tag | None:
-        return next((tag for tag in self.tags if tag.name == tag_name), None)
+        return self.tags_by_name.get(tag_name)
 
     def create_tag(self, name: str) -> Tag:
         tag = Tag(name, {"attribute": {}, "statuses": {}})
         self.tags.append(tag)
+        self.shared_flowtags.clear()
+        self.update_indexes()
         return tag
 
+    def get_shared_flowtag(self, data: FlowtagDict) -> Flowtag:
+        """Returns one Flowtag for every part with the same flow, so it must never be changed in place.
+
+        Parts replace their flowtag when their flow changes, what is specific to a part is kept in its
+        FlowtagData.
+        """
+        if not isinstance(data, dict) or not data:
+            return Flowtag(data, self)
+        key = (
+            data.get("name", ""),
+            data.get("group", 0),
+            data.get("add_quantity_tag"),
+            data.get("remove_quantity_tag"),
+            tuple(data.get("tags", [])),
+        )
+        if (flowtag := self.shared_flowtags.get(key)) is None:
+            flowtag = self.shared_flowtags[key] = Flowtag(data, self)
+        return flowtag
+
     def create_flow_tag(self, flow_tags: Flowtags, name: str):
         emplty_flowtag = FlowtagDict({"name": name, "group": 0, "add_quantity_tag": None, "remove_quantity_tag": None, "tags": []})
         flow_tag = Flowtag(emplty_flowtag, self)
@@ -68,11 +113,7 @@ class WorkspaceSettings:
         return flow_tags
 
     def get_flow_tag_by_name(self, name: str) -> Optional[Flowtag]:
-        for flow_tag_group in self.flow_tags_group:
-            for flow_tag in flow_tag_group:
-                if str(flow_tag) == name:
-                    return flow_tag
-        return None
+        return self.flow_tags_by_name.get(name)
 
     def get_all_assembly_flow_tags(self) -> dict[str, Flowtag]:
         return {flow_tag.get_flow_string(): flow_tag for flow_tag in self.get_all_flow_tags() if flow_tag.group == Group.ASSEMBLY}
@@ -85,11 +126,14 @@ class WorkspaceSettings:
 
     def add_flow_tag(self, flow_tags: Flowtags, flow_tag: Flowtag):
         flow_tags.add_flow_tag(flow_tag)
+        self.update_indexes()
 
     def remove_flow_tag(self, flow_tags: Flowtags, flow_tag: Flowtag):
         flow_tags.remove_flow_tag(flow_tag)
+        self.update_indexes()
 
     def save(self):
+        self.update_indexes()  # The settings dialog edits tags and flow tags directly
         with open(f"{self.FOLDER_LOCATION}/{self.filename}.json", "wb") as file:
             file.write(msgspec.json.encode(self.to_dict()))
 
@@ -121,10 +165,12 @@ Tags such as, "Staging", "Editing", and "Planning" cannot be used as flow tags,
         )
         self.tags.clear()
         self.flow_tags_group.clear()
+        self.shared_flowtags.clear()  # They point to the old tags
 
         for tag, tag_data in data.get("tags", {}).items():
             tag = Tag(tag, tag_data)
             self.tags.append(tag)
+        self.update_indexes()
 
         for group, flow_tags in data.get("flow_tags", {}).items():
             flow_tag_group = Flowtags(group)
@@ -133,6 +179,7 @@ Tags such as, "Staging", "Editing", and "Planning" cannot be used as flow tags,
                 flow_tag = Flowtag(flow_tag_data, self)
                 flow_tag_group.group = flow_tag.group
                 flow_tag_group.add_flow_tag(flow_tag)
+        self.update_indexes()
 
     def to_dict(self) -> dict[str, dict[str, dict[str, dict]]]:
         data: dict[str, dict[str, list]] = {